@@ -154,6 +154,7 @@ const ParlayBuilder = () => {
         player: pick.player,
         team: pick.team || pick.home_team,
         bet_type: pick.bet_type || 'prop',
+        prop_type: pick.prop_type || pick.stat,
         side: pick.side,
         line: pick.line,
         odds: pick.odds || -110,
@@ -8,6 +8,7 @@ const SystemHealthPanel = ({ compact = false }) => {
   const [health, setHealth] = useState(null);
   const [modelStatus, setModelStatus] = useState(null);
   const [weights, setWeights] = useState(null);
+  const [stageTimings, setStageTimings] = useState(null);
   const [loading, setLoading] = useState(true);
   const pollInFlightRef = useRef(false);
   const pollBackoffUntilRef = useRef(0);
@@ -29,14 +30,16 @@ const SystemHealthPanel = ({ compact = false }) => {
     if (Date.now() < pollBackoffUntilRef.current) return;
     pollInFlightRef.current = true;
     try {
-      const [healthData, statusData, weightsData] = await Promise.all([
+      const [healthData, statusData, weightsData, timingsData] = await Promise.all([
         api.getHealth().catch(() => ({ status: 'offline' })),
         api.getModelStatus().catch(() => null),
-        api.getGraderWeights().catch(() => null)
+        api.getGraderWeights().catch(() => null),
+        api.getStageTimings().catch(() => null)
       ]);
       setHealth(healthData);
       setModelStatus(statusData);
       setWeights(weightsData);
+      setStageTimings(timingsData);
       pollErrorStreakRef.current = 0;
     } catch (err) {
       console.error(err);
@@ -73,8 +76,21 @@ const SystemHealthPanel = ({ compact = false }) => {
     return { level: 'SIGNIFICANT', color: '#FF4444', value: bias > 0 ? 'OVER' : 'UNDER', pct: (absBias * 100).toFixed(1) };
   };
 
+  // Slate routes whose pipeline stages are worth watching
+  const TIMED_ROUTES = [
+    { label: 'Props', route: 'GET /live/props/{sport}' },
+    { label: 'Best Bets', route: 'GET /live/best-bets/{sport}' }
+  ];
+
+  const getTimingColor = (ms) => {
+    if (ms < 50) return '#00FF88';
+    if (ms < 250) return '#FFD700';
+    return '#FF4444';
+  };
+
   const drift = getDriftStatus();
   const bias = getBiasStatus();
+  const timedRoutes = TIMED_ROUTES.filter(r => stageTimings?.routes?.[r.route]);
 
   if (loading) {
     return (
@@ -281,6 +297,31 @@ const SystemHealthPanel = ({ compact = false }) => {
         </div>
       </div>
 
+      {/* Pipeline Stage Timings (Server-Timing spans, aggregated per route) */}
+      {timedRoutes.length > 0 && (
+        <div style={{ marginBottom: '25px' }}>
+          <div style={{ color: '#6b7280', fontSize: '12px', marginBottom: '12px', textTransform: 'uppercase' }}>Pipeline Stage Timings (p50 / p95)</div>
+          <div style={{ display: 'grid', gridTemplateColumns: `repeat(${timedRoutes.length}, 1fr)`, gap: '12px' }}>
+            {timedRoutes.map(({ label, route }) => {
+              const { requests, stages } = stageTimings.routes[route];
+              return (
+                <div key={route} style={{ backgroundColor: '#12121f', borderRadius: '8px', padding: '12px' }}>
+                  <div style={{ color: '#fff', fontSize: '13px', fontWeight: 'bold', marginBottom: '8px' }}>
+                    {label} <span style={{ color: '#6b7280', fontWeight: 'normal' }}>({requests} req)</span>
+                  </div>
+                  {Object.entries(stages).map(([stage, t]) => (
+                    <div key={stage} style={{ display: 'flex', justifyContent: 'space-between', fontSize: '12px', padding: '2px 0' }}>
+                      <span style={{ color: '#9ca3af' }}>{stage}</span>
+                      <span style={{ color: getTimingColor(t.p95_ms) }}>{t.p50_ms}ms / {t.p95_ms}ms</span>
+                    </div>
+                  ))}
+                </div>
+              );
+            })}
+          </div>
+        </div>
+      )}
+
       {/* Weight Tuning Alert */}
       {((drift && drift.level !== 'LOW') || (bias && bias.level !== 'NEUTRAL')) && (
         <div style={{
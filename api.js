@@ -475,6 +475,20 @@ export const api = {
     }
   },
 
+  // Closing line value over tracked bets: overall and by tier / sport / signal
+  async getCLVSummary({ sport, userId, days } = {}) {
+    try {
+      const params = new URLSearchParams();
+      if (sport) params.set('sport', sport.toLowerCase());
+      if (userId) params.set('user_id', userId);
+      if (days) params.set('days', days);
+      const query = params.toString();
+      return safeJson(await authFetch(`${API_BASE_URL}/live/bets/clv${query ? `?${query}` : ''}`));
+    } catch {
+      return null;
+    }
+  },
+
   // ============================================================================
   // PARLAY BUILDER
   // ============================================================================
@@ -721,6 +735,13 @@ export const api = {
     return safeJson(await authFetch(`${API_BASE_URL}/live/scheduler/status`)) || { status: 'unavailable', jobs: [] };
   },
 
+  /**
+   * Get per-route pipeline stage timings (aggregated Server-Timing spans)
+   */
+  async getStageTimings() {
+    return safeJson(await authFetch(`${API_BASE_URL}/live/timings`)) || { routes: {} };
+  },
+
   // ============================================================================
   // DEBUG / DEV TOOLS
   // ============================================================================
@@ -0,0 +1,428 @@
+"""
+Backtest - replay historical slates through the scorers and grade the picks
+
+Reads one JSON file per slate date from BACKTEST_DATA_DIR:
+
+    <BACKTEST_DATA_DIR>/<sport>/<YYYY-MM-DD>.json
+    {
+      "games": [<Odds API game with bookmakers>, + optional
+                 "closing": <the same game's last snapshot before kickoff>,
+                 "result": {"home_score": 112, "away_score": 104}],
+      "props": [{"event": <Odds API event>, "odds": <event odds payload>,
+                 "closing": <event odds payload>, optional,
+                 "results": {"<player>": {"player_points": 27, ...,
+                                          "team": "Boston Celtics" (optional)}}}]
+    }
+
+Dates are sharded across a dedicated pool of spawn workers (the live scoring
+pool is left alone); each worker reads its own files, scores every game and
+prop outcome with engines.scoring for the slate's date, grades the pick and
+ships back compact graded rows. The parent aggregates ROI, hit rate and CLV
+per tier, plus the actionable picks (SMASH / STRONG / PLAY).
+
+Picks follow the live slates: a game's pick is the home spread when the
+main model says SMASH / STRONG / PLAY, otherwise the away spread; a prop's
+pick is the outcome itself (Over / Under at its line). Stakes are 1 unit at
+the quoted American price. CLV is in line points, positive when the pick
+beat the closing line. Unpriced picks default to -110.
+
+Jobs (POST /live/backtest) live in the worker that accepted them. The same
+files' graded props feed the parlay correlation estimates
+(engines/prop_correlation.py) through load_prop_history.
+
+Config (env):
+- BACKTEST_DATA_DIR  root of the historical files (default: backend/data/backtest)
+- BACKTEST_WORKERS   pool processes per job (default: CPU count, max 4; 1 = in-process)
+- BACKTEST_JOBS_KEPT finished jobs kept for GET /live/backtest (default 20)
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+BACKTEST_DATA_DIR = os.getenv(
+    "BACKTEST_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "backtest")
+)
+BACKTEST_WORKERS = int(os.getenv("BACKTEST_WORKERS", min(4, os.cpu_count() or 1)))
+BACKTEST_JOBS_KEPT = int(os.getenv("BACKTEST_JOBS_KEPT", "20"))
+
+ACTIONABLE = ("SMASH", "STRONG", "PLAY")
+DEFAULT_PRICE = -110
+# Shards per worker - smaller shards even out slow dates
+SHARDS_PER_WORKER = 4
+
+
+# ============================================================================
+# GRADING - pure helpers, run inside the workers
+# ============================================================================
+
+def profit(price: float, result: str) -> float:
+    """Units won on a 1-unit stake at an American price"""
+    if result == "W":
+        return price / 100 if price > 0 else 100 / -price
+    if result == "L":
+        return -1.0
+    return 0.0
+
+
+def grade_margin(margin: float) -> str:
+    return "W" if margin > 0 else "L" if margin < 0 else "P"
+
+
+def spread_outcome(game: Optional[dict], team: str) -> tuple:
+    """(point, price) for team's spread - the last bookmaker quoting it, like extract_game_lines"""
+    point = price = None
+    for bm in (game or {}).get("bookmakers", []):
+        for market in bm.get("markets", []):
+            if market.get("key") == "spreads":
+                for outcome in market.get("outcomes", []):
+                    if outcome.get("name") == team:
+                        point, price = outcome.get("point"), outcome.get("price")
+    return point, price
+
+
+def prop_line(odds: Optional[dict], market_key: str, player: str, side: str) -> Optional[float]:
+    """The first bookmaker's line for one player / market / side (scoring uses the first bookmaker)"""
+    for bm in (odds or {}).get("bookmakers", [])[:1]:
+        for market in bm.get("markets", []):
+            if market.get("key") != market_key:
+                continue
+            for outcome in market.get("outcomes", []):
+                if outcome.get("description") == player and outcome.get("name") == side:
+                    return outcome.get("point")
+    return None
+
+
+def grade_game(game: dict, main_result: dict) -> Optional[tuple]:
+    """-> (tier, recommendation, result, profit, clv) or None when ungradable"""
+    score = game.get("result")
+    home, away = game.get("home_team", ""), game.get("away_team", "")
+    pick_home = main_result["recommendation"] in ACTIONABLE
+    team, opponent = (home, away) if pick_home else (away, home)
+    point, price = spread_outcome(game, team)
+    if score is None or point is None:
+        return None
+
+    scores = {home: score["home_score"], away: score["away_score"]}
+    result = grade_margin(scores[team] + point - scores[opponent])
+    closing_point, _ = spread_outcome(game.get("closing"), team)
+    clv = point - closing_point if closing_point is not None else None
+    return (
+        main_result["tier"], main_result["recommendation"], result,
+        profit(price or DEFAULT_PRICE, result), clv
+    )
+
+
+def grade_prop(item: tuple, main_result: dict, results: dict, closing: Optional[dict]) -> Optional[tuple]:
+    outcome, market_key = item[0], item[1]
+    player, side, line = outcome.get("description"), outcome.get("name"), outcome.get("point")
+    actual = results.get(player, {}).get(market_key)
+    if actual is None or line is None:
+        return None
+
+    margin = actual - line if side == "Over" else line - actual
+    result = grade_margin(margin)
+    closing_point = prop_line(closing, market_key, player, side)
+    clv = None
+    if closing_point is not None:
+        clv = closing_point - line if side == "Over" else line - closing_point
+    return (
+        main_result["tier"], main_result["recommendation"], result,
+        profit(outcome.get("price") or DEFAULT_PRICE, result), clv
+    )
+
+
+# ============================================================================
+# WORKER SIDE
+# ============================================================================
+
+def slate_dates(data_dir: str, sport: str, start: str = None, end: str = None) -> list:
+    """Sorted YYYY-MM-DD dates with a slate file for sport, within [start, end]"""
+    sport_dir = os.path.join(data_dir, sport)
+    dates = []
+    for name in os.listdir(sport_dir):
+        stem, ext = os.path.splitext(name)
+        if ext != ".json":
+            continue
+        try:
+            date.fromisoformat(stem)
+        except ValueError:
+            continue
+        if (start is None or stem >= start) and (end is None or stem <= end):
+            dates.append(stem)
+    return sorted(dates)
+
+
+def backtest_shard(data_dir: str, sport: str, dates: list, include_props: bool = True) -> dict:
+    """
+    Score and grade every slate in dates -> {"rows": [(date, kind, tier,
+    recommendation, result, profit, clv), ...], "games", "props", "ungraded"}
+    """
+    from engines.scoring import collect_prop_outcomes, score_game, score_prop_outcome
+
+    rows = []
+    counts = {"games": 0, "props": 0, "ungraded": 0}
+    label = sport.upper()
+    for day in dates:
+        with open(os.path.join(data_dir, sport, f"{day}.json")) as f:
+            slate = json.load(f)
+        # Noon, so the esoteric date maths sees the slate's calendar day
+        game_date = datetime.combine(date.fromisoformat(day), datetime.min.time()).replace(hour=12)
+
+        for game in slate.get("games", []):
+            counts["games"] += 1
+            _, main_result, _ = score_game(game, label, game_date=game_date)
+            graded = grade_game(game, main_result)
+            if graded is None:
+                counts["ungraded"] += 1
+            else:
+                rows.append((day, "game", *graded))
+
+        if not include_props:
+            continue
+        for entry in slate.get("props", []):
+            event, results = entry.get("event", {}), entry.get("results", {})
+            for item in collect_prop_outcomes(event, entry.get("odds", {})):
+                counts["props"] += 1
+                outcome, market_key, home_team, away_team, commence_time, bookmaker_title = item
+                _, main_result = score_prop_outcome(
+                    outcome, market_key, home_team, away_team, label,
+                    commence_time=commence_time, bookmaker_title=bookmaker_title, game_date=game_date
+                )
+                graded = grade_prop(item, main_result, results, entry.get("closing"))
+                if graded is None:
+                    counts["ungraded"] += 1
+                else:
+                    rows.append((day, "prop", *graded))
+    return {"rows": rows, **counts}
+
+
+def prop_outcomes(entry: dict) -> list:
+    """
+    One historical props entry -> its graded Over lines as correlation
+    samples [{"event_id", "player", "team", "market", "hit": +1 | -1}, ...]
+    (pushes and players without a result left out)
+    """
+    from engines.prop_correlation import prop_market_key
+
+    event, results = entry.get("event", {}), entry.get("results", {})
+    outcomes = []
+    for bm in entry.get("odds", {}).get("bookmakers", [])[:1]:
+        for market in bm.get("markets", []):
+            for outcome in market.get("outcomes", []):
+                player, line = outcome.get("description"), outcome.get("point")
+                actual = results.get(player, {}).get(market.get("key"))
+                if outcome.get("name") != "Over" or actual is None or line is None or actual == line:
+                    continue
+                outcomes.append({
+                    "event_id": event.get("id"),
+                    "player": player,
+                    "team": results[player].get("team"),
+                    "market": prop_market_key(market.get("key")),
+                    "hit": 1 if actual > line else -1
+                })
+    return outcomes
+
+
+def load_prop_history(data_dir: str, sport: str) -> list:
+    """Every historical slate's graded props for sport, one outcome list per event"""
+    if not os.path.isdir(os.path.join(data_dir, sport)):
+        return []
+    events = []
+    for day in slate_dates(data_dir, sport):
+        with open(os.path.join(data_dir, sport, f"{day}.json")) as f:
+            slate = json.load(f)
+        for entry in slate.get("props", []):
+            outcomes = prop_outcomes(entry)
+            if outcomes:
+                events.append(outcomes)
+    return events
+
+
+# ============================================================================
+# AGGREGATION
+# ============================================================================
+
+def summarize_bets(rows: list) -> dict:
+    """Graded rows -> bets, W/L/P, hit rate, units, ROI and CLV"""
+    wins = sum(1 for row in rows if row[4] == "W")
+    losses = sum(1 for row in rows if row[4] == "L")
+    units = sum(row[5] for row in rows)
+    clvs = [row[6] for row in rows if row[6] is not None]
+    return {
+        "bets": len(rows),
+        "wins": wins,
+        "losses": losses,
+        "pushes": len(rows) - wins - losses,
+        "hit_rate": round(wins / (wins + losses), 4) if wins + losses else None,
+        "units": round(units, 2),
+        "roi": round(units / len(rows), 4) if rows else None,
+        "avg_clv": round(sum(clvs) / len(clvs), 3) if clvs else None,
+        "clv_positive_rate": round(sum(1 for clv in clvs if clv > 0) / len(clvs), 4) if clvs else None
+    }
+
+
+def aggregate(rows: list) -> dict:
+    by_tier = {}
+    by_kind = {}
+    for row in rows:
+        by_tier.setdefault(row[2], []).append(row)
+        by_kind.setdefault(row[1], []).append(row)
+    return {
+        "overall": summarize_bets(rows),
+        "actionable": summarize_bets([row for row in rows if row[3] in ACTIONABLE]),
+        "tiers": {tier: summarize_bets(tier_rows) for tier, tier_rows in sorted(by_tier.items())},
+        "kinds": {kind: summarize_bets(kind_rows) for kind, kind_rows in sorted(by_kind.items())}
+    }
+
+
+def shard_dates(dates: list, shards: int) -> list:
+    """Contiguous, evenly sized date shards"""
+    shards = max(1, min(shards, len(dates)))
+    size, extra = divmod(len(dates), shards)
+    out, start = [], 0
+    for i in range(shards):
+        end = start + size + (1 if i < extra else 0)
+        out.append(dates[start:end])
+        start = end
+    return out
+
+
+# ============================================================================
+# JOBS
+# ============================================================================
+
+class BacktestJob:
+    """One backtest run: progress while it shards through the dates, then the report"""
+
+    def __init__(self, sport: str, start: str = None, end: str = None, include_props: bool = True):
+        self.id = uuid.uuid4().hex[:12]
+        self.sport = sport
+        self.start = start
+        self.end = end
+        self.include_props = include_props
+        self.status = "queued"
+        self.created = datetime.now().isoformat()
+        self.dates = 0
+        self.shards_total = 0
+        self.shards_done = 0
+        self.elapsed_ms = None
+        self.error = None
+        self.report = None
+
+    def summary(self) -> dict:
+        return {
+            "job_id": self.id,
+            "sport": self.sport,
+            "start": self.start,
+            "end": self.end,
+            "include_props": self.include_props,
+            "status": self.status,
+            "created": self.created,
+            "dates": self.dates,
+            "progress": round(self.shards_done / self.shards_total, 3) if self.shards_total else 0.0,
+            "elapsed_ms": self.elapsed_ms,
+            "error": self.error
+        }
+
+
+async def run_backtest(job: BacktestJob, data_dir: str = None, workers: int = None) -> dict:
+    """Run job over its dates (sharded across a spawn pool when workers > 1) -> report"""
+    data_dir = data_dir or BACKTEST_DATA_DIR
+    workers = max(1, workers or BACKTEST_WORKERS)
+    job.status = "running"
+    started = time.perf_counter()
+    try:
+        dates = await asyncio.to_thread(slate_dates, data_dir, job.sport, job.start, job.end)
+        job.dates = len(dates)
+        shards = shard_dates(dates, workers * SHARDS_PER_WORKER if workers > 1 else 1) if dates else []
+        job.shards_total = len(shards)
+
+        results = []
+        # No dates in range: nothing to shard, and no pool to start
+        if workers == 1 or not shards:
+            for shard in shards:
+                results.append(await asyncio.to_thread(backtest_shard, data_dir, job.sport, shard, job.include_props))
+                job.shards_done += 1
+        else:
+            loop = asyncio.get_running_loop()
+            from scoring_executor import warm_scoring_worker
+            pool = ProcessPoolExecutor(
+                max_workers=min(workers, len(shards)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_scoring_worker
+            )
+            try:
+                futures = [
+                    loop.run_in_executor(pool, backtest_shard, data_dir, job.sport, shard, job.include_props)
+                    for shard in shards
+                ]
+                for future in asyncio.as_completed(futures):
+                    results.append(await future)
+                    job.shards_done += 1
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        rows = sorted((row for result in results for row in result["rows"]), key=lambda row: row[0])
+        job.report = {
+            **aggregate(rows),
+            "dates": {"count": len(dates), "first": dates[0] if dates else None, "last": dates[-1] if dates else None},
+            "scored": {
+                "games": sum(result["games"] for result in results),
+                "props": sum(result["props"] for result in results),
+                "ungraded": sum(result["ungraded"] for result in results)
+            },
+            "workers": workers
+        }
+        job.status = "done"
+    except Exception as e:
+        logger.exception("Backtest %s failed", job.id)
+        job.status = "failed"
+        job.error = str(e) or type(e).__name__
+    job.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    return job.report
+
+
+class BacktestJobs:
+    """Jobs by id; at most one running at a time, the last BACKTEST_JOBS_KEPT kept"""
+
+    def __init__(self, kept: int = None):
+        self.kept = kept or BACKTEST_JOBS_KEPT
+        self._jobs = OrderedDict()
+        self._tasks = {}
+
+    @property
+    def running(self) -> Optional[BacktestJob]:
+        return next((job for job in self._jobs.values() if job.status in ("queued", "running")), None)
+
+    def submit(self, job: BacktestJob, data_dir: str = None, workers: int = None) -> BacktestJob:
+        self._jobs[job.id] = job
+        while len(self._jobs) > self.kept:
+            oldest = next(iter(self._jobs))
+            if self._jobs[oldest].status in ("queued", "running"):
+                break
+            del self._jobs[oldest]
+        task = asyncio.create_task(run_backtest(job, data_dir, workers))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        return job
+
+    def get(self, job_id: str) -> Optional[BacktestJob]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> list:
+        return [job.summary() for job in reversed(self._jobs.values())]
+
+
+backtest_jobs = BacktestJobs()
@@ -0,0 +1 @@
+"""Micro-benchmarks for the scoring engines (see bench_engines)"""
@@ -0,0 +1,122 @@
+"""
+Backtest season - a synthetic season of slates, and a timed backtest over it
+
+Writes one slate file per day in the backtest layout (see backtest.py) from
+the mock Odds API generator: opening odds, a closing snapshot with the lines
+nudged, final scores and player results. Then runs the backtest with the
+requested worker count and prints the timing and the per-tier report.
+
+    python -m benchmarks.backtest_season --days 170 --workers 4
+
+Config (env):
+- BACKTEST_SEASON_DAYS   slate days generated (default 170, an NBA regular season)
+- BACKTEST_SEASON_GAMES  games per day (default 7)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from backtest import BacktestJob, run_backtest
+from benchmarks.mock_odds_api import build_slate, event_summary
+
+BACKTEST_SEASON_DAYS = int(os.getenv("BACKTEST_SEASON_DAYS", "170"))
+BACKTEST_SEASON_GAMES = int(os.getenv("BACKTEST_SEASON_GAMES", "7"))
+SEASON_START = date(2025, 10, 21)
+SPORT_KEYS = {
+    "nba": "basketball_nba", "nfl": "americanfootball_nfl", "mlb": "baseball_mlb",
+    "nhl": "icehockey_nhl", "ncaab": "basketball_ncaab"
+}
+SCORE_RANGES = {"nba": (95, 130), "nfl": (10, 38), "mlb": (1, 9), "nhl": (1, 6), "ncaab": (60, 90)}
+
+
+def _closing(odds: dict, rng: random.Random) -> dict:
+    """The same bookmakers with every line moved by -1 .. +1"""
+    closing = json.loads(json.dumps(odds))
+    for bm in closing.get("bookmakers", []):
+        for market in bm.get("markets", []):
+            move = rng.choice((-1, -0.5, 0, 0, 0.5, 1))
+            for outcome in market.get("outcomes", []):
+                if "point" in outcome:
+                    outcome["point"] = outcome["point"] + (-move if outcome["point"] < 0 else move)
+    return closing
+
+
+def build_day(sport: str, day: date, games: int, rng: random.Random) -> dict:
+    low, high = SCORE_RANGES.get(sport, (90, 120))
+    slate = build_slate(SPORT_KEYS.get(sport, "basketball_nba"), games, seed=f"{sport}:{day}")
+    out = {"games": [], "props": []}
+    for event in slate:
+        game = {**event_summary(event), "bookmakers": event["bookmakers"]}
+        out["games"].append({
+            **game,
+            "closing": _closing(game, rng),
+            "result": {"home_score": rng.randint(low, high), "away_score": rng.randint(low, high)}
+        })
+        odds = {**event_summary(event), "bookmakers": event["props"]}
+        results = {}
+        for market in event["props"][0]["markets"]:
+            for outcome in market["outcomes"]:
+                player_results = results.setdefault(outcome["description"], {})
+                if market["key"] not in player_results:
+                    player_results[market["key"]] = max(0, round(outcome["point"] + rng.gauss(0, 4)))
+        out["props"].append({"event": event_summary(event), "odds": odds, "closing": _closing(odds, rng), "results": results})
+    return out
+
+
+def write_season(data_dir: str, sport: str = "nba", days: int = None, games: int = None, seed: int = 41) -> list:
+    """Write days slate files under data_dir/sport -> the dates written"""
+    rng = random.Random(seed)
+    os.makedirs(os.path.join(data_dir, sport), exist_ok=True)
+    dates = []
+    for i in range(days or BACKTEST_SEASON_DAYS):
+        day = SEASON_START + timedelta(days=i)
+        with open(os.path.join(data_dir, sport, f"{day}.json"), "w") as f:
+            json.dump(build_day(sport, day, games or BACKTEST_SEASON_GAMES, rng), f)
+        dates.append(day.isoformat())
+    return dates
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.backtest_season", description=__doc__.split("\n")[1])
+    parser.add_argument("--sport", default="nba")
+    parser.add_argument("--days", type=int, default=BACKTEST_SEASON_DAYS)
+    parser.add_argument("--games", type=int, default=BACKTEST_SEASON_GAMES)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--no-props", action="store_true")
+    parser.add_argument("--data-dir", help="reuse / keep the generated season here (default: a temp dir)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or tmp
+        started = time.perf_counter()
+        if not os.path.isdir(os.path.join(data_dir, args.sport)):
+            write_season(data_dir, args.sport, args.days, args.games)
+        print(f"season ready in {time.perf_counter() - started:.1f}s ({data_dir})")
+
+        job = BacktestJob(args.sport, include_props=not args.no_props)
+        report = asyncio.run(run_backtest(job, data_dir, args.workers))
+        if report is None:
+            print(f"backtest failed: {job.error}")
+            return 1
+        print(
+            f"backtest: {report['dates']['count']} days, {report['scored']['games']} games, "
+            f"{report['scored']['props']} prop outcomes in {job.elapsed_ms / 1000:.2f}s "
+            f"({report['workers']} workers)"
+        )
+        print(f"{'tier':<22} {'bets':>6} {'hit':>7} {'roi':>8} {'clv':>7}")
+        for tier, stats in {**report["tiers"], "ACTIONABLE": report["actionable"], "ALL": report["overall"]}.items():
+            print(
+                f"{tier:<22} {stats['bets']:>6} {stats['hit_rate'] or 0:>7.3f} "
+                f"{stats['roi'] or 0:>8.3f} {stats['avg_clv'] or 0:>7.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
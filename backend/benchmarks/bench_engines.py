@@ -0,0 +1,357 @@
+"""
+Engine Benchmarks - per-call timings for every scoring engine function
+
+Inputs are drawn from the reference tables with a fixed seed and a fixed set
+of game dates, so two runs time exactly the same work. A benchmark "loop"
+calls its function once per input; loops run until BENCH_MIN_TIME seconds
+have passed, BENCH_REPEAT times over. Both the median and the best (min)
+per-call time are recorded; comparisons use the min, which is the least
+sensitive to a busy machine (as with timeit). Caches stay warm, as in a
+running scoring worker, except in the [cold] cases which clear them before
+every loop.
+
+Usage (from backend/):
+    python -m benchmarks.bench_engines run [--output FILE] [--only NAME ...]
+    python -m benchmarks.bench_engines compare [BASELINE] [--current FILE] [--threshold 0.15]
+
+`run` writes the results as JSON (default: the committed baseline,
+benchmarks/baselines/engines.json). `compare` runs the suite (or reads
+--current) and exits 1 when any benchmark's min is more than --threshold
+slower than the baseline. Timings are machine-specific - refresh the
+baseline on the box that runs the comparison.
+
+Config (env):
+- BENCH_SEED       input generator seed (default 1234)
+- BENCH_REPEAT     timed repeats per benchmark (default 5)
+- BENCH_MIN_TIME   seconds per repeat (default 0.2)
+- BENCH_THRESHOLD  compare regression threshold, as a fraction (default 0.15)
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from engines import tables
+from engines.confidence import calculate_main_confidence
+from engines.esoteric import calculate_standalone_esoteric
+from engines.gann import get_gann_physics_composite
+from engines.gematria import (
+    analyze_storyline, calculate_date_numerology, get_all_ciphers, get_cipher_values
+)
+from engines.noosphere import calculate_noosphere_velocity
+from engines.omni_glitch import calculate_vortex_math
+from engines.resonance import analyze_founders_echo, analyze_life_path_sync
+from engines.scalar_savant import calculate_biorhythm, get_planetary_aspects
+
+BENCH_SEED = int(os.getenv("BENCH_SEED", "1234"))
+BENCH_REPEAT = int(os.getenv("BENCH_REPEAT", "5"))
+BENCH_MIN_TIME = float(os.getenv("BENCH_MIN_TIME", "0.2"))
+BENCH_THRESHOLD = float(os.getenv("BENCH_THRESHOLD", "0.15"))
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "engines.json")
+
+# Inputs per benchmark loop
+CASES = 32
+
+# One evening game every 11 days across a season - never datetime.now()
+GAME_DATES = tuple(datetime(2025, 10, 21, 19, 30) + timedelta(days=11 * i) for i in range(16))
+
+SPREADS = (-10.5, -7.5, -6.5, -3.5, -3, -1.5, 1.5, 3, 3.5, 6.5, 7.5, 10.5)
+PLAYER_QUERIES = (
+    "{} stats", "{} injury update", "{} highlights", "is {} playing tonight",
+    "{} contract", "{} questionable", "{} points last game"
+)
+
+
+class Benchmark:
+    """One engine function and the fixed calls it is timed on"""
+
+    def __init__(self, name: str, fn: Callable, calls: list, setup: Optional[Callable] = None):
+        self.name = name
+        self.fn = fn
+        self.calls = calls
+        self.setup = setup
+
+    def loop(self):
+        if self.setup is not None:
+            self.setup()
+        fn = self.fn
+        for args, kwargs in self.calls:
+            fn(*args, **kwargs)
+
+
+def build_cases(seed: int = None) -> list:
+    """CASES matchups (teams, date, lines, player) from the reference tables"""
+    rng = random.Random(BENCH_SEED if seed is None else seed)
+    teams = sorted(tables.FRANCHISE_FOUNDING_DATES)
+    players = sorted(tables.STAR_PLAYER_BIRTHDATES)
+    cases = []
+    for _ in range(CASES):
+        home, away = rng.sample(teams, 2)
+        player = rng.choice(players)
+        cases.append({
+            "home": home,
+            "away": away,
+            "date": rng.choice(GAME_DATES),
+            "spread": rng.choice(SPREADS),
+            "total": round(rng.uniform(200, 240) * 2) / 2,
+            "player": player,
+            "birthdate": tables.STAR_PLAYER_BIRTHDATES[player],
+            "jersey": rng.randint(0, 99),
+            "prop_line": round(rng.uniform(4, 35) * 2) / 2,
+            "price": rng.choice((-130, -120, -115, -110, -105, 100, 105)),
+            "margin": rng.randint(-25, 25),
+            "ats": [rng.random() < 0.5 for _ in range(5)],
+            "wl": [rng.choice("WL") for _ in range(5)],
+            "volumes": (rng.uniform(20, 300), rng.uniform(20, 300), rng.uniform(20, 300)),
+            "has_news": rng.random() < 0.3,
+            "sentiment": rng.choice(("manic", "neutral", "negative")),
+            "queries": [q.format(player) for q in rng.sample(PLAYER_QUERIES, 3)],
+            "split": (rng.randint(20, 80), rng.randint(20, 80))
+        })
+    return cases
+
+
+def noosphere_kwargs(case: dict) -> dict:
+    team_volume, opponent_volume, player_volume = case["volumes"]
+    return {
+        "team_name": case["away"],
+        "opponent_name": case["home"],
+        "team_volume": team_volume,
+        "opponent_volume": opponent_volume,
+        "has_news": case["has_news"],
+        "is_underdog": case["spread"] < 0,
+        "spread": abs(case["spread"]),
+        "sentiment": case["sentiment"],
+        "player_name": case["player"],
+        "player_volume": player_volume,
+        "player_queries": case["queries"]
+    }
+
+
+def build_benchmarks(seed: int = None) -> list:
+    cases = build_cases(seed)
+
+    def calls(make):
+        return [make(case) for case in cases]
+
+    confidence_calls = []
+    for case in cases:
+        money_pct, ticket_pct = case["split"]
+        game_data = {
+            "home_team": case["home"],
+            "away_team": case["away"],
+            "spread": case["spread"],
+            "spread_odds": case["price"],
+            "total": case["total"],
+            "public_pct": ticket_pct,
+            "is_favorite": case["spread"] < 0,
+            "sport": "NBA"
+        }
+        context = {
+            "sharp_data": {"money_pct": money_pct, "ticket_pct": ticket_pct},
+            "noosphere_data": calculate_noosphere_velocity(**noosphere_kwargs(case))
+        }
+        confidence_calls.append(((game_data, context), {}))
+
+    names = [case["home"] for case in cases] + [case["player"] for case in cases]
+    return [
+        Benchmark("get_all_ciphers", get_all_ciphers, [((name,), {}) for name in names]),
+        Benchmark(
+            "get_all_ciphers[cold]", get_all_ciphers, [((name,), {}) for name in names],
+            setup=get_cipher_values.cache_clear
+        ),
+        Benchmark("calculate_date_numerology", calculate_date_numerology, calls(lambda c: ((c["date"],), {}))),
+        Benchmark("analyze_storyline", analyze_storyline, calls(lambda c: ((c["home"], c["away"]), {}))),
+        Benchmark("analyze_founders_echo", analyze_founders_echo, calls(lambda c: ((c["home"], c["date"]), {}))),
+        Benchmark("analyze_life_path_sync", analyze_life_path_sync, calls(lambda c: ((c["player"], c["date"]), {}))),
+        Benchmark("calculate_biorhythm", calculate_biorhythm, calls(lambda c: ((*c["birthdate"], c["date"]), {}))),
+        Benchmark("get_planetary_aspects", get_planetary_aspects, calls(lambda c: ((c["date"],), {}))),
+        Benchmark(
+            "calculate_vortex_math", calculate_vortex_math,
+            calls(lambda c: ((c["home"], c["away"], c["date"], c["spread"], c["total"]), {}))
+        ),
+        Benchmark(
+            "get_gann_physics_composite", get_gann_physics_composite,
+            calls(lambda c: ((c["home"], c["margin"], c["spread"], c["margin"] > 0, c["ats"], c["wl"]), {}))
+        ),
+        Benchmark(
+            "calculate_noosphere_velocity", calculate_noosphere_velocity,
+            calls(lambda c: ((), noosphere_kwargs(c)))
+        ),
+        Benchmark(
+            "calculate_standalone_esoteric", calculate_standalone_esoteric,
+            calls(lambda c: ((), {
+                "home_team": c["home"],
+                "away_team": c["away"],
+                "spread": c["spread"],
+                "total": c["total"],
+                "player_name": c["player"],
+                "jersey_number": c["jersey"],
+                "prop_line": c["prop_line"],
+                "game_date": c["date"]
+            }))
+        ),
+        Benchmark("calculate_main_confidence", calculate_main_confidence, confidence_calls)
+    ]
+
+
+def time_benchmark(bench: Benchmark, repeat: int = None, min_time: float = None) -> dict:
+    """Median and min microseconds per call over `repeat` runs of >= min_time seconds"""
+    repeat = repeat or BENCH_REPEAT
+    min_time = BENCH_MIN_TIME if min_time is None else min_time
+    bench.loop()  # warm-up: fills caches and lazy tables
+
+    per_call = []
+    total_loops = 0
+    for _ in range(repeat):
+        loops = 0
+        started = time.perf_counter()
+        while True:
+            bench.loop()
+            loops += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        total_loops += loops
+        per_call.append(elapsed / (loops * len(bench.calls)) * 1e6)
+
+    return {
+        "median_us": round(statistics.median(per_call), 3),
+        "min_us": round(min(per_call), 3),
+        "calls_per_loop": len(bench.calls),
+        "loops": total_loops
+    }
+
+
+def run_suite(only: list = None, repeat: int = None, min_time: float = None, seed: int = None) -> dict:
+    results = {}
+    for bench in build_benchmarks(seed):
+        if only and bench.name not in only:
+            continue
+        results[bench.name] = time_benchmark(bench, repeat, min_time)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "seed": BENCH_SEED if seed is None else seed,
+            "repeat": repeat or BENCH_REPEAT,
+            "min_time": BENCH_MIN_TIME if min_time is None else min_time,
+            "cases": CASES
+        },
+        "benchmarks": results
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = None) -> list:
+    """
+    Per-benchmark rows {name, baseline_us, current_us, change, status}, on min_us.
+    status: regression (slower than baseline by more than threshold),
+    improved (faster by more than threshold), ok, new, missing.
+    """
+    threshold = BENCH_THRESHOLD if threshold is None else threshold
+    before = baseline.get("benchmarks", {})
+    after = current.get("benchmarks", {})
+    rows = []
+    for name in list(before) + [n for n in after if n not in before]:
+        old = before.get(name, {}).get("min_us")
+        new = after.get(name, {}).get("min_us")
+        if old is None or new is None:
+            status = "new" if old is None else "missing"
+            rows.append({"name": name, "baseline_us": old, "current_us": new, "change": None, "status": status})
+            continue
+        change = (new - old) / old if old else 0.0
+        if change > threshold:
+            status = "regression"
+        elif change < -threshold:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({
+            "name": name, "baseline_us": old, "current_us": new, "change": round(change, 4), "status": status
+        })
+    return rows
+
+
+def format_results(results: dict) -> str:
+    lines = [f"{'benchmark':<32} {'median us':>12} {'min us':>12} {'loops':>7}"]
+    for name, r in results["benchmarks"].items():
+        lines.append(f"{name:<32} {r['median_us']:>12.3f} {r['min_us']:>12.3f} {r['loops']:>7}")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: list, threshold: float) -> str:
+    lines = [f"{'benchmark':<32} {'baseline us':>12} {'current us':>12} {'change':>9}  status (threshold {threshold:.0%})"]
+    for row in rows:
+        old = "-" if row["baseline_us"] is None else f"{row['baseline_us']:.3f}"
+        new = "-" if row["current_us"] is None else f"{row['current_us']:.3f}"
+        change = "-" if row["change"] is None else f"{row['change']:+.1%}"
+        lines.append(f"{row['name']:<32} {old:>12} {new:>12} {change:>9}  {row['status'].upper()}")
+    return "\n".join(lines)
+
+
+def load_results(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_results(results: dict, path: str):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_engines", description=__doc__.split("\n")[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = sub.add_parser("run", help="time the suite and write the results as JSON")
+    run_cmd.add_argument("--output", default=BASELINE_PATH, help="results file (default: the committed baseline)")
+
+    compare_cmd = sub.add_parser("compare", help="flag regressions against a baseline")
+    compare_cmd.add_argument("baseline", nargs="?", default=BASELINE_PATH)
+    compare_cmd.add_argument("--current", help="compare this results file instead of running the suite")
+    compare_cmd.add_argument("--threshold", type=float, default=BENCH_THRESHOLD, help="allowed slowdown (0.15 = 15%%)")
+
+    for cmd in (run_cmd, compare_cmd):
+        cmd.add_argument("--only", nargs="+", metavar="NAME", help="run just these benchmarks")
+        cmd.add_argument("--repeat", type=int, default=None)
+        cmd.add_argument("--min-time", type=float, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_suite(args.only, args.repeat, args.min_time)
+        print(format_results(results))
+        write_results(results, args.output)
+        print(f"\nwrote {args.output}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)
+    else:
+        current = run_suite(args.only, args.repeat, args.min_time, seed=baseline.get("meta", {}).get("seed"))
+    rows = compare_results(baseline, current, args.threshold)
+    if args.only:
+        rows = [row for row in rows if row["name"] in args.only]
+    print(format_comparison(rows, args.threshold))
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,393 @@
+"""
+Load Test - replay a realistic traffic mix against the app, end to end
+
+Starts the mock Odds API (benchmarks/mock_odds_api.py) on a local port,
+points ODDS_API_BASE at it and brings up main:app either in-process
+(httpx ASGI transport, app lifespan included) or as a real uvicorn server.
+Closed-loop workers then replay TRAFFIC_MIX - slates, esoteric-edge,
+today-energy and the catalog endpoints - at each concurrency level.
+
+Every level reports throughput, p50/p95/p99 latency and error rate per
+route (any status >= 400 or transport error counts as an error). The report
+is JSON with stable key order, so two releases can be compared with `diff`.
+
+Usage (from backend/):
+    python -m benchmarks.load_test run [--mode inprocess|uvicorn] [--concurrency 1,8,32]
+                                       [--duration 10] [--warmup 2] [--output load_report.json]
+    python -m benchmarks.load_test diff OLD.json NEW.json
+
+The app's own env applies (SCORING_EXECUTOR_MODE, SNAPSHOT_MAX_AGE, ...);
+SHARED_CACHE_PATH defaults to a fresh temp file per run so snapshots from
+another process never leak in. MOCK_LATENCY_MS / MOCK_JITTER_MS shape the
+mock upstream.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD_SEED = 36
+READY_TIMEOUT = 120.0
+
+SLATE_SPORTS = ("nba", "nfl", "mlb", "nhl")
+MATCHUPS = (
+    ("Los Angeles Lakers", "Boston Celtics"), ("Kansas City Chiefs", "Buffalo Bills"),
+    ("New York Yankees", "Boston Red Sox"), ("Toronto Maple Leafs", "Montreal Canadiens"),
+    ("Golden State Warriors", "Denver Nuggets"), ("Dallas Cowboys", "Philadelphia Eagles")
+)
+STAR_PLAYERS = ("LeBron James", "Stephen Curry", "Patrick Mahomes", "Connor McDavid", None)
+
+
+def slate_request(kind: str):
+    def build(rng: random.Random):
+        return "GET", f"/live/{kind}/{rng.choice(SLATE_SPORTS)}", None
+    return build
+
+
+def esoteric_edge_request(rng: random.Random):
+    home, away = rng.choice(MATCHUPS)
+    if rng.random() < 0.5:
+        home, away = away, home
+    body = {
+        "home_team": home,
+        "away_team": away,
+        "spread": rng.choice((-7.5, -3.5, -1.5, 2.5, 4.5, 9.5)),
+        "total": rng.choice((44.5, 8.5, 6, 221.5)),
+        "player_name": rng.choice(STAR_PLAYERS),
+        "jersey_number": rng.randint(0, 99),
+        "sport": "NBA"
+    }
+    return "POST", "/live/esoteric-edge", body
+
+
+def get_request(path: str):
+    def build(rng: random.Random):
+        return "GET", path, None
+    return build
+
+
+# (route label, weight, request builder) - weights are relative
+TRAFFIC_MIX = (
+    ("GET /live/props/{sport}", 25, slate_request("props")),
+    ("GET /live/best-bets/{sport}", 25, slate_request("best-bets")),
+    ("POST /live/esoteric-edge", 20, esoteric_edge_request),
+    ("GET /esoteric/today-energy", 5, get_request("/esoteric/today-energy")),
+    ("GET /live/today-energy", 5, get_request("/live/today-energy")),
+    ("GET /live/star-players", 4, get_request("/live/star-players")),
+    ("GET /live/franchise-dates", 4, get_request("/live/franchise-dates")),
+    ("GET /live/team-colors", 4, get_request("/live/team-colors")),
+    ("GET /live/star-tiers", 4, get_request("/live/star-tiers")),
+    ("GET /live/jarvis-triggers", 4, get_request("/live/jarvis-triggers"))
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def mock_upstream():
+    """Mock Odds API on a free local port -> its v4 base URL"""
+    import uvicorn
+    from benchmarks.mock_odds_api import create_app
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(create_app(), host="127.0.0.1", port=port, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.05)
+    try:
+        yield f"http://127.0.0.1:{port}/v4"
+    finally:
+        server.should_exit = True
+        await task
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = READY_TIMEOUT):
+    """Poll /ready until the startup warm-up has finished"""
+    give_up = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/ready")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        if time.monotonic() > give_up:
+            raise RuntimeError(f"app not ready after {timeout:.0f}s")
+        await asyncio.sleep(0.2)
+
+
+@asynccontextmanager
+async def inprocess_app(odds_api_base: str):
+    """main:app in this process, lifespan and all, driven over the ASGI transport"""
+    os.environ["ODDS_API_BASE"] = odds_api_base
+    import main
+    import live_data_router
+
+    # The router reads ODDS_API_BASE at import; cover an already-imported module
+    live_data_router.ODDS_API_BASE = odds_api_base
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60) as client:
+            await wait_ready(client)
+            yield client
+
+
+@asynccontextmanager
+async def uvicorn_app(odds_api_base: str, concurrency: int, workers: int = 1):
+    """main:app under a uvicorn subprocess, driven over real TCP connections"""
+    port = free_port()
+    env = {**os.environ, "ODDS_API_BASE": odds_api_base}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR, env=env
+    )
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=60, limits=limits) as client:
+            await wait_ready(client)
+            yield client
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def percentile(ordered: list, pct: float) -> float:
+    """Nearest-rank percentile of a sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct * len(ordered)))
+    return ordered[min(len(ordered), rank) - 1]
+
+
+def summarize(latencies: list, errors: int, seconds: float) -> dict:
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "throughput_rps": round(count / seconds, 2) if seconds else 0.0,
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50), 2),
+        "p95_ms": round(percentile(ordered, 0.95), 2),
+        "p99_ms": round(percentile(ordered, 0.99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+        "mean_ms": round(sum(ordered) / count, 2) if count else 0.0
+    }
+
+
+async def run_level(client: httpx.AsyncClient, concurrency: int, duration: float, warmup: float, seed: int) -> dict:
+    """Closed loop: `concurrency` workers each send their next request as soon as the last returns"""
+    labels = [label for label, _, _ in TRAFFIC_MIX]
+    weights = [weight for _, weight, _ in TRAFFIC_MIX]
+    builders = {label: build for label, _, build in TRAFFIC_MIX}
+    latencies = defaultdict(list)
+    errors = Counter()
+    statuses = defaultdict(Counter)
+
+    loop = asyncio.get_running_loop()
+    record_from = loop.time() + warmup
+    stop_at = record_from + duration
+
+    async def worker(index: int):
+        rng = random.Random(f"{seed}:{concurrency}:{index}")
+        while loop.time() < stop_at:
+            label = rng.choices(labels, weights)[0]
+            method, path, body = builders[label](rng)
+            started = time.perf_counter()
+            try:
+                resp = await client.request(method, path, json=body)
+                status = str(resp.status_code)
+                failed = resp.status_code >= 400
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+                failed = True
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if loop.time() >= record_from:
+                latencies[label].append(elapsed_ms)
+                statuses[label][status] += 1
+                if failed:
+                    errors[label] += 1
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    # Requests still in flight at stop_at finish (and count) late - measure the real window
+    seconds = max(loop.time() - record_from, 1e-9)
+
+    routes = {}
+    for label in labels:
+        if latencies[label]:
+            routes[label] = {
+                **summarize(latencies[label], errors[label], seconds),
+                "statuses": dict(sorted(statuses[label].items()))
+            }
+    everything = [ms for samples in latencies.values() for ms in samples]
+    return {
+        "concurrency": concurrency,
+        "seconds": round(seconds, 2),
+        "overall": summarize(everything, sum(errors.values()), seconds),
+        "routes": routes
+    }
+
+
+async def run_load_test(
+    mode: str = "inprocess",
+    concurrency_levels: tuple = (1, 8, 32),
+    duration: float = 10.0,
+    warmup: float = 2.0,
+    workers: int = 1,
+    seed: int = LOAD_SEED,
+    log=print
+) -> dict:
+    os.environ.setdefault("SHARED_CACHE_PATH", os.path.join(tempfile.mkdtemp(prefix="loadtest-"), "shared.sqlite3"))
+    levels = []
+    async with mock_upstream() as odds_api_base:
+        if mode == "uvicorn":
+            app = uvicorn_app(odds_api_base, max(concurrency_levels), workers)
+        else:
+            app = inprocess_app(odds_api_base)
+        async with app as client:
+            for concurrency in concurrency_levels:
+                level = await run_level(client, concurrency, duration, warmup, seed)
+                overall = level["overall"]
+                log(
+                    f"c={concurrency:<4} {overall['throughput_rps']:>8.1f} req/s  "
+                    f"p50 {overall['p50_ms']:.1f}ms  p95 {overall['p95_ms']:.1f}ms  "
+                    f"p99 {overall['p99_ms']:.1f}ms  errors {overall['error_rate']:.2%}"
+                )
+                levels.append(level)
+
+    from benchmarks import mock_odds_api
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "mode": mode,
+            "workers": workers if mode == "uvicorn" else 1,
+            "duration_s": duration,
+            "warmup_s": warmup,
+            "seed": seed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "mock_latency_ms": mock_odds_api.MOCK_LATENCY_MS,
+            "mock_jitter_ms": mock_odds_api.MOCK_JITTER_MS,
+            "scoring_executor_mode": os.getenv("SCORING_EXECUTOR_MODE", "process"),
+            "mix": {label: weight for label, weight, _ in TRAFFIC_MIX}
+        },
+        "levels": levels
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    for level in report["levels"]:
+        lines.append(f"\nconcurrency {level['concurrency']} ({level['seconds']}s)")
+        lines.append(f"  {'route':<32} {'req':>6} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'err':>7}")
+        for label, r in [*level["routes"].items(), ("overall", level["overall"])]:
+            lines.append(
+                f"  {label:<32} {r['requests']:>6} {r['throughput_rps']:>8.1f} {r['p50_ms']:>8.1f} "
+                f"{r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['error_rate']:>7.2%}"
+            )
+    return "\n".join(lines)
+
+
+def diff_reports(old: dict, new: dict) -> list:
+    """Rows {concurrency, route, metric, old, new, change} for throughput, p50/p95/p99 and error rate"""
+    rows = []
+    old_levels = {level["concurrency"]: level for level in old["levels"]}
+    for level in new["levels"]:
+        before = old_levels.get(level["concurrency"])
+        if before is None:
+            continue
+        routes = {**level["routes"], "overall": level["overall"]}
+        before_routes = {**before["routes"], "overall": before["overall"]}
+        for route, stats in routes.items():
+            prev = before_routes.get(route)
+            if prev is None:
+                continue
+            for metric in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms", "error_rate"):
+                a, b = prev[metric], stats[metric]
+                rows.append({
+                    "concurrency": level["concurrency"],
+                    "route": route,
+                    "metric": metric,
+                    "old": a,
+                    "new": b,
+                    "change": round((b - a) / a, 4) if a else None
+                })
+    return rows
+
+
+def format_diff(rows: list) -> str:
+    lines = [f"{'c':>4}  {'route':<32} {'metric':<15} {'old':>10} {'new':>10} {'change':>9}"]
+    for row in rows:
+        change = "-" if row["change"] is None else f"{row['change']:+.1%}"
+        lines.append(
+            f"{row['concurrency']:>4}  {row['route']:<32} {row['metric']:<15} "
+            f"{row['old']:>10} {row['new']:>10} {change:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test", description=__doc__.split("\n")[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = sub.add_parser("run", help="run the traffic mix and write a JSON report")
+    run_cmd.add_argument("--mode", choices=("inprocess", "uvicorn"), default="inprocess")
+    run_cmd.add_argument("--workers", type=int, default=1, help="uvicorn workers (uvicorn mode)")
+    run_cmd.add_argument("--concurrency", default="1,8,32", help="comma-separated concurrency levels")
+    run_cmd.add_argument("--duration", type=float, default=10.0, help="measured seconds per level")
+    run_cmd.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before each level")
+    run_cmd.add_argument("--seed", type=int, default=LOAD_SEED)
+    run_cmd.add_argument("--output", default="load_report.json")
+
+    diff_cmd = sub.add_parser("diff", help="compare two reports")
+    diff_cmd.add_argument("old")
+    diff_cmd.add_argument("new")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "diff":
+        with open(args.old, encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.new, encoding="utf-8") as f:
+            new = json.load(f)
+        print(format_diff(diff_reports(old, new)))
+        return 0
+
+    levels = tuple(int(c) for c in args.concurrency.split(",") if c.strip())
+    report = asyncio.run(run_load_test(args.mode, levels, args.duration, args.warmup, args.workers, args.seed))
+    print(format_report(report))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print(f"\nwrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
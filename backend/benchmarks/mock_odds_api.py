@@ -0,0 +1,221 @@
+"""
+Mock Odds API - the v4 endpoints the live router calls, served locally
+
+Slates are generated once per sport from a fixed seed (teams, spreads,
+totals, player props for star players), so every load-test run replays the
+same upstream data. Each response waits MOCK_LATENCY_MS +- MOCK_JITTER_MS
+to stand in for the real API's round trip, and carries the quota headers
+(x-requests-last / -used / -remaining) priced like the real API: one credit
+per market requested, events listings free, scores 2 with daysFrom. The
+slates are all upcoming, so scores lists every game as not completed.
+
+Run standalone (then start the app with ODDS_API_BASE=http://127.0.0.1:8911/v4):
+    python -m benchmarks.mock_odds_api --port 8911
+
+Config (env):
+- MOCK_LATENCY_MS  base response delay (default 40)
+- MOCK_JITTER_MS   +- uniform jitter on the delay (default 20)
+- MOCK_GAMES       games per sport (default 6)
+"""
+
+import argparse
+import asyncio
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+from fastapi import FastAPI, HTTPException, Response
+
+from engines import tables
+
+MOCK_LATENCY_MS = float(os.getenv("MOCK_LATENCY_MS", "40"))
+MOCK_JITTER_MS = float(os.getenv("MOCK_JITTER_MS", "20"))
+MOCK_GAMES = int(os.getenv("MOCK_GAMES", "6"))
+MOCK_SEED = 36
+MOCK_QUOTA = 20000
+
+SPORT_TEAMS = {
+    "basketball_nba": [
+        "Los Angeles Lakers", "Boston Celtics", "Golden State Warriors", "Miami Heat", "Denver Nuggets",
+        "Milwaukee Bucks", "Phoenix Suns", "Dallas Mavericks", "Chicago Bulls", "New York Knicks",
+        "Philadelphia 76ers", "Utah Jazz"
+    ],
+    "americanfootball_nfl": [
+        "Kansas City Chiefs", "Buffalo Bills", "Philadelphia Eagles", "San Francisco 49ers",
+        "Dallas Cowboys", "Baltimore Ravens", "Green Bay Packers", "Detroit Lions", "Miami Dolphins",
+        "Cincinnati Bengals", "New York Jets", "Denver Broncos"
+    ],
+    "baseball_mlb": [
+        "New York Yankees", "Los Angeles Dodgers", "Boston Red Sox", "Chicago Cubs", "Atlanta Braves",
+        "Houston Astros", "San Francisco Giants", "St. Louis Cardinals", "New York Mets",
+        "Philadelphia Phillies", "Seattle Mariners", "Texas Rangers"
+    ],
+    "icehockey_nhl": [
+        "Boston Bruins", "Toronto Maple Leafs", "Montreal Canadiens", "New York Rangers",
+        "Chicago Blackhawks", "Detroit Red Wings", "Edmonton Oilers", "Colorado Avalanche",
+        "Vegas Golden Knights", "Tampa Bay Lightning", "Florida Panthers", "Dallas Stars"
+    ],
+    "basketball_ncaab": [
+        "Duke Blue Devils", "North Carolina Tar Heels", "Kentucky Wildcats", "Kansas Jayhawks",
+        "Gonzaga Bulldogs", "UConn Huskies", "Villanova Wildcats", "Michigan State Spartans"
+    ]
+}
+
+BOOKMAKERS = (("draftkings", "DraftKings"), ("fanduel", "FanDuel"), ("betmgm", "BetMGM"), ("caesars", "Caesars"))
+PROP_MARKETS = ("player_points", "player_rebounds", "player_assists", "player_threes")
+PROP_RANGES = {"player_points": (12, 32), "player_rebounds": (3, 13), "player_assists": (2, 11), "player_threes": (1, 5)}
+TOTAL_RANGES = {
+    "basketball_nba": (205, 240), "americanfootball_nfl": (37, 54), "baseball_mlb": (6.5, 10.5),
+    "icehockey_nhl": (5.5, 6.5), "basketball_ncaab": (130, 160)
+}
+
+
+def _half(value: float) -> float:
+    return round(value * 2) / 2
+
+
+def moneylines(home: str, away: str, spread: float) -> list:
+    """h2h outcomes implied by the home spread (~3% win probability a point, 4.5% vig) - no rng draw"""
+    home_prob = min(0.9, max(0.1, 0.5 - 0.03 * spread))
+
+    def american(prob: float) -> int:
+        prob *= 1.045
+        prob = min(prob, 0.95)
+        return round(-100 * prob / (1 - prob)) if prob >= 0.5 else round(100 * (1 - prob) / prob)
+
+    return [{"name": home, "price": american(home_prob)}, {"name": away, "price": american(1 - home_prob)}]
+
+
+def build_slate(sport_key: str, games: int = None, seed: int = MOCK_SEED) -> list:
+    """Events with spreads/totals/h2h per bookmaker plus a props payload per event"""
+    rng = random.Random(f"{seed}:{sport_key}")
+    teams = list(SPORT_TEAMS.get(sport_key, SPORT_TEAMS["basketball_nba"]))
+    rng.shuffle(teams)
+    players = sorted(tables.STAR_PLAYER_BIRTHDATES)
+    low, high = TOTAL_RANGES.get(sport_key, (200, 240))
+    kickoff = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(hours=6)
+
+    slate = []
+    for i in range(min(games or MOCK_GAMES, len(teams) // 2)):
+        home, away = teams[2 * i], teams[2 * i + 1]
+        spread = _half(rng.uniform(-12, 12))
+        total = _half(rng.uniform(low, high))
+        bookmakers = []
+        for key, title in BOOKMAKERS:
+            shade = rng.choice((-0.5, 0, 0, 0.5))
+            bookmakers.append({
+                "key": key,
+                "title": title,
+                "last_update": kickoff.isoformat().replace("+00:00", "Z"),
+                "markets": [
+                    {"key": "spreads", "outcomes": [
+                        {"name": home, "point": spread + shade, "price": rng.choice((-115, -110, -105))},
+                        {"name": away, "point": -(spread + shade), "price": rng.choice((-115, -110, -105))}
+                    ]},
+                    {"key": "totals", "outcomes": [
+                        {"name": "Over", "point": total + shade, "price": rng.choice((-115, -110, -105))},
+                        {"name": "Under", "point": total + shade, "price": rng.choice((-115, -110, -105))}
+                    ]},
+                    {"key": "h2h", "outcomes": moneylines(home, away, spread + shade)}
+                ]
+            })
+
+        prop_markets = []
+        for market in PROP_MARKETS:
+            outcomes = []
+            for player in rng.sample(players, 3):
+                line = _half(rng.uniform(*PROP_RANGES[market])) or 0.5
+                outcomes.append({"name": "Over", "description": player, "point": line, "price": rng.choice((-125, -115, -110, 100))})
+                outcomes.append({"name": "Under", "description": player, "point": line, "price": rng.choice((-125, -115, -110, 100))})
+            prop_markets.append({"key": market, "outcomes": outcomes})
+
+        slate.append({
+            "id": f"mock-{sport_key}-{i}",
+            "sport_key": sport_key,
+            "commence_time": (kickoff + timedelta(hours=i)).isoformat().replace("+00:00", "Z"),
+            "home_team": home,
+            "away_team": away,
+            "bookmakers": bookmakers,
+            "props": [{"key": BOOKMAKERS[0][0], "title": BOOKMAKERS[0][1], "markets": prop_markets}]
+        })
+    return slate
+
+
+def event_summary(event: dict) -> dict:
+    return {k: v for k, v in event.items() if k not in ("bookmakers", "props")}
+
+
+def create_app(latency_ms: float = None, jitter_ms: float = None, games: int = None) -> FastAPI:
+    latency = (MOCK_LATENCY_MS if latency_ms is None else latency_ms) / 1000
+    jitter = (MOCK_JITTER_MS if jitter_ms is None else jitter_ms) / 1000
+    rng = random.Random(MOCK_SEED)
+    slates = {}
+    stats = {"requests": 0, "quota_used": 0}
+
+    app = FastAPI(title="Mock Odds API")
+
+    def slate_for(sport_key: str) -> list:
+        if sport_key not in slates:
+            slates[sport_key] = build_slate(sport_key, games)
+        return slates[sport_key]
+
+    async def respond(response: Response, markets: str = "", cost: int = None):
+        stats["requests"] += 1
+        if cost is None:
+            cost = len([m for m in markets.split(",") if m])
+        stats["quota_used"] += cost
+        response.headers["x-requests-last"] = str(cost)
+        response.headers["x-requests-used"] = str(stats["quota_used"])
+        response.headers["x-requests-remaining"] = str(max(0, MOCK_QUOTA - stats["quota_used"]))
+        delay = latency + rng.uniform(-jitter, jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @app.get("/v4/sports/{sport_key}/events")
+    async def events(sport_key: str, response: Response):
+        await respond(response)
+        return [event_summary(event) for event in slate_for(sport_key)]
+
+    @app.get("/v4/sports/{sport_key}/events/{event_id}/odds")
+    async def event_odds(sport_key: str, event_id: str, response: Response, markets: str = ""):
+        await respond(response, markets)
+        for event in slate_for(sport_key):
+            if event["id"] == event_id:
+                return {**event_summary(event), "bookmakers": event["props"]}
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    @app.get("/v4/sports/{sport_key}/odds")
+    async def odds(sport_key: str, response: Response, markets: str = ""):
+        await respond(response, markets)
+        wanted = set(markets.split(","))
+        return [
+            {**event_summary(event), "bookmakers": [
+                {**book, "markets": [market for market in book["markets"] if market["key"] in wanted]}
+                for book in event["bookmakers"]
+            ]}
+            for event in slate_for(sport_key)
+        ]
+
+    @app.get("/v4/sports/{sport_key}/scores")
+    async def scores(sport_key: str, response: Response, daysFrom: int = None):
+        await respond(response, cost=2 if daysFrom else 1)
+        return [
+            {**event_summary(event), "completed": False, "scores": None, "last_update": None}
+            for event in slate_for(sport_key)
+        ]
+
+    @app.get("/stats")
+    async def mock_stats():
+        return stats
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.mock_odds_api", description="Mock Odds API v4")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8911)
+    args = parser.parse_args()
+    uvicorn.run(create_app(), host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,125 @@
+"""
+Circuit Breaker - stop hammering an upstream path that is failing
+
+One breaker per upstream path (e.g. "odds:basketball_nba"):
+- CLOSED     calls flow; CIRCUIT_FAILURE_THRESHOLD consecutive failures -> OPEN
+- OPEN       calls rejected instantly for CIRCUIT_RESET_TIMEOUT seconds
+- HALF_OPEN  one probe call is let through; success -> CLOSED, failure -> OPEN
+
+Callers fall back to the last good snapshot while a circuit is open.
+
+Config (env):
+- CIRCUIT_FAILURE_THRESHOLD  consecutive failures before opening (default 3)
+- CIRCUIT_RESET_TIMEOUT      seconds open before a half-open probe (default 30)
+"""
+
+import os
+import time
+from typing import Optional
+
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open probe"""
+
+    def __init__(self, name: str, failure_threshold: int = None, reset_timeout: float = None):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold or CIRCUIT_FAILURE_THRESHOLD)
+        self.reset_timeout = reset_timeout or CIRCUIT_RESET_TIMEOUT
+        self._state = CLOSED
+        self._opened_at = None
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.total_rejections = 0
+        self.last_failure = None
+        self.last_error = None
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.time() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def is_open(self) -> bool:
+        """True while calls would be rejected (open, or half-open with the probe out)"""
+        state = self.state
+        return state == OPEN or (state == HALF_OPEN and self._probe_in_flight)
+
+    def allow(self) -> bool:
+        """Whether a call may go out now. In half-open, only the first caller probes."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.total_rejections += 1
+        return False
+
+    def record_success(self):
+        self._state = CLOSED
+        self._probe_in_flight = False
+        self.consecutive_failures = 0
+
+    def record_failure(self, error: str = None):
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        self.last_failure = time.time()
+        self.last_error = error
+        if self._state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._state = OPEN
+            self._opened_at = time.time()
+        self._probe_in_flight = False
+
+    def release(self):
+        """Call abandoned without an outcome (e.g. cancelled) - let another probe through"""
+        self._probe_in_flight = False
+
+    def stats(self) -> dict:
+        state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "total_rejections": self.total_rejections,
+            "last_failure": self.last_failure,
+            "last_error": self.last_error,
+            "retry_in_seconds": (
+                round(max(0.0, self.reset_timeout - (time.time() - self._opened_at)), 1)
+                if state == OPEN else None
+            )
+        }
+
+
+class CircuitBreakerRegistry:
+    """Breakers created on first use, keyed by upstream path"""
+
+    def __init__(self):
+        self._breakers = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name)
+        return breaker
+
+    def peek(self, name: str) -> Optional[CircuitBreaker]:
+        return self._breakers.get(name)
+
+    def is_open(self, name: str) -> bool:
+        breaker = self._breakers.get(name)
+        return breaker is not None and breaker.is_open()
+
+    def stats(self) -> dict:
+        return {name: breaker.stats() for name, breaker in sorted(self._breakers.items())}
+
+
+upstream_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,506 @@
+"""
+CLV Tracker - recommended picks, their closing lines and closing line value
+
+clvTracker.js keeps picks in the browser's localStorage, so CLV is per
+device and gone when storage is cleared. This tracker keeps them server-side:
+POST /live/bets/track records the pick's line and price at recommendation
+time (taken from the current games snapshot when the client does not send
+them), and every snapshot refresh captures closing lines for the sport:
+- picks whose game starts within CLV_CLOSE_LEAD take the snapshot's
+  consensus line and price on their side as the provisional close
+- once the game has started, the last pre-game close is final and the pick's
+  CLV is computed (a pick that never saw a pre-game snapshot closes without one)
+The props snapshot scores only its first few events, so a props refresh also
+fetches the later events that have open prop picks inside the close lead,
+for their closes.
+
+CLV is positive when the pick beat the close, in the pick's own terms:
+- spreads: points gained on the side's own point (HOME -3 closing -4: +1)
+- totals and props: points gained on the line (OVER 210 closing 212: +2)
+- moneylines: implied probability gained, in percent
+clv_cents converts it to cents of juice (6 per point, 2 per percent), as
+clvTracker.js does.
+
+Picks live in tables in the shared cache file and every read is a query:
+the ledger only grows, so nothing is mirrored in memory. Summaries per
+tier, sport and signal are one GROUP BY each over indexed columns (signals
+have their own table, one row per pick and signal).
+
+Config (env):
+- CLV_CLOSE_LEAD     seconds before commence a snapshot line counts as the close (default 3600)
+- CLV_TRACKER_PATH   SQLite file (default: SHARED_CACHE_PATH)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from statistics import median
+from typing import Iterable, Optional
+
+from engines.market_scan import american_to_decimal, decimal_to_american, flatten_quotes, prop_market
+from noosphere_stream import parse_timestamp
+from shared_cache import SHARED_CACHE_PATH
+
+CLV_CLOSE_LEAD = float(os.getenv("CLV_CLOSE_LEAD", "3600"))
+CLV_TRACKER_PATH = os.getenv("CLV_TRACKER_PATH", SHARED_CACHE_PATH)
+
+# Client bet_type -> Odds API market key; anything else with a player is a prop
+BET_TYPES = {
+    "spread": "spreads", "spreads": "spreads",
+    "total": "totals", "totals": "totals",
+    "moneyline": "h2h", "h2h": "h2h", "ml": "h2h"
+}
+MARKET_BET_TYPES = {"spreads": "spread", "totals": "total", "h2h": "moneyline"}
+SIDES = {"spreads": ("HOME", "AWAY"), "h2h": ("HOME", "AWAY"), "totals": ("OVER", "UNDER")}
+PROP_SIDES = ("OVER", "UNDER")
+OUTCOMES = ("WIN", "LOSS", "PUSH")
+GROUPS = ("tier", "sport", "signal")
+# Cents of juice per point (spreads, totals, props) / per percent of implied probability
+CENTS_PER_POINT = 6
+CENTS_PER_PERCENT = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracked_picks (
+    bet_id TEXT PRIMARY KEY,
+    user_id TEXT,
+    sport TEXT NOT NULL,
+    event_id TEXT,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    commence_ts REAL NOT NULL,
+    bet_type TEXT NOT NULL,
+    market TEXT NOT NULL,
+    player TEXT,
+    side TEXT NOT NULL,
+    line REAL,
+    odds REAL NOT NULL,
+    book TEXT,
+    stake REAL,
+    tier TEXT,
+    confidence REAL,
+    signals TEXT NOT NULL,
+    tracked_at REAL NOT NULL,
+    closing_line REAL,
+    closing_odds REAL,
+    closing_books INTEGER,
+    closed_at REAL,
+    clv REAL,
+    clv_cents REAL,
+    outcome TEXT,
+    graded_at REAL
+);
+CREATE INDEX IF NOT EXISTS tracked_picks_open ON tracked_picks (sport, commence_ts) WHERE closed_at IS NULL;
+CREATE INDEX IF NOT EXISTS tracked_picks_sport ON tracked_picks (sport, tracked_at);
+CREATE INDEX IF NOT EXISTS tracked_picks_tier ON tracked_picks (tier);
+CREATE INDEX IF NOT EXISTS tracked_picks_user ON tracked_picks (user_id, tracked_at);
+CREATE TABLE IF NOT EXISTS tracked_pick_signals (
+    signal TEXT NOT NULL,
+    bet_id TEXT NOT NULL,
+    PRIMARY KEY (signal, bet_id)
+);
+"""
+
+COLUMNS = (
+    "bet_id", "user_id", "sport", "event_id", "home_team", "away_team", "commence_ts",
+    "bet_type", "market", "player", "side", "line", "odds", "book", "stake", "tier",
+    "confidence", "signals", "tracked_at", "closing_line", "closing_odds", "closing_books",
+    "closed_at", "clv", "clv_cents", "outcome", "graded_at"
+)
+
+SUMMARY_COLUMNS = """
+    COUNT(*),
+    SUM(p.clv IS NOT NULL),
+    AVG(p.clv),
+    AVG(p.clv_cents),
+    SUM(p.clv > 0),
+    SUM(p.outcome = 'WIN'),
+    SUM(p.outcome = 'LOSS'),
+    SUM(p.outcome = 'PUSH')
+"""
+
+
+class DuplicatePickError(ValueError):
+    """Raised by track for a bet_id that is already tracked"""
+
+
+def optional_number(raw: dict, key: str) -> Optional[float]:
+    value = raw.get(key)
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} must be a number")
+
+
+def signal_names(signals) -> list:
+    """Client signals (names, or objects with a name / signal key) -> unique names"""
+    names = []
+    for signal in signals or []:
+        if isinstance(signal, dict):
+            signal = signal.get("name") or signal.get("signal") or signal.get("key")
+        if signal and str(signal) not in names:
+            names.append(str(signal))
+    return names
+
+
+def implied_probability(odds: float) -> float:
+    return 1 / american_to_decimal(odds)
+
+
+def pick_clv(market: str, side: str, line, odds, closing_line, closing_odds) -> tuple:
+    """-> (clv, clv_cents), (None, None) when the close is missing"""
+    if market == "h2h":
+        if closing_odds is None:
+            return None, None
+        clv = (implied_probability(closing_odds) - implied_probability(odds)) * 100
+        return round(clv, 4), round(clv * CENTS_PER_PERCENT, 4)
+    if closing_line is None or line is None:
+        return None, None
+    if market == "spreads" or side == "UNDER":
+        clv = line - closing_line
+    else:
+        clv = closing_line - line
+    return round(clv, 4), round(clv * CENTS_PER_POINT, 4)
+
+
+def parse_pick(raw: dict, quotes: dict = None) -> dict:
+    """
+    A client pick (clvTracker.js recordPick fields, the game flat or under
+    "game") -> a tracked_picks row. Missing line / odds come from quotes
+    (see game_closing_quotes) when the game is in them. ValueError if it is
+    not usable.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("pick must be an object")
+    game = raw.get("game") if isinstance(raw.get("game"), dict) else {}
+    bet_id = raw.get("id")
+    raw = {**game, **raw}
+    sport = str(raw.get("sport") or "").lower()
+    if not sport:
+        raise ValueError("sport required")
+    for key in ("home_team", "away_team"):
+        if not raw.get(key):
+            raise ValueError(f"{key} required")
+    if raw.get("commence_time") is None:
+        raise ValueError("commence_time required")
+    try:
+        commence_ts = parse_timestamp(raw["commence_time"])
+    except ValueError:
+        raise ValueError("commence_time must be unix seconds or ISO 8601")
+
+    bet_type = str(raw.get("bet_type") or "").lower()
+    player = raw.get("player") or None
+    if player:
+        market, bet_type = prop_market(raw.get("market") or bet_type), "prop"
+        sides = PROP_SIDES
+        if not market:
+            raise ValueError("prop market (bet_type) required")
+    elif bet_type in BET_TYPES:
+        market = BET_TYPES[bet_type]
+        bet_type = MARKET_BET_TYPES[market]
+        sides = SIDES[market]
+    else:
+        raise ValueError("bet_type must be one of spread, total, moneyline (or a prop with a player)")
+
+    side = str(raw.get("side") or "")
+    side = {raw["home_team"]: "HOME", raw["away_team"]: "AWAY"}.get(side, side.upper())
+    if side not in sides:
+        raise ValueError(f"side must be one of {', '.join(sides)}")
+
+    event_id = raw.get("event_id") or raw.get("game_id") or game.get("id")
+    event_id = str(event_id) if event_id else None
+    line, odds = optional_number(raw, "line"), optional_number(raw, "odds")
+    quote = (quotes or {}).get((event_id, market, player, side))
+    if quote:
+        line = quote["line"] if line is None else line
+        odds = quote["odds"] if odds is None else odds
+    if market != "h2h" and line is None:
+        raise ValueError("line required (the game has no current line for this side)")
+    if odds is None:
+        if market == "h2h":
+            raise ValueError("odds required (the game has no current moneyline for this side)")
+        odds = -110.0
+    if -100 < odds < 100:
+        raise ValueError("odds must be American odds (<= -100 or >= 100)")
+
+    return {
+        "bet_id": str(bet_id or uuid.uuid4().hex),
+        "user_id": str(raw["user_id"]) if raw.get("user_id") else None,
+        "sport": sport,
+        "event_id": event_id,
+        "home_team": str(raw["home_team"]),
+        "away_team": str(raw["away_team"]),
+        "commence_ts": commence_ts,
+        "bet_type": bet_type,
+        "market": market,
+        "player": str(player) if player else None,
+        "side": side,
+        "line": None if market == "h2h" else line,
+        "odds": odds,
+        "book": raw.get("book") or raw.get("bookmaker"),
+        "stake": optional_number(raw, "stake"),
+        "tier": raw.get("tier") or None,
+        "confidence": optional_number(raw, "confidence"),
+        "signals": signal_names(raw.get("signals")),
+        "tracked_at": time.time()
+    }
+
+
+def consensus(quotes: list) -> dict:
+    """[(book, point, decimal), ...] -> the median line and price across books"""
+    books = {}
+    for book, point, decimal in quotes:
+        books.setdefault(book, (point, decimal))
+    points = [point for point, _ in books.values() if point is not None]
+    return {
+        "line": median(points) if points else None,
+        "odds": decimal_to_american(median(decimal for _, decimal in books.values())),
+        "books": len(books)
+    }
+
+
+def game_closing_quotes(games: Iterable[dict]) -> dict:
+    """Odds API games -> (event_id, market, None, side) -> consensus line / odds on that side"""
+    table = flatten_quotes(games)
+    grouped = {}
+    for row in range(len(table)):
+        event_id = table.events[table.event[row]]["event_id"]
+        if not event_id:
+            continue
+        side = SIDES[table.market[row]][table.side[row]]
+        grouped.setdefault((event_id, table.market[row], None, side), []).append(
+            (table.book[row], table.point[row], table.decimal[row])
+        )
+    return {key: consensus(quotes) for key, quotes in grouped.items()}
+
+
+def prop_closing_quotes(events: list, scored: Iterable) -> dict:
+    """A props snapshot's events and [event_index, prop_row, main_result] entries -> closing quote keys"""
+    grouped = {}
+    for idx, prop_row, _ in scored:
+        event_id = events[idx].get("id") if idx < len(events) else None
+        side = str(prop_row.get("bet_type", "")).upper()
+        if not event_id or side not in PROP_SIDES or prop_row.get("line") is None:
+            continue
+        key = (event_id, prop_market(prop_row.get("prop_type", "")), prop_row.get("player"), side)
+        grouped.setdefault(key, []).append(
+            (prop_row.get("bookmaker"), prop_row["line"], american_to_decimal(prop_row.get("price", -110)))
+        )
+    return {key: consensus(quotes) for key, quotes in grouped.items()}
+
+
+def event_prop_quotes(event_props: Iterable[tuple]) -> dict:
+    """
+    [(event, Odds API event odds), ...] fetched only for their closes (not
+    scored) -> closing quote keys, across every book quoting them
+    """
+    grouped = {}
+    for event, props_data in event_props:
+        for bookmaker in props_data.get("bookmakers", []):
+            for market in bookmaker.get("markets", []):
+                for outcome in market.get("outcomes", []):
+                    side = str(outcome.get("name", "")).upper()
+                    if side not in PROP_SIDES or outcome.get("point") is None:
+                        continue
+                    key = (event.get("id"), prop_market(market.get("key", "")), outcome.get("description"), side)
+                    grouped.setdefault(key, []).append(
+                        (bookmaker.get("title"), outcome["point"], american_to_decimal(outcome.get("price", -110)))
+                    )
+    return {key: consensus(quotes) for key, quotes in grouped.items()}
+
+
+def pick_filters(user_id: str = None, sport: str = None, since: float = None) -> tuple:
+    """-> (WHERE clause on tracked_picks p, params)"""
+    clauses, params = [], []
+    for clause, value in (("p.user_id = ?", user_id), ("p.sport = ?", sport), ("p.tracked_at >= ?", since)):
+        if value is not None:
+            clauses.append(clause)
+            params.append(value)
+    return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), tuple(params)
+
+
+def summarize(row: tuple) -> dict:
+    picks, closed, avg_clv, avg_cents, positive, wins, losses, pushes = (value or 0 for value in row)
+    return {
+        "picks": picks,
+        "closed": closed,
+        "avg_clv": round(avg_clv, 3),
+        "avg_clv_cents": round(avg_cents, 2),
+        "positive_clv_rate": round(positive / closed * 100, 1) if closed else 0.0,
+        "wins": wins,
+        "losses": losses,
+        "pushes": pushes,
+        "win_rate": round(wins / (wins + losses) * 100, 1) if wins + losses else 0.0
+    }
+
+
+class CLVTracker:
+    """Tracked picks, their closing lines and CLV, shared through SQLite"""
+
+    def __init__(self, path: str = None, close_lead: float = None):
+        self.path = path or CLV_TRACKER_PATH
+        self.close_lead = CLV_CLOSE_LEAD if close_lead is None else close_lead
+        self._local = threading.local()
+        self.captured = 0
+        self.closed = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def track(self, raw: dict, quotes: dict = None) -> dict:
+        """
+        Record a pick (blocking; run in a thread) -> the stored pick. ValueError
+        if it is not usable, DuplicatePickError if its bet_id is already tracked.
+        """
+        pick = parse_pick(raw, quotes)
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM tracked_picks WHERE bet_id = ?", (pick["bet_id"],)).fetchone():
+                raise DuplicatePickError(f"pick {pick['bet_id']} is already tracked")
+            row = {**pick, "signals": json.dumps(pick["signals"])}
+            conn.execute(
+                f"INSERT INTO tracked_picks ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})",
+                tuple(row.values())
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO tracked_pick_signals (signal, bet_id) VALUES (?, ?)",
+                [(signal, pick["bet_id"]) for signal in pick["signals"]]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return self.get(pick["bet_id"])
+
+    def closing_events(self, sport: str, kind: str, now: float = None) -> list:
+        """Event ids of the sport's open game ("games") or prop ("props") picks starting within the close lead"""
+        now = time.time() if now is None else now
+        props = "IS NOT NULL" if kind == "props" else "IS NULL"
+        rows = self._conn().execute(
+            "SELECT DISTINCT event_id FROM tracked_picks WHERE closed_at IS NULL AND sport = ? "
+            f"AND commence_ts > ? AND commence_ts <= ? AND player {props} AND event_id IS NOT NULL",
+            (sport, now, now + self.close_lead)
+        ).fetchall()
+        return sorted(event_id for event_id, in rows)
+
+    def capture(self, sport: str, kind: str, quotes: dict, now: float = None) -> dict:
+        """
+        Snapshot refresh hook (blocking; run in a thread): open picks of the
+        sport's games ("games") or props ("props") starting within the close
+        lead take their side's quote as the close; started ones are closed
+        and their CLV computed -> counts.
+        """
+        now = time.time() if now is None else now
+        props = "IS NOT NULL" if kind == "props" else "IS NULL"
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT bet_id, event_id, market, player, side, line, odds, commence_ts, closing_line, closing_odds "
+                f"FROM tracked_picks WHERE closed_at IS NULL AND sport = ? AND commence_ts <= ? AND player {props}",
+                (sport, now + self.close_lead)
+            ).fetchall()
+            captured, closed = [], []
+            for bet_id, event_id, market, player, side, line, odds, commence_ts, closing_line, closing_odds in rows:
+                if commence_ts > now:
+                    quote = quotes.get((event_id, market, player, side))
+                    if quote and (quote["line"], quote["odds"]) != (closing_line, closing_odds):
+                        captured.append((quote["line"], quote["odds"], quote["books"], bet_id))
+                else:
+                    closed.append((*pick_clv(market, side, line, odds, closing_line, closing_odds), now, bet_id))
+            conn.executemany(
+                "UPDATE tracked_picks SET closing_line = ?, closing_odds = ?, closing_books = ? WHERE bet_id = ?",
+                captured
+            )
+            conn.executemany("UPDATE tracked_picks SET clv = ?, clv_cents = ?, closed_at = ? WHERE bet_id = ?", closed)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self.captured += len(captured)
+        self.closed += len(closed)
+        return {"captured": len(captured), "closed": len(closed)}
+
+    def grade(self, bet_id: str, outcome: str) -> Optional[dict]:
+        """Set a pick's outcome (WIN / LOSS / PUSH) -> the pick, None if it is not tracked"""
+        cursor = self._conn().execute(
+            "UPDATE tracked_picks SET outcome = ?, graded_at = ? WHERE bet_id = ?", (outcome, time.time(), bet_id)
+        )
+        return self.get(bet_id) if cursor.rowcount else None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _picks(self, where: str, params: tuple, limit: int = None) -> list:
+        query = f"SELECT {', '.join(COLUMNS)} FROM tracked_picks p {where} ORDER BY tracked_at DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        picks = []
+        for row in self._conn().execute(query, params):
+            pick = dict(zip(COLUMNS, row))
+            pick["id"] = pick["bet_id"]
+            pick["signals"] = json.loads(pick["signals"])
+            picks.append(pick)
+        return picks
+
+    def get(self, bet_id: str) -> Optional[dict]:
+        picks = self._picks("WHERE p.bet_id = ?", (bet_id,))
+        return picks[0] if picks else None
+
+    def history(self, user_id: str = None, sport: str = None, limit: int = 50) -> list:
+        """Tracked picks, newest first"""
+        where, params = pick_filters(user_id, sport)
+        return self._picks(where, params, limit)
+
+    def summary(self, user_id: str = None, sport: str = None, since: float = None, groups: Iterable[str] = GROUPS) -> dict:
+        """Overall CLV and record, plus one entry per tier / sport / signal, best average CLV first"""
+        where, params = pick_filters(user_id, sport, since)
+        conn = self._conn()
+        result = {"overall": summarize(conn.execute(f"SELECT {SUMMARY_COLUMNS} FROM tracked_picks p {where}", params).fetchone())}
+        for group in groups:
+            if group == "signal":
+                query = (
+                    f"SELECT s.signal, {SUMMARY_COLUMNS} FROM tracked_pick_signals s "
+                    f"JOIN tracked_picks p ON p.bet_id = s.bet_id {where} GROUP BY s.signal"
+                )
+            else:
+                query = f"SELECT p.{group}, {SUMMARY_COLUMNS} FROM tracked_picks p {where} GROUP BY p.{group}"
+            entries = [{group: row[0], **summarize(row[1:])} for row in conn.execute(query, params)]
+            entries.sort(key=lambda entry: (-entry["avg_clv"], -entry["picks"]))
+            result[f"by_{group}"] = entries
+        return result
+
+    def stats(self) -> dict:
+        picks, open_picks, graded = self._conn().execute(
+            "SELECT COUNT(*), SUM(closed_at IS NULL), SUM(outcome IS NOT NULL) FROM tracked_picks"
+        ).fetchone()
+        return {
+            "picks": picks,
+            "open": open_picks or 0,
+            "graded": graded or 0,
+            "captured": self.captured,
+            "closed": self.closed,
+            "close_lead_seconds": self.close_lead
+        }
+
+    def reset(self):
+        """Drop every pick (tests and benchmarks)"""
+        conn = self._conn()
+        conn.execute("DELETE FROM tracked_picks")
+        conn.execute("DELETE FROM tracked_pick_signals")
+
+
+clv_tracker = CLVTracker()
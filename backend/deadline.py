@@ -0,0 +1,69 @@
+"""
+Request Deadlines - one time budget per request, threaded through upstream
+fetches and scoring so a slow dependency can't hold a handler open.
+
+Clients set the budget with the X-Request-Deadline header or ?deadline_ms=
+(milliseconds); otherwise REQUEST_DEADLINE_MS applies. Budgets are clamped
+to [REQUEST_DEADLINE_MIN_MS, REQUEST_DEADLINE_MAX_MS].
+
+Upstream fetches get UPSTREAM_BUDGET_SHARE of what is left (for_upstream()),
+so a slow event odds call can't leave nothing for scoring what did arrive.
+"""
+
+import copy
+import os
+import time
+from typing import Optional
+
+REQUEST_DEADLINE_MS = int(os.getenv("REQUEST_DEADLINE_MS", "10000"))
+REQUEST_DEADLINE_MIN_MS = int(os.getenv("REQUEST_DEADLINE_MIN_MS", "50"))
+REQUEST_DEADLINE_MAX_MS = int(os.getenv("REQUEST_DEADLINE_MAX_MS", "30000"))
+UPSTREAM_BUDGET_SHARE = float(os.getenv("UPSTREAM_BUDGET_SHARE", "0.8"))
+
+DEADLINE_HEADER = "X-Request-Deadline"
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the budget ran out before there was anything to return"""
+
+
+class Deadline:
+    """Absolute point in (monotonic) time a request must answer by"""
+
+    def __init__(self, budget_ms: int):
+        self.budget_ms = budget_ms
+        self.started = time.monotonic()
+        self.expires = self.started + budget_ms / 1000
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(0.0, self.expires - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+    def timeout(self, cap: float) -> float:
+        """Per-call timeout: whatever is left of the budget, at most cap seconds"""
+        return min(cap, self.remaining())
+
+    def for_upstream(self) -> "Deadline":
+        """Earlier deadline for the fetch phase - UPSTREAM_BUDGET_SHARE of the time left"""
+        child = copy.copy(self)
+        child.expires = time.monotonic() + self.remaining() * UPSTREAM_BUDGET_SHARE
+        return child
+
+    def elapsed_ms(self) -> float:
+        return round((time.monotonic() - self.started) * 1000, 1)
+
+
+def parse_deadline(header_value: Optional[str], query_ms: Optional[int]) -> Deadline:
+    """Deadline from ?deadline_ms= (wins) or the header, else the server default"""
+    budget = query_ms
+    if budget is None and header_value:
+        try:
+            budget = int(float(header_value))
+        except ValueError:
+            budget = None
+    if budget is None:
+        budget = REQUEST_DEADLINE_MS
+    return Deadline(max(REQUEST_DEADLINE_MIN_MS, min(REQUEST_DEADLINE_MAX_MS, budget)))
@@ -0,0 +1,37 @@
+"""
+Bookie-o-em scoring engines - one module per engine family
+
+    gematria       Jarvis triggers, 6 ciphers, date numerology, storylines
+    gematria_index Reverse index: cipher value / Jarvis trigger -> names
+    resonance      v10.3 Founder's Echo + Life Path Sync
+    scalar_savant  v10.4 SCALAR-SAVANT (6 modules)
+    omni_glitch    v11.0 OMNI-GLITCH (6 modules)
+    gann           v13.0 GANN PHYSICS (3 modules)
+    noosphere      v14.0 NOOSPHERE VELOCITY (MAIN MODEL)
+    esoteric       Standalone esoteric edge, moon/daily energy, DayContext
+    confluence     Research model vs esoteric alignment alerts
+    confidence     v10.1 main confidence (preserved weights)
+    scoring        One game / one prop through the full stack
+    market_scan    Cross-book arbitrage, middles and stale lines over a slate
+    steam          Steam moves: synchronized multi-book line moves
+    prop_correlation  Pairwise prop correlations, slate matrices, correlated parlay pricing
+    season_calendar  Founder's Echo + date numerology per team per date, memory-mapped
+    tables         Static reference tables, loaded from data/ on first use
+
+Importing the package is free: submodules load on first attribute access
+(engines.gann) or explicit import (from engines.gann import ...).
+"""
+
+import importlib
+
+ENGINE_MODULES = (
+    "gematria", "gematria_index", "resonance", "scalar_savant", "omni_glitch", "gann",
+    "noosphere", "esoteric", "confluence", "confidence", "scoring", "market_scan", "steam",
+    "prop_correlation", "season_calendar", "tables"
+)
+
+
+def __getattr__(name):
+    if name in ENGINE_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,319 @@
+"""
+v10.1 MAIN CONFIDENCE - research-optimized weights (PRESERVED)
+
+Signal weights, Jarvis edge signals and calculate_main_confidence.
+"""
+
+from engines.noosphere import get_noosphere_main_model_signal
+
+
+# ============================================================================
+# V10.1 SIGNAL WEIGHTS - PRESERVED
+# ============================================================================
+
+SIGNAL_WEIGHTS = {
+    "sharp_money": 22,
+    "line_edge": 18,
+    "noosphere_velocity": 17,  # v14.0 - Information asymmetry detection (MAIN MODEL)
+    "injury_vacuum": 16,
+    "game_pace": 15,
+    "travel_fatigue": 14,
+    "back_to_back": 13,
+    "defense_vs_position": 12,
+    "public_fade": 11,
+    "steam_moves": 10,
+    "home_court": 10,
+    "weather": 10,
+    "minutes_projection": 10,
+    "referee": 8,
+    "game_script": 8,
+    "ensemble_ml": 8,
+    "gematria": 3,
+    "moon_phase": 2,
+    "numerology": 2,
+    "sacred_geometry": 2,
+    "zodiac": 1,
+    "jarvis_trigger": 5,
+    "crush_zone": 4,
+    "goldilocks": 3,
+    "nhl_protocol": 4
+}
+
+# ============================================================================
+# V10.1 JARVIS EDGE SIGNALS - PRESERVED
+# ============================================================================
+
+def calculate_public_fade_signal(public_percentage: float, is_favorite: bool) -> dict:
+    signal = {
+        "public_pct": public_percentage,
+        "is_favorite": is_favorite,
+        "in_crush_zone": False,
+        "fade_signal": False,
+        "influence": 0.0,
+        "recommendation": ""
+    }
+
+    if public_percentage >= 65 and is_favorite:
+        signal["in_crush_zone"] = True
+        signal["fade_signal"] = True
+        if public_percentage >= 80:
+            signal["influence"] = 0.95
+            signal["recommendation"] = "MAXIMUM FADE - Public delusion at peak"
+        elif public_percentage >= 75:
+            signal["influence"] = 0.85
+            signal["recommendation"] = "STRONG FADE - Heavy public chalk"
+        elif public_percentage >= 70:
+            signal["influence"] = 0.75
+            signal["recommendation"] = "FADE - Solid crush zone entry"
+        else:
+            signal["influence"] = 0.65
+            signal["recommendation"] = "FADE - Entering crush zone"
+    elif public_percentage >= 65 and not is_favorite:
+        signal["influence"] = 0.45
+        signal["recommendation"] = "Monitor - Public dog heavy"
+    elif public_percentage <= 35:
+        signal["influence"] = 0.55
+        signal["recommendation"] = "Contrarian value - Public avoiding"
+    else:
+        signal["influence"] = 0.30
+        signal["recommendation"] = "No clear public edge"
+
+    return signal
+
+def calculate_mid_spread_signal(spread: float) -> dict:
+    abs_spread = abs(spread) if spread else 0
+    signal = {
+        "spread": spread,
+        "abs_spread": abs_spread,
+        "in_goldilocks": False,
+        "influence": 0.0,
+        "zone": "",
+        "boost_modifier": 1.0
+    }
+
+    if 4 <= abs_spread <= 9:
+        signal["in_goldilocks"] = True
+        signal["zone"] = "GOLDILOCKS"
+        signal["boost_modifier"] = 1.20
+        signal["influence"] = 0.85 if 6 <= abs_spread <= 7 else 0.75
+    elif abs_spread < 4:
+        signal["zone"] = "TOO_TIGHT"
+        signal["influence"] = 0.50
+    elif abs_spread > 15:
+        signal["zone"] = "TRAP_GATE"
+        signal["influence"] = 0.25
+        signal["boost_modifier"] = 0.80
+    else:
+        signal["zone"] = "MODERATE"
+        signal["influence"] = 0.55
+
+    return signal
+
+def calculate_large_spread_trap(spread: float) -> dict:
+    abs_spread = abs(spread) if spread else 0
+    signal = {"spread": spread, "abs_spread": abs_spread, "is_trap": False, "penalty": 1.0, "warning": ""}
+
+    if abs_spread > 15:
+        signal["is_trap"] = True
+        signal["penalty"] = 0.70 if abs_spread > 20 else 0.80
+        signal["warning"] = "EXTREME TRAP" if abs_spread > 20 else "TRAP GATE ACTIVE"
+
+    return signal
+
+def calculate_nhl_dog_protocol(sport: str, spread: float, research_score: float, public_pct: float) -> dict:
+    signal = {"sport": sport, "protocol_active": False, "conditions_met": [], "conditions_failed": [], "influence": 0.0, "recommendation": ""}
+
+    if sport.upper() != "NHL":
+        signal["recommendation"] = "Protocol only applies to NHL"
+        return signal
+
+    is_dog = spread > 0 if spread else False
+    is_puck_line = abs(spread) == 1.5 if spread else False
+
+    if is_dog and is_puck_line:
+        signal["conditions_met"].append("Puck line dog (+1.5)")
+    else:
+        signal["conditions_failed"].append("Not puck line dog")
+
+    if research_score >= 9.3:
+        signal["conditions_met"].append(f"Research score {research_score} ≥ 9.3")
+    else:
+        signal["conditions_failed"].append(f"Research score {research_score} < 9.3")
+
+    if public_pct >= 65:
+        signal["conditions_met"].append(f"Public {public_pct}% ≥ 65%")
+    else:
+        signal["conditions_failed"].append(f"Public {public_pct}% < 65%")
+
+    count = len(signal["conditions_met"])
+    if count == 3:
+        signal["protocol_active"] = True
+        signal["influence"] = 0.92
+        signal["recommendation"] = "FULL PROTOCOL"
+    elif count == 2:
+        signal["influence"] = 0.70
+        signal["recommendation"] = "PARTIAL PROTOCOL"
+    elif count == 1:
+        signal["influence"] = 0.45
+        signal["recommendation"] = "WEAK SIGNAL"
+    else:
+        signal["influence"] = 0.20
+        signal["recommendation"] = "NO PROTOCOL"
+
+    return signal
+
+# ============================================================================
+# V10.1 MAIN CONFIDENCE CALCULATION - PRESERVED
+# ============================================================================
+
+def calculate_main_confidence(game_data: dict, context: dict = None) -> dict:
+    context = context or {}
+    signals = {}
+
+    # Sharp money
+    sharp_data = context.get("sharp_data", {})
+    if sharp_data:
+        divergence = abs(sharp_data.get("money_pct", 50) - sharp_data.get("ticket_pct", 50))
+        if divergence >= 25:
+            signals["sharp_money"] = {"score": 95, "contribution": f"STRONG SHARP: {divergence}% divergence"}
+        elif divergence >= 20:
+            signals["sharp_money"] = {"score": 88, "contribution": f"Sharp detected: {divergence}% split"}
+        elif divergence >= 15:
+            signals["sharp_money"] = {"score": 75, "contribution": f"Moderate sharp lean: {divergence}%"}
+        else:
+            signals["sharp_money"] = {"score": 50, "contribution": "No significant sharp action"}
+    else:
+        signals["sharp_money"] = {"score": 50, "contribution": "No sharp data"}
+
+    # Line edge
+    odds = game_data.get("spread_odds", -110)
+    if odds >= -100:
+        signals["line_edge"] = {"score": 95, "contribution": f"ELITE odds: {odds}"}
+    elif odds >= -105:
+        signals["line_edge"] = {"score": 82, "contribution": f"Great odds: {odds}"}
+    elif odds >= -110:
+        signals["line_edge"] = {"score": 55, "contribution": f"Standard odds: {odds}"}
+    else:
+        signals["line_edge"] = {"score": 40, "contribution": f"Poor odds: {odds}"}
+
+    # Game pace
+    total = game_data.get("total", 220)
+    if total >= 235:
+        signals["game_pace"] = {"score": 88, "contribution": f"High pace: O/U {total}"}
+    elif total >= 228:
+        signals["game_pace"] = {"score": 72, "contribution": f"Above avg pace: O/U {total}"}
+    elif total <= 210:
+        signals["game_pace"] = {"score": 75, "contribution": f"Slow pace: O/U {total}"}
+    else:
+        signals["game_pace"] = {"score": 55, "contribution": f"Normal pace: O/U {total}"}
+
+    # Home court
+    home_team = (game_data.get("home_team") or "").lower()
+    altitude_teams = ["nuggets", "denver", "jazz", "utah"]
+    if any(t in home_team for t in altitude_teams):
+        signals["home_court"] = {"score": 82, "contribution": "Altitude advantage"}
+    else:
+        signals["home_court"] = {"score": 58, "contribution": "Standard home court"}
+
+    # Jarvis edges
+    spread = game_data.get("spread", 0)
+    public_pct = game_data.get("public_pct", 50)
+    is_fav = game_data.get("is_favorite", False)
+    sport = game_data.get("sport", "NBA")
+
+    public_fade = calculate_public_fade_signal(public_pct, is_fav)
+    if public_fade["in_crush_zone"]:
+        signals["public_fade"] = {"score": 88, "contribution": public_fade["recommendation"]}
+    elif public_fade["fade_signal"]:
+        signals["public_fade"] = {"score": 72, "contribution": public_fade["recommendation"]}
+    else:
+        signals["public_fade"] = {"score": 50, "contribution": public_fade["recommendation"]}
+
+    mid_spread = calculate_mid_spread_signal(spread)
+    if mid_spread["in_goldilocks"]:
+        signals["goldilocks"] = {"score": 78, "contribution": f"GOLDILOCKS ZONE: {abs(spread)} spread"}
+    elif mid_spread["zone"] == "TRAP_GATE":
+        signals["goldilocks"] = {"score": 30, "contribution": f"TRAP GATE: {abs(spread)} spread too large"}
+    else:
+        signals["goldilocks"] = {"score": 50, "contribution": f"{mid_spread['zone']} spread"}
+
+    if sport.upper() == "NHL":
+        nhl = calculate_nhl_dog_protocol(sport, spread, 70, public_pct)
+        if nhl["protocol_active"]:
+            signals["nhl_protocol"] = {"score": 92, "contribution": "FULL NHL DOG PROTOCOL"}
+        elif len(nhl["conditions_met"]) >= 2:
+            signals["nhl_protocol"] = {"score": 70, "contribution": "Partial NHL protocol"}
+        else:
+            signals["nhl_protocol"] = {"score": 50, "contribution": "NHL protocol inactive"}
+
+    # v14.0 NOOSPHERE VELOCITY - Information asymmetry detection
+    # This is a MAIN MODEL signal - "Someone always knows"
+    noosphere_data = context.get("noosphere_data")
+    if noosphere_data:
+        noosphere_signal = get_noosphere_main_model_signal(noosphere_data)
+        signals["noosphere_velocity"] = noosphere_signal
+
+        # If Noosphere detects INSIDER_LEAK, apply penalty to confidence
+        if "INSIDER_LEAK" in noosphere_data.get("active_signals", []):
+            # The team being analyzed has a silent spike - this is BAD for them
+            # So we want to reduce confidence if backing them, increase if fading
+            if not game_data.get("is_fade_pick", False):
+                # We're backing the team with the leak - reduce score
+                signals["noosphere_velocity"]["score"] = max(20, signals["noosphere_velocity"]["score"] - 30)
+                signals["noosphere_velocity"]["contribution"] += " (FADE SIGNAL - reduce confidence)"
+    else:
+        signals["noosphere_velocity"] = {"score": 50, "contribution": "No Noosphere data"}
+
+    # Steam moves - synchronized multi-book line moves (line_history), scored for the home side
+    steam_data = context.get("steam_data")
+    if steam_data:
+        signals["steam_moves"] = {"score": steam_data["score"], "contribution": steam_data["contribution"]}
+
+    # Fill remaining
+    for signal in ["injury_vacuum", "travel_fatigue", "back_to_back", "defense_vs_position",
+                   "steam_moves", "weather", "minutes_projection", "referee", "game_script", "ensemble_ml"]:
+        if signal not in signals:
+            signals[signal] = {"score": 50, "contribution": "No data available"}
+
+    # Calculate weighted average
+    total_weight = 0
+    weighted_sum = 0
+    for signal_name, signal_data in signals.items():
+        weight = SIGNAL_WEIGHTS.get(signal_name, 1)
+        total_weight += weight
+        weighted_sum += signal_data["score"] * weight
+
+    confidence = round(weighted_sum / total_weight) if total_weight > 0 else 50
+
+    if game_data.get("spread_odds") or game_data.get("over_odds"):
+        confidence = min(100, confidence + 5)
+
+    # Tier
+    if confidence >= 80:
+        tier = "GOLDEN_CONVERGENCE"
+    elif confidence >= 70:
+        tier = "SUPER_SIGNAL"
+    elif confidence >= 60:
+        tier = "HARMONIC_ALIGNMENT"
+    else:
+        tier = "PARTIAL_ALIGNMENT"
+
+    # Recommendation
+    if confidence >= 80:
+        recommendation = "SMASH"
+    elif confidence >= 70:
+        recommendation = "STRONG"
+    elif confidence >= 60:
+        recommendation = "PLAY"
+    elif confidence >= 55:
+        recommendation = "LEAN"
+    else:
+        recommendation = "PASS"
+
+    return {
+        "confidence": confidence,
+        "tier": tier,
+        "recommendation": recommendation,
+        "signals": signals,
+        "top_signals": sorted(signals.items(), key=lambda x: x[1]["score"] * SIGNAL_WEIGHTS.get(x[0], 1), reverse=True)[:3]
+    }
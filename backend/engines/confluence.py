@@ -0,0 +1,101 @@
+"""
+CONFLUENCE ALERT SYSTEM (v10.2)
+
+Informational alignment between the research model and the esoteric edge.
+"""
+
+
+# ============================================================================
+# CONFLUENCE ALERT SYSTEM (v10.2 NEW)
+# Shows when research model and esoteric align - informational only
+# ============================================================================
+
+def check_confluence_alert(
+    main_confidence: int,
+    main_pick: str,  # "home", "away", or team name
+    esoteric_score: int,
+    esoteric_pick: str  # "home", "away", or team name
+) -> dict:
+    """
+    CONFLUENCE ALERT SYSTEM
+
+    Checks if research model and esoteric edge point same direction.
+    This is INFORMATIONAL ONLY - does not boost the main score.
+    Users can decide if they want to factor this in.
+    """
+
+    # Normalize picks for comparison
+    main_norm = main_pick.lower() if main_pick else ""
+    esoteric_norm = esoteric_pick.lower() if esoteric_pick else ""
+
+    same_direction = main_norm == esoteric_norm and main_norm != "" and main_norm != "neutral"
+
+    # Both must be strong
+    main_strong = main_confidence >= 70
+    esoteric_strong = esoteric_score >= 65
+
+    if same_direction and main_strong and esoteric_strong:
+        # FULL CONFLUENCE
+        if main_confidence >= 80 and esoteric_score >= 80:
+            return {
+                "has_confluence": True,
+                "level": "PERFECT",
+                "emoji": "🌟🔥⚡",
+                "badge": "PERFECT CONFLUENCE",
+                "message": "Research model and cosmic forces in PERFECT alignment",
+                "color": "gold",
+                "show_alert": True
+            }
+        elif main_confidence >= 75 and esoteric_score >= 70:
+            return {
+                "has_confluence": True,
+                "level": "STRONG",
+                "emoji": "⭐💪",
+                "badge": "STRONG CONFLUENCE",
+                "message": "Research and esoteric both favor same side",
+                "color": "green",
+                "show_alert": True
+            }
+        else:
+            return {
+                "has_confluence": True,
+                "level": "MODERATE",
+                "emoji": "✨",
+                "badge": "CONFLUENCE",
+                "message": "Models aligned - additional conviction",
+                "color": "blue",
+                "show_alert": True
+            }
+
+    elif same_direction and (main_strong or esoteric_strong):
+        return {
+            "has_confluence": False,
+            "level": "PARTIAL",
+            "emoji": "🔮",
+            "badge": "PARTIAL ALIGNMENT",
+            "message": "Same direction but not both strong",
+            "color": "gray",
+            "show_alert": False
+        }
+
+    elif not same_direction and main_strong and esoteric_strong:
+        return {
+            "has_confluence": False,
+            "level": "DIVERGENT",
+            "emoji": "⚡",
+            "badge": "DIVERGENCE",
+            "message": "Research and esoteric point different directions",
+            "color": "orange",
+            "show_alert": True  # Show as warning
+        }
+
+    else:
+        return {
+            "has_confluence": False,
+            "level": "NONE",
+            "emoji": "📊",
+            "badge": "NO ALERT",
+            "message": "No significant alignment or divergence",
+            "color": "gray",
+            "show_alert": False
+        }
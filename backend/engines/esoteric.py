@@ -0,0 +1,441 @@
+"""
+STANDALONE ESOTERIC EDGE (v10.2)
+
+Moon phase, daily energy, per-date DayContext and the standalone esoteric
+module with the Jarvis Savant +94.40u weights.
+"""
+
+from datetime import datetime, timedelta
+
+from engines.gematria import (
+    POWER_NUMBERS, analyze_jersey_number, analyze_storyline, calculate_date_numerology,
+    check_jarvis_trigger, get_all_ciphers, validate_2178
+)
+from engines.resonance import analyze_founders_echo, analyze_life_path_sync
+from timing import span
+
+
+# ============================================================================
+# MOON PHASE & DAILY ENERGY
+# ============================================================================
+
+def get_moon_phase(date: datetime = None) -> str:
+    if date is None:
+        date = datetime.now()
+    known_new_moon = datetime(2024, 1, 11)
+    days_since = (date - known_new_moon).days
+    lunar_cycle = 29.53
+    phase_num = (days_since % lunar_cycle) / lunar_cycle * 8
+    phases = ['new', 'waxing_crescent', 'first_quarter', 'waxing_gibbous',
+              'full', 'waning_gibbous', 'last_quarter', 'waning_crescent']
+    return phases[int(phase_num) % 8]
+
+def get_daily_energy(date: datetime = None) -> dict:
+    """Daily planetary energy - used by Twitter gematria community"""
+    if date is None:
+        date = datetime.now()
+
+    day_energies = {
+        0: {"planet": "Moon", "energy": "intuition", "bias": "home teams", "emoji": "🌙"},
+        1: {"planet": "Mars", "energy": "aggression", "bias": "overs", "emoji": "♂️"},
+        2: {"planet": "Mercury", "energy": "speed", "bias": "high-pace teams", "emoji": "☿"},
+        3: {"planet": "Jupiter", "energy": "expansion", "bias": "underdogs", "emoji": "♃"},
+        4: {"planet": "Venus", "energy": "harmony", "bias": "close games", "emoji": "♀"},
+        5: {"planet": "Saturn", "energy": "discipline", "bias": "unders", "emoji": "♄"},
+        6: {"planet": "Sun", "energy": "victory", "bias": "favorites", "emoji": "☉"}
+    }
+
+    return day_energies[date.weekday()]
+
+# ============================================================================
+# DAY CONTEXT - everything that depends only on the calendar date, built once
+# per date and shared by every game scored that day
+# ============================================================================
+
+DAY_CONTEXTS = {}
+DAY_CONTEXT_LIMIT = 32
+
+def build_day_context(date: datetime) -> dict:
+    """Date numerology, moon phase and planetary energy for one calendar date"""
+    day = datetime(date.year, date.month, date.day)
+    return {
+        "date": day.strftime("%Y-%m-%d"),
+        "date_numerology": calculate_date_numerology(day),
+        "moon_phase": get_moon_phase(day),
+        "daily_energy": get_daily_energy(day)
+    }
+
+def get_day_context(date: datetime = None) -> dict:
+    """Cached DayContext for a date (default today). Treat as read-only."""
+    if date is None:
+        date = datetime.now()
+    key = date.strftime("%Y-%m-%d")
+    context = DAY_CONTEXTS.get(key)
+    if context is None:
+        context = build_day_context(date)
+        DAY_CONTEXTS[key] = context
+        # Oldest dates go first once the table is full
+        for stale in sorted(DAY_CONTEXTS)[:max(0, len(DAY_CONTEXTS) - DAY_CONTEXT_LIMIT)]:
+            DAY_CONTEXTS.pop(stale, None)
+    return context
+
+def build_day_contexts(days: int = 7, start: datetime = None) -> int:
+    """Pre-build DayContexts for the next `days` dates, returns how many are cached"""
+    start = start or datetime.now()
+    for offset in range(days):
+        get_day_context(start + timedelta(days=offset))
+    return len(DAY_CONTEXTS)
+
+# ============================================================================
+# JARVIS SAVANT ESOTERIC WEIGHTS - +94.40u YTD PRESERVED
+# These weights produced the winning edge - DO NOT CHANGE
+# ============================================================================
+
+JARVIS_ESOTERIC_WEIGHTS = {
+    "gematria": 0.52,      # Boss approved - dominant
+    "numerology": 0.20,
+    "astro": 0.13,
+    "vedic": 0.10,
+    "sacred": 0.05,
+    "fib_phi": 0.05,
+    "vortex": 0.05
+}
+
+# Public Fade (Exoteric King) - ≥65% chalk = crush
+PUBLIC_FADE_PENALTY = -0.13
+
+# Mid-Spread Priority (Boss zone) - +4 to +9 strongest
+MID_SPREAD_AMPLIFIER = 0.20
+
+# NHL Pivot v5.9
+NHL_ML_DOG_THRESHOLD_RS = 9.3
+NHL_ML_DOG_THRESHOLD_PUBLIC = 65
+
+# Betting thresholds
+GOLD_STAR_THRESHOLD = 72  # 2u
+EDGE_LEAN_THRESHOLD = 68  # 1u
+
+# Large Spread Trap Gate (Kings 41-pt, Rice 31-pt lessons)
+LARGE_SPREAD_TRAP_PENALTY = -0.20
+
+# ============================================================================
+# STANDALONE ESOTERIC EDGE MODULE (v10.2 NEW)
+# Complete analysis tool with Jarvis Savant +94.40u weights
+# ============================================================================
+
+def calculate_standalone_esoteric(
+    home_team: str,
+    away_team: str,
+    spread: float = None,
+    total: float = None,
+    player_name: str = None,
+    jersey_number: int = None,
+    prop_line: float = None,
+    sport: str = "NBA",
+    game_date: datetime = None
+) -> dict:
+    """
+    STANDALONE ESOTERIC EDGE MODULE v10.3
+
+    Complete gematria/numerology analysis as its own feature.
+    Users can click into this to see full esoteric breakdown.
+    Does NOT affect main research confidence score.
+
+    v10.3 NEW: RESONANCE LAYER
+    - Founder's Echo: Franchise founding date vs game date
+    - Life Path Sync: Star player life path vs game numerology
+
+    Integrates insights from:
+    - @gematriasports
+    - @psgematria
+    - @SportsGematria
+    - @SGDecodes
+    - Gematria Effect Sports
+    """
+    if game_date is None:
+        game_date = datetime.now()
+
+    game_day = get_day_context(game_date)
+
+    # 1. DATE NUMEROLOGY
+    date_analysis = game_day["date_numerology"]
+
+    # 2. TEAM GEMATRIA (all 6 ciphers)
+    home_ciphers = get_all_ciphers(home_team)
+    away_ciphers = get_all_ciphers(away_team)
+
+    # 3. STORYLINE ANALYSIS
+    with span("esoteric.storyline"):
+        storyline = analyze_storyline(home_team, away_team)
+
+    # 4. JERSEY NUMBER ANALYSIS (if provided)
+    jersey_analysis = None
+    if jersey_number:
+        jersey_analysis = analyze_jersey_number(jersey_number, game_date)
+
+    # 5. PLAYER GEMATRIA (if provided)
+    player_analysis = None
+    life_path_sync = None
+    if player_name:
+        player_ciphers = get_all_ciphers(player_name)
+        player_jarvis = {}
+        for cipher_name, value in player_ciphers.items():
+            player_jarvis[cipher_name] = check_jarvis_trigger(value)
+
+        player_analysis = {
+            "name": player_name,
+            "ciphers": player_ciphers,
+            "jarvis_checks": player_jarvis,
+            "has_jarvis_trigger": any(j["triggered"] for j in player_jarvis.values())
+        }
+
+        # v10.3 NEW: LIFE PATH SYNC for player
+        with span("esoteric.life_path"):
+            life_path_sync = analyze_life_path_sync(player_name, game_date)
+
+    # 6. MOON & PLANETARY
+    moon_phase = game_day["moon_phase"]
+    daily_energy = game_day["daily_energy"]
+
+    # 7. v10.3 NEW: FOUNDER'S ECHO for both teams
+    with span("esoteric.founders_echo"):
+        home_founders_echo = analyze_founders_echo(home_team, game_date)
+        away_founders_echo = analyze_founders_echo(away_team, game_date)
+
+    moon_emoji = {
+        'new': '🌑', 'waxing_crescent': '🌒', 'first_quarter': '🌓', 'waxing_gibbous': '🌔',
+        'full': '🌕', 'waning_gibbous': '🌖', 'last_quarter': '🌗', 'waning_crescent': '🌘'
+    }.get(moon_phase, '🌙')
+
+    # 7. LINE GEOMETRY (spread/total analysis)
+    with span("esoteric.line_analysis"):
+        line_analysis = None
+        if spread is not None or total is not None:
+            line = spread if spread is not None else total
+            line_abs = abs(line) if line else 0
+            line_rounded = round(line_abs)
+
+            line_insights = []
+            if line_rounded in POWER_NUMBERS["fibonacci"]:
+                line_insights.append(f"Line {line_rounded} = Fibonacci (natural harmony)")
+            if line_rounded % 3 == 0:
+                line_insights.append(f"Line {line_rounded} = Tesla divisible (3-6-9)")
+            if line_rounded in POWER_NUMBERS["sacred"]:
+                line_insights.append(f"Line {line_rounded} = Sacred number")
+            if line_rounded in POWER_NUMBERS["master"]:
+                line_insights.append(f"Line {line_rounded} = Master number")
+
+            line_jarvis = check_jarvis_trigger(line_rounded)
+
+            line_analysis = {
+                "spread": spread,
+                "total": total,
+                "analyzed_line": line_rounded,
+                "insights": line_insights,
+                "jarvis_check": line_jarvis
+            }
+
+    # 8. CALCULATE ESOTERIC SCORE (standalone) - USING JARVIS SAVANT +94.40u WEIGHTS
+
+    # Calculate component scores (0-100 scale)
+    gematria_score = min(100, storyline["home_score"] if storyline["favored"] == "home" else storyline["away_score"])
+    numerology_score = min(100, 50 + len(date_analysis["alignments"]) * 10)
+    astro_score = 70 if moon_phase in ['full', 'new'] else 55 if moon_phase in ['waxing_gibbous', 'first_quarter'] else 50
+    vedic_score = 50 + (date_analysis["life_path"] * 3) if date_analysis["life_path"] in [3, 6, 9, 11, 22, 33] else 50
+    sacred_score = 60 if line_analysis and line_analysis["insights"] else 50
+    fib_phi_score = 70 if line_analysis and any("Fibonacci" in i for i in line_analysis.get("insights", [])) else 50
+    vortex_score = 65 if any("TESLA" in str(a) for a in date_analysis.get("alignments", [])) else 50
+
+    # Apply JARVIS SAVANT WEIGHTS (the +94.40u formula)
+    weighted_score = (
+        gematria_score * JARVIS_ESOTERIC_WEIGHTS["gematria"] +
+        numerology_score * JARVIS_ESOTERIC_WEIGHTS["numerology"] +
+        astro_score * JARVIS_ESOTERIC_WEIGHTS["astro"] +
+        vedic_score * JARVIS_ESOTERIC_WEIGHTS["vedic"] +
+        sacred_score * JARVIS_ESOTERIC_WEIGHTS["sacred"] +
+        fib_phi_score * JARVIS_ESOTERIC_WEIGHTS["fib_phi"] +
+        vortex_score * JARVIS_ESOTERIC_WEIGHTS["vortex"]
+    )
+
+    esoteric_score = round(weighted_score)
+
+    # Apply MID-SPREAD AMPLIFIER (+20% for +4 to +9 spreads)
+    if spread is not None and 4 <= abs(spread) <= 9:
+        esoteric_score = min(100, round(esoteric_score * (1 + MID_SPREAD_AMPLIFIER)))
+
+    # Apply LARGE SPREAD TRAP GATE (-20% for >15 spreads)
+    if spread is not None and abs(spread) > 15:
+        esoteric_score = max(0, round(esoteric_score * (1 + LARGE_SPREAD_TRAP_PENALTY)))
+
+    # Jersey alignment bonus
+    if jersey_analysis and jersey_analysis["has_alignment"]:
+        esoteric_score = min(100, esoteric_score + round(jersey_analysis["alignment_score"] * 0.2))
+
+    # Player Jarvis trigger bonus
+    if player_analysis and player_analysis["has_jarvis_trigger"]:
+        esoteric_score = min(100, esoteric_score + 10)
+
+    # v10.3 NEW: RESONANCE LAYER BONUSES
+
+    # Founder's Echo bonus - team with stronger founding resonance gets boost
+    resonance_bonus = 0
+    resonance_favored = None
+
+    if home_founders_echo["has_echo"] or away_founders_echo["has_echo"]:
+        home_echo_score = home_founders_echo["echo_score"]
+        away_echo_score = away_founders_echo["echo_score"]
+
+        if home_echo_score > away_echo_score + 10:
+            resonance_favored = "home"
+            resonance_bonus = min(15, round(home_echo_score * 0.15))
+        elif away_echo_score > home_echo_score + 10:
+            resonance_favored = "away"
+            resonance_bonus = min(15, round(away_echo_score * 0.15))
+
+        # Apply resonance bonus to score
+        esoteric_score = min(100, esoteric_score + resonance_bonus)
+
+    # Life Path Sync bonus - if player has destiny game alignment
+    life_path_bonus = 0
+    if life_path_sync and life_path_sync["has_sync"]:
+        life_path_bonus = min(10, round(life_path_sync["sync_score"] * 0.1))
+        esoteric_score = min(100, esoteric_score + life_path_bonus)
+
+    # Build resonance layer summary
+    resonance_layer = {
+        "active": resonance_bonus > 0 or life_path_bonus > 0,
+        "total_bonus": resonance_bonus + life_path_bonus,
+        "founders_echo": {
+            "home": home_founders_echo,
+            "away": away_founders_echo,
+            "favored": resonance_favored,
+            "bonus_applied": resonance_bonus
+        },
+        "life_path_sync": life_path_sync if life_path_sync else {"has_sync": False, "message": "No player specified"},
+        "life_path_bonus": life_path_bonus
+    }
+
+    # Determine tier using JARVIS THRESHOLDS
+    if esoteric_score >= GOLD_STAR_THRESHOLD:
+        tier = "GOLD_STAR"
+        emoji = "⭐⭐"
+        badge = "2u GOLD STAR"
+        bet_recommendation = "2u"
+    elif esoteric_score >= EDGE_LEAN_THRESHOLD:
+        tier = "EDGE_LEAN"
+        emoji = "⭐"
+        badge = "1u EDGE LEAN"
+        bet_recommendation = "1u"
+    elif esoteric_score >= 60:
+        tier = "MILD_ALIGNMENT"
+        emoji = "✨"
+        badge = "WATCH"
+        bet_recommendation = "0.5u or pass"
+    else:
+        tier = "NEUTRAL"
+        emoji = "🔮"
+        badge = "PASS"
+        bet_recommendation = "pass"
+
+    # Check for NHL ML Dog special play
+    nhl_ml_dog = None
+    if sport.upper() == "NHL" and spread and spread > 0:  # Underdog
+        if esoteric_score >= NHL_ML_DOG_THRESHOLD_RS * 10:  # Scale RS to 0-100
+            nhl_ml_dog = {
+                "active": True,
+                "bet": "0.5u ML Dog of the Day",
+                "reasoning": f"NHL dog with RS {esoteric_score}% meets {NHL_ML_DOG_THRESHOLD_RS * 10}% threshold"
+            }
+
+    # Build top insights
+    top_insights = []
+    if storyline["storylines"]:
+        top_insights.append(storyline["storylines"][0]["detail"])
+    if date_analysis["alignments"]:
+        top_insights.append(date_analysis["alignments"][0])
+    if jersey_analysis and jersey_analysis["alignments"]:
+        top_insights.append(jersey_analysis["alignments"][0])
+
+    # v10.3 NEW: Add resonance layer insights
+    if home_founders_echo["has_echo"] and home_founders_echo["echos"]:
+        top_insights.append(f"🏛️ {home_founders_echo['echos'][0]['detail']}")
+    if away_founders_echo["has_echo"] and away_founders_echo["echos"]:
+        top_insights.append(f"🏛️ {away_founders_echo['echos'][0]['detail']}")
+    if life_path_sync and life_path_sync["has_sync"] and life_path_sync["syncs"]:
+        top_insights.append(f"👤 {life_path_sync['syncs'][0]['detail']}")
+
+    top_insights.append(f"{moon_emoji} {moon_phase.replace('_', ' ').title()} Moon - {daily_energy['bias']}")
+
+    return {
+        "esoteric_score": esoteric_score,
+        "tier": tier,
+        "emoji": emoji,
+        "badge": badge,
+        "bet_recommendation": bet_recommendation,
+        "top_insights": top_insights[:5],
+
+        # JARVIS SAVANT +94.40u WEIGHTS BREAKDOWN
+        "jarvis_weights": {
+            "formula": "Gematria 52% + Numerology 20% + Astro 13% + Vedic 10% + Sacred 5% + Fib/Phi 5% + Vortex 5%",
+            "ytd_record": "+94.40u",
+            "components": {
+                "gematria": {"score": gematria_score, "weight": "52%"},
+                "numerology": {"score": numerology_score, "weight": "20%"},
+                "astro": {"score": astro_score, "weight": "13%"},
+                "vedic": {"score": vedic_score, "weight": "10%"},
+                "sacred": {"score": sacred_score, "weight": "5%"},
+                "fib_phi": {"score": fib_phi_score, "weight": "5%"},
+                "vortex": {"score": vortex_score, "weight": "5%"}
+            },
+            "modifiers_applied": {
+                "mid_spread_amplifier": spread is not None and 4 <= abs(spread) <= 9,
+                "large_spread_trap": spread is not None and abs(spread) > 15
+            }
+        },
+
+        # NHL ML Dog special play
+        "nhl_ml_dog": nhl_ml_dog,
+
+        # Full breakdowns for clickable detail
+        "date_numerology": date_analysis,
+        "team_analysis": {
+            "home": {
+                "team": home_team,
+                "ciphers": home_ciphers
+            },
+            "away": {
+                "team": away_team,
+                "ciphers": away_ciphers
+            }
+        },
+        "storyline": storyline,
+        "jersey_analysis": jersey_analysis,
+        "player_analysis": player_analysis,
+        "line_analysis": line_analysis,
+
+        # v10.3 NEW: RESONANCE LAYER
+        "resonance_layer": resonance_layer,
+
+        "cosmic": {
+            "moon_phase": moon_phase,
+            "moon_emoji": moon_emoji,
+            "planetary_ruler": daily_energy["planet"],
+            "daily_energy": daily_energy["energy"],
+            "natural_bias": daily_energy["bias"],
+            "planet_emoji": daily_energy["emoji"]
+        },
+        "immortal_status": validate_2178()["status"],
+
+        # Favored pick from esoteric
+        "esoteric_pick": {
+            "favored": storyline["favored"],
+            "favored_team": storyline["favored_team"],
+            "reasoning": storyline["reasoning"]
+        },
+
+        # Thresholds used
+        "thresholds": {
+            "gold_star": GOLD_STAR_THRESHOLD,
+            "edge_lean": EDGE_LEAN_THRESHOLD
+        }
+    }
@@ -0,0 +1,419 @@
+"""
+v13.0 GANN PHYSICS - Financial Laws Applied to Sports
+
+50% Retracement (Gravity Check) | Rule of Three (Exhaustion Node) |
+Annulifier Cycle (Harmonic Lock)
+"""
+
+
+# ============================================================================
+# LEVEL 13: GANN PHYSICS - Financial Laws Applied to Sports
+# W.D. Gann turned $130 into $12,000 in 30 days using geometric rules
+# "Tunnel Thru the Air" + "Law of Vibration" = Sports Physics
+# ============================================================================
+
+def analyze_fifty_percent_retracement(
+    team_name: str,
+    last_game_margin: int,
+    current_spread: float,
+    was_win: bool = True
+) -> dict:
+    """
+    THE 50% RETRACEMENT RULE (Gravity Check)
+
+    Gann proved the most powerful support level is exactly 50% of the previous major move.
+    In sports: After a blowout win (20+ pts), the market overreacts.
+    FADE if current spread falls within the 50% retracement zone.
+
+    The Law: What goes up violently must pull back to the midpoint before continuing.
+    """
+
+    # Only applies to "major moves" (20+ point margins)
+    is_major_move = abs(last_game_margin) >= 20
+
+    if not is_major_move:
+        return {
+            "team": team_name,
+            "last_margin": last_game_margin,
+            "is_major_move": False,
+            "retracement_active": False,
+            "signal": "NO_SIGNAL",
+            "recommendation": "No major move detected. Gravity Check not applicable.",
+            "fade_strength": 0
+        }
+
+    # Calculate 50% retracement zone
+    # For a 24-point win, the 50% retracement = 12 points
+    # If current spread is near that zone (within 3 points), it's in the gravity well
+    fifty_percent = abs(last_game_margin) / 2
+    retracement_zone_low = fifty_percent - 3
+    retracement_zone_high = fifty_percent + 3
+
+    # Check if current spread falls in the retracement zone
+    current_spread_abs = abs(current_spread)
+    in_retracement_zone = retracement_zone_low <= current_spread_abs <= retracement_zone_high
+
+    # Calculate how close to exact 50% (0 = perfect retracement)
+    distance_from_fifty = abs(current_spread_abs - fifty_percent)
+    retracement_accuracy = max(0, 100 - (distance_from_fifty * 10))
+
+    # Determine signal
+    if in_retracement_zone and was_win:
+        signal = "GRAVITY_FADE"
+        recommendation = f"🎯 FADE {team_name}. Spread at 50% retracement zone. Market overreaction after blowout."
+        fade_strength = min(100, 60 + retracement_accuracy * 0.4)
+    elif in_retracement_zone and not was_win:
+        signal = "GRAVITY_BOUNCE"
+        recommendation = f"📈 BACK {team_name}. At 50% retracement after blowout loss. Due for bounce."
+        fade_strength = min(100, 55 + retracement_accuracy * 0.35)
+    elif current_spread_abs < retracement_zone_low:
+        signal = "BELOW_RETRACEMENT"
+        recommendation = f"Spread below 50% zone. Market may be under-correcting."
+        fade_strength = 30
+    else:
+        signal = "ABOVE_RETRACEMENT"
+        recommendation = f"Spread above 50% zone. Market not yet corrected."
+        fade_strength = 25
+
+    return {
+        "team": team_name,
+        "last_margin": last_game_margin,
+        "was_win": was_win,
+        "is_major_move": True,
+        "fifty_percent_level": round(fifty_percent, 1),
+        "retracement_zone": {"low": round(retracement_zone_low, 1), "high": round(retracement_zone_high, 1)},
+        "current_spread": current_spread,
+        "in_retracement_zone": in_retracement_zone,
+        "retracement_accuracy": round(retracement_accuracy, 1),
+        "signal": signal,
+        "recommendation": recommendation,
+        "fade_strength": round(fade_strength),
+        "gann_principle": "The 50% retracement is nature's point of equilibrium. All things return to center."
+    }
+
+
+def analyze_rule_of_three(
+    team_name: str,
+    recent_ats_results: list,  # List of True/False for ATS covers, most recent first
+    current_pick: str = "cover"  # "cover" or "fade"
+) -> dict:
+    """
+    THE RULE OF THREE (Exhaustion Node)
+
+    Gann: "Never trade in the direction of the trend on the 3rd time period."
+    Trends exhaust or pause on the 3rd consecutive move.
+
+    Sports Application: If a team has covered 3 games in a row, FADE the 4th.
+    This is the Exhaustion Node - energy depletes after 3 cycles.
+
+    The Law: All trends must breathe. The 3rd repetition drains the pattern.
+    """
+
+    if len(recent_ats_results) < 3:
+        return {
+            "team": team_name,
+            "results_provided": len(recent_ats_results),
+            "exhaustion_active": False,
+            "signal": "INSUFFICIENT_DATA",
+            "recommendation": "Need at least 3 recent ATS results.",
+            "fade_strength": 0
+        }
+
+    # Check for 3 consecutive covers (True, True, True)
+    last_three = recent_ats_results[:3]
+    three_covers = all(last_three)
+    three_misses = not any(last_three)
+
+    # Check for 4+ consecutive (super exhaustion)
+    consecutive_count = 0
+    first_result = recent_ats_results[0] if recent_ats_results else None
+    for result in recent_ats_results:
+        if result == first_result:
+            consecutive_count += 1
+        else:
+            break
+
+    # Determine exhaustion state
+    if consecutive_count >= 4:
+        exhaustion_level = "CRITICAL"
+        base_strength = 85
+        emoji = "🔥"
+    elif consecutive_count == 3:
+        exhaustion_level = "HIGH"
+        base_strength = 72
+        emoji = "⚠️"
+    else:
+        exhaustion_level = "NONE"
+        base_strength = 0
+        emoji = "✓"
+
+    # Generate signal and recommendation
+    if three_covers:
+        signal = "EXHAUSTION_FADE"
+        direction = "covers"
+        recommendation = f"{emoji} FADE {team_name}. {consecutive_count} consecutive covers = Exhaustion Node reached. The 4th is the reversal."
+        fade_strength = base_strength
+    elif three_misses:
+        signal = "EXHAUSTION_BACK"
+        direction = "misses"
+        recommendation = f"{emoji} BACK {team_name}. {consecutive_count} consecutive ATS misses = Negative exhaustion. Due to cover."
+        fade_strength = base_strength - 5  # Slightly less confident on reversal backs
+    else:
+        signal = "NO_EXHAUSTION"
+        direction = "mixed"
+        recommendation = f"Mixed recent results. No exhaustion pattern detected."
+        fade_strength = 0
+
+    return {
+        "team": team_name,
+        "recent_ats": recent_ats_results[:5],  # Show last 5
+        "consecutive_count": consecutive_count,
+        "direction": direction,
+        "exhaustion_level": exhaustion_level,
+        "signal": signal,
+        "recommendation": recommendation,
+        "fade_strength": round(fade_strength),
+        "gann_principle": "The Rule of Three: Energy depletes after 3 cycles. The 4th move reverses or pauses."
+    }
+
+
+def analyze_annulifier_cycle(
+    team_name: str,
+    recent_results: list,  # List of "W" or "L" for wins/losses, most recent first
+    bet_type: str = "moneyline"  # "moneyline" or "ats"
+) -> dict:
+    """
+    THE ANNULIFIER CYCLE (Alternating Vibration)
+
+    Gann observed that chaos seeks balance through alternating patterns.
+    Strong assets often enter W-L-W-L harmonic for short periods.
+
+    Sports Application: Scan for exactly 4 alternating results (W-L-W-L or L-W-L-W).
+    The 5th result is LOCKED to continue the pattern.
+
+    The Law: The universe maintains balance through oscillation.
+    4 alternations = harmonic lock. The 5th must complete the wave.
+    """
+
+    if len(recent_results) < 4:
+        return {
+            "team": team_name,
+            "results_provided": len(recent_results),
+            "annulifier_active": False,
+            "signal": "INSUFFICIENT_DATA",
+            "recommendation": "Need at least 4 recent results (W/L).",
+            "lock_strength": 0
+        }
+
+    # Normalize results
+    normalized = [r.upper()[0] if isinstance(r, str) else ("W" if r else "L") for r in recent_results]
+    last_four = normalized[:4]
+
+    # Check for alternating pattern (W-L-W-L or L-W-L-W)
+    is_alternating = True
+    for i in range(len(last_four) - 1):
+        if last_four[i] == last_four[i + 1]:
+            is_alternating = False
+            break
+
+    # Determine the locked 5th result
+    if is_alternating:
+        # The 5th continues the pattern
+        # If pattern is W-L-W-L (most recent is L), next is W
+        # If pattern is L-W-L-W (most recent is W), next is L
+        predicted_next = "W" if last_four[0] == "L" else "L"
+
+        # Check if we have 5+ for extended pattern
+        extended_alternating = False
+        if len(normalized) >= 5:
+            extended_pattern = normalized[:5]
+            extended_alternating = all(extended_pattern[i] != extended_pattern[i+1] for i in range(4))
+
+        if extended_alternating:
+            lock_level = "SUPER_HARMONIC"
+            lock_strength = 90
+            emoji = "🔒"
+            extra = "5+ alternations detected. Harmonic resonance at peak."
+        else:
+            lock_level = "HARMONIC_LOCK"
+            lock_strength = 78
+            emoji = "⚡"
+            extra = "4 alternations confirmed. 5th result locked."
+
+        if predicted_next == "W":
+            signal = "LOCKED_WIN"
+            recommendation = f"{emoji} BET {team_name} TO WIN. Annulifier cycle predicts WIN. {extra}"
+        else:
+            signal = "LOCKED_LOSS"
+            recommendation = f"{emoji} FADE {team_name}. Annulifier cycle predicts LOSS. {extra}"
+    else:
+        # Find where the pattern broke
+        break_point = 0
+        for i in range(len(last_four) - 1):
+            if last_four[i] == last_four[i + 1]:
+                break_point = i + 1
+                break
+
+        lock_level = "NO_HARMONIC"
+        lock_strength = 0
+        predicted_next = None
+        signal = "NO_PATTERN"
+        recommendation = f"No alternating pattern. Results broke at position {break_point + 1}."
+        emoji = "〰️"
+
+    return {
+        "team": team_name,
+        "bet_type": bet_type,
+        "recent_results": last_four,
+        "full_history": normalized[:6],  # Show last 6
+        "is_alternating": is_alternating,
+        "lock_level": lock_level,
+        "predicted_next": predicted_next,
+        "signal": signal,
+        "recommendation": recommendation,
+        "lock_strength": round(lock_strength),
+        "gann_principle": "The Annulifier: Chaos balances through oscillation. 4 alternations create harmonic lock."
+    }
+
+
+def get_gann_physics_composite(
+    team_name: str,
+    last_game_margin: int = None,
+    current_spread: float = None,
+    was_win: bool = True,
+    recent_ats_results: list = None,
+    recent_wl_results: list = None
+) -> dict:
+    """
+    GANN PHYSICS COMPOSITE - All three laws combined
+
+    Returns unified analysis from:
+    1. 50% Retracement (Gravity Check)
+    2. Rule of Three (Exhaustion Node)
+    3. Annulifier Cycle (Harmonic Lock)
+
+    When multiple signals align = MAXIMUM CONVICTION
+    """
+
+    results = {
+        "team": team_name,
+        "version": "13.0",
+        "codename": "GANN_PHYSICS"
+    }
+
+    active_signals = []
+    total_strength = 0
+    signal_count = 0
+
+    # 1. 50% Retracement
+    if last_game_margin is not None and current_spread is not None:
+        retracement = analyze_fifty_percent_retracement(team_name, last_game_margin, current_spread, was_win)
+        results["retracement"] = retracement
+        if retracement["signal"] in ["GRAVITY_FADE", "GRAVITY_BOUNCE"]:
+            active_signals.append(retracement["signal"])
+            total_strength += retracement["fade_strength"]
+            signal_count += 1
+
+    # 2. Rule of Three
+    if recent_ats_results and len(recent_ats_results) >= 3:
+        exhaustion = analyze_rule_of_three(team_name, recent_ats_results)
+        results["exhaustion"] = exhaustion
+        if exhaustion["signal"] in ["EXHAUSTION_FADE", "EXHAUSTION_BACK"]:
+            active_signals.append(exhaustion["signal"])
+            total_strength += exhaustion["fade_strength"]
+            signal_count += 1
+
+    # 3. Annulifier Cycle
+    if recent_wl_results and len(recent_wl_results) >= 4:
+        annulifier = analyze_annulifier_cycle(team_name, recent_wl_results)
+        results["annulifier"] = annulifier
+        if annulifier["signal"] in ["LOCKED_WIN", "LOCKED_LOSS"]:
+            active_signals.append(annulifier["signal"])
+            total_strength += annulifier["lock_strength"]
+            signal_count += 1
+
+    # Calculate composite
+    if signal_count > 0:
+        composite_strength = total_strength / signal_count
+
+        # CONFLUENCE BONUS: Multiple Gann signals aligning
+        if signal_count >= 2:
+            confluence_bonus = 15 * (signal_count - 1)
+            composite_strength = min(100, composite_strength + confluence_bonus)
+
+        if signal_count >= 3:
+            conviction_level = "GANN_TRIFECTA"
+            emoji = "🏛️🏛️🏛️"
+            message = "ALL THREE GANN LAWS ACTIVE. Maximum geometric conviction."
+        elif signal_count == 2:
+            conviction_level = "DUAL_GEOMETRY"
+            emoji = "🏛️🏛️"
+            message = "Two Gann laws aligned. Strong geometric signal."
+        else:
+            conviction_level = "SINGLE_LAW"
+            emoji = "🏛️"
+            message = "One Gann law active. Moderate signal."
+    else:
+        composite_strength = 0
+        conviction_level = "NO_SIGNAL"
+        emoji = "📐"
+        message = "No active Gann physics signals."
+
+    results["composite"] = {
+        "active_signals": active_signals,
+        "signal_count": signal_count,
+        "composite_strength": round(composite_strength),
+        "conviction_level": conviction_level,
+        "emoji": emoji,
+        "message": message
+    }
+
+    # Determine final recommendation
+    fade_signals = sum(1 for s in active_signals if "FADE" in s or "LOSS" in s)
+    back_signals = sum(1 for s in active_signals if "BACK" in s or "WIN" in s or "BOUNCE" in s)
+
+    if fade_signals > back_signals:
+        results["final_recommendation"] = f"FADE {team_name}"
+        results["direction"] = "FADE"
+    elif back_signals > fade_signals:
+        results["final_recommendation"] = f"BACK {team_name}"
+        results["direction"] = "BACK"
+    else:
+        results["final_recommendation"] = "CONFLICTING SIGNALS - Use discretion"
+        results["direction"] = "NEUTRAL"
+
+    return results
+
+
+def scan_gann_physics(teams: list) -> list:
+    """
+    League scan: get_gann_physics_composite for each entry of teams (dicts
+    with team_name plus the composite's optional inputs; any other keys are
+    carried through as context), ranked strongest first.
+
+    Each result row is the context, the composite block, direction, final
+    recommendation and the signal of each law that had its inputs.
+    """
+    rows = []
+    for entry in teams:
+        inputs = {key: entry.get(key) for key in (
+            "last_game_margin", "current_spread", "recent_ats_results", "recent_wl_results"
+        )}
+        was_win = entry.get("was_win")
+        analysis = get_gann_physics_composite(
+            entry["team_name"], was_win=True if was_win is None else was_win, **inputs
+        )
+        rows.append({
+            **entry,
+            "composite": analysis["composite"],
+            "direction": analysis["direction"],
+            "final_recommendation": analysis["final_recommendation"],
+            "laws": {
+                law: analysis[law]["signal"]
+                for law in ("retracement", "exhaustion", "annulifier") if law in analysis
+            }
+        })
+    rows.sort(key=lambda row: (
+        -row["composite"]["signal_count"], -row["composite"]["composite_strength"], row["team_name"]
+    ))
+    return rows
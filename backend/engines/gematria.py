@@ -0,0 +1,454 @@
+"""
+GEMATRIA ENGINE - Twitter gematria community methods
+
+Jarvis trigger numbers, the 6-cipher system, date numerology, jersey number
+and storyline analysis.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+
+# ============================================================================
+# JARVIS TRIGGERS - THE PROVEN EDGE NUMBERS (v10.1 preserved)
+# ============================================================================
+
+JARVIS_TRIGGERS = {
+    2178: {
+        "name": "THE IMMORTAL",
+        "boost": 20,
+        "tier": "LEGENDARY",
+        "description": "Only number where n×4=reverse AND n×reverse=66^4. Never collapses.",
+        "mathematical": True
+    },
+    201: {
+        "name": "THE ORDER",
+        "boost": 12,
+        "tier": "HIGH",
+        "description": "Jesuit Order gematria. The Event of 201.",
+        "mathematical": False
+    },
+    33: {
+        "name": "THE MASTER",
+        "boost": 10,
+        "tier": "HIGH",
+        "description": "Highest master number. Masonic significance.",
+        "mathematical": False
+    },
+    93: {
+        "name": "THE WILL",
+        "boost": 10,
+        "tier": "HIGH",
+        "description": "Thelema sacred number. Will and Love.",
+        "mathematical": False
+    },
+    322: {
+        "name": "THE SOCIETY",
+        "boost": 10,
+        "tier": "HIGH",
+        "description": "Skull & Bones. Genesis 3:22.",
+        "mathematical": False
+    }
+}
+
+# Extended power numbers from Twitter gematria community
+POWER_NUMBERS = {
+    "master": [11, 22, 33, 44, 55, 66, 77, 88, 99],
+    "tesla": [3, 6, 9, 27, 36, 63, 72, 81, 108, 144, 216, 369],
+    "fibonacci": [1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377],
+    "sacred": [7, 12, 40, 72, 153, 666, 777, 888],
+    "jarvis": [2178, 201, 33, 93, 322],
+    "super_bowl": [56, 131, 58, 59],  # Super Bowl gematria markers
+    "nfl_favorites": [13, 17, 23, 32, 42]  # Common NFL narrative numbers
+}
+
+TESLA_NUMBERS = [3, 6, 9]
+
+# ============================================================================
+# TWITTER GEMATRIA COMMUNITY - 6 CIPHER SYSTEM
+# Sources: @gematriasports, @psgematria, @SportsGematria, @SGDecodes
+# ============================================================================
+
+def cipher_ordinal(text: str) -> int:
+    """Ordinal: A=1, B=2, ... Z=26 (most common cipher)"""
+    return sum(ord(c) - 64 for c in (text or "").upper() if 65 <= ord(c) <= 90)
+
+def cipher_reduction(text: str) -> int:
+    """Reduction/Pythagorean: Reduce to single digits (purest form)"""
+    total = 0
+    for c in (text or "").upper():
+        if 65 <= ord(c) <= 90:
+            val = ord(c) - 64
+            while val > 9:
+                val = sum(int(d) for d in str(val))
+            total += val
+    return total
+
+def cipher_reverse_ordinal(text: str) -> int:
+    """Reverse Ordinal: Z=1, Y=2, ... A=26"""
+    return sum(27 - (ord(c) - 64) for c in (text or "").upper() if 65 <= ord(c) <= 90)
+
+def cipher_reverse_reduction(text: str) -> int:
+    """Reverse Reduction: Reverse + reduce to single digits"""
+    total = 0
+    for c in (text or "").upper():
+        if 65 <= ord(c) <= 90:
+            val = 27 - (ord(c) - 64)
+            while val > 9:
+                val = sum(int(d) for d in str(val))
+            total += val
+    return total
+
+def cipher_sumerian(text: str) -> int:
+    """Sumerian: Multiply by 6 (A=6, B=12, ... Z=156)"""
+    return sum((ord(c) - 64) * 6 for c in (text or "").upper() if 65 <= ord(c) <= 90)
+
+def cipher_jewish(text: str) -> int:
+    """Jewish/Hebrew: Traditional Kabbalistic values"""
+    values = {
+        'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8, 'I': 9,
+        'K': 10, 'L': 20, 'M': 30, 'N': 40, 'O': 50, 'P': 60, 'Q': 70, 'R': 80,
+        'S': 90, 'T': 100, 'U': 200, 'V': 300, 'W': 400, 'X': 500, 'Y': 600, 'Z': 700, 'J': 600
+    }
+    return sum(values.get(c, 0) for c in (text or "").upper())
+
+CIPHER_NAMES = ("ordinal", "reduction", "reverse_ordinal", "reverse_reduction", "sumerian", "jewish")
+
+@lru_cache(maxsize=8192)
+def get_cipher_values(text: str) -> tuple:
+    """Cipher cache - all 6 cipher values for a text, in CIPHER_NAMES order"""
+    return (
+        cipher_ordinal(text),
+        cipher_reduction(text),
+        cipher_reverse_ordinal(text),
+        cipher_reverse_reduction(text),
+        cipher_sumerian(text),
+        cipher_jewish(text)
+    )
+
+def get_all_ciphers(text: str) -> dict:
+    """Calculate all 6 ciphers for a text string"""
+    return dict(zip(CIPHER_NAMES, get_cipher_values(text)))
+
+# ============================================================================
+# DATE NUMEROLOGY - Twitter Community Standard
+# ============================================================================
+
+def calculate_date_numerology(date: datetime = None) -> dict:
+    """
+    Full date numerology breakdown used by @gematriasports, @SportsGematria
+    """
+    if date is None:
+        date = datetime.now()
+
+    day = date.day
+    month = date.month
+    year = date.year
+    year_short = year % 100
+
+    # Standard reductions
+    def reduce(n):
+        while n > 9 and n not in [11, 22, 33]:
+            n = sum(int(d) for d in str(n))
+        return n
+
+    # Multiple date formats used by community
+    formats = {
+        "full": month + day + year,           # 1+9+2026
+        "short": month + day + year_short,    # 1+9+26
+        "day_month": day + month,             # 9+1
+        "month_day": month * 100 + day,       # 109
+    }
+
+    reductions = {k: reduce(v) for k, v in formats.items()}
+
+    # Life path number
+    life_path = reduce(sum(int(d) for d in f"{year}{month:02d}{day:02d}"))
+
+    # Check for power alignments
+    alignments = []
+    for fmt_name, value in formats.items():
+        if value in POWER_NUMBERS["master"]:
+            alignments.append(f"{fmt_name}={value} (MASTER)")
+        if value in POWER_NUMBERS["tesla"]:
+            alignments.append(f"{fmt_name}={value} (TESLA)")
+        if value in JARVIS_TRIGGERS:
+            alignments.append(f"{fmt_name}={value} (JARVIS: {JARVIS_TRIGGERS[value]['name']})")
+
+    for fmt_name, value in reductions.items():
+        if value in [3, 6, 9]:
+            alignments.append(f"{fmt_name} reduces to {value} (TESLA)")
+        if value in [11, 22, 33]:
+            alignments.append(f"{fmt_name} reduces to {value} (MASTER)")
+
+    return {
+        "date": date.strftime("%Y-%m-%d"),
+        "display": date.strftime("%a %b %d, %Y"),
+        "day": day,
+        "month": month,
+        "year": year,
+        "formats": formats,
+        "reductions": reductions,
+        "life_path": life_path,
+        "alignments": alignments,
+        "is_power_date": len(alignments) >= 2
+    }
+
+# ============================================================================
+# JERSEY NUMBER ANALYSIS - Key Twitter Community Method
+# ============================================================================
+
+def analyze_jersey_number(jersey: int, date: datetime = None) -> dict:
+    """
+    Jersey number analysis - matches jersey to date numerology
+    Used by @gematriasports, @SGDecodes for player props
+    """
+    if date is None:
+        date = datetime.now()
+
+    date_info = calculate_date_numerology(date)
+
+    # Reduce jersey
+    jersey_reduced = jersey
+    while jersey_reduced > 9 and jersey_reduced not in [11, 22, 33]:
+        jersey_reduced = sum(int(d) for d in str(jersey_reduced))
+
+    alignments = []
+    alignment_score = 0
+
+    # Direct match to date components
+    if jersey == date_info["day"]:
+        alignments.append(f"Jersey {jersey} = Day of month")
+        alignment_score += 25
+
+    if jersey == date_info["month"]:
+        alignments.append(f"Jersey {jersey} = Month")
+        alignment_score += 20
+
+    if jersey == date_info["life_path"]:
+        alignments.append(f"Jersey {jersey} = Life path number")
+        alignment_score += 30
+
+    # Reduction matches
+    for fmt_name, red_value in date_info["reductions"].items():
+        if jersey_reduced == red_value:
+            alignments.append(f"Jersey reduces to {jersey_reduced} = {fmt_name} reduction")
+            alignment_score += 15
+
+    # Power number check
+    if jersey in POWER_NUMBERS["master"]:
+        alignments.append(f"Jersey {jersey} = MASTER NUMBER")
+        alignment_score += 20
+
+    if jersey in POWER_NUMBERS["nfl_favorites"]:
+        alignments.append(f"Jersey {jersey} = NFL narrative number")
+        alignment_score += 10
+
+    # Jarvis trigger check
+    if jersey in JARVIS_TRIGGERS:
+        trigger = JARVIS_TRIGGERS[jersey]
+        alignments.append(f"Jersey {jersey} = JARVIS {trigger['name']}")
+        alignment_score += trigger["boost"]
+
+    return {
+        "jersey": jersey,
+        "jersey_reduced": jersey_reduced,
+        "date": date_info["display"],
+        "alignments": alignments,
+        "alignment_score": min(100, alignment_score),
+        "has_alignment": len(alignments) > 0,
+        "recommendation": "STRONG ALIGNMENT" if alignment_score >= 40 else "MODERATE" if alignment_score >= 20 else "WEAK"
+    }
+
+# ============================================================================
+# BEST STORYLINE ANALYSIS - Twitter Community Narrative Method
+# ============================================================================
+
+def analyze_storyline(home_team: str, away_team: str, context: dict = None) -> dict:
+    """
+    "Best Storyline" analysis - what narrative would the league push?
+    Based on @psgematria, Gematria Effect Sports methodology
+    """
+    context = context or {}
+
+    storylines = []
+    home_score = 50
+    away_score = 50
+
+    # Get all ciphers for both teams
+    home_ciphers = get_all_ciphers(home_team)
+    away_ciphers = get_all_ciphers(away_team)
+
+    # Check for championship/milestone narratives
+    championship_keywords = ["first", "revenge", "repeat", "dynasty", "historic", "record"]
+
+    # Cipher value analysis
+    for cipher_name, home_val in home_ciphers.items():
+        away_val = away_ciphers[cipher_name]
+
+        # Check Jarvis triggers
+        if home_val in JARVIS_TRIGGERS:
+            trigger = JARVIS_TRIGGERS[home_val]
+            storylines.append({
+                "team": home_team,
+                "type": "JARVIS_TRIGGER",
+                "cipher": cipher_name,
+                "value": home_val,
+                "detail": f"{home_team} {cipher_name}={home_val} ({trigger['name']})"
+            })
+            home_score += trigger["boost"]
+
+        if away_val in JARVIS_TRIGGERS:
+            trigger = JARVIS_TRIGGERS[away_val]
+            storylines.append({
+                "team": away_team,
+                "type": "JARVIS_TRIGGER",
+                "cipher": cipher_name,
+                "value": away_val,
+                "detail": f"{away_team} {cipher_name}={away_val} ({trigger['name']})"
+            })
+            away_score += trigger["boost"]
+
+        # Master numbers
+        if home_val in POWER_NUMBERS["master"]:
+            storylines.append({
+                "team": home_team,
+                "type": "MASTER_NUMBER",
+                "cipher": cipher_name,
+                "value": home_val,
+                "detail": f"{home_team} {cipher_name}={home_val} (Master)"
+            })
+            home_score += 8
+
+        if away_val in POWER_NUMBERS["master"]:
+            storylines.append({
+                "team": away_team,
+                "type": "MASTER_NUMBER",
+                "cipher": cipher_name,
+                "value": away_val,
+                "detail": f"{away_team} {cipher_name}={away_val} (Master)"
+            })
+            away_score += 8
+
+        # Tesla alignment (difference)
+        diff = abs(home_val - away_val)
+        if diff in POWER_NUMBERS["tesla"]:
+            storylines.append({
+                "team": "matchup",
+                "type": "TESLA_ALIGNMENT",
+                "cipher": cipher_name,
+                "value": diff,
+                "detail": f"{cipher_name} difference = {diff} (Tesla)"
+            })
+
+    # Determine favored team
+    if home_score > away_score + 10:
+        favored = "home"
+        favored_team = home_team
+        reasoning = f"{home_team} has stronger gematria storyline ({home_score} vs {away_score})"
+    elif away_score > home_score + 10:
+        favored = "away"
+        favored_team = away_team
+        reasoning = f"{away_team} has stronger gematria storyline ({away_score} vs {home_score})"
+    else:
+        favored = "neutral"
+        favored_team = None
+        reasoning = "No clear storyline advantage"
+
+    return {
+        "home_team": home_team,
+        "away_team": away_team,
+        "home_ciphers": home_ciphers,
+        "away_ciphers": away_ciphers,
+        "storylines": storylines[:10],  # Top 10
+        "home_score": min(100, home_score),
+        "away_score": min(100, away_score),
+        "favored": favored,
+        "favored_team": favored_team,
+        "reasoning": reasoning
+    }
+
+
+def validate_2178() -> dict:
+    """Prove the mathematical uniqueness of 2178"""
+    n = 2178
+    reversal = 8712
+    prop1 = (n * 4 == reversal)
+    prop2 = (n * reversal == 66**4)
+
+    return {
+        "number": n,
+        "reversal": reversal,
+        "n_times_4_equals_reversal": prop1,
+        "n_times_reversal": n * reversal,
+        "sixty_six_to_fourth": 66**4,
+        "n_times_reversal_equals_66_4": prop2,
+        "validated": prop1 and prop2,
+        "status": "IMMORTAL CONFIRMED" if (prop1 and prop2) else "VALIDATION FAILED"
+    }
+
+
+def digit_sum(n: int) -> int:
+    return sum(int(d) for d in str(abs(n)))
+
+
+def reduce_to_single(n: int) -> int:
+    while n > 9:
+        n = digit_sum(n)
+    return n
+
+
+# Each trigger's digital root, so check_jarvis_trigger doesn't re-reduce them per call
+_TRIGGER_ROOTS = {trigger_num: reduce_to_single(trigger_num) for trigger_num in JARVIS_TRIGGERS}
+
+
+def check_jarvis_trigger(value: int) -> dict:
+    """Check if a value triggers any Jarvis edge numbers"""
+    result = {
+        "triggered": False,
+        "triggers": [],
+        "total_boost": 0,
+        "highest_tier": None,
+        "details": []
+    }
+
+    str_value = str(abs(value))
+
+    if "2178" in str_value:
+        trigger = JARVIS_TRIGGERS[2178]
+        result["triggered"] = True
+        result["triggers"].append(2178)
+        result["total_boost"] += trigger["boost"]
+        result["highest_tier"] = "LEGENDARY"
+        result["details"].append("Contains THE IMMORTAL sequence (2178)")
+
+    if value in JARVIS_TRIGGERS:
+        trigger = JARVIS_TRIGGERS[value]
+        if value not in result["triggers"]:
+            result["triggered"] = True
+            result["triggers"].append(value)
+            result["total_boost"] += trigger["boost"]
+            if result["highest_tier"] != "LEGENDARY":
+                result["highest_tier"] = trigger["tier"]
+            result["details"].append(f"Direct match: {trigger['name']}")
+
+    reduced = reduce_to_single(value)
+    for trigger_num, trigger in JARVIS_TRIGGERS.items():
+        if trigger_num not in result["triggers"]:
+            if _TRIGGER_ROOTS[trigger_num] == reduced:
+                result["triggered"] = True
+                result["triggers"].append(trigger_num)
+                result["total_boost"] += trigger["boost"] * 0.5
+                result["details"].append(f"Reduces to same as {trigger['name']}")
+
+    if value % 33 == 0 and 33 not in result["triggers"]:
+        result["triggered"] = True
+        result["triggers"].append(33)
+        result["total_boost"] += 5
+        result["details"].append("Divisible by THE MASTER (33)")
+
+    if reduced in TESLA_NUMBERS:
+        result["details"].append(f"Tesla alignment: reduces to {reduced}")
+        result["total_boost"] += 2
+
+    return result
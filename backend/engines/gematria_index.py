@@ -0,0 +1,212 @@
+"""
+GEMATRIA INDEX - cipher value -> names, the reverse of get_all_ciphers
+
+"Which team or player hits 2178 (or 33) today" needs every name's six cipher
+values looked up by value. The index holds, per cipher:
+- value -> names with that value
+- the distinct values, sorted, so a range is two bisects
+- Jarvis trigger -> names whose value fires it, split by how it fires
+  ("direct": the value is the trigger or contains 2178, "divisible": a
+  multiple of 33, "reduction": same digital root, half boost)
+
+Names come from FRANCHISE_FOUNDING_DATES, TEAM_NAME_ALIASES and
+STAR_PLAYER_BIRTHDATES on first use, then from Odds API participants (teams
+in game snapshots, players in props snapshots) as they are seen. Adding a
+name costs its six cipher values and a check_jarvis_trigger per value;
+names already indexed only gain a kind.
+
+Config (env):
+- GEMATRIA_INDEX_MAX_PARTICIPANTS  Odds API names kept beyond the tables (default 20000)
+"""
+
+import os
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, Optional
+
+from engines import tables
+from engines.gematria import CIPHER_NAMES, JARVIS_TRIGGERS, check_jarvis_trigger, get_cipher_values
+
+GEMATRIA_INDEX_MAX_PARTICIPANTS = int(os.getenv("GEMATRIA_INDEX_MAX_PARTICIPANTS", "20000"))
+
+MATCH_KINDS = ("direct", "divisible", "reduction")
+ENTITY_KINDS = ("team", "alias", "player", "participant")
+
+
+def trigger_match(trigger: int, value: int) -> str:
+    """How a value that fires trigger (per check_jarvis_trigger) fires it"""
+    if value == trigger or (trigger == 2178 and "2178" in str(abs(value))):
+        return "direct"
+    if trigger == 33 and value % 33 == 0:
+        return "divisible"
+    return "reduction"
+
+
+class GematriaIndex:
+    """Inverted index (cipher, value) -> names, grown one name at a time"""
+
+    def __init__(self, max_participants: int = None):
+        self.max_participants = max_participants or GEMATRIA_INDEX_MAX_PARTICIPANTS
+        self._entities = {}
+        self._by_value = {cipher: {} for cipher in CIPHER_NAMES}
+        self._values = {cipher: [] for cipher in CIPHER_NAMES}
+        self._by_trigger = {
+            cipher: {trigger: {kind: [] for kind in MATCH_KINDS} for trigger in JARVIS_TRIGGERS}
+            for cipher in CIPHER_NAMES
+        }
+        self._lock = threading.Lock()
+        self._tables_loaded = False
+        self.participants = 0
+        self.dropped = 0
+        self.versions = {}
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def _index(self, name: str, values: tuple):
+        for cipher, value in zip(CIPHER_NAMES, values):
+            names = self._by_value[cipher].get(value)
+            if names is None:
+                names = self._by_value[cipher][value] = []
+                insort(self._values[cipher], value)
+            names.append(name)
+            for trigger in check_jarvis_trigger(value)["triggers"]:
+                self._by_trigger[cipher][trigger][trigger_match(trigger, value)].append(name)
+
+    def add(self, name: str, kind: str, canonical: str = None) -> bool:
+        """Index a name (no-op beyond recording the kind if known) -> True if it was new"""
+        name = (name or "").strip()
+        if not name or not any(c.isalpha() for c in name):
+            return False
+        with self._lock:
+            entity = self._entities.get(name)
+            if entity is not None:
+                if kind not in entity["kinds"]:
+                    entity["kinds"].append(kind)
+                if canonical and not entity["canonical"]:
+                    entity["canonical"] = canonical
+                return False
+            if kind == "participant":
+                if self.participants >= self.max_participants:
+                    self.dropped += 1
+                    return False
+                self.participants += 1
+            values = get_cipher_values(name)
+            self._entities[name] = {"kinds": [kind], "canonical": canonical, "values": values}
+            self._index(name, values)
+        return True
+
+    def ensure_tables(self) -> dict:
+        """Index the reference tables once -> counts"""
+        if not self._tables_loaded:
+            for team in tables.FRANCHISE_FOUNDING_DATES:
+                self.add(team, "team", team)
+            for alias, team in tables.TEAM_NAME_ALIASES.items():
+                self.add(alias, "alias", team)
+            for player in tables.STAR_PLAYER_BIRTHDATES:
+                self.add(player, "player", player)
+            self._tables_loaded = True
+        return self.stats()
+
+    def add_participants(self, names: Iterable[str], key: str = None, version=None) -> int:
+        """
+        Index Odds API names -> how many were new. With key/version (a snapshot)
+        a version already ingested is skipped without touching the names.
+        """
+        if key is not None:
+            with self._lock:
+                if self.versions.get(key) == version:
+                    return 0
+                self.versions[key] = version
+        return sum(self.add(name, "participant") for name in names)
+
+    def ingested(self, key: str, version) -> bool:
+        """This snapshot version's names are already indexed"""
+        return self.versions.get(key) == version
+
+    # ------------------------------------------------------------------
+    # Queries - under the lock, as ensure_tables may be adding from a thread.
+    # Each returns (rows, count): every match is counted, only the first
+    # limit are built into rows.
+    # ------------------------------------------------------------------
+
+    def _collect(self, hits: list, cipher: str, names: Iterable[str], kinds: Optional[set], **extra):
+        for name in names:
+            if not kinds or not kinds.isdisjoint(self._entities[name]["kinds"]):
+                hits.append((cipher, name, extra))
+
+    def _rows(self, hits: list, limit: Optional[int]) -> list:
+        rows = []
+        for cipher, name, extra in hits[:limit]:
+            entity = self._entities[name]
+            rows.append({
+                "name": name,
+                "kinds": list(entity["kinds"]),
+                "canonical": entity["canonical"],
+                "cipher": cipher,
+                "value": entity["values"][CIPHER_NAMES.index(cipher)],
+                **extra
+            })
+        return rows
+
+    def lookup(self, value: int, ciphers: Iterable[str] = CIPHER_NAMES, kinds: set = None, limit: int = None) -> tuple:
+        """Names whose cipher value equals value"""
+        hits = []
+        with self._lock:
+            for cipher in ciphers:
+                self._collect(hits, cipher, self._by_value[cipher].get(value, ()), kinds)
+            return self._rows(hits, limit), len(hits)
+
+    def value_range(
+        self,
+        low: int,
+        high: int,
+        ciphers: Iterable[str] = CIPHER_NAMES,
+        kinds: set = None,
+        limit: int = None
+    ) -> tuple:
+        """Names whose cipher value is in [low, high], by cipher then value"""
+        hits = []
+        with self._lock:
+            for cipher in ciphers:
+                values = self._values[cipher]
+                for value in values[bisect_left(values, low):bisect_right(values, high)]:
+                    self._collect(hits, cipher, self._by_value[cipher][value], kinds)
+            return self._rows(hits, limit), len(hits)
+
+    def triggered(
+        self,
+        trigger: int,
+        ciphers: Iterable[str] = CIPHER_NAMES,
+        matches: Iterable[str] = MATCH_KINDS,
+        kinds: set = None,
+        limit: int = None
+    ) -> tuple:
+        """Names whose cipher value fires a Jarvis trigger, strongest match first"""
+        hits = []
+        with self._lock:
+            for match in matches:
+                for cipher in ciphers:
+                    self._collect(hits, cipher, self._by_trigger[cipher][trigger][match], kinds, match=match)
+            return self._rows(hits, limit), len(hits)
+
+    def stats(self) -> dict:
+        kinds = {kind: 0 for kind in ENTITY_KINDS}
+        with self._lock:
+            for entity in self._entities.values():
+                for kind in entity["kinds"]:
+                    kinds[kind] += 1
+            return {
+                "names": len(self._entities),
+                "kinds": kinds,
+                "distinct_values": {cipher: len(self._values[cipher]) for cipher in CIPHER_NAMES},
+                "participants_dropped": self.dropped,
+                "snapshots_ingested": len(self.versions)
+            }
+
+
+gematria_index = GematriaIndex()
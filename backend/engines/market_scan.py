@@ -0,0 +1,259 @@
+"""
+MARKET SCAN - cross-book arbitrage, middles and stale lines over a slate
+
+Every bookmaker's quote for the slate (game spreads, totals and moneylines,
+player props) is flattened into one columnar QuoteTable, then scanned in a
+single pass that keeps, per two-way market:
+- the best price on each side at each line -> arbitrage when the two best
+  prices' implied probabilities sum below 1
+- the most favorable line on each side (best price breaking ties) -> a
+  middle when the two sides' lines leave a window where both win
+- each book's line (moneylines: implied probability) -> stale when a book
+  sits far from the median of at least MARKET_MIN_BOOKS books
+
+Sides are 0 = home / Over and 1 = away / Under. Spreads are keyed by the
+home team's point (an away +5.5 is a home -5.5), so both sides of the same
+line land in one market.
+
+Config (env):
+- MARKET_STALE_POINTS       spread / total points off consensus for stale (default 1.5)
+- MARKET_STALE_PROP_POINTS  prop line points off consensus for stale (default 1.0)
+- MARKET_STALE_PROB         moneyline implied probability off consensus for stale (default 0.05)
+- MARKET_MIN_BOOKS          books quoting a market before it has a consensus (default 3)
+"""
+
+import os
+from statistics import median
+from typing import Iterable
+
+MARKET_STALE_POINTS = float(os.getenv("MARKET_STALE_POINTS", "1.5"))
+MARKET_STALE_PROP_POINTS = float(os.getenv("MARKET_STALE_PROP_POINTS", "1.0"))
+MARKET_STALE_PROB = float(os.getenv("MARKET_STALE_PROB", "0.05"))
+MARKET_MIN_BOOKS = int(os.getenv("MARKET_MIN_BOOKS", "3"))
+
+GAME_MARKETS = ("spreads", "totals", "h2h")
+FINDINGS = ("arbitrage", "middles", "stale")
+
+
+def american_to_decimal(price: float) -> float:
+    """American odds -> decimal (stake included)"""
+    return 1 + (price / 100 if price > 0 else 100 / -price)
+
+
+def decimal_to_american(decimal: float) -> int:
+    """Decimal odds (stake included) -> American, rounded"""
+    return round((decimal - 1) * 100 if decimal >= 2 else -100 / (decimal - 1))
+
+
+def prop_market(value) -> str:
+    """'player_points', 'Points', 'points' -> 'points'"""
+    return str(value or "").lower().replace("player_", "").replace(" ", "_")
+
+
+class QuoteTable:
+    """One row per bookmaker outcome, stored as parallel columns"""
+
+    def __init__(self):
+        self.events = []
+        self.event = []
+        self.market = []
+        self.player = []
+        self.book = []
+        self.side = []
+        self.selection = []
+        self.point = []
+        self.line = []
+        self.price = []
+        self.decimal = []
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def add_event(self, event: dict) -> int:
+        self.events.append({
+            "event_id": event.get("id"),
+            "home_team": event.get("home_team"),
+            "away_team": event.get("away_team"),
+            "commence_time": event.get("commence_time")
+        })
+        return len(self.events) - 1
+
+    def add(self, event: int, market: str, player, book: str, side: int, selection: str, point, line, price):
+        self.event.append(event)
+        self.market.append(market)
+        self.player.append(player)
+        self.book.append(book)
+        self.side.append(side)
+        self.selection.append(selection)
+        self.point.append(point)
+        self.line.append(line)
+        self.price.append(price)
+        self.decimal.append(american_to_decimal(price))
+
+    def leg(self, row: int) -> dict:
+        return {
+            "book": self.book[row],
+            "selection": self.selection[row],
+            "point": self.point[row],
+            "price": self.price[row]
+        }
+
+
+def game_outcome_side(market: str, name: str, event: dict):
+    if market == "totals":
+        return {"Over": 0, "Under": 1}.get(name)
+    return {event.get("home_team"): 0, event.get("away_team"): 1}.get(name)
+
+
+def flatten_quotes(games: Iterable[dict] = (), prop_events: Iterable[tuple] = ()) -> QuoteTable:
+    """
+    games: Odds API odds entries (bookmakers inline); prop_events: (event,
+    event odds payload) pairs. Outcomes without a price, with no side
+    (draws, three-way markets) or, outside moneylines, without a point are left out.
+    """
+    table = QuoteTable()
+    for game in games:
+        event = table.add_event(game)
+        for bookmaker in game.get("bookmakers", []):
+            book = bookmaker.get("title") or bookmaker.get("key", "Unknown")
+            for market in bookmaker.get("markets", []):
+                key = market.get("key")
+                if key not in GAME_MARKETS:
+                    continue
+                for outcome in market.get("outcomes", []):
+                    side = game_outcome_side(key, outcome.get("name"), game)
+                    point, price = outcome.get("point"), outcome.get("price")
+                    if side is None or not price or (key != "h2h" and point is None):
+                        continue
+                    line = None if key == "h2h" else point if key == "totals" or side == 0 else -point
+                    table.add(event, key, None, book, side, outcome["name"], point, line, price)
+
+    for game, props_data in prop_events:
+        event = table.add_event(game)
+        for bookmaker in props_data.get("bookmakers", []):
+            book = bookmaker.get("title") or bookmaker.get("key", "Unknown")
+            for market in bookmaker.get("markets", []):
+                for outcome in market.get("outcomes", []):
+                    side = {"Over": 0, "Under": 1}.get(outcome.get("name"))
+                    point, price = outcome.get("point"), outcome.get("price")
+                    if side is None or not price or point is None or not outcome.get("description"):
+                        continue
+                    table.add(
+                        event, market.get("key", ""), outcome["description"], book, side,
+                        outcome["name"], point, point, price
+                    )
+    return table
+
+
+def scan_quotes(
+    table: QuoteTable,
+    stale_points: float = None,
+    stale_prop_points: float = None,
+    stale_prob: float = None,
+    min_books: int = None
+) -> dict:
+    """One pass over the table -> {"arbitrage", "middles", "stale"}, each ranked best first"""
+    stale_points = MARKET_STALE_POINTS if stale_points is None else stale_points
+    stale_prop_points = MARKET_STALE_PROP_POINTS if stale_prop_points is None else stale_prop_points
+    stale_prob = MARKET_STALE_PROB if stale_prob is None else stale_prob
+    min_books = MARKET_MIN_BOOKS if min_books is None else min_books
+
+    best_price = {}   # (event, market, player, line, side) -> row
+    best_line = {}    # (event, market, player, side) -> row
+    book_value = {}   # (event, market, player) -> {book: line, or implied probability for h2h}
+    for row in range(len(table)):
+        market_key = (table.event[row], table.market[row], table.player[row])
+        side, line, decimal = table.side[row], table.line[row], table.decimal[row]
+
+        key = (*market_key, line, side)
+        current = best_price.get(key)
+        if current is None or decimal > table.decimal[current]:
+            best_price[key] = row
+
+        if line is not None:
+            # Spreads: home wants the highest home point, away the lowest; totals and props the reverse
+            sign = (1 if table.market[row] == "spreads" else -1) * (1 if side == 0 else -1)
+            key = (*market_key, side)
+            current = best_line.get(key)
+            if current is None or (sign * line, decimal) > (sign * table.line[current], table.decimal[current]):
+                best_line[key] = row
+
+        if side == 0:
+            books = book_value.setdefault(market_key, {})
+            books.setdefault(table.book[row], 1 / decimal if line is None else line)
+
+    def context(row: int) -> dict:
+        return {**table.events[table.event[row]], "market": table.market[row], "player": table.player[row]}
+
+    arbitrage = []
+    for (event, market, player, line, side), home in best_price.items():
+        away = best_price.get((event, market, player, line, 1))
+        if side != 0 or away is None:
+            continue
+        implied = 1 / table.decimal[home] + 1 / table.decimal[away]
+        if implied < 1:
+            arbitrage.append({
+                **context(home),
+                "line": line,
+                "legs": [
+                    {**table.leg(home), "stake_pct": round(100 / table.decimal[home] / implied, 2)},
+                    {**table.leg(away), "stake_pct": round(100 / table.decimal[away] / implied, 2)}
+                ],
+                "implied_total": round(implied, 4),
+                "profit_pct": round((1 / implied - 1) * 100, 2)
+            })
+    arbitrage.sort(key=lambda entry: -entry["profit_pct"])
+
+    middles = []
+    for (event, market, player, side), first in best_line.items():
+        second = best_line.get((event, market, player, 1))
+        if side != 0 or second is None:
+            continue
+        width = table.line[first] - table.line[second]
+        if market != "spreads":
+            width = -width
+        if width > 0:
+            d0, d1 = table.decimal[first], table.decimal[second]
+            middles.append({
+                **context(first),
+                "legs": [table.leg(first), table.leg(second)],
+                "width": width,
+                # Net per unit on each side when the result lands outside the window
+                "miss_result": round(min(d0, d1) - 2, 4),
+                "hit_result": round(d0 + d1 - 2, 4)
+            })
+    middles.sort(key=lambda entry: (-entry["width"], -entry["miss_result"]))
+
+    stale = []
+    for (event, market, player), books in book_value.items():
+        if len(books) < min_books:
+            continue
+        consensus = median(books.values())
+        if market == "h2h":
+            threshold = stale_prob
+        else:
+            threshold = stale_points if player is None else stale_prop_points
+        for book, value in books.items():
+            deviation = value - consensus
+            if abs(deviation) >= threshold:
+                stale.append({
+                    **table.events[event],
+                    "market": market,
+                    "player": player,
+                    "book": book,
+                    "measure": "implied_probability" if market == "h2h" else "line",
+                    "value": round(value, 4),
+                    "consensus": round(consensus, 4),
+                    "deviation": round(deviation, 4),
+                    "books": len(books),
+                    "severity": round(abs(deviation) / threshold, 2)
+                })
+    stale.sort(key=lambda entry: -entry["severity"])
+
+    return {"arbitrage": arbitrage, "middles": middles, "stale": stale}
+
+
+def scan_market_lines(games: Iterable[dict] = (), prop_events: Iterable[tuple] = ()) -> dict:
+    """flatten_quotes + scan_quotes -> findings plus the quote / event counts"""
+    table = flatten_quotes(games, prop_events)
+    return {"quotes": len(table), "events": len(table.events), **scan_quotes(table)}
@@ -0,0 +1,466 @@
+"""
+v14.0 NOOSPHERE VELOCITY - The Global Mind (MAIN MODEL INTEGRATION)
+
+Insider Leak (Silent Spike) | Main Character Syndrome | Phantom Injury
+"Someone always knows." - Information Asymmetry Detection
+"""
+
+from engines import tables
+
+
+# ============================================================================
+# v14.0: NOOSPHERE VELOCITY - The Global Mind Signal (MAIN MODEL)
+# "Someone always knows." - Information Asymmetry Detection
+# Princeton Global Consciousness Project meets Sports Betting
+# ============================================================================
+
+# Baseline search volumes (relative scale 0-100) for calibration
+# TEAM_BASELINE_VOLUMES -> data/team_baseline_volumes.json, loaded on first use (engines.tables)
+
+# Injury-related search terms that indicate "Phantom Injury"
+INJURY_RELATED_TERMS = [
+    "injury", "injured", "hurt", "limp", "limping", "grimace", "grimacing",
+    "questionable", "doubtful", "out", "DNP", "rest", "load management",
+    "ankle", "knee", "hamstring", "back", "shoulder", "wrist", "concussion",
+    "illness", "sick", "flu", "covid", "protocol", "warmups", "practice"
+]
+
+
+def get_baseline_volume(team_name: str) -> int:
+    """Get baseline search volume for a team"""
+    for key in tables.TEAM_BASELINE_VOLUMES:
+        if key.lower() in team_name.lower() or team_name.lower() in key.lower():
+            val = tables.TEAM_BASELINE_VOLUMES[key]
+            return int(val) if isinstance(val, (int, float)) else 30
+    return tables.TEAM_BASELINE_VOLUMES.get("default", 30)
+
+
+def calculate_volume_velocity(current_volume: float, baseline_volume: float) -> dict:
+    """
+    Calculate search volume velocity (rate of change)
+
+    Returns velocity metrics:
+    - velocity_pct: Percentage above/below baseline
+    - velocity_tier: SILENT_SPIKE, LOUD_SPIKE, NORMAL, DEAD
+    """
+    if baseline_volume <= 0:
+        baseline_volume = 30
+
+    velocity_pct = ((current_volume - baseline_volume) / baseline_volume) * 100
+
+    if velocity_pct >= 300:
+        tier = "EXTREME_SPIKE"
+        description = "Massive unexplained interest"
+    elif velocity_pct >= 200:
+        tier = "SILENT_SPIKE"
+        description = "Strong phantom signal"
+    elif velocity_pct >= 100:
+        tier = "ELEVATED"
+        description = "Above normal interest"
+    elif velocity_pct >= 50:
+        tier = "MILD_SPIKE"
+        description = "Slightly elevated"
+    elif velocity_pct <= -50:
+        tier = "DEAD"
+        description = "Unusually low interest"
+    else:
+        tier = "NORMAL"
+        description = "Baseline activity"
+
+    return {
+        "current_volume": current_volume,
+        "baseline_volume": baseline_volume,
+        "velocity_pct": round(velocity_pct, 1),
+        "tier": tier,
+        "description": description
+    }
+
+
+def detect_insider_leak(
+    team_name: str,
+    current_volume: float,
+    has_news: bool = False,
+    news_sentiment: str = "neutral",  # "positive", "negative", "neutral"
+    baseline_volume: float = None
+) -> dict:
+    """
+    INSIDER LEAK DETECTION (The Line-Mover)
+
+    Silent Spike (High volume + No news) = Someone knows something
+    FADE the team with the unexplained spike - bad news is coming.
+
+    The Science: Information leaks to cousins, trainers, beat writers.
+    They search to confirm the rumor before news breaks.
+
+    baseline_volume: a measured baseline (noosphere_stream) instead of TEAM_BASELINE_VOLUMES
+    """
+    baseline = baseline_volume if baseline_volume is not None else get_baseline_volume(team_name)
+    velocity = calculate_volume_velocity(current_volume, baseline)
+
+    # The key insight: High volume WITHOUT news = insider activity
+    is_silent_spike = velocity["velocity_pct"] >= 200 and not has_news
+
+    # If there IS news, the spike is "loud" and oddsmakers already adjusted
+    is_loud_spike = velocity["velocity_pct"] >= 200 and has_news
+
+    if is_silent_spike:
+        signal = "INSIDER_LEAK_DETECTED"
+        confidence = min(95, 70 + (velocity["velocity_pct"] - 200) / 10)
+        recommendation = f"🚨 FADE {team_name}. Silent spike ({velocity['velocity_pct']:.0f}%) with NO news. Someone knows."
+        action = "FADE"
+        edge_score = min(100, velocity["velocity_pct"] / 3)
+    elif is_loud_spike:
+        signal = "LOUD_SPIKE_NO_EDGE"
+        confidence = 50
+        recommendation = f"Loud spike but news is public. Line already adjusted. No edge."
+        action = "NEUTRAL"
+        edge_score = 0
+    elif velocity["tier"] == "DEAD":
+        signal = "DEAD_INTEREST"
+        confidence = 60
+        recommendation = f"Unusually low interest in {team_name}. Potential trap game."
+        action = "CAUTION"
+        edge_score = 25
+    else:
+        signal = "NO_ANOMALY"
+        confidence = 50
+        recommendation = "Normal search activity. No insider signal detected."
+        action = "NEUTRAL"
+        edge_score = 0
+
+    return {
+        "team": team_name,
+        "signal_type": "INSIDER_LEAK",
+        "velocity": velocity,
+        "has_news": has_news,
+        "news_sentiment": news_sentiment,
+        "is_silent_spike": is_silent_spike,
+        "is_loud_spike": is_loud_spike,
+        "signal": signal,
+        "confidence": round(confidence),
+        "recommendation": recommendation,
+        "action": action,
+        "edge_score": round(edge_score),
+        "principle": "Silent Spike = Information asymmetry. Someone always knows first."
+    }
+
+
+def detect_main_character_syndrome(
+    underdog_name: str,
+    favorite_name: str,
+    underdog_volume: float,
+    favorite_volume: float,
+    underdog_spread: float,
+    sentiment: str = "manic"  # "manic", "negative", "neutral"
+) -> dict:
+    """
+    MAIN CHARACTER SYNDROME (The Energy Shift)
+
+    When underdog has HIGHER search volume than favorite = Collective manifestation.
+    The Noosphere has decided this is the "Upset of the Night."
+
+    The Science: Memes, hype videos, "belief" energy.
+    The collective consciousness wills the ball into the hoop.
+    """
+    underdog_baseline = get_baseline_volume(underdog_name)
+    favorite_baseline = get_baseline_volume(favorite_name)
+
+    underdog_velocity = calculate_volume_velocity(underdog_volume, underdog_baseline)
+    favorite_velocity = calculate_volume_velocity(favorite_volume, favorite_baseline)
+
+    # Main Character = Underdog has more volume than favorite (adjusted for baseline)
+    volume_ratio = underdog_volume / max(favorite_volume, 1)
+    adjusted_ratio = (underdog_volume / underdog_baseline) / max((favorite_volume / favorite_baseline), 0.1)
+
+    is_main_character = adjusted_ratio > 1.5 and sentiment == "manic"
+    is_strong_main_character = adjusted_ratio > 2.0 and sentiment == "manic"
+
+    if is_strong_main_character:
+        signal = "STRONG_MAIN_CHARACTER"
+        confidence = min(92, 75 + (adjusted_ratio - 2) * 10)
+        recommendation = f"⭐ BET {underdog_name} (DOG). STRONG Main Character energy. The Noosphere chose this upset."
+        action = "BET_DOG"
+        edge_score = min(100, adjusted_ratio * 35)
+    elif is_main_character:
+        signal = "MAIN_CHARACTER_ACTIVE"
+        confidence = min(82, 65 + (adjusted_ratio - 1.5) * 15)
+        recommendation = f"🎬 BET {underdog_name} (DOG). Main Character syndrome detected. Collective belief active."
+        action = "BET_DOG"
+        edge_score = min(85, adjusted_ratio * 30)
+    elif adjusted_ratio > 1.2:
+        signal = "MILD_ENERGY_SHIFT"
+        confidence = 58
+        recommendation = f"Slight energy toward {underdog_name}. Monitor for escalation."
+        action = "WATCH"
+        edge_score = 15
+    else:
+        signal = "NO_ENERGY_SHIFT"
+        confidence = 50
+        recommendation = "Normal volume distribution. Favorite remains the narrative."
+        action = "NEUTRAL"
+        edge_score = 0
+
+    return {
+        "underdog": underdog_name,
+        "favorite": favorite_name,
+        "signal_type": "MAIN_CHARACTER",
+        "underdog_velocity": underdog_velocity,
+        "favorite_velocity": favorite_velocity,
+        "volume_ratio": round(volume_ratio, 2),
+        "adjusted_ratio": round(adjusted_ratio, 2),
+        "sentiment": sentiment,
+        "spread": underdog_spread,
+        "is_main_character": is_main_character or is_strong_main_character,
+        "signal": signal,
+        "confidence": round(confidence),
+        "recommendation": recommendation,
+        "action": action,
+        "edge_score": round(edge_score),
+        "principle": "The Hive Mind chose the upset. Collective belief manifests outcomes."
+    }
+
+
+def detect_phantom_injury(
+    player_name: str,
+    player_volume: float,
+    player_baseline: float = 50,
+    related_queries: list = None,
+    has_official_injury_report: bool = False
+) -> dict:
+    """
+    PHANTOM INJURY DETECTION (The Prop Killer)
+
+    Player search spike + injury-related queries + NO official report = Hidden limitation.
+    Fans at arena/warmups saw something beat writers ignored.
+
+    The Science: The Hive sees physical weakness before stats reflect it.
+    """
+    related_queries = related_queries or []
+
+    velocity = calculate_volume_velocity(player_volume, player_baseline)
+
+    # Check for injury-related search terms
+    injury_query_count = 0
+    injury_queries_found = []
+    for query in related_queries:
+        query_lower = query.lower()
+        for term in INJURY_RELATED_TERMS:
+            if term in query_lower:
+                injury_query_count += 1
+                injury_queries_found.append(query)
+                break
+
+    injury_query_ratio = injury_query_count / max(len(related_queries), 1)
+
+    # Phantom Injury = Volume spike + Injury queries + NO official report
+    is_phantom_injury = (
+        velocity["velocity_pct"] >= 100 and
+        injury_query_ratio >= 0.3 and
+        not has_official_injury_report
+    )
+
+    is_strong_phantom = (
+        velocity["velocity_pct"] >= 200 and
+        injury_query_ratio >= 0.5 and
+        not has_official_injury_report
+    )
+
+    if is_strong_phantom:
+        signal = "STRONG_PHANTOM_INJURY"
+        confidence = min(90, 72 + injury_query_ratio * 30)
+        recommendation = f"🩹 BET UNDER on {player_name} props. Strong phantom injury signal. The Hive sees limitation."
+        action = "BET_UNDER"
+        edge_score = min(95, velocity["velocity_pct"] / 2.5 + injury_query_ratio * 50)
+    elif is_phantom_injury:
+        signal = "PHANTOM_INJURY_DETECTED"
+        confidence = min(78, 60 + injury_query_ratio * 25)
+        recommendation = f"⚠️ Lean UNDER on {player_name}. Phantom injury queries detected. Monitor warmups."
+        action = "LEAN_UNDER"
+        edge_score = min(75, velocity["velocity_pct"] / 3 + injury_query_ratio * 40)
+    elif has_official_injury_report:
+        signal = "OFFICIAL_INJURY"
+        confidence = 50
+        recommendation = f"Official injury report exists. Line already adjusted."
+        action = "NEUTRAL"
+        edge_score = 0
+    else:
+        signal = "NO_PHANTOM"
+        confidence = 50
+        recommendation = "No phantom injury signals. Normal activity."
+        action = "NEUTRAL"
+        edge_score = 0
+
+    return {
+        "player": player_name,
+        "signal_type": "PHANTOM_INJURY",
+        "velocity": velocity,
+        "related_queries": related_queries,
+        "injury_queries_found": injury_queries_found,
+        "injury_query_ratio": round(injury_query_ratio, 2),
+        "has_official_report": has_official_injury_report,
+        "is_phantom_injury": is_phantom_injury or is_strong_phantom,
+        "signal": signal,
+        "confidence": round(confidence),
+        "recommendation": recommendation,
+        "action": action,
+        "edge_score": round(edge_score),
+        "principle": "The Hive sees physical weakness before stats reflect it."
+    }
+
+
+def calculate_noosphere_velocity(
+    team_name: str,
+    opponent_name: str = None,
+    team_volume: float = None,
+    opponent_volume: float = None,
+    has_news: bool = False,
+    is_underdog: bool = False,
+    spread: float = None,
+    sentiment: str = "neutral",
+    player_name: str = None,
+    player_volume: float = None,
+    player_queries: list = None,
+    team_baseline: float = None,
+    player_baseline: float = None,
+    player_injury_report: bool = False
+) -> dict:
+    """
+    NOOSPHERE VELOCITY - Composite Signal for Main Model
+
+    Combines all three detection methods:
+    1. Insider Leak (Silent Spike) - FADE team with unexplained spike
+    2. Main Character Syndrome - BET underdog with higher volume
+    3. Phantom Injury - BET UNDER on player props
+
+    Returns weighted signal for main confidence calculation.
+
+    team_baseline / player_baseline: measured baselines (noosphere_stream) in
+    place of TEAM_BASELINE_VOLUMES / the phantom-injury default.
+    """
+    results = {
+        "team": team_name,
+        "version": "14.0",
+        "codename": "NOOSPHERE_VELOCITY",
+        "active_signals": [],
+        "signals": {}
+    }
+
+    total_edge = 0
+    signal_count = 0
+
+    # 1. Insider Leak Detection
+    if team_volume is not None:
+        insider = detect_insider_leak(team_name, team_volume, has_news, baseline_volume=team_baseline)
+        results["signals"]["insider_leak"] = insider
+        if insider["signal"] == "INSIDER_LEAK_DETECTED":
+            results["active_signals"].append("INSIDER_LEAK")
+            total_edge += insider["edge_score"]
+            signal_count += 1
+
+    # 2. Main Character Syndrome
+    if opponent_name and team_volume is not None and opponent_volume is not None and is_underdog:
+        main_char = detect_main_character_syndrome(
+            underdog_name=team_name,
+            favorite_name=opponent_name,
+            underdog_volume=team_volume,
+            favorite_volume=opponent_volume,
+            underdog_spread=spread or 0,
+            sentiment=sentiment
+        )
+        results["signals"]["main_character"] = main_char
+        if main_char["is_main_character"]:
+            results["active_signals"].append("MAIN_CHARACTER")
+            total_edge += main_char["edge_score"]
+            signal_count += 1
+
+    # 3. Phantom Injury (Player Props)
+    if player_name and player_volume is not None:
+        phantom = detect_phantom_injury(
+            player_name=player_name,
+            player_volume=player_volume,
+            player_baseline=player_baseline if player_baseline is not None else 50,
+            related_queries=player_queries or [],
+            has_official_injury_report=player_injury_report
+        )
+        results["signals"]["phantom_injury"] = phantom
+        if phantom["is_phantom_injury"]:
+            results["active_signals"].append("PHANTOM_INJURY")
+            total_edge += phantom["edge_score"]
+            signal_count += 1
+
+    # Calculate composite score for main model integration
+    if signal_count > 0:
+        composite_edge = total_edge / signal_count
+
+        # Confluence bonus - multiple Noosphere signals = stronger
+        if signal_count >= 2:
+            composite_edge = min(100, composite_edge * 1.25)
+
+        if signal_count >= 3:
+            noosphere_tier = "FULL_NOOSPHERE"
+            message = "🌐 ALL NOOSPHERE SIGNALS ACTIVE. Maximum information asymmetry."
+        elif signal_count == 2:
+            noosphere_tier = "DUAL_SIGNAL"
+            message = "🌐 Two Noosphere signals aligned. Strong edge."
+        else:
+            noosphere_tier = "SINGLE_SIGNAL"
+            message = "🌐 Noosphere signal detected."
+    else:
+        composite_edge = 0
+        noosphere_tier = "SILENT"
+        message = "No Noosphere anomalies detected."
+
+    # Convert edge to main model score (0-100 scale)
+    # High edge = high score, which boosts confidence
+    noosphere_score = min(100, 50 + composite_edge * 0.5)
+
+    results["composite"] = {
+        "signal_count": signal_count,
+        "total_edge": round(total_edge),
+        "composite_edge": round(composite_edge),
+        "noosphere_score": round(noosphere_score),  # For main model integration
+        "noosphere_tier": noosphere_tier,
+        "message": message
+    }
+
+    # Determine primary action
+    if "INSIDER_LEAK" in results["active_signals"]:
+        results["primary_action"] = "FADE"
+        results["primary_target"] = team_name
+    elif "MAIN_CHARACTER" in results["active_signals"]:
+        results["primary_action"] = "BET_DOG"
+        results["primary_target"] = team_name
+    elif "PHANTOM_INJURY" in results["active_signals"]:
+        results["primary_action"] = "BET_UNDER"
+        results["primary_target"] = player_name
+    else:
+        results["primary_action"] = "NEUTRAL"
+        results["primary_target"] = None
+
+    return results
+
+
+def get_noosphere_main_model_signal(noosphere_data: dict) -> dict:
+    """
+    Extract the signal for main model integration.
+
+    Returns a signal dict compatible with calculate_main_confidence().
+    """
+    composite = noosphere_data.get("composite", {})
+    score = composite.get("noosphere_score", 50)
+    tier = composite.get("noosphere_tier", "SILENT")
+    active = noosphere_data.get("active_signals", [])
+
+    if tier == "FULL_NOOSPHERE":
+        contribution = f"🌐 FULL NOOSPHERE: {', '.join(active)}"
+    elif tier == "DUAL_SIGNAL":
+        contribution = f"🌐 Dual Noosphere: {', '.join(active)}"
+    elif tier == "SINGLE_SIGNAL":
+        contribution = f"🌐 Noosphere: {active[0] if active else 'Active'}"
+    else:
+        contribution = "No Noosphere signal"
+
+    return {
+        "score": score,
+        "contribution": contribution
+    }
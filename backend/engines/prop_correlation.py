@@ -0,0 +1,268 @@
+"""
+PROP CORRELATION - pairwise prop outcome correlations, slate matrices and correlated parlay pricing
+
+Parlay legs on the same game are not independent: a star's points and
+assists rise together, teammates split one box score, opponents share the
+pace. Historical graded props estimate the correlation of "Over hit" per
+class of pair - (relation, market, market) with relations:
+- same_player  two markets of one player
+- teammates    two players on one team (when the history knows their teams)
+- opponents    two players on opposing teams
+- same_game    two players of one game, teams unknown (every such
+               historical pair counts, whatever the teams)
+Each class estimate is shrunk toward its relation's prior by
+CORRELATION_PRIOR_WEIGHT pseudo-pairs, so thin classes stay near the prior.
+Props on different games are independent.
+
+A slate's props become one matrix, block-diagonal by event (cross-event
+entries are all zero): each class is estimated once, then every block is
+filled from the class lookup into a flat array. Any leg set is priced by
+slicing the legs' rows out of it - an Under leg flips its row's sign - and
+the joint probability takes the pairwise (second-order Bahadur) correction
+to the independent product, clamped to the Frechet bounds.
+
+Config (env):
+- CORRELATION_PRIOR_WEIGHT  pseudo-pairs pulling a class toward its prior (default 30)
+- CORRELATION_WARN          |correlation| between two legs that earns a warning (default 0.15)
+"""
+
+import math
+import os
+from array import array
+from typing import Iterable, Optional
+
+from engines.market_scan import american_to_decimal, decimal_to_american, prop_market
+
+CORRELATION_PRIOR_WEIGHT = float(os.getenv("CORRELATION_PRIOR_WEIGHT", "30"))
+CORRELATION_WARN = float(os.getenv("CORRELATION_WARN", "0.15"))
+
+RELATION_PRIORS = {"same_player": 0.25, "teammates": -0.05, "opponents": 0.05, "same_game": 0.0}
+# Leg markets that name no stat (a client's bet_type "prop") - the market is unknown
+GENERIC_MARKETS = ("", "prop", "props", "player_prop")
+# |correlation| at which a warning is high severity
+HIGH_CORRELATION = 0.35
+
+
+def prop_market_key(value) -> str:
+    """prop_market, except a generic 'prop' (or nothing) -> '' (unknown)"""
+    market = prop_market(value)
+    return "" if market in GENERIC_MARKETS else market
+
+
+def relation(a: dict, b: dict) -> Optional[str]:
+    """Two props ({"event_id", "player", "team", "market"}) -> their relation, None across games"""
+    if a.get("event_id") is None or a.get("event_id") != b.get("event_id"):
+        return None
+    return game_relation(a, b)
+
+
+def game_relation(a: dict, b: dict) -> str:
+    """The relation of two props known to be on one game"""
+    if a["player"] == b["player"]:
+        return "same_player"
+    if a.get("team") and b.get("team"):
+        return "teammates" if a["team"] == b["team"] else "opponents"
+    return "same_game"
+
+
+class CorrelationTable:
+    """Per-class sums over historical pairs of Over-hit indicators (+1 Over, -1 Under)"""
+
+    def __init__(self, prior_weight: float = None):
+        self.prior_weight = CORRELATION_PRIOR_WEIGHT if prior_weight is None else prior_weight
+        # class -> [pairs, sum x, sum y, sum xy]
+        self.sums = {}
+        # player -> team in the latest history naming one (slate props carry no team)
+        self.teams = {}
+        self.events = 0
+        self.pairs = 0
+
+    @staticmethod
+    def class_key(relation_name: str, market_a: str, market_b: str) -> tuple:
+        return (relation_name, *sorted((market_a, market_b)))
+
+    def add_event(self, outcomes: list):
+        """
+        One historical game's graded props: [{"player", "team", "market", "hit": +1 | -1}, ...].
+        Add events oldest first - a player's latest team wins.
+        """
+        self.events += 1
+        for outcome in outcomes:
+            if outcome.get("team"):
+                self.teams[outcome["player"]] = outcome["team"]
+        for i, a in enumerate(outcomes):
+            for b in outcomes[i + 1:]:
+                name = game_relation(a, b)
+                if name == "same_player" and a["market"] == b["market"]:
+                    continue
+                self.pairs += 1
+                self._add(name, a, b)
+                if name != "same_player" and name != "same_game":
+                    self._add("same_game", a, b)
+
+    def _add(self, relation_name: str, a: dict, b: dict):
+        key = self.class_key(relation_name, a["market"], b["market"])
+        # Keep x on the class's first market so sum x / sum y stay per market
+        x, y = (a["hit"], b["hit"]) if key[1] == a["market"] else (b["hit"], a["hit"])
+        sums = self.sums.get(key)
+        if sums is None:
+            sums = self.sums[key] = [0, 0, 0, 0]
+        sums[0] += 1
+        sums[1] += x
+        sums[2] += y
+        sums[3] += x * y
+
+    def estimate(self, relation_name: str, market_a: str, market_b: str) -> float:
+        """Shrunk Pearson correlation of the class (the relation's prior without history)"""
+        prior = RELATION_PRIORS[relation_name]
+        sums = self.sums.get(self.class_key(relation_name, market_a, market_b))
+        if sums is None:
+            return prior
+        n, sx, sy, sxy = sums
+        # x, y are +-1, so sum x^2 = sum y^2 = n
+        spread = (n * n - sx * sx) * (n * n - sy * sy)
+        observed = (n * sxy - sx * sy) / math.sqrt(spread) if spread > 0 else 0.0
+        return (n * observed + self.prior_weight * prior) / (n + self.prior_weight)
+
+    def classes(self) -> list:
+        """Estimated classes, strongest first"""
+        rows = [
+            {"relation": key[0], "markets": list(key[1:]), "pairs": sums[0], "correlation": round(self.estimate(*key), 4)}
+            for key, sums in self.sums.items()
+        ]
+        rows.sort(key=lambda row: (-abs(row["correlation"]), -row["pairs"]))
+        return rows
+
+
+class SlateMatrix:
+    """Correlation of every slate prop's Over with every other's, one flat block per event"""
+
+    def __init__(self, props: Iterable[dict], table: CorrelationTable):
+        self.table = table
+        self.props = []
+        self.index = {}     # (event_id, player, market) -> (block, position)
+        self.blocks = {}    # event_id -> (props, array of k * k)
+        by_event = {}
+        for prop in props:
+            key = (prop["event_id"], prop["player"], prop["market"])
+            if prop["event_id"] is None or key in self.index:
+                continue
+            members = by_event.setdefault(prop["event_id"], [])
+            self.index[key] = (prop["event_id"], len(members))
+            members.append(prop)
+            self.props.append(prop)
+
+        estimates = {}
+        for event_id, members in by_event.items():
+            k = len(members)
+            block = array("d", bytes(8 * k * k))
+            for i, a in enumerate(members):
+                block[i * k + i] = 1.0
+                for j in range(i + 1, k):
+                    b = members[j]
+                    name = relation(a, b)
+                    key = CorrelationTable.class_key(name, a["market"], b["market"])
+                    value = estimates.get(key)
+                    if value is None:
+                        value = estimates[key] = table.estimate(*key)
+                    block[i * k + j] = block[j * k + i] = value
+            self.blocks[event_id] = (members, block)
+        self.classes_used = len(estimates)
+
+    def __len__(self) -> int:
+        return len(self.props)
+
+    def locate(self, leg: dict) -> Optional[tuple]:
+        return self.index.get((leg.get("event_id"), leg.get("player"), leg.get("market")))
+
+    def pair(self, a: dict, b: dict) -> tuple:
+        """Two legs -> (relation, correlation of their Over outcomes), from the block when both are in it"""
+        name = relation(a, b)
+        if name is None:
+            return None, 0.0
+        if name == "same_player" and a["market"] == b["market"] and a["market"]:
+            # Both sides of one prop, or two lines of it - move together. Two
+            # legs of unknown market may be different stats: the prior holds
+            return name, 1.0
+        found_a, found_b = self.locate(a), self.locate(b)
+        if found_a and found_b:
+            members, block = self.blocks[found_a[0]]
+            return name, block[found_a[1] * len(members) + found_b[1]]
+        return name, self.table.estimate(*CorrelationTable.class_key(name, a["market"], b["market"]))
+
+    def slice(self, legs: list) -> tuple:
+        """Legs (props with a "side") -> (n x n correlation of the legs hitting, n x n relations)"""
+        n = len(legs)
+        signs = [-1.0 if str(leg.get("side", "")).upper() == "UNDER" else 1.0 for leg in legs]
+        matrix = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+        relations = [[None] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                if legs[i].get("player") is None or legs[j].get("player") is None:
+                    continue
+                name, value = self.pair(legs[i], legs[j])
+                matrix[i][j] = matrix[j][i] = value * signs[i] * signs[j]
+                relations[i][j] = relations[j][i] = name
+        return matrix, relations
+
+
+def joint_probability(probabilities: list, matrix: list) -> float:
+    """
+    P(every leg hits): the independent product times the pairwise Bahadur
+    correction, clamped to the Frechet bounds (exact for two legs)
+    """
+    product = math.prod(probabilities)
+    correction = 1.0
+    n = len(probabilities)
+    for i in range(n):
+        for j in range(i + 1, n):
+            pi, pj = probabilities[i], probabilities[j]
+            if matrix[i][j] and 0 < pi < 1 and 0 < pj < 1:
+                correction += matrix[i][j] * math.sqrt((1 - pi) * (1 - pj) / (pi * pj))
+    lower = max(0.0, sum(probabilities) - (n - 1))
+    return min(min(probabilities), max(lower, product * correction))
+
+
+def price_parlay(legs: list, matrix: list, relations: list, stake: float) -> dict:
+    """
+    Legs with American "odds" -> the book's combined price, the payout and the
+    correlation-adjusted hit probability, fair price and expected value.
+    Leg probabilities are the quoted prices' implied probabilities.
+    """
+    decimals = [american_to_decimal(leg["odds"]) for leg in legs]
+    probabilities = [1 / decimal for decimal in decimals]
+    combined = math.prod(decimals)
+    independent = math.prod(probabilities)
+    correlated = joint_probability(probabilities, matrix)
+
+    warnings = []
+    for i in range(len(legs)):
+        for j in range(i + 1, len(legs)):
+            value = matrix[i][j]
+            if relations[i][j] is None or abs(value) < CORRELATION_WARN:
+                continue
+            names = [legs[k].get("player") or legs[k].get("team") for k in (i, j)]
+            warnings.append({
+                "legs": [i, j],
+                "relation": relations[i][j],
+                "correlation": round(value, 3),
+                "severity": "high" if abs(value) >= HIGH_CORRELATION else "medium",
+                "message": (
+                    f"{names[0]} and {names[1]} ({relations[i][j].replace('_', ' ')}) "
+                    f"{'tend to hit together' if value > 0 else 'tend to offset'}: correlation {value:+.2f}"
+                )
+            })
+    warnings.sort(key=lambda warning: -abs(warning["correlation"]))
+
+    payout = stake * combined
+    return {
+        "combined_odds": decimal_to_american(combined),
+        "decimal_odds": round(combined, 3),
+        "potential_payout": round(payout, 2),
+        "potential_profit": round(payout - stake, 2),
+        "independent_probability": round(independent, 4),
+        "correlated_probability": round(correlated, 4),
+        "fair_odds": decimal_to_american(1 / correlated) if 0 < correlated < 1 else None,
+        "expected_value_pct": round((correlated * combined - 1) * 100, 2),
+        "warnings": warnings
+    }
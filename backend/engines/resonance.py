@@ -0,0 +1,517 @@
+"""
+RESONANCE LAYER (v10.3) - Founder's Echo + Life Path Sync
+
+Franchise founding dates and star player birthdates against game numerology.
+Tables load lazily from data/ (see engines.tables).
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+from engines import tables
+
+
+# ============================================================================
+# FRANCHISE FOUNDING DATES DATABASE - v10.3 RESONANCE LAYER
+# Used for Founder's Echo - when franchise founding date resonates with game date
+# Format: (month, day, year) - Using official establishment/founding dates
+# ============================================================================
+
+# FRANCHISE_FOUNDING_DATES -> data/franchise_founding_dates.json, loaded on first use (engines.tables)
+
+# Alternative name mappings for matching
+# TEAM_NAME_ALIASES -> data/team_name_aliases.json, loaded on first use (engines.tables)
+
+@lru_cache(maxsize=4096)
+def resolve_franchise_name(team_name: str) -> Optional[str]:
+    """
+    Resolve any team string to its FRANCHISE_FOUNDING_DATES key (or None).
+    Memoized - the alias/partial scans run once per distinct name.
+    """
+    # Try direct match first
+    if team_name in tables.FRANCHISE_FOUNDING_DATES:
+        return team_name
+
+    # Try alias matching
+    team_lower = team_name.lower()
+    for alias, full_name in tables.TEAM_NAME_ALIASES.items():
+        if alias in team_lower or team_lower in alias:
+            if full_name in tables.FRANCHISE_FOUNDING_DATES:
+                return full_name
+
+    # Try partial match
+    for full_name in tables.FRANCHISE_FOUNDING_DATES:
+        if team_lower in full_name.lower() or full_name.lower() in team_lower:
+            return full_name
+
+    return None
+
+def get_team_founding(team_name: str) -> dict:
+    """Get franchise founding date for a team"""
+    full_name = resolve_franchise_name(team_name)
+    if full_name is None:
+        return {"found": False, "team": team_name, "year": None, "month": None, "day": None}
+
+    year, month, day = tables.FRANCHISE_FOUNDING_DATES[full_name]
+    return {"found": True, "team": full_name, "year": year, "month": month, "day": day}
+
+# ============================================================================
+# FOUNDER'S ECHO - v10.3 RESONANCE LAYER
+# Checks if franchise founding date resonates with today's game date
+# Major insight from Twitter gematria community: founding dates are scripted
+# ============================================================================
+
+def analyze_founders_echo(team_name: str, game_date: datetime = None) -> dict:
+    """
+    FOUNDER'S ECHO - v10.3 Resonance Layer
+
+    Checks for cosmic resonance between a franchise's founding date
+    and the current game date. The Twitter gematria community has shown
+    that leagues script outcomes around founding date alignments.
+
+    Resonance Types:
+    - EXACT DAY MATCH: Founding day = Game day (e.g., founded 8th, playing 8th)
+    - MONTH MATCH: Same month as founding
+    - ANNIVERSARY: Exact date match (month + day)
+    - MILESTONE YEAR: Playing on a round anniversary (25, 50, 75, 100 years)
+    - LIFE PATH SYNC: Founding date life path = Game date life path
+    - NUMEROLOGICAL ECHO: Founding date reduces to same as game date
+    """
+    if game_date is None:
+        game_date = datetime.now()
+
+    founding_info = get_team_founding(team_name)
+
+    if not founding_info["found"]:
+        return {
+            "team": team_name,
+            "has_echo": False,
+            "echo_score": 0,
+            "echos": [],
+            "message": "Franchise founding date not found",
+            "founding_info": founding_info
+        }
+
+    found_year = founding_info["year"]
+    found_month = founding_info["month"]
+    found_day = founding_info["day"]
+
+    game_day = game_date.day
+    game_month = game_date.month
+    game_year = game_date.year
+
+    echos = []
+    echo_score = 0
+
+    # 1. EXACT DAY MATCH - Same day of month (MASSIVE RESONANCE)
+    if found_day == game_day:
+        echos.append({
+            "type": "EXACT_DAY_MATCH",
+            "detail": f"Founded on the {found_day}th, playing on the {game_day}th",
+            "boost": 30,
+            "tier": "LEGENDARY"
+        })
+        echo_score += 30
+
+    # 2. MONTH MATCH - Same month
+    if found_month == game_month:
+        echos.append({
+            "type": "MONTH_MATCH",
+            "detail": f"Founded in month {found_month}, playing in month {game_month}",
+            "boost": 20,
+            "tier": "HIGH"
+        })
+        echo_score += 20
+
+    # 3. ANNIVERSARY - Exact date match (month AND day) - ULTRA RARE
+    if found_month == game_month and found_day == game_day:
+        echos.append({
+            "type": "ANNIVERSARY",
+            "detail": f"Playing on franchise birthday! ({found_month}/{found_day})",
+            "boost": 50,
+            "tier": "IMMORTAL"
+        })
+        echo_score += 50  # Additional 50 on top of day/month matches
+
+    # 4. MILESTONE YEAR - Round anniversary years
+    years_since_founding = game_year - found_year
+    milestone_years = [25, 50, 75, 100, 125, 150]
+    if years_since_founding in milestone_years:
+        echos.append({
+            "type": "MILESTONE_YEAR",
+            "detail": f"{years_since_founding}th anniversary season!",
+            "boost": 25,
+            "tier": "HIGH"
+        })
+        echo_score += 25
+
+    # Near milestone (within 1 year)
+    for milestone in milestone_years:
+        if abs(years_since_founding - milestone) == 1:
+            echos.append({
+                "type": "NEAR_MILESTONE",
+                "detail": f"Approaching/just passed {milestone}th anniversary ({years_since_founding} years)",
+                "boost": 10,
+                "tier": "MODERATE"
+            })
+            echo_score += 10
+            break
+
+    # 5. LIFE PATH SYNC - Founding date life path matches game date life path
+    def calculate_life_path(year, month, day):
+        total = sum(int(d) for d in f"{year}{month:02d}{day:02d}")
+        while total > 9 and total not in [11, 22, 33]:
+            total = sum(int(d) for d in str(total))
+        return total
+
+    founding_life_path = calculate_life_path(found_year, found_month, found_day)
+    game_life_path = calculate_life_path(game_year, game_month, game_day)
+
+    if founding_life_path == game_life_path:
+        echos.append({
+            "type": "LIFE_PATH_SYNC",
+            "detail": f"Founding life path ({founding_life_path}) = Game life path ({game_life_path})",
+            "boost": 25,
+            "tier": "HIGH"
+        })
+        echo_score += 25
+
+    # 6. NUMEROLOGICAL ECHO - Date sums match
+    founding_sum = found_month + found_day + (found_year % 100)
+    game_sum = game_month + game_day + (game_year % 100)
+
+    def reduce(n):
+        while n > 9:
+            n = sum(int(d) for d in str(n))
+        return n
+
+    if reduce(founding_sum) == reduce(game_sum):
+        echos.append({
+            "type": "NUMEROLOGICAL_ECHO",
+            "detail": f"Founding date reduces to {reduce(founding_sum)}, game date reduces to {reduce(game_sum)}",
+            "boost": 15,
+            "tier": "MODERATE"
+        })
+        echo_score += 15
+
+    # 7. TESLA ALIGNMENT - Days or months divisible by 3, 6, or 9
+    if found_day in [3, 6, 9, 12, 15, 18, 21, 24, 27, 30] and game_day in [3, 6, 9, 12, 15, 18, 21, 24, 27, 30]:
+        echos.append({
+            "type": "TESLA_DAY_ALIGNMENT",
+            "detail": f"Both days Tesla-aligned: {found_day} and {game_day}",
+            "boost": 10,
+            "tier": "MODERATE"
+        })
+        echo_score += 10
+
+    # 8. MASTER NUMBER YEAR - Year sum = 11, 22, or 33
+    if years_since_founding in [11, 22, 33, 44, 55, 66, 77, 88, 99]:
+        echos.append({
+            "type": "MASTER_NUMBER_YEAR",
+            "detail": f"{years_since_founding} years since founding (Master Number)",
+            "boost": 20,
+            "tier": "HIGH"
+        })
+        echo_score += 20
+
+    # Cap at 100
+    echo_score = min(100, echo_score)
+
+    # Determine tier
+    if echo_score >= 80:
+        overall_tier = "LEGENDARY"
+        emoji = "🏛️⚡"
+        message = f"MASSIVE FOUNDER'S ECHO - {founding_info['team']} ({found_year})"
+    elif echo_score >= 50:
+        overall_tier = "HIGH"
+        emoji = "🏛️✨"
+        message = f"Strong Founder's Echo - {founding_info['team']}"
+    elif echo_score >= 25:
+        overall_tier = "MODERATE"
+        emoji = "🏛️"
+        message = f"Founder's Echo present - {founding_info['team']}"
+    elif echo_score > 0:
+        overall_tier = "MILD"
+        emoji = "🏢"
+        message = f"Minor Founder's resonance - {founding_info['team']}"
+    else:
+        overall_tier = "NONE"
+        emoji = "📊"
+        message = "No Founder's Echo detected"
+
+    return {
+        "team": team_name,
+        "matched_team": founding_info["team"],
+        "has_echo": echo_score > 0,
+        "echo_score": echo_score,
+        "tier": overall_tier,
+        "emoji": emoji,
+        "message": message,
+        "echos": echos,
+        "founding_info": {
+            "year": found_year,
+            "month": found_month,
+            "day": found_day,
+            "full_date": f"{found_month}/{found_day}/{found_year}",
+            "years_since": game_year - found_year,
+            "life_path": founding_life_path
+        },
+        "game_info": {
+            "year": game_year,
+            "month": game_month,
+            "day": game_day,
+            "full_date": f"{game_month}/{game_day}/{game_year}",
+            "life_path": game_life_path
+        }
+    }
+
+# ============================================================================
+# LIFE PATH SYNC - v10.3 RESONANCE LAYER
+# Checks if star player's life path matches game numerology
+# Based on Twitter gematria insight: birthdates determine destiny games
+# ============================================================================
+
+# Star player birthdates database - key players per team
+# STAR_PLAYER_BIRTHDATES -> data/star_player_birthdates.json, loaded on first use (engines.tables)
+
+@lru_cache(maxsize=8192)
+def resolve_star_player_name(player_name: str) -> Optional[str]:
+    """
+    Resolve any player string to its STAR_PLAYER_BIRTHDATES key (or None).
+    Memoized - the partial/last-name scans run once per distinct name.
+    """
+    # Try direct match
+    if player_name in tables.STAR_PLAYER_BIRTHDATES:
+        return player_name
+
+    # Try partial match
+    player_lower = player_name.lower()
+    for known_player in tables.STAR_PLAYER_BIRTHDATES:
+        if player_lower in known_player.lower() or known_player.lower() in player_lower:
+            return known_player
+
+    # Try last name match
+    player_parts = player_name.split()
+    if player_parts:
+        last_name = player_parts[-1].lower()
+        for known_player in tables.STAR_PLAYER_BIRTHDATES:
+            if last_name in known_player.lower():
+                return known_player
+
+    return None
+
+def get_player_birthdate(player_name: str) -> dict:
+    """Get player's birthdate from database"""
+    known_player = resolve_star_player_name(player_name)
+    if known_player is None:
+        return {"found": False, "player": player_name, "year": None, "month": None, "day": None}
+
+    year, month, day = tables.STAR_PLAYER_BIRTHDATES[known_player]
+    return {"found": True, "player": known_player, "year": year, "month": month, "day": day}
+
+def calculate_life_path_number(year: int, month: int, day: int) -> int:
+    """Calculate life path number from birthdate"""
+    total = sum(int(d) for d in f"{year}{month:02d}{day:02d}")
+    while total > 9 and total not in [11, 22, 33]:
+        total = sum(int(d) for d in str(total))
+    return total
+
+def analyze_life_path_sync(player_name: str, game_date: datetime = None) -> dict:
+    """
+    LIFE PATH SYNC - v10.3 Resonance Layer
+
+    Checks if a star player's life path number syncs with the game's numerology.
+    The Twitter gematria community has documented that players have "destiny games"
+    when their life path aligns with the date.
+
+    Sync Types:
+    - EXACT LIFE PATH MATCH: Player life path = Game life path
+    - BIRTHDAY MATCH: Playing on their birthday (or same day of month)
+    - DESTINY NUMBER: Player jersey reduces to game day
+    - AGE SYNC: Player's current age relates to game numerology
+    """
+    if game_date is None:
+        game_date = datetime.now()
+
+    player_info = get_player_birthdate(player_name)
+
+    if not player_info["found"]:
+        return {
+            "player": player_name,
+            "has_sync": False,
+            "sync_score": 0,
+            "syncs": [],
+            "message": "Player birthdate not in database",
+            "player_info": player_info
+        }
+
+    birth_year = player_info["year"]
+    birth_month = player_info["month"]
+    birth_day = player_info["day"]
+
+    game_day = game_date.day
+    game_month = game_date.month
+    game_year = game_date.year
+
+    # Calculate life paths
+    player_life_path = calculate_life_path_number(birth_year, birth_month, birth_day)
+    game_life_path = calculate_life_path_number(game_year, game_month, game_day)
+
+    # Calculate current age
+    player_age = game_year - birth_year
+    if game_month < birth_month or (game_month == birth_month and game_day < birth_day):
+        player_age -= 1
+
+    syncs = []
+    sync_score = 0
+
+    # 1. EXACT LIFE PATH MATCH (MASSIVE SYNC)
+    if player_life_path == game_life_path:
+        syncs.append({
+            "type": "EXACT_LIFE_PATH",
+            "detail": f"Player life path ({player_life_path}) = Game life path ({game_life_path})",
+            "boost": 35,
+            "tier": "LEGENDARY"
+        })
+        sync_score += 35
+
+    # 2. BIRTHDAY - Playing on actual birthday
+    if birth_month == game_month and birth_day == game_day:
+        syncs.append({
+            "type": "BIRTHDAY_GAME",
+            "detail": f"Playing on birthday! ({birth_month}/{birth_day})",
+            "boost": 50,
+            "tier": "IMMORTAL"
+        })
+        sync_score += 50
+
+    # 3. SAME DAY OF MONTH
+    elif birth_day == game_day:
+        syncs.append({
+            "type": "DAY_SYNC",
+            "detail": f"Born on {birth_day}th, playing on {game_day}th",
+            "boost": 25,
+            "tier": "HIGH"
+        })
+        sync_score += 25
+
+    # 4. SAME MONTH
+    if birth_month == game_month and birth_day != game_day:
+        syncs.append({
+            "type": "BIRTHDAY_MONTH",
+            "detail": f"Playing in birthday month ({birth_month})",
+            "boost": 15,
+            "tier": "MODERATE"
+        })
+        sync_score += 15
+
+    # 5. AGE SYNC - Age matches game day or life path
+    if player_age == game_day:
+        syncs.append({
+            "type": "AGE_DAY_SYNC",
+            "detail": f"Player is {player_age} years old, playing on day {game_day}",
+            "boost": 20,
+            "tier": "HIGH"
+        })
+        sync_score += 20
+
+    # Reduce age to single digit
+    age_reduced = player_age
+    while age_reduced > 9:
+        age_reduced = sum(int(d) for d in str(age_reduced))
+
+    if age_reduced == game_life_path:
+        syncs.append({
+            "type": "AGE_LIFE_PATH_SYNC",
+            "detail": f"Age {player_age} reduces to {age_reduced} = game life path {game_life_path}",
+            "boost": 15,
+            "tier": "MODERATE"
+        })
+        sync_score += 15
+
+    # 6. MASTER NUMBER PLAYER - Life path is 11, 22, or 33
+    if player_life_path in [11, 22, 33]:
+        syncs.append({
+            "type": "MASTER_NUMBER_PLAYER",
+            "detail": f"Player has Master Number life path ({player_life_path})",
+            "boost": 15,
+            "tier": "HIGH"
+        })
+        sync_score += 15
+
+    # 7. TESLA ALIGNMENT - Life path is 3, 6, or 9
+    if player_life_path in [3, 6, 9] and game_life_path in [3, 6, 9]:
+        syncs.append({
+            "type": "TESLA_SYNC",
+            "detail": f"Both player ({player_life_path}) and game ({game_life_path}) are Tesla numbers",
+            "boost": 20,
+            "tier": "HIGH"
+        })
+        sync_score += 20
+
+    # 8. PRIME AGE - Player at a prime number age
+    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+    if player_age in primes:
+        syncs.append({
+            "type": "PRIME_AGE",
+            "detail": f"Player at prime age {player_age}",
+            "boost": 10,
+            "tier": "MODERATE"
+        })
+        sync_score += 10
+
+    # 9. JERSEY DESTINY - If we have jersey number context
+    # This would be passed in from the main function
+
+    # Cap at 100
+    sync_score = min(100, sync_score)
+
+    # Determine tier
+    if sync_score >= 80:
+        overall_tier = "LEGENDARY"
+        emoji = "🌟👤"
+        message = f"MASSIVE LIFE PATH SYNC - {player_info['player']} DESTINY GAME"
+    elif sync_score >= 50:
+        overall_tier = "HIGH"
+        emoji = "✨👤"
+        message = f"Strong Life Path Sync - {player_info['player']}"
+    elif sync_score >= 25:
+        overall_tier = "MODERATE"
+        emoji = "👤"
+        message = f"Life Path Sync present - {player_info['player']}"
+    elif sync_score > 0:
+        overall_tier = "MILD"
+        emoji = "📊"
+        message = f"Minor numerological sync - {player_info['player']}"
+    else:
+        overall_tier = "NONE"
+        emoji = "📊"
+        message = "No Life Path Sync detected"
+
+    return {
+        "player": player_name,
+        "matched_player": player_info["player"],
+        "has_sync": sync_score > 0,
+        "sync_score": sync_score,
+        "tier": overall_tier,
+        "emoji": emoji,
+        "message": message,
+        "syncs": syncs,
+        "player_info": {
+            "birth_year": birth_year,
+            "birth_month": birth_month,
+            "birth_day": birth_day,
+            "birthdate": f"{birth_month}/{birth_day}/{birth_year}",
+            "life_path": player_life_path,
+            "current_age": player_age,
+            "age_reduced": age_reduced
+        },
+        "game_info": {
+            "year": game_year,
+            "month": game_month,
+            "day": game_day,
+            "game_date": f"{game_month}/{game_day}/{game_year}",
+            "life_path": game_life_path
+        }
+    }
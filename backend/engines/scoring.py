@@ -0,0 +1,269 @@
+"""
+SLATE SCORING - one game / one prop through main model + esoteric + confluence
+
+Pure functions with no web framework dependency, so scoring worker processes
+import only the engines (see scoring_executor). Each stage is wrapped in a
+timing span (main_confidence / esoteric / confluence).
+"""
+
+from datetime import datetime
+
+from timing import span
+
+from engines import tables
+from engines.gematria import get_cipher_values
+from engines.resonance import resolve_franchise_name, resolve_star_player_name
+from engines.esoteric import build_day_contexts, calculate_standalone_esoteric
+from engines.confluence import check_confluence_alert
+from engines.confidence import calculate_main_confidence
+
+
+def build_name_indexes() -> dict:
+    """Resolve every known team, alias and star player into the name indexes"""
+    for team in tables.FRANCHISE_FOUNDING_DATES:
+        resolve_franchise_name(team)
+    for alias in tables.TEAM_NAME_ALIASES:
+        resolve_franchise_name(alias)
+    for player in tables.STAR_PLAYER_BIRTHDATES:
+        resolve_star_player_name(player)
+    return {
+        "team_index": resolve_franchise_name.cache_info().currsize,
+        "player_index": resolve_star_player_name.cache_info().currsize
+    }
+
+
+def prime_cipher_cache() -> dict:
+    """Compute all 6 ciphers for every team and star player"""
+    for name in list(tables.FRANCHISE_FOUNDING_DATES) + list(tables.STAR_PLAYER_BIRTHDATES):
+        get_cipher_values(name)
+    return {"cipher_cache": get_cipher_values.cache_info().currsize}
+
+
+def warm_scoring_caches() -> dict:
+    """
+    Fill the name indexes, the DayContexts for the coming week and the cipher
+    cache. Runs once per scoring worker (and in the app warm-up).
+    """
+    return {
+        **build_name_indexes(),
+        "day_contexts": build_day_contexts(7),
+        **prime_cipher_cache()
+    }
+
+
+def collect_prop_outcomes(event: dict, props_data: dict) -> list:
+    """Flatten one event's first bookmaker into score_props_batch items"""
+    items = []
+    for bookmaker in props_data.get("bookmakers", [])[:1]:
+        for market in bookmaker.get("markets", []):
+            for outcome in market.get("outcomes", []):
+                items.append((
+                    outcome,
+                    market.get("key", ""),
+                    event.get("home_team", ""),
+                    event.get("away_team", ""),
+                    event.get("commence_time"),
+                    bookmaker.get("title", "Unknown")
+                ))
+    return items
+
+
+def score_prop_outcome(
+    outcome: dict,
+    market_key: str,
+    home_team: str,
+    away_team: str,
+    sport: str,
+    commence_time: str = None,
+    bookmaker_title: str = "Unknown",
+    game_date: datetime = None,
+    noosphere_data: dict = None
+) -> tuple:
+    """
+    Score a single player prop outcome through the main model, the standalone
+    esoteric module and the confluence check. game_date defaults to now
+    (backtests pass the slate's date). noosphere_data: the player's (or home
+    team's) current Noosphere result from noosphere_stream, if it has one.
+
+    Returns (prop_row, main_result) so callers can read the raw signal scores.
+    """
+    player_name = outcome.get("description", "Unknown")
+    prop_type = market_key.replace("player_", "").replace("_", " ").title()
+    line = outcome.get("point", 0)
+    price = outcome.get("price", -110)
+    bet_type = outcome.get("name", "Over")
+
+    # v10.1 Main confidence
+    game_data = {
+        "home_team": home_team,
+        "away_team": away_team,
+        "spread_odds": price,
+        "total": 220,
+        "sport": sport.upper()
+    }
+    with span("main_confidence"):
+        main_result = calculate_main_confidence(game_data, {"noosphere_data": noosphere_data})
+
+    # v10.2 Standalone esoteric
+    with span("esoteric"):
+        esoteric_result = calculate_standalone_esoteric(
+            home_team=home_team,
+            away_team=away_team,
+            prop_line=line,
+            player_name=player_name,
+            sport=sport.upper(),
+            game_date=game_date
+        )
+
+    # v10.2 Confluence alert
+    main_pick = "home" if main_result["recommendation"] in ["SMASH", "STRONG"] else "away"
+    with span("confluence"):
+        confluence = check_confluence_alert(
+            main_confidence=main_result["confidence"],
+            main_pick=main_pick,
+            esoteric_score=esoteric_result["esoteric_score"],
+            esoteric_pick=esoteric_result["esoteric_pick"]["favored"]
+        )
+
+    prop_row = {
+        "player": player_name,
+        "team": home_team,
+        "opponent": away_team,
+        "prop_type": prop_type,
+        "line": line,
+        "bet_type": bet_type,
+        "price": price,
+
+        # v10.1 Main model
+        "confidence": main_result["confidence"],
+        "tier": main_result["tier"],
+        "recommendation": main_result["recommendation"],
+
+        # v10.2 Standalone esoteric (clickable)
+        "esoteric_edge": {
+            "score": esoteric_result["esoteric_score"],
+            "tier": esoteric_result["tier"],
+            "emoji": esoteric_result["emoji"],
+            "badge": esoteric_result["badge"],
+            "top_insights": esoteric_result["top_insights"],
+            "favored": esoteric_result["esoteric_pick"]["favored"]
+        },
+
+        # v10.2 Confluence alert
+        "confluence_alert": confluence,
+
+        "game_time": commence_time,
+        "bookmaker": bookmaker_title
+    }
+
+    return prop_row, main_result
+
+
+def extract_game_lines(game: dict) -> dict:
+    """Pull the home spread (with price) and the over total from a game's bookmakers"""
+    home_team = game.get("home_team", "")
+    best_spread = None
+    spread_price = None
+    best_total = None
+
+    for bm in game.get("bookmakers", []):
+        for market in bm.get("markets", []):
+            if market["key"] == "spreads":
+                for outcome in market["outcomes"]:
+                    if outcome["name"] == home_team:
+                        best_spread = outcome.get("point", 0)
+                        spread_price = outcome.get("price")
+            elif market["key"] == "totals":
+                for outcome in market["outcomes"]:
+                    if outcome["name"] == "Over":
+                        best_total = outcome.get("point", 220)
+
+    return {"spread": best_spread, "spread_price": spread_price, "total": best_total}
+
+
+def score_game(
+    game: dict,
+    sport: str,
+    game_date: datetime = None,
+    noosphere_data: dict = None,
+    steam_data: dict = None
+) -> tuple:
+    """
+    Score a single game (spreads/totals) through the main model, the standalone
+    esoteric module and the confluence check. game_date defaults to now
+    (backtests pass the slate's date). noosphere_data: the home team's current
+    Noosphere result from noosphere_stream, if it has one. steam_data: the
+    game's steam-move result from line_history, if its lines are tracked.
+
+    Returns (game_row, main_result, lines) so callers can read the raw signal
+    scores and the price of the line that was scored.
+    """
+    home_team = game.get("home_team", "")
+    away_team = game.get("away_team", "")
+    commence_time = game.get("commence_time")
+
+    lines = extract_game_lines(game)
+    best_spread = lines["spread"]
+    best_total = lines["total"]
+
+    # v10.1 Main confidence
+    game_data = {
+        "home_team": home_team,
+        "away_team": away_team,
+        "spread": best_spread,
+        "total": best_total,
+        "sport": sport.upper()
+    }
+    with span("main_confidence"):
+        main_result = calculate_main_confidence(game_data, {"noosphere_data": noosphere_data, "steam_data": steam_data})
+
+    # v10.2 Standalone esoteric
+    with span("esoteric"):
+        esoteric_result = calculate_standalone_esoteric(
+            home_team=home_team,
+            away_team=away_team,
+            spread=best_spread,
+            total=best_total,
+            sport=sport.upper(),
+            game_date=game_date
+        )
+
+    # v10.2 Confluence alert
+    main_pick = "home" if main_result["recommendation"] in ["SMASH", "STRONG", "PLAY"] else "away"
+    with span("confluence"):
+        confluence = check_confluence_alert(
+            main_confidence=main_result["confidence"],
+            main_pick=main_pick,
+            esoteric_score=esoteric_result["esoteric_score"],
+            esoteric_pick=esoteric_result["esoteric_pick"]["favored"]
+        )
+
+    game_row = {
+        "home_team": home_team,
+        "away_team": away_team,
+        "game_time": commence_time,
+        "spread": best_spread,
+        "total": best_total,
+
+        # v10.1 Main model
+        "main_confidence": main_result["confidence"],
+        "main_tier": main_result["tier"],
+        "recommendation": main_result["recommendation"],
+
+        # v10.2 Standalone esoteric (clickable)
+        "esoteric_edge": {
+            "score": esoteric_result["esoteric_score"],
+            "tier": esoteric_result["tier"],
+            "emoji": esoteric_result["emoji"],
+            "badge": esoteric_result["badge"],
+            "top_insights": esoteric_result["top_insights"],
+            "favored": esoteric_result["esoteric_pick"]["favored"],
+            "favored_team": esoteric_result["esoteric_pick"]["favored_team"],
+            "reasoning": esoteric_result["esoteric_pick"]["reasoning"]
+        },
+
+        # v10.2 Confluence alert
+        "confluence_alert": confluence
+    }
+
+    return game_row, main_result, lines
@@ -0,0 +1,325 @@
+"""
+SEASON ESOTERIC CALENDAR - Founder's Echo and date numerology, precomputed
+
+Founder's Echo depends only on (team, date) and date numerology / the vortex
+date sum only on the date, so a season's worth is built once into a
+memory-mapped file and read back with one struct unpack per lookup:
+
+    header | meta JSON (teams, window, table fingerprint)
+    | team rows   n_teams x (letter_sum, founding life path)
+    | date rows   n_dates x (vortex date sum, 4 date reductions, life path,
+                             alignment count, power date / Tesla day flags)
+    | cells       n_teams x n_dates x (echo score, echo tier, echo type bits)
+    | top dates   n_teams x TOP_K date indexes, best echo first
+    | top teams   n_dates x TOP_K team indexes, best echo first
+
+Cells are built by calling analyze_founders_echo / calculate_date_numerology,
+so the calendar always agrees with the live engines. Bump CALENDAR_VERSION
+when their logic changes; a changed founding-dates table is picked up by the
+fingerprint and triggers a rebuild.
+
+Build ahead of time (or let the app warm-up build it when missing/stale):
+    python -m engines.season_calendar --start 2026-08-01 --days 366
+
+Config (env):
+- CALENDAR_PATH   calendar file (default: <tmpdir>/bookie_season_calendar.bin)
+- CALENDAR_START  first date of the window (default: Aug 1 of the current season)
+- CALENDAR_DAYS   dates in the window (default 366)
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from engines import tables
+from engines.gematria import calculate_date_numerology
+from engines.omni_glitch import calculate_digital_root
+from engines.resonance import analyze_founders_echo, calculate_life_path_number, resolve_franchise_name
+
+CALENDAR_PATH = os.getenv(
+    "CALENDAR_PATH",
+    os.path.join(tempfile.gettempdir(), "bookie_season_calendar.bin")
+)
+CALENDAR_DAYS = int(os.getenv("CALENDAR_DAYS", "366"))
+CALENDAR_VERSION = 1
+TOP_K = 32
+
+MAGIC = b"ESOCAL\x00\x01"
+HEADER = struct.Struct("<8sIIIIII")      # magic, version, teams, dates, start ordinal, top_k, meta bytes
+TEAM_ROW = struct.Struct("<HB")          # letter sum, founding life path
+DATE_ROW = struct.Struct("<HBBBBBBB")    # vortex date sum, full/short/day_month/month_day reductions, life path, alignments, flags
+CELL = struct.Struct("<BBH")             # echo score, echo tier, echo type bits
+INDEX = struct.Struct("<H")
+NO_INDEX = 0xFFFF
+
+ECHO_TYPES = (
+    "EXACT_DAY_MATCH", "MONTH_MATCH", "ANNIVERSARY", "MILESTONE_YEAR", "NEAR_MILESTONE",
+    "LIFE_PATH_SYNC", "NUMEROLOGICAL_ECHO", "TESLA_DAY_ALIGNMENT", "MASTER_NUMBER_YEAR"
+)
+ECHO_BITS = {echo_type: 1 << i for i, echo_type in enumerate(ECHO_TYPES)}
+ECHO_TIERS = ("NONE", "MILD", "MODERATE", "HIGH", "LEGENDARY")
+REDUCTION_FORMATS = ("full", "short", "day_month", "month_day")
+POWER_DATE = 1
+TESLA_DATE = 2
+
+# "HOME vs AWAY" - the letters of " vs " in calculate_vortex_math's matchup string
+VS_LETTER_SUM = 22 + 19
+
+
+def default_start(today: date = None) -> date:
+    """Aug 1 of the season in progress (seasons here straddle the new year)"""
+    today = today or date.today()
+    return date(today.year if today.month >= 8 else today.year - 1, 8, 1)
+
+
+def letter_sum(name: str) -> int:
+    return sum(ord(c) - ord("A") + 1 for c in name.upper() if c.isalpha())
+
+
+def tables_fingerprint() -> str:
+    body = json.dumps(sorted(tables.FRANCHISE_FOUNDING_DATES.items())).encode()
+    return hashlib.sha1(body + str(CALENDAR_VERSION).encode()).hexdigest()[:16]
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def _date_row(day: datetime) -> bytes:
+    numerology = calculate_date_numerology(day)
+    flags = POWER_DATE if numerology["is_power_date"] else 0
+    if day.day % 3 == 0:
+        flags |= TESLA_DATE
+    date_sum = day.month + day.day + sum(int(d) for d in str(day.year))
+    reductions = numerology["reductions"]
+    return DATE_ROW.pack(
+        date_sum, *(reductions[fmt] for fmt in REDUCTION_FORMATS),
+        numerology["life_path"], min(255, len(numerology["alignments"])), flags
+    )
+
+
+def _echo_cell(team: str, day: datetime) -> tuple:
+    echo = analyze_founders_echo(team, day)
+    bits = 0
+    for entry in echo["echos"]:
+        bits |= ECHO_BITS.get(entry["type"], 0)
+    return echo["echo_score"], ECHO_TIERS.index(echo.get("tier", "NONE")), bits
+
+
+def _top(scores: list, k: int) -> bytes:
+    """Indexes of the k best scores (ties: earliest first), padded with NO_INDEX"""
+    ranked = sorted((i for i, score in enumerate(scores) if score > 0), key=lambda i: (-scores[i], i))[:k]
+    ranked += [NO_INDEX] * (k - len(ranked))
+    return b"".join(INDEX.pack(i) for i in ranked)
+
+
+def build_calendar(path: str = None, start: date = None, days: int = None) -> dict:
+    """Compute the calendar and atomically replace the file at path -> its meta"""
+    path = path or CALENDAR_PATH
+    start = start or default_start()
+    days = days or CALENDAR_DAYS
+    started = time.perf_counter()
+
+    teams = sorted(tables.FRANCHISE_FOUNDING_DATES)
+    dates = [datetime(start.year, start.month, start.day) + timedelta(days=i) for i in range(days)]
+
+    team_rows = b"".join(
+        TEAM_ROW.pack(letter_sum(team), calculate_life_path_number(*tables.FRANCHISE_FOUNDING_DATES[team]))
+        for team in teams
+    )
+    date_rows = b"".join(_date_row(day) for day in dates)
+
+    cells = bytearray()
+    scores = []
+    for team in teams:
+        team_scores = []
+        for day in dates:
+            score, tier, bits = _echo_cell(team, day)
+            cells += CELL.pack(score, tier, bits)
+            team_scores.append(score)
+        scores.append(team_scores)
+    top_dates = b"".join(_top(team_scores, TOP_K) for team_scores in scores)
+    top_teams = b"".join(_top([scores[t][d] for t in range(len(teams))], TOP_K) for d in range(len(dates)))
+
+    meta = {
+        "teams": teams,
+        "start": start.isoformat(),
+        "days": days,
+        "fingerprint": tables_fingerprint(),
+        "built_at": datetime.now().isoformat(),
+        "build_ms": round((time.perf_counter() - started) * 1000, 1)
+    }
+    meta_bytes = json.dumps(meta).encode()
+    header = HEADER.pack(MAGIC, CALENDAR_VERSION, len(teams), days, start.toordinal(), TOP_K, len(meta_bytes))
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        for section in (header, meta_bytes, team_rows, date_rows, bytes(cells), top_dates, top_teams):
+            f.write(section)
+    os.replace(tmp, path)
+    return meta
+
+
+# ============================================================================
+# READ
+# ============================================================================
+
+class SeasonCalendar:
+    """Read-only view over a calendar file; every lookup is one struct unpack"""
+
+    def __init__(self, path: str = None):
+        self.path = path or CALENDAR_PATH
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_teams, n_dates, start_ordinal, top_k, meta_len = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != CALENDAR_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a v{CALENDAR_VERSION} season calendar: {self.path}")
+        self.meta = json.loads(self._mm[HEADER.size:HEADER.size + meta_len])
+        self.teams = self.meta["teams"]
+        self.team_index = {team: i for i, team in enumerate(self.teams)}
+        self.n_teams = n_teams
+        self.n_dates = n_dates
+        self.top_k = top_k
+        self.start = date.fromordinal(start_ordinal)
+        self.end = self.start + timedelta(days=n_dates - 1)
+
+        self._team_rows = HEADER.size + meta_len
+        self._date_rows = self._team_rows + n_teams * TEAM_ROW.size
+        self._cells = self._date_rows + n_dates * DATE_ROW.size
+        self._top_dates = self._cells + n_teams * n_dates * CELL.size
+        self._top_teams = self._top_dates + n_teams * top_k * INDEX.size
+
+    def close(self):
+        self._mm.close()
+
+    def covers(self, start: date, days: int) -> bool:
+        return self.start <= start and start + timedelta(days=days - 1) <= self.end
+
+    @property
+    def fresh(self) -> bool:
+        """Built from the current founding-dates table"""
+        return self.meta.get("fingerprint") == tables_fingerprint()
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    def resolve_team(self, team_name: str) -> Optional[int]:
+        full_name = resolve_franchise_name(team_name)
+        return self.team_index.get(full_name) if full_name is not None else None
+
+    def date_index(self, day: date) -> Optional[int]:
+        offset = (day - self.start).days
+        return offset if 0 <= offset < self.n_dates else None
+
+    def date_at(self, index: int) -> date:
+        return self.start + timedelta(days=index)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def echo(self, team: int, day: int) -> dict:
+        score, tier, bits = CELL.unpack_from(self._mm, self._cells + (team * self.n_dates + day) * CELL.size)
+        return {
+            "echo_score": score,
+            "echo_tier": ECHO_TIERS[tier],
+            "echo_types": [echo_type for echo_type in ECHO_TYPES if bits & ECHO_BITS[echo_type]],
+            "life_path_match": bool(bits & ECHO_BITS["LIFE_PATH_SYNC"])
+        }
+
+    def date_numbers(self, day: int) -> dict:
+        date_sum, *rest = DATE_ROW.unpack_from(self._mm, self._date_rows + day * DATE_ROW.size)
+        reductions, (life_path, alignments, flags) = rest[:4], rest[4:]
+        return {
+            "reductions": dict(zip(REDUCTION_FORMATS, reductions)),
+            "life_path": life_path,
+            "alignments": alignments,
+            "is_power_date": bool(flags & POWER_DATE),
+            "tesla_day": bool(flags & TESLA_DATE),
+            "vortex_date_sum": date_sum
+        }
+
+    def vortex_root(self, home: int, away: int, day: int) -> int:
+        """calculate_vortex_math's digital root for the canonical names of home vs away"""
+        home_sum, _ = TEAM_ROW.unpack_from(self._mm, self._team_rows + home * TEAM_ROW.size)
+        away_sum, _ = TEAM_ROW.unpack_from(self._mm, self._team_rows + away * TEAM_ROW.size)
+        date_sum = DATE_ROW.unpack_from(self._mm, self._date_rows + day * DATE_ROW.size)[0]
+        return calculate_digital_root(home_sum + VS_LETTER_SUM + away_sum + date_sum)
+
+    def day(self, team: int, day: int, opponent: int = None) -> dict:
+        row = {"date": self.date_at(day).isoformat(), **self.echo(team, day), **self.date_numbers(day)}
+        if opponent is not None:
+            row["vortex_root"] = self.vortex_root(team, opponent, day)
+        return row
+
+    def top_dates(self, team: int, limit: int = 10) -> list:
+        """Team's best echo dates in the window, highest score first"""
+        offset = self._top_dates + team * self.top_k * INDEX.size
+        out = []
+        for i in range(min(limit, self.top_k)):
+            (day,) = INDEX.unpack_from(self._mm, offset + i * INDEX.size)
+            if day == NO_INDEX:
+                break
+            out.append(self.day(team, day))
+        return out
+
+    def top_teams(self, day: int, limit: int = 10) -> list:
+        """Teams with the strongest echo on a date, highest score first"""
+        offset = self._top_teams + day * self.top_k * INDEX.size
+        out = []
+        for i in range(min(limit, self.top_k)):
+            (team,) = INDEX.unpack_from(self._mm, offset + i * INDEX.size)
+            if team == NO_INDEX:
+                break
+            out.append({"team": self.teams[team], **self.echo(team, day)})
+        return out
+
+    def info(self) -> dict:
+        return {
+            "path": self.path,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "teams": self.n_teams,
+            "dates": self.n_dates,
+            "bytes": len(self._mm),
+            "fresh": self.fresh,
+            "built_at": self.meta.get("built_at"),
+            "build_ms": self.meta.get("build_ms")
+        }
+
+
+def open_calendar(path: str = None, start: date = None, days: int = None, rebuild: bool = False) -> SeasonCalendar:
+    """Open the calendar at path, building it first if missing, stale or not covering the window"""
+    path = path or CALENDAR_PATH
+    start = start or default_start()
+    days = days or CALENDAR_DAYS
+    if not rebuild:
+        try:
+            calendar = SeasonCalendar(path)
+        except (OSError, ValueError):
+            calendar = None
+        if calendar is not None:
+            if calendar.fresh and calendar.covers(start, days):
+                return calendar
+            calendar.close()
+    build_calendar(path, start, days)
+    return SeasonCalendar(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m engines.season_calendar", description="Build the season esoteric calendar")
+    parser.add_argument("--path", default=CALENDAR_PATH)
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="YYYY-MM-DD (default: Aug 1 of this season)")
+    parser.add_argument("--days", type=int, default=CALENDAR_DAYS)
+    args = parser.parse_args()
+    meta = build_calendar(args.path, args.start, args.days)
+    print(f"{args.path}: {len(meta['teams'])} teams x {meta['days']} dates from {meta['start']} in {meta['build_ms']}ms")
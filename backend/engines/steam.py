@@ -0,0 +1,113 @@
+"""
+STEAM MOVES - synchronized multi-book line moves
+
+A steam move is several books moving the same line the same way within
+minutes of each other - the footprint of a sharp syndicate hitting the
+market everywhere at once. Per event and market, every book's line history
+becomes a list of moves, and a rolling window over them counts the books
+whose net move inside the window clears the threshold in one direction.
+
+Moves are signed toward the home side (spreads: the home point falling,
+moneylines: the home implied probability rising) or the Over (totals: the
+total rising).
+
+A steam move is only news while it is fresh: once its last move is more than
+STEAM_WINDOW old the market has absorbed it, and expire_steam drops it.
+
+Config (env):
+- STEAM_WINDOW      seconds a steam move may span (default 900)
+- STEAM_MIN_BOOKS   books that must move together (default 3)
+- STEAM_MIN_POINTS  spread / total move per book, in points (default 0.5)
+- STEAM_MIN_PROB    moneyline move per book, in implied probability (default 0.02)
+"""
+
+import os
+
+STEAM_WINDOW = float(os.getenv("STEAM_WINDOW", "900"))
+STEAM_MIN_BOOKS = int(os.getenv("STEAM_MIN_BOOKS", "3"))
+STEAM_MIN_POINTS = float(os.getenv("STEAM_MIN_POINTS", "0.5"))
+STEAM_MIN_PROB = float(os.getenv("STEAM_MIN_PROB", "0.02"))
+
+STEAM_MARKETS = ("spreads", "h2h", "totals")
+DIRECTIONS = {"spreads": ("home", "away"), "h2h": ("home", "away"), "totals": ("over", "under")}
+
+
+def market_moves(market: str, series: dict) -> list:
+    """book -> [(ts, value), ...] oldest first -> [(ts, book, signed move), ...] by time"""
+    sign = -1 if market == "spreads" else 1
+    moves = []
+    for book, points in series.items():
+        for (_, before), (ts, after) in zip(points, points[1:]):
+            if after != before:
+                moves.append((ts, book, sign * (after - before)))
+    moves.sort()
+    return moves
+
+
+def find_steam(market: str, moves: list, window: float = None, min_books: int = None, threshold: float = None):
+    """
+    Rolling window over a market's moves -> the steam move with the most
+    books (latest on a tie), or None. The window slides move by move, keeping
+    each book's net move inside it.
+    """
+    window = STEAM_WINDOW if window is None else window
+    min_books = STEAM_MIN_BOOKS if min_books is None else min_books
+    if threshold is None:
+        threshold = STEAM_MIN_PROB if market == "h2h" else STEAM_MIN_POINTS
+
+    net = {}
+    best = None
+    start = 0
+    for end, (ts, book, move) in enumerate(moves):
+        net[book] = net.get(book, 0.0) + move
+        while moves[start][0] < ts - window:
+            _, old_book, old_move = moves[start]
+            net[old_book] -= old_move
+            start += 1
+        for direction in (1, -1):
+            books = sorted(b for b, total in net.items() if direction * total >= threshold - 1e-9)
+            if len(books) >= min_books and (best is None or len(books) >= len(best["books"])):
+                best = {
+                    "direction": DIRECTIONS[market][0 if direction == 1 else 1],
+                    "books": books,
+                    "started_at": moves[start][0],
+                    "ended_at": ts,
+                    "size": round(sum(abs(net[b]) for b in books) / len(books), 3)
+                }
+    return best
+
+
+def expire_steam(steam: dict, now: float, window: float = None) -> dict:
+    """market -> find_steam result (or None), with moves that ended more than window before now dropped"""
+    window = STEAM_WINDOW if window is None else window
+    return {market: found if found and found["ended_at"] >= now - window else None for market, found in steam.items()}
+
+
+def steam_signal(steam: dict) -> dict:
+    """
+    market -> find_steam result (or None) -> the main model's steam_moves
+    signal for the home side: spread steam decides, moneyline steam when the
+    spread has none; total steam is reported but does not pick a side.
+    """
+    side = steam.get("spreads") or steam.get("h2h")
+    market = "spreads" if steam.get("spreads") else "h2h"
+    notes = []
+    if steam.get("totals"):
+        notes.append(f"totals steam to the {steam['totals']['direction']}")
+
+    if side is None:
+        score = 50
+        contribution = "No steam on tracked lines"
+    else:
+        books = len(side["books"])
+        extra = max(0, books - STEAM_MIN_BOOKS)
+        minutes = max(1, round((side["ended_at"] - side["started_at"]) / 60))
+        if side["direction"] == "home":
+            score = min(95, 82 + 4 * extra)
+            contribution = f"STEAM on home: {books} books moved the {market} in {minutes} min"
+        else:
+            score = max(20, 30 - 4 * extra)
+            contribution = f"STEAM against home: {books} books moved the {market} in {minutes} min"
+    if notes:
+        contribution += f" ({'; '.join(notes)})"
+    return {"score": score, "contribution": contribution, "markets": steam}
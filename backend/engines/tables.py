@@ -0,0 +1,48 @@
+"""
+Static reference tables, kept as compact JSON in backend/data/
+
+Nothing is read at import. Each table loads from its data file the first
+time it is accessed (tables.TEAM_COLORS) and is then a plain module global.
+"""
+
+import json
+import os
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# Table name -> data file
+TABLE_FILES = {
+    "FRANCHISE_FOUNDING_DATES": "franchise_founding_dates.json",
+    "TEAM_NAME_ALIASES": "team_name_aliases.json",
+    "STAR_PLAYER_BIRTHDATES": "star_player_birthdates.json",
+    "TEAM_COLORS": "team_colors.json",
+    "COLOR_EFFECTS": "color_effects.json",
+    "STAR_PLAYER_TIERS": "star_player_tiers.json",
+    "REF_CREW_HOME_BIAS": "ref_crew_home_bias.json",
+    "VENUE_ATMOSPHERICS": "venue_atmospherics.json",
+    "TEAM_BASELINE_VOLUMES": "team_baseline_volumes.json"
+}
+
+# Tables whose values are (year, month, day) - JSON stores them as lists
+DATE_TABLES = {"FRANCHISE_FOUNDING_DATES", "STAR_PLAYER_BIRTHDATES"}
+
+
+def load_table(name: str):
+    """Read a table from its data file and pin it as a module global"""
+    with open(os.path.join(DATA_DIR, TABLE_FILES[name]), encoding="utf-8") as f:
+        table = json.load(f)
+    if name in DATE_TABLES:
+        table = {key: tuple(value) for key, value in table.items()}
+    globals()[name] = table
+    return table
+
+
+def loaded_tables() -> list:
+    """Names of the tables read so far in this process"""
+    return [name for name in TABLE_FILES if name in globals()]
+
+
+def __getattr__(name):
+    if name in TABLE_FILES:
+        return load_table(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
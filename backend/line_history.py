@@ -0,0 +1,267 @@
+"""
+Line History - every book's game lines over time, and the steam moves in them
+
+Each games snapshot refresh records, per event, market (spreads, totals,
+moneylines when quoted) and book, the home / Over line (moneylines: the home
+implied probability) - only when it changed since the book's last quote, so
+the table holds moves, not polls. Tracked markets are re-scanned for steam
+(engines/steam.py) as their history grows, and the game's steam_moves signal
+is kept per event: scoring reads it from a dict, nothing is scanned at
+request time. A read drops steam whose last move is older than STEAM_WINDOW.
+
+History lives in a table in the shared cache file, so every worker sees the
+moves the poller recorded: readers pull rows newer than the last sequence
+number they saw. Events that started more than LINE_HISTORY_RETENTION ago
+are dropped.
+
+Config (env):
+- LINE_HISTORY_RETENTION   seconds a started event's history is kept (default 86400)
+- LINE_HISTORY_MAX_POINTS  quotes kept in memory per book and market (default 100)
+- LINE_HISTORY_PATH        SQLite file (default: SHARED_CACHE_PATH)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from statistics import median
+from typing import Iterable, Optional
+
+from engines.market_scan import flatten_quotes
+from engines.steam import STEAM_MARKETS, expire_steam, find_steam, market_moves, steam_signal
+from shared_cache import SHARED_CACHE_PATH
+
+LINE_HISTORY_RETENTION = float(os.getenv("LINE_HISTORY_RETENTION", "86400"))
+LINE_HISTORY_MAX_POINTS = int(os.getenv("LINE_HISTORY_MAX_POINTS", "100"))
+LINE_HISTORY_PATH = os.getenv("LINE_HISTORY_PATH", SHARED_CACHE_PATH)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS line_history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    market TEXT NOT NULL,
+    book TEXT NOT NULL,
+    ts REAL NOT NULL,
+    commence_ts REAL NOT NULL,
+    value REAL NOT NULL,
+    price REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS line_history_commence ON line_history (commence_ts);
+"""
+
+COLUMNS = ("seq", "event_id", "sport", "market", "book", "ts", "commence_ts", "value", "price")
+
+
+def commence_timestamp(value) -> float:
+    """Odds API commence_time -> unix seconds (unparseable: now, so it ages out)"""
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return time.time()
+
+
+class LineHistory:
+    """Per event / market / book line series and the steam found in them, shared through SQLite"""
+
+    def __init__(self, path: str = None, retention: float = None):
+        self.path = path or LINE_HISTORY_PATH
+        self.retention = LINE_HISTORY_RETENTION if retention is None else retention
+        self._series = {}
+        self._events = {}
+        self._steam = {}
+        self._seq = 0
+        self._local = threading.local()
+        # _lock serialises sync/record (held across the SQLite write lock);
+        # _state_lock guards the series, events and steam dicts, so loop-side
+        # reads never wait on SQLite
+        self._lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self.recorded = 0
+        self.scans = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _prune(self, now: float):
+        cutoff = now - self.retention
+        for event_id in [e for e, event in self._events.items() if event["commence_ts"] < cutoff]:
+            del self._events[event_id]
+            self._steam.pop(event_id, None)
+            for market in STEAM_MARKETS:
+                self._series.pop((event_id, market), None)
+
+    def _pull(self, conn: sqlite3.Connection) -> int:
+        rows = conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM line_history WHERE seq > ? ORDER BY seq", (self._seq,)
+        ).fetchall()
+        touched = set()
+        with self._state_lock:
+            for row in rows:
+                entry = dict(zip(COLUMNS, row))
+                self._seq = max(self._seq, entry["seq"])
+                self._events[entry["event_id"]] = {"sport": entry["sport"], "commence_ts": entry["commence_ts"]}
+                books = self._series.setdefault((entry["event_id"], entry["market"]), {})
+                series = books.get(entry["book"])
+                if series is None:
+                    series = books[entry["book"]] = deque(maxlen=LINE_HISTORY_MAX_POINTS)
+                series.append((entry["ts"], entry["value"]))
+                touched.add(entry["event_id"])
+            self._prune(time.time())
+        # Only _pull mutates the series and it runs under _lock, so the scan reads them unlocked
+        for event_id in touched:
+            if event_id in self._events:
+                self._scan(event_id)
+        return len(rows)
+
+    def _scan(self, event_id: str):
+        steam = {}
+        for market in STEAM_MARKETS:
+            books = self._series.get((event_id, market), {})
+            moves = market_moves(market, {book: list(series) for book, series in books.items()})
+            steam[market] = find_steam(market, moves) if moves else None
+        signal = steam_signal(steam)
+        with self._state_lock:
+            self._steam[event_id] = signal
+        self.scans += 1
+
+    def sync(self) -> int:
+        """Pull quotes other workers recorded -> rows pulled (blocking; run in a thread)"""
+        with self._lock:
+            return self._pull(self._conn())
+
+    def record(self, sport: str, games: Iterable[dict], ts: float = None) -> int:
+        """
+        Record a games snapshot's lines (blocking; run in a thread) -> quotes
+        that changed. The first quote of a book is recorded as-is.
+        """
+        ts = time.time() if ts is None else ts
+        table = flatten_quotes(games)
+        with self._lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._pull(conn)
+                seen, rows = set(), []
+                for row in range(len(table)):
+                    if table.side[row] != 0:
+                        continue
+                    event = table.events[table.event[row]]
+                    if not event["event_id"]:
+                        continue
+                    key = (event["event_id"], table.market[row], table.book[row])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    value = 1 / table.decimal[row] if table.market[row] == "h2h" else table.line[row]
+                    series = self._series.get(key[:2], {}).get(key[2])
+                    if series and series[-1][1] == value:
+                        continue
+                    rows.append((
+                        event["event_id"], sport, table.market[row], table.book[row], ts,
+                        commence_timestamp(event["commence_time"]), value, table.price[row]
+                    ))
+                conn.executemany(
+                    f"INSERT INTO line_history ({', '.join(COLUMNS[1:])}) VALUES ({', '.join('?' * (len(COLUMNS) - 1))})",
+                    rows
+                )
+                conn.execute("DELETE FROM line_history WHERE commence_ts < ?", (ts - self.retention,))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._pull(conn)
+        self.recorded += len(rows)
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Reads - in-memory, call sync() first for other workers' quotes
+    # ------------------------------------------------------------------
+
+    def steam_for(self, event_ids: Iterable[str], now: float = None) -> dict:
+        """event id -> steam_moves signal, for the events with tracked lines (stale steam expired)"""
+        now = time.time() if now is None else now
+        with self._state_lock:
+            signals = {event_id: self._steam.get(event_id) for event_id in event_ids}
+        return {
+            event_id: steam_signal(expire_steam(signal["markets"], now))
+            for event_id, signal in signals.items() if signal is not None
+        }
+
+    def closing_lines(self, event_ids: Iterable[str]) -> dict:
+        """
+        event id -> {"spread": home, "total": Over} closing consensus (median of
+        each book's last quote before commence) for the events still tracked.
+        Blocking - it waits out a sync, run in a thread.
+        """
+        lines = {}
+        with self._lock:
+            for event_id in event_ids:
+                event = self._events.get(event_id)
+                if event is None:
+                    continue
+                closing = {}
+                for market, name in (("spreads", "spread"), ("totals", "total")):
+                    closes = []
+                    for series in self._series.get((event_id, market), {}).values():
+                        before = [value for ts, value in series if ts <= event["commence_ts"]]
+                        closes.append(before[-1] if before else series[-1][1])
+                    closing[name] = median(closes) if closes else None
+                lines[event_id] = closing
+        return lines
+
+    def history(self, event_id: str) -> Optional[dict]:
+        """market -> book -> [(ts, value), ...] for one event"""
+        with self._state_lock:
+            if event_id not in self._events:
+                return None
+            return {
+                market: {book: list(series) for book, series in self._series[(event_id, market)].items()}
+                for market in STEAM_MARKETS if (event_id, market) in self._series
+            }
+
+    def steam_events(self, sport: str = None, now: float = None) -> list:
+        """Events with live steam on any market -> [(event_id, signal), ...]"""
+        with self._state_lock:
+            event_ids = [
+                event_id for event_id, signal in self._steam.items()
+                if any(signal["markets"].values()) and (sport is None or self._events[event_id]["sport"] == sport)
+            ]
+        return [
+            (event_id, signal) for event_id, signal in self.steam_for(event_ids, now).items()
+            if any(signal["markets"].values())
+        ]
+
+    def stats(self) -> dict:
+        with self._state_lock:
+            events, series = len(self._events), sum(len(books) for books in self._series.values())
+        return {
+            "events": events,
+            "series": series,
+            "seq": self._seq,
+            "recorded": self.recorded,
+            "scans": self.scans,
+            "retention_seconds": self.retention
+        }
+
+    def reset(self):
+        """Drop all history (tests and benchmarks)"""
+        with self._lock:
+            self._conn().execute("DELETE FROM line_history")
+            with self._state_lock:
+                self._series.clear()
+                self._events.clear()
+                self._steam.clear()
+            self._seq = 0
+
+
+line_history = LineHistory()
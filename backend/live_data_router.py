@@ -17,4621 +17,110 @@
 #        Princeton Global Consciousness Project meets Sports Betting
 #        Insider Leak (Silent Spike) | Main Character Syndrome | Phantom Injury
 #        "Someone always knows." - Information Asymmetry Detection
+#
+# The engines live in engines/ (one module per family, tables in data/);
+# this module is the /live HTTP surface over them.
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
 from typing import Optional, List, Dict, Any
 import httpx
 import asyncio
-from datetime import datetime, timedelta
-import math
-import random
+import json
+from datetime import datetime, timezone
+import logging
+import os
+import time
+
+from backtest import BACKTEST_DATA_DIR, BacktestJob, backtest_jobs, load_prop_history
+from circuit_breaker import upstream_breakers
+from clv_tracker import (
+    GROUPS, OUTCOMES, DuplicatePickError, clv_tracker, event_prop_quotes, game_closing_quotes, prop_closing_quotes
+)
+from deadline import DEADLINE_HEADER, Deadline, DeadlineExceeded, parse_deadline
+from line_history import line_history
+from memory import deep_sizeof, memory_accounting, request_memory, start_tracing, stop_tracing, top_allocations
+from metrics import registry
+from noosphere_stream import noosphere_stream, parse_timestamp
+from profiling import PROFILE_HEADER, profile_store, profiling_authorized
+from request_log import current_request
+from results_store import DEFAULT_MARKETS, MARKETS, SIGNALS, results_store
+from scoring_executor import scoring_executor, ScoringBackpressureError
+from server_timing import TimedJSONResponse
+from shared_cache import WORKER_ID, shared_cache, SnapshotPoller
+from timing import Trace, current_trace, route_timings, run_traced, span
+from upstream_ledger import bind_initiator, summarize_calls, unbind_initiator, upstream_ledger
+
+from engines import tables
+from engines.gematria import (
+    CIPHER_NAMES, JARVIS_TRIGGERS, POWER_NUMBERS, TESLA_NUMBERS, analyze_jersey_number,
+    calculate_date_numerology, check_jarvis_trigger, get_all_ciphers, get_cipher_values,
+    validate_2178
+)
+from engines.resonance import (
+    analyze_founders_echo, analyze_life_path_sync, calculate_life_path_number,
+    resolve_franchise_name, resolve_star_player_name
+)
+from engines.scalar_savant import (
+    analyze_chrome_resonance, analyze_player_biorhythm, analyze_zebra_privilege,
+    get_detailed_moon_phase, get_planetary_aspects, get_schumann_resonance
+)
+from engines.omni_glitch import (
+    analyze_atmospheric_drag, analyze_gann_spiral, analyze_mars_uranus_aspect,
+    analyze_shannon_entropy, calculate_vortex_math, is_void_of_course_moon
+)
+from engines.gann import (
+    analyze_annulifier_cycle, analyze_fifty_percent_retracement, analyze_rule_of_three,
+    get_gann_physics_composite, scan_gann_physics
+)
+from engines.noosphere import (
+    calculate_noosphere_velocity, detect_insider_leak, detect_main_character_syndrome,
+    detect_phantom_injury
+)
+from engines.esoteric import DAY_CONTEXTS, build_day_contexts, calculate_standalone_esoteric, get_day_context
+from engines.confluence import check_confluence_alert
+from engines.confidence import SIGNAL_WEIGHTS
+from engines.gematria_index import ENTITY_KINDS, MATCH_KINDS, gematria_index
+from engines.market_scan import FINDINGS, GAME_MARKETS as SCANNED_GAME_MARKETS, scan_market_lines
+from engines.prop_correlation import CorrelationTable, SlateMatrix, price_parlay, prop_market_key
+from engines.scoring import build_name_indexes, collect_prop_outcomes, extract_game_lines, prime_cipher_cache
+from engines.season_calendar import CALENDAR_DAYS, default_start, open_calendar
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/live", tags=["live"])
 
 ODDS_API_KEY = "ceb2e3a6a3302e0f38fd0d34150294e9"
-ODDS_API_BASE = "https://api.the-odds-api.com/v4"
-
-# ============================================================================
-# JARVIS TRIGGERS - THE PROVEN EDGE NUMBERS (v10.1 preserved)
-# ============================================================================
-
-JARVIS_TRIGGERS = {
-    2178: {
-        "name": "THE IMMORTAL",
-        "boost": 20,
-        "tier": "LEGENDARY",
-        "description": "Only number where n×4=reverse AND n×reverse=66^4. Never collapses.",
-        "mathematical": True
-    },
-    201: {
-        "name": "THE ORDER",
-        "boost": 12,
-        "tier": "HIGH",
-        "description": "Jesuit Order gematria. The Event of 201.",
-        "mathematical": False
-    },
-    33: {
-        "name": "THE MASTER",
-        "boost": 10,
-        "tier": "HIGH",
-        "description": "Highest master number. Masonic significance.",
-        "mathematical": False
-    },
-    93: {
-        "name": "THE WILL",
-        "boost": 10,
-        "tier": "HIGH",
-        "description": "Thelema sacred number. Will and Love.",
-        "mathematical": False
-    },
-    322: {
-        "name": "THE SOCIETY",
-        "boost": 10,
-        "tier": "HIGH",
-        "description": "Skull & Bones. Genesis 3:22.",
-        "mathematical": False
-    }
-}
-
-# Extended power numbers from Twitter gematria community
-POWER_NUMBERS = {
-    "master": [11, 22, 33, 44, 55, 66, 77, 88, 99],
-    "tesla": [3, 6, 9, 27, 36, 63, 72, 81, 108, 144, 216, 369],
-    "fibonacci": [1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377],
-    "sacred": [7, 12, 40, 72, 153, 666, 777, 888],
-    "jarvis": [2178, 201, 33, 93, 322],
-    "super_bowl": [56, 131, 58, 59],  # Super Bowl gematria markers
-    "nfl_favorites": [13, 17, 23, 32, 42]  # Common NFL narrative numbers
-}
-
-TESLA_NUMBERS = [3, 6, 9]
-
-# ============================================================================
-# FRANCHISE FOUNDING DATES DATABASE - v10.3 RESONANCE LAYER
-# Used for Founder's Echo - when franchise founding date resonates with game date
-# Format: (month, day, year) - Using official establishment/founding dates
-# ============================================================================
-
-FRANCHISE_FOUNDING_DATES = {
-    # NFL Teams (32 teams)
-    "Arizona Cardinals": (1898, 9, 1),      # Founded as Morgan Athletic Club
-    "Atlanta Falcons": (1965, 6, 30),
-    "Baltimore Ravens": (1996, 2, 9),
-    "Buffalo Bills": (1960, 10, 28),
-    "Carolina Panthers": (1993, 10, 26),
-    "Chicago Bears": (1920, 9, 17),         # Decatur Staleys
-    "Cincinnati Bengals": (1968, 5, 24),
-    "Cleveland Browns": (1946, 6, 4),
-    "Dallas Cowboys": (1960, 1, 28),
-    "Denver Broncos": (1960, 8, 14),
-    "Detroit Lions": (1930, 7, 12),
-    "Green Bay Packers": (1919, 8, 11),
-    "Houston Texans": (1999, 10, 6),
-    "Indianapolis Colts": (1953, 1, 23),    # Baltimore Colts
-    "Jacksonville Jaguars": (1993, 11, 30),
-    "Kansas City Chiefs": (1960, 8, 14),    # Dallas Texans
-    "Las Vegas Raiders": (1960, 1, 30),     # Oakland Raiders
-    "Los Angeles Chargers": (1960, 8, 14),
-    "Los Angeles Rams": (1936, 2, 12),      # Cleveland Rams
-    "Miami Dolphins": (1965, 8, 16),
-    "Minnesota Vikings": (1960, 1, 28),
-    "New England Patriots": (1959, 11, 16),
-    "New Orleans Saints": (1966, 11, 1),    # All Saints Day!
-    "New York Giants": (1925, 8, 1),
-    "New York Jets": (1960, 8, 14),         # Titans of New York
-    "Philadelphia Eagles": (1933, 7, 8),
-    "Pittsburgh Steelers": (1933, 7, 8),
-    "San Francisco 49ers": (1946, 6, 4),
-    "Seattle Seahawks": (1974, 6, 4),
-    "Tampa Bay Buccaneers": (1974, 4, 24),
-    "Tennessee Titans": (1960, 8, 14),      # Houston Oilers
-    "Washington Commanders": (1932, 7, 9),
-
-    # NBA Teams (30 teams)
-    "Atlanta Hawks": (1946, 8, 1),          # Tri-Cities Blackhawks
-    "Boston Celtics": (1946, 6, 6),
-    "Brooklyn Nets": (1967, 8, 17),         # New Jersey Americans
-    "Charlotte Hornets": (1988, 4, 22),
-    "Chicago Bulls": (1966, 1, 16),
-    "Cleveland Cavaliers": (1970, 2, 10),
-    "Dallas Mavericks": (1980, 1, 14),
-    "Denver Nuggets": (1967, 2, 5),         # Denver Rockets
-    "Detroit Pistons": (1941, 1, 1),        # Fort Wayne Zollner Pistons
-    "Golden State Warriors": (1946, 6, 6),  # Philadelphia Warriors
-    "Houston Rockets": (1967, 2, 5),        # San Diego Rockets
-    "Indiana Pacers": (1967, 2, 2),
-    "LA Clippers": (1970, 6, 15),           # Buffalo Braves
-    "Los Angeles Lakers": (1947, 1, 1),     # Minneapolis Lakers
-    "Memphis Grizzlies": (1995, 4, 27),     # Vancouver Grizzlies
-    "Miami Heat": (1988, 4, 22),
-    "Milwaukee Bucks": (1968, 1, 22),
-    "Minnesota Timberwolves": (1989, 4, 22),
-    "New Orleans Pelicans": (2002, 5, 11),  # Charlotte Bobcats -> Hornets -> Pelicans split
-    "New York Knicks": (1946, 6, 6),
-    "Oklahoma City Thunder": (1967, 2, 5),  # Seattle SuperSonics
-    "Orlando Magic": (1989, 4, 22),
-    "Philadelphia 76ers": (1946, 8, 1),     # Syracuse Nationals
-    "Phoenix Suns": (1968, 1, 22),
-    "Portland Trail Blazers": (1970, 2, 6),
-    "Sacramento Kings": (1923, 1, 1),       # Rochester Seagrams
-    "San Antonio Spurs": (1967, 2, 5),      # Dallas Chaparrals
-    "Toronto Raptors": (1995, 4, 27),
-    "Utah Jazz": (1974, 6, 7),              # New Orleans Jazz
-    "Washington Wizards": (1961, 12, 19),   # Chicago Packers
-
-    # MLB Teams (30 teams)
-    "Arizona Diamondbacks": (1998, 3, 9),
-    "Atlanta Braves": (1871, 3, 17),        # Boston Red Stockings
-    "Baltimore Orioles": (1901, 1, 28),     # Milwaukee Brewers (original)
-    "Boston Red Sox": (1901, 1, 28),
-    "Chicago Cubs": (1876, 2, 2),           # Chicago White Stockings
-    "Chicago White Sox": (1901, 1, 28),
-    "Cincinnati Reds": (1881, 11, 2),
-    "Cleveland Guardians": (1901, 1, 28),   # Cleveland Indians
-    "Colorado Rockies": (1991, 7, 5),
-    "Detroit Tigers": (1901, 1, 28),
-    "Houston Astros": (1962, 10, 17),       # Houston Colt .45s
-    "Kansas City Royals": (1969, 1, 11),
-    "Los Angeles Angels": (1961, 12, 6),
-    "Los Angeles Dodgers": (1883, 1, 1),    # Brooklyn Atlantics
-    "Miami Marlins": (1991, 7, 5),          # Florida Marlins
-    "Milwaukee Brewers": (1969, 3, 28),     # Seattle Pilots
-    "Minnesota Twins": (1901, 1, 28),       # Washington Senators
-    "New York Mets": (1962, 10, 17),
-    "New York Yankees": (1901, 1, 28),      # Baltimore Orioles (original)
-    "Oakland Athletics": (1901, 1, 28),     # Philadelphia Athletics
-    "Philadelphia Phillies": (1883, 1, 1),
-    "Pittsburgh Pirates": (1881, 10, 15),
-    "San Diego Padres": (1969, 5, 27),
-    "San Francisco Giants": (1883, 1, 1),   # New York Gothams
-    "Seattle Mariners": (1977, 2, 7),
-    "St. Louis Cardinals": (1882, 1, 1),    # St. Louis Brown Stockings
-    "Tampa Bay Rays": (1998, 3, 9),         # Tampa Bay Devil Rays
-    "Texas Rangers": (1961, 12, 6),         # Washington Senators (second)
-    "Toronto Blue Jays": (1977, 1, 15),
-    "Washington Nationals": (1969, 4, 14),  # Montreal Expos
-
-    # NHL Teams (32 teams)
-    "Anaheim Ducks": (1993, 3, 1),          # Mighty Ducks of Anaheim
-    "Arizona Coyotes": (1972, 6, 23),       # Winnipeg Jets (original)
-    "Boston Bruins": (1924, 11, 1),
-    "Buffalo Sabres": (1970, 5, 22),
-    "Calgary Flames": (1972, 6, 6),         # Atlanta Flames
-    "Carolina Hurricanes": (1972, 2, 9),    # New England Whalers
-    "Chicago Blackhawks": (1926, 9, 25),
-    "Colorado Avalanche": (1972, 2, 9),     # Quebec Nordiques
-    "Columbus Blue Jackets": (1997, 6, 25),
-    "Dallas Stars": (1967, 2, 9),           # Minnesota North Stars
-    "Detroit Red Wings": (1926, 9, 25),     # Detroit Cougars
-    "Edmonton Oilers": (1972, 6, 22),
-    "Florida Panthers": (1993, 4, 14),
-    "Los Angeles Kings": (1967, 2, 9),
-    "Minnesota Wild": (2000, 6, 25),
-    "Montreal Canadiens": (1909, 12, 4),
-    "Nashville Predators": (1998, 5, 4),
-    "New Jersey Devils": (1974, 6, 11),     # Kansas City Scouts
-    "New York Islanders": (1972, 6, 6),
-    "New York Rangers": (1926, 5, 15),
-    "Ottawa Senators": (1992, 12, 16),      # Modern expansion
-    "Philadelphia Flyers": (1967, 2, 9),
-    "Pittsburgh Penguins": (1967, 2, 9),
-    "San Jose Sharks": (1991, 5, 9),
-    "Seattle Kraken": (2018, 12, 4),
-    "St. Louis Blues": (1967, 2, 9),
-    "Tampa Bay Lightning": (1992, 12, 16),
-    "Toronto Maple Leafs": (1917, 11, 22),  # Toronto Arenas
-    "Vancouver Canucks": (1970, 5, 22),
-    "Vegas Golden Knights": (2016, 6, 22),
-    "Washington Capitals": (1974, 6, 11),
-    "Winnipeg Jets": (2011, 5, 31),         # Atlanta Thrashers relocated
-}
-
-# Alternative name mappings for matching
-TEAM_NAME_ALIASES = {
-    "cardinals": "Arizona Cardinals",
-    "falcons": "Atlanta Falcons",
-    "ravens": "Baltimore Ravens",
-    "bills": "Buffalo Bills",
-    "panthers": "Carolina Panthers",
-    "bears": "Chicago Bears",
-    "bengals": "Cincinnati Bengals",
-    "browns": "Cleveland Browns",
-    "cowboys": "Dallas Cowboys",
-    "broncos": "Denver Broncos",
-    "lions": "Detroit Lions",
-    "packers": "Green Bay Packers",
-    "texans": "Houston Texans",
-    "colts": "Indianapolis Colts",
-    "jaguars": "Jacksonville Jaguars",
-    "chiefs": "Kansas City Chiefs",
-    "raiders": "Las Vegas Raiders",
-    "chargers": "Los Angeles Chargers",
-    "rams": "Los Angeles Rams",
-    "dolphins": "Miami Dolphins",
-    "vikings": "Minnesota Vikings",
-    "patriots": "New England Patriots",
-    "saints": "New Orleans Saints",
-    "giants": "New York Giants",
-    "jets": "New York Jets",
-    "eagles": "Philadelphia Eagles",
-    "steelers": "Pittsburgh Steelers",
-    "49ers": "San Francisco 49ers",
-    "niners": "San Francisco 49ers",
-    "seahawks": "Seattle Seahawks",
-    "buccaneers": "Tampa Bay Buccaneers",
-    "bucs": "Tampa Bay Buccaneers",
-    "titans": "Tennessee Titans",
-    "commanders": "Washington Commanders",
-    "redskins": "Washington Commanders",
-    "football team": "Washington Commanders",
-    # NBA
-    "hawks": "Atlanta Hawks",
-    "celtics": "Boston Celtics",
-    "nets": "Brooklyn Nets",
-    "hornets": "Charlotte Hornets",
-    "bulls": "Chicago Bulls",
-    "cavaliers": "Cleveland Cavaliers",
-    "cavs": "Cleveland Cavaliers",
-    "mavericks": "Dallas Mavericks",
-    "mavs": "Dallas Mavericks",
-    "nuggets": "Denver Nuggets",
-    "pistons": "Detroit Pistons",
-    "warriors": "Golden State Warriors",
-    "dubs": "Golden State Warriors",
-    "rockets": "Houston Rockets",
-    "pacers": "Indiana Pacers",
-    "clippers": "LA Clippers",
-    "lakers": "Los Angeles Lakers",
-    "grizzlies": "Memphis Grizzlies",
-    "heat": "Miami Heat",
-    "bucks": "Milwaukee Bucks",
-    "timberwolves": "Minnesota Timberwolves",
-    "wolves": "Minnesota Timberwolves",
-    "pelicans": "New Orleans Pelicans",
-    "knicks": "New York Knicks",
-    "thunder": "Oklahoma City Thunder",
-    "okc": "Oklahoma City Thunder",
-    "magic": "Orlando Magic",
-    "76ers": "Philadelphia 76ers",
-    "sixers": "Philadelphia 76ers",
-    "suns": "Phoenix Suns",
-    "blazers": "Portland Trail Blazers",
-    "trail blazers": "Portland Trail Blazers",
-    "kings": "Sacramento Kings",
-    "spurs": "San Antonio Spurs",
-    "raptors": "Toronto Raptors",
-    "jazz": "Utah Jazz",
-    "wizards": "Washington Wizards",
-    # NHL
-    "ducks": "Anaheim Ducks",
-    "coyotes": "Arizona Coyotes",
-    "bruins": "Boston Bruins",
-    "sabres": "Buffalo Sabres",
-    "flames": "Calgary Flames",
-    "hurricanes": "Carolina Hurricanes",
-    "canes": "Carolina Hurricanes",
-    "blackhawks": "Chicago Blackhawks",
-    "avalanche": "Colorado Avalanche",
-    "avs": "Colorado Avalanche",
-    "blue jackets": "Columbus Blue Jackets",
-    "cbj": "Columbus Blue Jackets",
-    "stars": "Dallas Stars",
-    "red wings": "Detroit Red Wings",
-    "oilers": "Edmonton Oilers",
-    "panthers hockey": "Florida Panthers",
-    "la kings": "Los Angeles Kings",
-    "wild": "Minnesota Wild",
-    "canadiens": "Montreal Canadiens",
-    "habs": "Montreal Canadiens",
-    "predators": "Nashville Predators",
-    "preds": "Nashville Predators",
-    "devils": "New Jersey Devils",
-    "islanders": "New York Islanders",
-    "isles": "New York Islanders",
-    "rangers": "New York Rangers",
-    "senators": "Ottawa Senators",
-    "sens": "Ottawa Senators",
-    "flyers": "Philadelphia Flyers",
-    "penguins": "Pittsburgh Penguins",
-    "pens": "Pittsburgh Penguins",
-    "sharks": "San Jose Sharks",
-    "kraken": "Seattle Kraken",
-    "blues": "St. Louis Blues",
-    "lightning": "Tampa Bay Lightning",
-    "bolts": "Tampa Bay Lightning",
-    "maple leafs": "Toronto Maple Leafs",
-    "leafs": "Toronto Maple Leafs",
-    "canucks": "Vancouver Canucks",
-    "golden knights": "Vegas Golden Knights",
-    "vgk": "Vegas Golden Knights",
-    "capitals": "Washington Capitals",
-    "caps": "Washington Capitals",
-    "wpg jets": "Winnipeg Jets",
-    # MLB
-    "diamondbacks": "Arizona Diamondbacks",
-    "dbacks": "Arizona Diamondbacks",
-    "braves": "Atlanta Braves",
-    "orioles": "Baltimore Orioles",
-    "os": "Baltimore Orioles",
-    "red sox": "Boston Red Sox",
-    "cubs": "Chicago Cubs",
-    "white sox": "Chicago White Sox",
-    "sox": "Chicago White Sox",
-    "reds": "Cincinnati Reds",
-    "guardians": "Cleveland Guardians",
-    "indians": "Cleveland Guardians",
-    "rockies": "Colorado Rockies",
-    "tigers": "Detroit Tigers",
-    "astros": "Houston Astros",
-    "stros": "Houston Astros",
-    "royals": "Kansas City Royals",
-    "angels": "Los Angeles Angels",
-    "halos": "Los Angeles Angels",
-    "dodgers": "Los Angeles Dodgers",
-    "marlins": "Miami Marlins",
-    "brewers": "Milwaukee Brewers",
-    "crew": "Milwaukee Brewers",
-    "twins": "Minnesota Twins",
-    "mets": "New York Mets",
-    "yankees": "New York Yankees",
-    "yanks": "New York Yankees",
-    "athletics": "Oakland Athletics",
-    "a's": "Oakland Athletics",
-    "phillies": "Philadelphia Phillies",
-    "phils": "Philadelphia Phillies",
-    "pirates": "Pittsburgh Pirates",
-    "bucs baseball": "Pittsburgh Pirates",
-    "padres": "San Diego Padres",
-    "friars": "San Diego Padres",
-    "mariners": "Seattle Mariners",
-    "m's": "Seattle Mariners",
-    "cardinals baseball": "St. Louis Cardinals",
-    "cards": "St. Louis Cardinals",
-    "rays": "Tampa Bay Rays",
-    "texas rangers": "Texas Rangers",
-    "blue jays": "Toronto Blue Jays",
-    "jays": "Toronto Blue Jays",
-    "nationals": "Washington Nationals",
-    "nats": "Washington Nationals",
-}
-
-def get_team_founding(team_name: str) -> dict:
-    """Get franchise founding date for a team"""
-    # Try direct match first
-    if team_name in FRANCHISE_FOUNDING_DATES:
-        year, month, day = FRANCHISE_FOUNDING_DATES[team_name]
-        return {"found": True, "team": team_name, "year": year, "month": month, "day": day}
-
-    # Try alias matching
-    team_lower = team_name.lower()
-    for alias, full_name in TEAM_NAME_ALIASES.items():
-        if alias in team_lower or team_lower in alias:
-            if full_name in FRANCHISE_FOUNDING_DATES:
-                year, month, day = FRANCHISE_FOUNDING_DATES[full_name]
-                return {"found": True, "team": full_name, "year": year, "month": month, "day": day}
-
-    # Try partial match
-    for full_name in FRANCHISE_FOUNDING_DATES:
-        if team_lower in full_name.lower() or full_name.lower() in team_lower:
-            year, month, day = FRANCHISE_FOUNDING_DATES[full_name]
-            return {"found": True, "team": full_name, "year": year, "month": month, "day": day}
-
-    return {"found": False, "team": team_name, "year": None, "month": None, "day": None}
-
-# ============================================================================
-# TWITTER GEMATRIA COMMUNITY - 6 CIPHER SYSTEM
-# Sources: @gematriasports, @psgematria, @SportsGematria, @SGDecodes
-# ============================================================================
-
-def cipher_ordinal(text: str) -> int:
-    """Ordinal: A=1, B=2, ... Z=26 (most common cipher)"""
-    return sum(ord(c) - 64 for c in (text or "").upper() if 65 <= ord(c) <= 90)
-
-def cipher_reduction(text: str) -> int:
-    """Reduction/Pythagorean: Reduce to single digits (purest form)"""
-    total = 0
-    for c in (text or "").upper():
-        if 65 <= ord(c) <= 90:
-            val = ord(c) - 64
-            while val > 9:
-                val = sum(int(d) for d in str(val))
-            total += val
-    return total
-
-def cipher_reverse_ordinal(text: str) -> int:
-    """Reverse Ordinal: Z=1, Y=2, ... A=26"""
-    return sum(27 - (ord(c) - 64) for c in (text or "").upper() if 65 <= ord(c) <= 90)
-
-def cipher_reverse_reduction(text: str) -> int:
-    """Reverse Reduction: Reverse + reduce to single digits"""
-    total = 0
-    for c in (text or "").upper():
-        if 65 <= ord(c) <= 90:
-            val = 27 - (ord(c) - 64)
-            while val > 9:
-                val = sum(int(d) for d in str(val))
-            total += val
-    return total
-
-def cipher_sumerian(text: str) -> int:
-    """Sumerian: Multiply by 6 (A=6, B=12, ... Z=156)"""
-    return sum((ord(c) - 64) * 6 for c in (text or "").upper() if 65 <= ord(c) <= 90)
-
-def cipher_jewish(text: str) -> int:
-    """Jewish/Hebrew: Traditional Kabbalistic values"""
-    values = {
-        'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8, 'I': 9,
-        'K': 10, 'L': 20, 'M': 30, 'N': 40, 'O': 50, 'P': 60, 'Q': 70, 'R': 80,
-        'S': 90, 'T': 100, 'U': 200, 'V': 300, 'W': 400, 'X': 500, 'Y': 600, 'Z': 700, 'J': 600
-    }
-    return sum(values.get(c, 0) for c in (text or "").upper())
-
-def get_all_ciphers(text: str) -> dict:
-    """Calculate all 6 ciphers for a text string"""
-    return {
-        "ordinal": cipher_ordinal(text),
-        "reduction": cipher_reduction(text),
-        "reverse_ordinal": cipher_reverse_ordinal(text),
-        "reverse_reduction": cipher_reverse_reduction(text),
-        "sumerian": cipher_sumerian(text),
-        "jewish": cipher_jewish(text)
-    }
-
-# ============================================================================
-# DATE NUMEROLOGY - Twitter Community Standard
-# ============================================================================
-
-def calculate_date_numerology(date: datetime = None) -> dict:
-    """
-    Full date numerology breakdown used by @gematriasports, @SportsGematria
-    """
-    if date is None:
-        date = datetime.now()
-
-    day = date.day
-    month = date.month
-    year = date.year
-    year_short = year % 100
-
-    # Standard reductions
-    def reduce(n):
-        while n > 9 and n not in [11, 22, 33]:
-            n = sum(int(d) for d in str(n))
-        return n
-
-    # Multiple date formats used by community
-    formats = {
-        "full": month + day + year,           # 1+9+2026
-        "short": month + day + year_short,    # 1+9+26
-        "day_month": day + month,             # 9+1
-        "month_day": month * 100 + day,       # 109
-    }
-
-    reductions = {k: reduce(v) for k, v in formats.items()}
-
-    # Life path number
-    life_path = reduce(sum(int(d) for d in f"{year}{month:02d}{day:02d}"))
-
-    # Check for power alignments
-    alignments = []
-    for fmt_name, value in formats.items():
-        if value in POWER_NUMBERS["master"]:
-            alignments.append(f"{fmt_name}={value} (MASTER)")
-        if value in POWER_NUMBERS["tesla"]:
-            alignments.append(f"{fmt_name}={value} (TESLA)")
-        if value in JARVIS_TRIGGERS:
-            alignments.append(f"{fmt_name}={value} (JARVIS: {JARVIS_TRIGGERS[value]['name']})")
-
-    for fmt_name, value in reductions.items():
-        if value in [3, 6, 9]:
-            alignments.append(f"{fmt_name} reduces to {value} (TESLA)")
-        if value in [11, 22, 33]:
-            alignments.append(f"{fmt_name} reduces to {value} (MASTER)")
-
-    return {
-        "date": date.strftime("%Y-%m-%d"),
-        "display": date.strftime("%a %b %d, %Y"),
-        "day": day,
-        "month": month,
-        "year": year,
-        "formats": formats,
-        "reductions": reductions,
-        "life_path": life_path,
-        "alignments": alignments,
-        "is_power_date": len(alignments) >= 2
-    }
-
-# ============================================================================
-# JERSEY NUMBER ANALYSIS - Key Twitter Community Method
-# ============================================================================
-
-def analyze_jersey_number(jersey: int, date: datetime = None) -> dict:
-    """
-    Jersey number analysis - matches jersey to date numerology
-    Used by @gematriasports, @SGDecodes for player props
-    """
-    if date is None:
-        date = datetime.now()
-
-    date_info = calculate_date_numerology(date)
-
-    # Reduce jersey
-    jersey_reduced = jersey
-    while jersey_reduced > 9 and jersey_reduced not in [11, 22, 33]:
-        jersey_reduced = sum(int(d) for d in str(jersey_reduced))
-
-    alignments = []
-    alignment_score = 0
-
-    # Direct match to date components
-    if jersey == date_info["day"]:
-        alignments.append(f"Jersey {jersey} = Day of month")
-        alignment_score += 25
-
-    if jersey == date_info["month"]:
-        alignments.append(f"Jersey {jersey} = Month")
-        alignment_score += 20
-
-    if jersey == date_info["life_path"]:
-        alignments.append(f"Jersey {jersey} = Life path number")
-        alignment_score += 30
-
-    # Reduction matches
-    for fmt_name, red_value in date_info["reductions"].items():
-        if jersey_reduced == red_value:
-            alignments.append(f"Jersey reduces to {jersey_reduced} = {fmt_name} reduction")
-            alignment_score += 15
-
-    # Power number check
-    if jersey in POWER_NUMBERS["master"]:
-        alignments.append(f"Jersey {jersey} = MASTER NUMBER")
-        alignment_score += 20
-
-    if jersey in POWER_NUMBERS["nfl_favorites"]:
-        alignments.append(f"Jersey {jersey} = NFL narrative number")
-        alignment_score += 10
-
-    # Jarvis trigger check
-    if jersey in JARVIS_TRIGGERS:
-        trigger = JARVIS_TRIGGERS[jersey]
-        alignments.append(f"Jersey {jersey} = JARVIS {trigger['name']}")
-        alignment_score += trigger["boost"]
-
-    return {
-        "jersey": jersey,
-        "jersey_reduced": jersey_reduced,
-        "date": date_info["display"],
-        "alignments": alignments,
-        "alignment_score": min(100, alignment_score),
-        "has_alignment": len(alignments) > 0,
-        "recommendation": "STRONG ALIGNMENT" if alignment_score >= 40 else "MODERATE" if alignment_score >= 20 else "WEAK"
-    }
-
-# ============================================================================
-# BEST STORYLINE ANALYSIS - Twitter Community Narrative Method
-# ============================================================================
-
-def analyze_storyline(home_team: str, away_team: str, context: dict = None) -> dict:
-    """
-    "Best Storyline" analysis - what narrative would the league push?
-    Based on @psgematria, Gematria Effect Sports methodology
-    """
-    context = context or {}
-
-    storylines = []
-    home_score = 50
-    away_score = 50
-
-    # Get all ciphers for both teams
-    home_ciphers = get_all_ciphers(home_team)
-    away_ciphers = get_all_ciphers(away_team)
-
-    # Check for championship/milestone narratives
-    championship_keywords = ["first", "revenge", "repeat", "dynasty", "historic", "record"]
-
-    # Cipher value analysis
-    for cipher_name, home_val in home_ciphers.items():
-        away_val = away_ciphers[cipher_name]
-
-        # Check Jarvis triggers
-        if home_val in JARVIS_TRIGGERS:
-            trigger = JARVIS_TRIGGERS[home_val]
-            storylines.append({
-                "team": home_team,
-                "type": "JARVIS_TRIGGER",
-                "cipher": cipher_name,
-                "value": home_val,
-                "detail": f"{home_team} {cipher_name}={home_val} ({trigger['name']})"
-            })
-            home_score += trigger["boost"]
-
-        if away_val in JARVIS_TRIGGERS:
-            trigger = JARVIS_TRIGGERS[away_val]
-            storylines.append({
-                "team": away_team,
-                "type": "JARVIS_TRIGGER",
-                "cipher": cipher_name,
-                "value": away_val,
-                "detail": f"{away_team} {cipher_name}={away_val} ({trigger['name']})"
-            })
-            away_score += trigger["boost"]
-
-        # Master numbers
-        if home_val in POWER_NUMBERS["master"]:
-            storylines.append({
-                "team": home_team,
-                "type": "MASTER_NUMBER",
-                "cipher": cipher_name,
-                "value": home_val,
-                "detail": f"{home_team} {cipher_name}={home_val} (Master)"
-            })
-            home_score += 8
-
-        if away_val in POWER_NUMBERS["master"]:
-            storylines.append({
-                "team": away_team,
-                "type": "MASTER_NUMBER",
-                "cipher": cipher_name,
-                "value": away_val,
-                "detail": f"{away_team} {cipher_name}={away_val} (Master)"
-            })
-            away_score += 8
-
-        # Tesla alignment (difference)
-        diff = abs(home_val - away_val)
-        if diff in POWER_NUMBERS["tesla"]:
-            storylines.append({
-                "team": "matchup",
-                "type": "TESLA_ALIGNMENT",
-                "cipher": cipher_name,
-                "value": diff,
-                "detail": f"{cipher_name} difference = {diff} (Tesla)"
-            })
-
-    # Determine favored team
-    if home_score > away_score + 10:
-        favored = "home"
-        favored_team = home_team
-        reasoning = f"{home_team} has stronger gematria storyline ({home_score} vs {away_score})"
-    elif away_score > home_score + 10:
-        favored = "away"
-        favored_team = away_team
-        reasoning = f"{away_team} has stronger gematria storyline ({away_score} vs {home_score})"
-    else:
-        favored = "neutral"
-        favored_team = None
-        reasoning = "No clear storyline advantage"
-
-    return {
-        "home_team": home_team,
-        "away_team": away_team,
-        "home_ciphers": home_ciphers,
-        "away_ciphers": away_ciphers,
-        "storylines": storylines[:10],  # Top 10
-        "home_score": min(100, home_score),
-        "away_score": min(100, away_score),
-        "favored": favored,
-        "favored_team": favored_team,
-        "reasoning": reasoning
-    }
-
-# ============================================================================
-# FOUNDER'S ECHO - v10.3 RESONANCE LAYER
-# Checks if franchise founding date resonates with today's game date
-# Major insight from Twitter gematria community: founding dates are scripted
-# ============================================================================
-
-def analyze_founders_echo(team_name: str, game_date: datetime = None) -> dict:
-    """
-    FOUNDER'S ECHO - v10.3 Resonance Layer
-
-    Checks for cosmic resonance between a franchise's founding date
-    and the current game date. The Twitter gematria community has shown
-    that leagues script outcomes around founding date alignments.
-
-    Resonance Types:
-    - EXACT DAY MATCH: Founding day = Game day (e.g., founded 8th, playing 8th)
-    - MONTH MATCH: Same month as founding
-    - ANNIVERSARY: Exact date match (month + day)
-    - MILESTONE YEAR: Playing on a round anniversary (25, 50, 75, 100 years)
-    - LIFE PATH SYNC: Founding date life path = Game date life path
-    - NUMEROLOGICAL ECHO: Founding date reduces to same as game date
-    """
-    if game_date is None:
-        game_date = datetime.now()
-
-    founding_info = get_team_founding(team_name)
-
-    if not founding_info["found"]:
-        return {
-            "team": team_name,
-            "has_echo": False,
-            "echo_score": 0,
-            "echos": [],
-            "message": "Franchise founding date not found",
-            "founding_info": founding_info
-        }
-
-    found_year = founding_info["year"]
-    found_month = founding_info["month"]
-    found_day = founding_info["day"]
-
-    game_day = game_date.day
-    game_month = game_date.month
-    game_year = game_date.year
-
-    echos = []
-    echo_score = 0
-
-    # 1. EXACT DAY MATCH - Same day of month (MASSIVE RESONANCE)
-    if found_day == game_day:
-        echos.append({
-            "type": "EXACT_DAY_MATCH",
-            "detail": f"Founded on the {found_day}th, playing on the {game_day}th",
-            "boost": 30,
-            "tier": "LEGENDARY"
-        })
-        echo_score += 30
-
-    # 2. MONTH MATCH - Same month
-    if found_month == game_month:
-        echos.append({
-            "type": "MONTH_MATCH",
-            "detail": f"Founded in month {found_month}, playing in month {game_month}",
-            "boost": 20,
-            "tier": "HIGH"
-        })
-        echo_score += 20
-
-    # 3. ANNIVERSARY - Exact date match (month AND day) - ULTRA RARE
-    if found_month == game_month and found_day == game_day:
-        echos.append({
-            "type": "ANNIVERSARY",
-            "detail": f"Playing on franchise birthday! ({found_month}/{found_day})",
-            "boost": 50,
-            "tier": "IMMORTAL"
-        })
-        echo_score += 50  # Additional 50 on top of day/month matches
-
-    # 4. MILESTONE YEAR - Round anniversary years
-    years_since_founding = game_year - found_year
-    milestone_years = [25, 50, 75, 100, 125, 150]
-    if years_since_founding in milestone_years:
-        echos.append({
-            "type": "MILESTONE_YEAR",
-            "detail": f"{years_since_founding}th anniversary season!",
-            "boost": 25,
-            "tier": "HIGH"
-        })
-        echo_score += 25
-
-    # Near milestone (within 1 year)
-    for milestone in milestone_years:
-        if abs(years_since_founding - milestone) == 1:
-            echos.append({
-                "type": "NEAR_MILESTONE",
-                "detail": f"Approaching/just passed {milestone}th anniversary ({years_since_founding} years)",
-                "boost": 10,
-                "tier": "MODERATE"
-            })
-            echo_score += 10
-            break
-
-    # 5. LIFE PATH SYNC - Founding date life path matches game date life path
-    def calculate_life_path(year, month, day):
-        total = sum(int(d) for d in f"{year}{month:02d}{day:02d}")
-        while total > 9 and total not in [11, 22, 33]:
-            total = sum(int(d) for d in str(total))
-        return total
-
-    founding_life_path = calculate_life_path(found_year, found_month, found_day)
-    game_life_path = calculate_life_path(game_year, game_month, game_day)
-
-    if founding_life_path == game_life_path:
-        echos.append({
-            "type": "LIFE_PATH_SYNC",
-            "detail": f"Founding life path ({founding_life_path}) = Game life path ({game_life_path})",
-            "boost": 25,
-            "tier": "HIGH"
-        })
-        echo_score += 25
-
-    # 6. NUMEROLOGICAL ECHO - Date sums match
-    founding_sum = found_month + found_day + (found_year % 100)
-    game_sum = game_month + game_day + (game_year % 100)
-
-    def reduce(n):
-        while n > 9:
-            n = sum(int(d) for d in str(n))
-        return n
-
-    if reduce(founding_sum) == reduce(game_sum):
-        echos.append({
-            "type": "NUMEROLOGICAL_ECHO",
-            "detail": f"Founding date reduces to {reduce(founding_sum)}, game date reduces to {reduce(game_sum)}",
-            "boost": 15,
-            "tier": "MODERATE"
-        })
-        echo_score += 15
-
-    # 7. TESLA ALIGNMENT - Days or months divisible by 3, 6, or 9
-    if found_day in [3, 6, 9, 12, 15, 18, 21, 24, 27, 30] and game_day in [3, 6, 9, 12, 15, 18, 21, 24, 27, 30]:
-        echos.append({
-            "type": "TESLA_DAY_ALIGNMENT",
-            "detail": f"Both days Tesla-aligned: {found_day} and {game_day}",
-            "boost": 10,
-            "tier": "MODERATE"
-        })
-        echo_score += 10
-
-    # 8. MASTER NUMBER YEAR - Year sum = 11, 22, or 33
-    if years_since_founding in [11, 22, 33, 44, 55, 66, 77, 88, 99]:
-        echos.append({
-            "type": "MASTER_NUMBER_YEAR",
-            "detail": f"{years_since_founding} years since founding (Master Number)",
-            "boost": 20,
-            "tier": "HIGH"
-        })
-        echo_score += 20
-
-    # Cap at 100
-    echo_score = min(100, echo_score)
-
-    # Determine tier
-    if echo_score >= 80:
-        overall_tier = "LEGENDARY"
-        emoji = "🏛️⚡"
-        message = f"MASSIVE FOUNDER'S ECHO - {founding_info['team']} ({found_year})"
-    elif echo_score >= 50:
-        overall_tier = "HIGH"
-        emoji = "🏛️✨"
-        message = f"Strong Founder's Echo - {founding_info['team']}"
-    elif echo_score >= 25:
-        overall_tier = "MODERATE"
-        emoji = "🏛️"
-        message = f"Founder's Echo present - {founding_info['team']}"
-    elif echo_score > 0:
-        overall_tier = "MILD"
-        emoji = "🏢"
-        message = f"Minor Founder's resonance - {founding_info['team']}"
-    else:
-        overall_tier = "NONE"
-        emoji = "📊"
-        message = "No Founder's Echo detected"
-
-    return {
-        "team": team_name,
-        "matched_team": founding_info["team"],
-        "has_echo": echo_score > 0,
-        "echo_score": echo_score,
-        "tier": overall_tier,
-        "emoji": emoji,
-        "message": message,
-        "echos": echos,
-        "founding_info": {
-            "year": found_year,
-            "month": found_month,
-            "day": found_day,
-            "full_date": f"{found_month}/{found_day}/{found_year}",
-            "years_since": game_year - found_year,
-            "life_path": founding_life_path
-        },
-        "game_info": {
-            "year": game_year,
-            "month": game_month,
-            "day": game_day,
-            "full_date": f"{game_month}/{game_day}/{game_year}",
-            "life_path": game_life_path
-        }
-    }
-
-# ============================================================================
-# LIFE PATH SYNC - v10.3 RESONANCE LAYER
-# Checks if star player's life path matches game numerology
-# Based on Twitter gematria insight: birthdates determine destiny games
-# ============================================================================
-
-# Star player birthdates database - key players per team
-STAR_PLAYER_BIRTHDATES = {
-    # NBA Stars
-    "LeBron James": (1984, 12, 30),
-    "Stephen Curry": (1988, 3, 14),
-    "Kevin Durant": (1988, 9, 29),
-    "Giannis Antetokounmpo": (1994, 12, 6),
-    "Luka Doncic": (1999, 2, 28),
-    "Jayson Tatum": (1998, 3, 3),
-    "Joel Embiid": (1994, 3, 16),
-    "Nikola Jokic": (1995, 2, 19),
-    "Anthony Edwards": (2001, 8, 5),
-    "Shai Gilgeous-Alexander": (1998, 7, 12),
-    "Devin Booker": (1996, 10, 30),
-    "Donovan Mitchell": (1996, 9, 7),
-    "Ja Morant": (1999, 8, 10),
-    "Trae Young": (1998, 9, 19),
-    "Damian Lillard": (1990, 7, 15),
-    "Jimmy Butler": (1989, 9, 14),
-    "Bam Adebayo": (1997, 7, 18),
-    "Paul George": (1990, 5, 2),
-    "Kawhi Leonard": (1991, 6, 29),
-    "Anthony Davis": (1993, 3, 11),
-    "De'Aaron Fox": (1997, 12, 20),
-    "Victor Wembanyama": (2004, 1, 4),
-    "Paolo Banchero": (2002, 11, 12),
-    "Tyrese Haliburton": (2000, 2, 29),
-    "Domantas Sabonis": (1996, 5, 3),
-    "Karl-Anthony Towns": (1995, 11, 15),
-    "Cade Cunningham": (2001, 9, 25),
-    "Jalen Brunson": (1996, 8, 31),
-    "RJ Barrett": (2000, 6, 14),
-    "Zion Williamson": (2000, 7, 6),
-
-    # NFL Stars
-    "Patrick Mahomes": (1995, 9, 17),
-    "Josh Allen": (1996, 5, 21),
-    "Lamar Jackson": (1997, 1, 7),
-    "Jalen Hurts": (1998, 8, 7),
-    "Joe Burrow": (1996, 12, 10),
-    "Justin Herbert": (1998, 3, 10),
-    "Trevor Lawrence": (1999, 10, 6),
-    "Dak Prescott": (1993, 7, 29),
-    "CJ Stroud": (2001, 10, 3),
-    "Jordan Love": (1998, 11, 2),
-    "Travis Kelce": (1989, 10, 5),
-    "Tyreek Hill": (1994, 3, 1),
-    "Davante Adams": (1992, 12, 24),
-    "Justin Jefferson": (1999, 6, 16),
-    "Ja'Marr Chase": (2000, 3, 1),
-    "CeeDee Lamb": (1999, 4, 8),
-    "Derrick Henry": (1994, 1, 4),
-    "Christian McCaffrey": (1996, 6, 7),
-    "Saquon Barkley": (1997, 2, 9),
-    "Nick Bosa": (1997, 10, 23),
-    "Micah Parsons": (1999, 5, 26),
-    "TJ Watt": (1994, 10, 11),
-    "Aaron Donald": (1991, 5, 23),
-    "Myles Garrett": (1995, 12, 29),
-
-    # NHL Stars
-    "Connor McDavid": (1997, 1, 13),
-    "Nathan MacKinnon": (1995, 9, 1),
-    "Auston Matthews": (1997, 9, 17),
-    "Leon Draisaitl": (1995, 10, 27),
-    "Nikita Kucherov": (1993, 6, 17),
-    "David Pastrnak": (1996, 5, 25),
-    "Mikko Rantanen": (1996, 10, 29),
-    "Mitch Marner": (1997, 5, 5),
-    "Alex Ovechkin": (1985, 9, 17),
-    "Sidney Crosby": (1987, 8, 7),
-    "Cale Makar": (1998, 10, 30),
-    "Quinn Hughes": (1999, 10, 14),
-    "Adam Fox": (1998, 2, 17),
-    "Andrei Vasilevskiy": (1994, 7, 25),
-    "Igor Shesterkin": (1995, 12, 30),
-    "Connor Hellebuyck": (1993, 5, 19),
-
-    # MLB Stars
-    "Shohei Ohtani": (1994, 7, 5),
-    "Mike Trout": (1991, 8, 7),
-    "Mookie Betts": (1992, 10, 7),
-    "Ronald Acuna Jr": (1997, 12, 18),
-    "Juan Soto": (1998, 10, 25),
-    "Corey Seager": (1994, 4, 27),
-    "Trea Turner": (1993, 6, 30),
-    "Freddie Freeman": (1989, 9, 12),
-    "Bryce Harper": (1992, 10, 16),
-    "Aaron Judge": (1992, 4, 26),
-    "Vladimir Guerrero Jr": (1999, 3, 16),
-    "Bo Bichette": (1998, 3, 5),
-    "Julio Rodriguez": (2000, 12, 29),
-    "Bobby Witt Jr": (2000, 6, 14),
-    "Gunnar Henderson": (2001, 6, 29),
-    "Elly De La Cruz": (2002, 1, 11),
-    "Corbin Carroll": (2000, 8, 21),
-    "Pete Alonso": (1994, 12, 7),
-    "Matt Olson": (1994, 3, 29),
-    "Marcus Semien": (1990, 9, 17),
-}
-
-def get_player_birthdate(player_name: str) -> dict:
-    """Get player's birthdate from database"""
-    # Try direct match
-    if player_name in STAR_PLAYER_BIRTHDATES:
-        year, month, day = STAR_PLAYER_BIRTHDATES[player_name]
-        return {"found": True, "player": player_name, "year": year, "month": month, "day": day}
-
-    # Try partial match
-    player_lower = player_name.lower()
-    for known_player in STAR_PLAYER_BIRTHDATES:
-        if player_lower in known_player.lower() or known_player.lower() in player_lower:
-            year, month, day = STAR_PLAYER_BIRTHDATES[known_player]
-            return {"found": True, "player": known_player, "year": year, "month": month, "day": day}
-
-    # Try last name match
-    player_parts = player_name.split()
-    if player_parts:
-        last_name = player_parts[-1].lower()
-        for known_player in STAR_PLAYER_BIRTHDATES:
-            if last_name in known_player.lower():
-                year, month, day = STAR_PLAYER_BIRTHDATES[known_player]
-                return {"found": True, "player": known_player, "year": year, "month": month, "day": day}
-
-    return {"found": False, "player": player_name, "year": None, "month": None, "day": None}
-
-def calculate_life_path_number(year: int, month: int, day: int) -> int:
-    """Calculate life path number from birthdate"""
-    total = sum(int(d) for d in f"{year}{month:02d}{day:02d}")
-    while total > 9 and total not in [11, 22, 33]:
-        total = sum(int(d) for d in str(total))
-    return total
-
-def analyze_life_path_sync(player_name: str, game_date: datetime = None) -> dict:
-    """
-    LIFE PATH SYNC - v10.3 Resonance Layer
-
-    Checks if a star player's life path number syncs with the game's numerology.
-    The Twitter gematria community has documented that players have "destiny games"
-    when their life path aligns with the date.
-
-    Sync Types:
-    - EXACT LIFE PATH MATCH: Player life path = Game life path
-    - BIRTHDAY MATCH: Playing on their birthday (or same day of month)
-    - DESTINY NUMBER: Player jersey reduces to game day
-    - AGE SYNC: Player's current age relates to game numerology
-    """
-    if game_date is None:
-        game_date = datetime.now()
-
-    player_info = get_player_birthdate(player_name)
-
-    if not player_info["found"]:
-        return {
-            "player": player_name,
-            "has_sync": False,
-            "sync_score": 0,
-            "syncs": [],
-            "message": "Player birthdate not in database",
-            "player_info": player_info
-        }
-
-    birth_year = player_info["year"]
-    birth_month = player_info["month"]
-    birth_day = player_info["day"]
-
-    game_day = game_date.day
-    game_month = game_date.month
-    game_year = game_date.year
-
-    # Calculate life paths
-    player_life_path = calculate_life_path_number(birth_year, birth_month, birth_day)
-    game_life_path = calculate_life_path_number(game_year, game_month, game_day)
-
-    # Calculate current age
-    player_age = game_year - birth_year
-    if game_month < birth_month or (game_month == birth_month and game_day < birth_day):
-        player_age -= 1
-
-    syncs = []
-    sync_score = 0
-
-    # 1. EXACT LIFE PATH MATCH (MASSIVE SYNC)
-    if player_life_path == game_life_path:
-        syncs.append({
-            "type": "EXACT_LIFE_PATH",
-            "detail": f"Player life path ({player_life_path}) = Game life path ({game_life_path})",
-            "boost": 35,
-            "tier": "LEGENDARY"
-        })
-        sync_score += 35
-
-    # 2. BIRTHDAY - Playing on actual birthday
-    if birth_month == game_month and birth_day == game_day:
-        syncs.append({
-            "type": "BIRTHDAY_GAME",
-            "detail": f"Playing on birthday! ({birth_month}/{birth_day})",
-            "boost": 50,
-            "tier": "IMMORTAL"
-        })
-        sync_score += 50
-
-    # 3. SAME DAY OF MONTH
-    elif birth_day == game_day:
-        syncs.append({
-            "type": "DAY_SYNC",
-            "detail": f"Born on {birth_day}th, playing on {game_day}th",
-            "boost": 25,
-            "tier": "HIGH"
-        })
-        sync_score += 25
-
-    # 4. SAME MONTH
-    if birth_month == game_month and birth_day != game_day:
-        syncs.append({
-            "type": "BIRTHDAY_MONTH",
-            "detail": f"Playing in birthday month ({birth_month})",
-            "boost": 15,
-            "tier": "MODERATE"
-        })
-        sync_score += 15
-
-    # 5. AGE SYNC - Age matches game day or life path
-    if player_age == game_day:
-        syncs.append({
-            "type": "AGE_DAY_SYNC",
-            "detail": f"Player is {player_age} years old, playing on day {game_day}",
-            "boost": 20,
-            "tier": "HIGH"
-        })
-        sync_score += 20
-
-    # Reduce age to single digit
-    age_reduced = player_age
-    while age_reduced > 9:
-        age_reduced = sum(int(d) for d in str(age_reduced))
-
-    if age_reduced == game_life_path:
-        syncs.append({
-            "type": "AGE_LIFE_PATH_SYNC",
-            "detail": f"Age {player_age} reduces to {age_reduced} = game life path {game_life_path}",
-            "boost": 15,
-            "tier": "MODERATE"
-        })
-        sync_score += 15
-
-    # 6. MASTER NUMBER PLAYER - Life path is 11, 22, or 33
-    if player_life_path in [11, 22, 33]:
-        syncs.append({
-            "type": "MASTER_NUMBER_PLAYER",
-            "detail": f"Player has Master Number life path ({player_life_path})",
-            "boost": 15,
-            "tier": "HIGH"
-        })
-        sync_score += 15
-
-    # 7. TESLA ALIGNMENT - Life path is 3, 6, or 9
-    if player_life_path in [3, 6, 9] and game_life_path in [3, 6, 9]:
-        syncs.append({
-            "type": "TESLA_SYNC",
-            "detail": f"Both player ({player_life_path}) and game ({game_life_path}) are Tesla numbers",
-            "boost": 20,
-            "tier": "HIGH"
-        })
-        sync_score += 20
-
-    # 8. PRIME AGE - Player at a prime number age
-    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
-    if player_age in primes:
-        syncs.append({
-            "type": "PRIME_AGE",
-            "detail": f"Player at prime age {player_age}",
-            "boost": 10,
-            "tier": "MODERATE"
-        })
-        sync_score += 10
-
-    # 9. JERSEY DESTINY - If we have jersey number context
-    # This would be passed in from the main function
-
-    # Cap at 100
-    sync_score = min(100, sync_score)
-
-    # Determine tier
-    if sync_score >= 80:
-        overall_tier = "LEGENDARY"
-        emoji = "🌟👤"
-        message = f"MASSIVE LIFE PATH SYNC - {player_info['player']} DESTINY GAME"
-    elif sync_score >= 50:
-        overall_tier = "HIGH"
-        emoji = "✨👤"
-        message = f"Strong Life Path Sync - {player_info['player']}"
-    elif sync_score >= 25:
-        overall_tier = "MODERATE"
-        emoji = "👤"
-        message = f"Life Path Sync present - {player_info['player']}"
-    elif sync_score > 0:
-        overall_tier = "MILD"
-        emoji = "📊"
-        message = f"Minor numerological sync - {player_info['player']}"
-    else:
-        overall_tier = "NONE"
-        emoji = "📊"
-        message = "No Life Path Sync detected"
-
-    return {
-        "player": player_name,
-        "matched_player": player_info["player"],
-        "has_sync": sync_score > 0,
-        "sync_score": sync_score,
-        "tier": overall_tier,
-        "emoji": emoji,
-        "message": message,
-        "syncs": syncs,
-        "player_info": {
-            "birth_year": birth_year,
-            "birth_month": birth_month,
-            "birth_day": birth_day,
-            "birthdate": f"{birth_month}/{birth_day}/{birth_year}",
-            "life_path": player_life_path,
-            "current_age": player_age,
-            "age_reduced": age_reduced
-        },
-        "game_info": {
-            "year": game_year,
-            "month": game_month,
-            "day": game_day,
-            "game_date": f"{game_month}/{game_day}/{game_year}",
-            "life_path": game_life_path
-        }
-    }
-
-# ============================================================================
-# ██╗   ██╗ ██╗ ██████╗    ██╗  ██╗    ███████╗ ██████╗ █████╗ ██╗      █████╗ ██████╗
-# ██║   ██║███║██╔═████╗   ██║  ██║    ██╔════╝██╔════╝██╔══██╗██║     ██╔══██╗██╔══██╗
-# ██║   ██║╚██║██║██╔██║   ███████║    ███████╗██║     ███████║██║     ███████║██████╔╝
-# ╚██╗ ██╔╝ ██║████╔╝██║   ╚════██║    ╚════██║██║     ██╔══██║██║     ██╔══██║██╔══██╗
-#  ╚████╔╝  ██║╚██████╔╝███████╗██║    ███████║╚██████╗██║  ██║███████╗██║  ██║██║  ██║
-#   ╚═══╝   ╚═╝ ╚═════╝ ╚══════╝╚═╝    ╚══════╝ ╚═════╝╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝╚═╝  ╚═╝
-# SCALAR-SAVANT EDITION - THE ABYSS
-# Planetary Physics | Scalar Variance | Deep Glitch Modules
-# ============================================================================
-
-# ============================================================================
-# MODULE 1: BIO-SINE WAVE (Player Biorhythms)
-# Theory: Every human oscillates on three sine waves from birth
-# Physical (23 days), Emotional (28 days), Intellectual (33 days)
-# Critical Days (zero crossing) = choke/injury risk
-# Peak Days (+1.0) = unstoppable performance
-# ============================================================================
-
-def calculate_biorhythm(birth_year: int, birth_month: int, birth_day: int, game_date: datetime = None) -> dict:
-    """
-    BIO-SINE WAVE - v10.4 Scalar-Savant
-
-    Calculate player's biorhythm state on game day.
-    Based on 1970s gambling edge research.
-
-    Cycles:
-    - Physical (23 days): Strength, coordination, stamina
-    - Emotional (28 days): Mood, creativity, sensitivity
-    - Intellectual (33 days): Thinking, memory, analysis
-
-    Critical Days: When cycle crosses zero (±0.1) = HIGH VARIANCE
-    Peak Days: When cycle at +1.0 = OPTIMAL PERFORMANCE
-    Trough Days: When cycle at -1.0 = DEGRADED PERFORMANCE
-    """
-    if game_date is None:
-        game_date = datetime.now()
-
-    # Calculate days since birth
-    birth_date = datetime(birth_year, birth_month, birth_day)
-    days_alive = (game_date - birth_date).days
-
-    # Calculate sine wave positions (-1 to +1)
-    physical = math.sin(2 * math.pi * days_alive / 23)
-    emotional = math.sin(2 * math.pi * days_alive / 28)
-    intellectual = math.sin(2 * math.pi * days_alive / 33)
-
-    # Identify critical days (zero crossings - high variance)
-    physical_critical = abs(physical) < 0.1
-    emotional_critical = abs(emotional) < 0.1
-    intellectual_critical = abs(intellectual) < 0.1
-
-    critical_count = sum([physical_critical, emotional_critical, intellectual_critical])
-
-    # Identify peak days (+0.9 to +1.0)
-    physical_peak = physical > 0.9
-    emotional_peak = emotional > 0.9
-    intellectual_peak = intellectual > 0.9
-
-    peak_count = sum([physical_peak, emotional_peak, intellectual_peak])
-
-    # Identify trough days (-0.9 to -1.0)
-    physical_trough = physical < -0.9
-    emotional_trough = emotional < -0.9
-    intellectual_trough = intellectual < -0.9
-
-    trough_count = sum([physical_trough, emotional_trough, intellectual_trough])
-
-    # Calculate composite score (weighted average)
-    # Physical matters most for athletes
-    composite = (physical * 0.50) + (emotional * 0.30) + (intellectual * 0.20)
-
-    # Determine state
-    if critical_count >= 2:
-        state = "CRITICAL_DAY"
-        emoji = "⚠️"
-        recommendation = "HIGH VARIANCE - Fade or reduce exposure"
-        variance_multiplier = 1.5
-    elif critical_count == 1:
-        state = "UNSTABLE"
-        emoji = "🌊"
-        recommendation = "Elevated variance - proceed with caution"
-        variance_multiplier = 1.2
-    elif peak_count >= 2:
-        state = "PEAK_PERFORMANCE"
-        emoji = "🔥"
-        recommendation = "OPTIMAL - Player props OVER, team performance UP"
-        variance_multiplier = 0.8
-    elif trough_count >= 2:
-        state = "TROUGH"
-        emoji = "📉"
-        recommendation = "DEGRADED - Fade player, props UNDER"
-        variance_multiplier = 1.1
-    elif composite > 0.5:
-        state = "POSITIVE"
-        emoji = "✅"
-        recommendation = "Above baseline - slight edge for player"
-        variance_multiplier = 0.95
-    elif composite < -0.5:
-        state = "NEGATIVE"
-        emoji = "❌"
-        recommendation = "Below baseline - slight fade on player"
-        variance_multiplier = 1.05
-    else:
-        state = "NEUTRAL"
-        emoji = "➖"
-        recommendation = "Baseline performance expected"
-        variance_multiplier = 1.0
-
-    # Score 0-100
-    bio_score = round(50 + (composite * 50))
-
-    return {
-        "days_alive": days_alive,
-        "cycles": {
-            "physical": {
-                "value": round(physical, 3),
-                "percent": round((physical + 1) * 50),
-                "is_critical": physical_critical,
-                "is_peak": physical_peak,
-                "is_trough": physical_trough,
-                "cycle_day": days_alive % 23
-            },
-            "emotional": {
-                "value": round(emotional, 3),
-                "percent": round((emotional + 1) * 50),
-                "is_critical": emotional_critical,
-                "is_peak": emotional_peak,
-                "is_trough": emotional_trough,
-                "cycle_day": days_alive % 28
-            },
-            "intellectual": {
-                "value": round(intellectual, 3),
-                "percent": round((intellectual + 1) * 50),
-                "is_critical": intellectual_critical,
-                "is_peak": intellectual_peak,
-                "is_trough": intellectual_trough,
-                "cycle_day": days_alive % 33
-            }
-        },
-        "composite": round(composite, 3),
-        "bio_score": bio_score,
-        "state": state,
-        "emoji": emoji,
-        "recommendation": recommendation,
-        "variance_multiplier": variance_multiplier,
-        "critical_count": critical_count,
-        "peak_count": peak_count,
-        "trough_count": trough_count,
-        "betting_implications": {
-            "player_props": "OVER" if composite > 0.3 else "UNDER" if composite < -0.3 else "NEUTRAL",
-            "variance_play": critical_count >= 1,
-            "confidence_modifier": 1 + (composite * 0.1)
-        }
-    }
-
-def analyze_player_biorhythm(player_name: str, game_date: datetime = None) -> dict:
-    """Get biorhythm analysis for a known player"""
-    player_info = get_player_birthdate(player_name)
-
-    if not player_info["found"]:
-        return {
-            "player": player_name,
-            "found": False,
-            "message": "Player birthdate not in database"
-        }
-
-    bio = calculate_biorhythm(
-        player_info["year"],
-        player_info["month"],
-        player_info["day"],
-        game_date
-    )
-
-    return {
-        "player": player_info["player"],
-        "found": True,
-        "birthdate": f"{player_info['month']}/{player_info['day']}/{player_info['year']}",
-        "biorhythm": bio
-    }
-
-# ============================================================================
-# MODULE 2: CHROME RESONANCE (Team Color Psychology)
-# Theory: Durham University 2005 study - Red teams win 60% of close contests
-# Teams in black draw more penalties (subconscious bias)
-# Color affects both player aggression and referee perception
-# ============================================================================
-
-# Team primary colors database
-TEAM_COLORS = {
-    # NFL Teams
-    "Arizona Cardinals": {"primary": "red", "secondary": "white", "accent": "black"},
-    "Atlanta Falcons": {"primary": "red", "secondary": "black", "accent": "white"},
-    "Baltimore Ravens": {"primary": "purple", "secondary": "black", "accent": "gold"},
-    "Buffalo Bills": {"primary": "blue", "secondary": "red", "accent": "white"},
-    "Carolina Panthers": {"primary": "blue", "secondary": "black", "accent": "silver"},
-    "Chicago Bears": {"primary": "navy", "secondary": "orange", "accent": "white"},
-    "Cincinnati Bengals": {"primary": "orange", "secondary": "black", "accent": "white"},
-    "Cleveland Browns": {"primary": "orange", "secondary": "brown", "accent": "white"},
-    "Dallas Cowboys": {"primary": "blue", "secondary": "silver", "accent": "white"},
-    "Denver Broncos": {"primary": "orange", "secondary": "navy", "accent": "white"},
-    "Detroit Lions": {"primary": "blue", "secondary": "silver", "accent": "white"},
-    "Green Bay Packers": {"primary": "green", "secondary": "gold", "accent": "white"},
-    "Houston Texans": {"primary": "navy", "secondary": "red", "accent": "white"},
-    "Indianapolis Colts": {"primary": "blue", "secondary": "white", "accent": "gray"},
-    "Jacksonville Jaguars": {"primary": "teal", "secondary": "gold", "accent": "black"},
-    "Kansas City Chiefs": {"primary": "red", "secondary": "gold", "accent": "white"},
-    "Las Vegas Raiders": {"primary": "black", "secondary": "silver", "accent": "white"},
-    "Los Angeles Chargers": {"primary": "blue", "secondary": "gold", "accent": "white"},
-    "Los Angeles Rams": {"primary": "blue", "secondary": "gold", "accent": "white"},
-    "Miami Dolphins": {"primary": "aqua", "secondary": "orange", "accent": "white"},
-    "Minnesota Vikings": {"primary": "purple", "secondary": "gold", "accent": "white"},
-    "New England Patriots": {"primary": "navy", "secondary": "red", "accent": "silver"},
-    "New Orleans Saints": {"primary": "gold", "secondary": "black", "accent": "white"},
-    "New York Giants": {"primary": "blue", "secondary": "red", "accent": "white"},
-    "New York Jets": {"primary": "green", "secondary": "white", "accent": "black"},
-    "Philadelphia Eagles": {"primary": "green", "secondary": "silver", "accent": "black"},
-    "Pittsburgh Steelers": {"primary": "black", "secondary": "gold", "accent": "white"},
-    "San Francisco 49ers": {"primary": "red", "secondary": "gold", "accent": "white"},
-    "Seattle Seahawks": {"primary": "blue", "secondary": "green", "accent": "gray"},
-    "Tampa Bay Buccaneers": {"primary": "red", "secondary": "pewter", "accent": "black"},
-    "Tennessee Titans": {"primary": "navy", "secondary": "red", "accent": "silver"},
-    "Washington Commanders": {"primary": "burgundy", "secondary": "gold", "accent": "white"},
-
-    # NBA Teams
-    "Atlanta Hawks": {"primary": "red", "secondary": "white", "accent": "gold"},
-    "Boston Celtics": {"primary": "green", "secondary": "white", "accent": "gold"},
-    "Brooklyn Nets": {"primary": "black", "secondary": "white", "accent": "gray"},
-    "Charlotte Hornets": {"primary": "teal", "secondary": "purple", "accent": "white"},
-    "Chicago Bulls": {"primary": "red", "secondary": "black", "accent": "white"},
-    "Cleveland Cavaliers": {"primary": "wine", "secondary": "gold", "accent": "navy"},
-    "Dallas Mavericks": {"primary": "blue", "secondary": "navy", "accent": "silver"},
-    "Denver Nuggets": {"primary": "navy", "secondary": "gold", "accent": "red"},
-    "Detroit Pistons": {"primary": "red", "secondary": "blue", "accent": "white"},
-    "Golden State Warriors": {"primary": "blue", "secondary": "gold", "accent": "white"},
-    "Houston Rockets": {"primary": "red", "secondary": "white", "accent": "silver"},
-    "Indiana Pacers": {"primary": "navy", "secondary": "gold", "accent": "white"},
-    "LA Clippers": {"primary": "red", "secondary": "blue", "accent": "white"},
-    "Los Angeles Lakers": {"primary": "purple", "secondary": "gold", "accent": "white"},
-    "Memphis Grizzlies": {"primary": "navy", "secondary": "blue", "accent": "gold"},
-    "Miami Heat": {"primary": "red", "secondary": "black", "accent": "white"},
-    "Milwaukee Bucks": {"primary": "green", "secondary": "cream", "accent": "blue"},
-    "Minnesota Timberwolves": {"primary": "navy", "secondary": "green", "accent": "white"},
-    "New Orleans Pelicans": {"primary": "navy", "secondary": "red", "accent": "gold"},
-    "New York Knicks": {"primary": "blue", "secondary": "orange", "accent": "white"},
-    "Oklahoma City Thunder": {"primary": "blue", "secondary": "orange", "accent": "navy"},
-    "Orlando Magic": {"primary": "blue", "secondary": "black", "accent": "white"},
-    "Philadelphia 76ers": {"primary": "blue", "secondary": "red", "accent": "white"},
-    "Phoenix Suns": {"primary": "orange", "secondary": "purple", "accent": "white"},
-    "Portland Trail Blazers": {"primary": "red", "secondary": "black", "accent": "white"},
-    "Sacramento Kings": {"primary": "purple", "secondary": "gray", "accent": "black"},
-    "San Antonio Spurs": {"primary": "black", "secondary": "silver", "accent": "white"},
-    "Toronto Raptors": {"primary": "red", "secondary": "black", "accent": "gold"},
-    "Utah Jazz": {"primary": "navy", "secondary": "yellow", "accent": "green"},
-    "Washington Wizards": {"primary": "red", "secondary": "navy", "accent": "white"},
-
-    # NHL Teams
-    "Anaheim Ducks": {"primary": "black", "secondary": "orange", "accent": "gold"},
-    "Arizona Coyotes": {"primary": "red", "secondary": "black", "accent": "tan"},
-    "Boston Bruins": {"primary": "gold", "secondary": "black", "accent": "white"},
-    "Buffalo Sabres": {"primary": "navy", "secondary": "gold", "accent": "white"},
-    "Calgary Flames": {"primary": "red", "secondary": "gold", "accent": "black"},
-    "Carolina Hurricanes": {"primary": "red", "secondary": "black", "accent": "white"},
-    "Chicago Blackhawks": {"primary": "red", "secondary": "black", "accent": "white"},
-    "Colorado Avalanche": {"primary": "burgundy", "secondary": "blue", "accent": "silver"},
-    "Columbus Blue Jackets": {"primary": "navy", "secondary": "red", "accent": "silver"},
-    "Dallas Stars": {"primary": "green", "secondary": "black", "accent": "silver"},
-    "Detroit Red Wings": {"primary": "red", "secondary": "white", "accent": "black"},
-    "Edmonton Oilers": {"primary": "blue", "secondary": "orange", "accent": "white"},
-    "Florida Panthers": {"primary": "red", "secondary": "navy", "accent": "gold"},
-    "Los Angeles Kings": {"primary": "black", "secondary": "silver", "accent": "white"},
-    "Minnesota Wild": {"primary": "green", "secondary": "red", "accent": "cream"},
-    "Montreal Canadiens": {"primary": "red", "secondary": "blue", "accent": "white"},
-    "Nashville Predators": {"primary": "gold", "secondary": "navy", "accent": "white"},
-    "New Jersey Devils": {"primary": "red", "secondary": "black", "accent": "white"},
-    "New York Islanders": {"primary": "blue", "secondary": "orange", "accent": "white"},
-    "New York Rangers": {"primary": "blue", "secondary": "red", "accent": "white"},
-    "Ottawa Senators": {"primary": "red", "secondary": "black", "accent": "gold"},
-    "Philadelphia Flyers": {"primary": "orange", "secondary": "black", "accent": "white"},
-    "Pittsburgh Penguins": {"primary": "black", "secondary": "gold", "accent": "white"},
-    "San Jose Sharks": {"primary": "teal", "secondary": "black", "accent": "orange"},
-    "Seattle Kraken": {"primary": "navy", "secondary": "teal", "accent": "red"},
-    "St. Louis Blues": {"primary": "blue", "secondary": "gold", "accent": "navy"},
-    "Tampa Bay Lightning": {"primary": "blue", "secondary": "white", "accent": "black"},
-    "Toronto Maple Leafs": {"primary": "blue", "secondary": "white", "accent": "navy"},
-    "Vancouver Canucks": {"primary": "blue", "secondary": "green", "accent": "white"},
-    "Vegas Golden Knights": {"primary": "gold", "secondary": "black", "accent": "red"},
-    "Washington Capitals": {"primary": "red", "secondary": "navy", "accent": "white"},
-    "Winnipeg Jets": {"primary": "navy", "secondary": "blue", "accent": "red"},
-
-    # MLB Teams
-    "Arizona Diamondbacks": {"primary": "red", "secondary": "black", "accent": "teal"},
-    "Atlanta Braves": {"primary": "navy", "secondary": "red", "accent": "white"},
-    "Baltimore Orioles": {"primary": "orange", "secondary": "black", "accent": "white"},
-    "Boston Red Sox": {"primary": "red", "secondary": "navy", "accent": "white"},
-    "Chicago Cubs": {"primary": "blue", "secondary": "red", "accent": "white"},
-    "Chicago White Sox": {"primary": "black", "secondary": "silver", "accent": "white"},
-    "Cincinnati Reds": {"primary": "red", "secondary": "white", "accent": "black"},
-    "Cleveland Guardians": {"primary": "red", "secondary": "navy", "accent": "white"},
-    "Colorado Rockies": {"primary": "purple", "secondary": "black", "accent": "silver"},
-    "Detroit Tigers": {"primary": "navy", "secondary": "orange", "accent": "white"},
-    "Houston Astros": {"primary": "orange", "secondary": "navy", "accent": "white"},
-    "Kansas City Royals": {"primary": "blue", "secondary": "white", "accent": "gold"},
-    "Los Angeles Angels": {"primary": "red", "secondary": "navy", "accent": "silver"},
-    "Los Angeles Dodgers": {"primary": "blue", "secondary": "white", "accent": "red"},
-    "Miami Marlins": {"primary": "black", "secondary": "blue", "accent": "red"},
-    "Milwaukee Brewers": {"primary": "navy", "secondary": "gold", "accent": "white"},
-    "Minnesota Twins": {"primary": "navy", "secondary": "red", "accent": "white"},
-    "New York Mets": {"primary": "blue", "secondary": "orange", "accent": "white"},
-    "New York Yankees": {"primary": "navy", "secondary": "white", "accent": "gray"},
-    "Oakland Athletics": {"primary": "green", "secondary": "gold", "accent": "white"},
-    "Philadelphia Phillies": {"primary": "red", "secondary": "blue", "accent": "white"},
-    "Pittsburgh Pirates": {"primary": "black", "secondary": "gold", "accent": "white"},
-    "San Diego Padres": {"primary": "brown", "secondary": "gold", "accent": "white"},
-    "San Francisco Giants": {"primary": "orange", "secondary": "black", "accent": "cream"},
-    "Seattle Mariners": {"primary": "navy", "secondary": "teal", "accent": "silver"},
-    "St. Louis Cardinals": {"primary": "red", "secondary": "navy", "accent": "white"},
-    "Tampa Bay Rays": {"primary": "navy", "secondary": "blue", "accent": "yellow"},
-    "Texas Rangers": {"primary": "blue", "secondary": "red", "accent": "white"},
-    "Toronto Blue Jays": {"primary": "blue", "secondary": "navy", "accent": "red"},
-    "Washington Nationals": {"primary": "red", "secondary": "navy", "accent": "white"},
+# Overridable so load tests can point the router at a local mock (benchmarks/mock_odds_api.py)
+ODDS_API_BASE = os.getenv("ODDS_API_BASE", "https://api.the-odds-api.com/v4")
+
+# Odds API sport keys per slate endpoint
+PROPS_SPORT_KEYS = {
+    "nba": "basketball_nba",
+    "nfl": "americanfootball_nfl",
+    "mlb": "baseball_mlb",
+    "nhl": "icehockey_nhl",
+    "ncaab": "basketball_ncaab"
 }
 
-# Color psychology effects (Durham 2005 + extended research)
-COLOR_EFFECTS = {
-    "red": {
-        "aggression_boost": 0.15,      # +15% aggression
-        "close_game_edge": 0.10,       # +10% in close games (Durham study)
-        "penalty_draw": 0.05,          # +5% penalties drawn (aggression perceived)
-        "psychology": "Dominance, aggression, intensity",
-        "betting_bias": "OVER on team totals, favor in close spreads"
-    },
-    "burgundy": {
-        "aggression_boost": 0.10,
-        "close_game_edge": 0.07,
-        "penalty_draw": 0.03,
-        "psychology": "Subdued aggression, sophistication",
-        "betting_bias": "Slight OVER lean"
-    },
-    "black": {
-        "aggression_boost": 0.08,
-        "close_game_edge": 0.00,
-        "penalty_draw": -0.12,         # BLACK TEAMS GET MORE PENALTIES (proven)
-        "psychology": "Intimidation, but refs penalize subconsciously",
-        "betting_bias": "FADE vs disciplined teams, penalty props OVER"
-    },
-    "blue": {
-        "aggression_boost": 0.00,
-        "close_game_edge": 0.02,
-        "penalty_draw": 0.00,
-        "psychology": "Trust, stability, professionalism",
-        "betting_bias": "Neutral - standard performance"
-    },
-    "navy": {
-        "aggression_boost": 0.02,
-        "close_game_edge": 0.03,
-        "penalty_draw": 0.00,
-        "psychology": "Authority, tradition",
-        "betting_bias": "Slight favorite lean"
-    },
-    "green": {
-        "aggression_boost": -0.03,
-        "close_game_edge": 0.00,
-        "penalty_draw": 0.02,
-        "psychology": "Calm, balance, harmony",
-        "betting_bias": "UNDER lean - controlled play"
-    },
-    "orange": {
-        "aggression_boost": 0.10,
-        "close_game_edge": 0.05,
-        "penalty_draw": 0.03,
-        "psychology": "Energy, enthusiasm, excitement",
-        "betting_bias": "OVER lean - high energy play"
-    },
-    "gold": {
-        "aggression_boost": 0.05,
-        "close_game_edge": 0.03,
-        "penalty_draw": 0.00,
-        "psychology": "Excellence, achievement, winner mentality",
-        "betting_bias": "Favorite lean in big games"
-    },
-    "purple": {
-        "aggression_boost": 0.03,
-        "close_game_edge": 0.02,
-        "penalty_draw": -0.02,
-        "psychology": "Royalty, luxury, ambition",
-        "betting_bias": "Neutral with slight prestige edge"
-    },
-    "white": {
-        "aggression_boost": 0.00,
-        "close_game_edge": 0.00,
-        "penalty_draw": 0.00,
-        "psychology": "Purity, neutrality",
-        "betting_bias": "Baseline - no color effect"
-    },
-    "silver": {
-        "aggression_boost": 0.00,
-        "close_game_edge": 0.00,
-        "penalty_draw": 0.00,
-        "psychology": "Modernity, sleekness",
-        "betting_bias": "Neutral"
-    },
-    "teal": {
-        "aggression_boost": -0.02,
-        "close_game_edge": 0.00,
-        "penalty_draw": 0.01,
-        "psychology": "Unique, calm energy",
-        "betting_bias": "Slight UNDER lean"
-    },
-    "brown": {
-        "aggression_boost": -0.05,
-        "close_game_edge": -0.03,
-        "penalty_draw": 0.00,
-        "psychology": "Earthiness, stability but lack of flash",
-        "betting_bias": "Fade in primetime/big games"
-    }
+GAME_SPORT_KEYS = {
+    "nba": "basketball_nba",
+    "nfl": "americanfootball_nfl",
+    "mlb": "baseball_mlb",
+    "nhl": "icehockey_nhl"
 }
 
-def get_team_colors(team_name: str) -> dict:
-    """Get team colors from database"""
-    # Try direct match
-    if team_name in TEAM_COLORS:
-        return {"found": True, "team": team_name, "colors": TEAM_COLORS[team_name]}
-
-    # Try alias matching
-    team_lower = team_name.lower()
-    for full_name in TEAM_COLORS:
-        if team_lower in full_name.lower() or full_name.lower() in team_lower:
-            return {"found": True, "team": full_name, "colors": TEAM_COLORS[full_name]}
-
-    return {"found": False, "team": team_name, "colors": None}
-
-def analyze_chrome_resonance(home_team: str, away_team: str, spread: float = None, is_primetime: bool = False) -> dict:
-    """
-    CHROME RESONANCE - v10.4 Scalar-Savant
-
-    Analyze color psychology matchup between two teams.
-    Based on Durham University 2005 study + extended research.
-
-    Key Findings:
-    - RED teams win ~60% of close contests
-    - BLACK teams draw more penalties (subconscious ref bias)
-    - Color affects perceived aggression and dominance
-    """
-    home_colors = get_team_colors(home_team)
-    away_colors = get_team_colors(away_team)
-
-    if not home_colors["found"] or not away_colors["found"]:
-        return {
-            "analyzed": False,
-            "message": "One or both teams not found in color database"
-        }
-
-    home_primary = home_colors["colors"]["primary"]
-    away_primary = away_colors["colors"]["primary"]
-
-    home_effects = COLOR_EFFECTS.get(home_primary, COLOR_EFFECTS["white"])
-    away_effects = COLOR_EFFECTS.get(away_primary, COLOR_EFFECTS["white"])
-
-    # Calculate chrome advantage
-    home_aggression = home_effects["aggression_boost"]
-    away_aggression = away_effects["aggression_boost"]
-
-    home_close_edge = home_effects["close_game_edge"]
-    away_close_edge = away_effects["close_game_edge"]
-
-    home_penalty = home_effects["penalty_draw"]
-    away_penalty = away_effects["penalty_draw"]
-
-    # Net advantages
-    aggression_advantage = home_aggression - away_aggression
-    close_game_advantage = home_close_edge - away_close_edge
-    penalty_advantage = home_penalty - away_penalty
-
-    # Determine chrome favored team
-    total_advantage = aggression_advantage + close_game_advantage
-
-    # Close spread amplification (Durham study applies to close games)
-    is_close_spread = spread is not None and abs(spread) <= 7
-    if is_close_spread:
-        total_advantage *= 1.5  # Amplify color effect in close games
-
-    if total_advantage > 0.05:
-        chrome_favored = "home"
-        chrome_team = home_team
-    elif total_advantage < -0.05:
-        chrome_favored = "away"
-        chrome_team = away_team
-    else:
-        chrome_favored = "neutral"
-        chrome_team = None
-
-    # Calculate chrome score (0-100)
-    chrome_score = 50 + round(total_advantage * 200)
-    chrome_score = max(0, min(100, chrome_score))
-
-    # Special alerts
-    alerts = []
-
-    # RED vs non-RED in close game
-    if is_close_spread:
-        if home_primary == "red" and away_primary != "red":
-            alerts.append("🔴 RED DOMINANCE: Home team has color edge in close game")
-        elif away_primary == "red" and home_primary != "red":
-            alerts.append("🔴 RED DOMINANCE: Away team has color edge in close game")
-
-    # BLACK team penalty alert
-    if home_primary == "black":
-        alerts.append("⚫ BLACK PENALTY RISK: Home team may draw more flags/fouls")
-    if away_primary == "black":
-        alerts.append("⚫ BLACK PENALTY RISK: Away team may draw more flags/fouls")
-
-    # Primetime boost for gold/flashy colors
-    if is_primetime:
-        if home_primary in ["gold", "red", "orange"]:
-            alerts.append("🌟 PRIMETIME FLASH: Home team's colors pop under lights")
-        if away_primary in ["gold", "red", "orange"]:
-            alerts.append("🌟 PRIMETIME FLASH: Away team's colors pop under lights")
-
-    return {
-        "analyzed": True,
-        "home": {
-            "team": home_team,
-            "primary_color": home_primary,
-            "effects": home_effects,
-            "aggression_boost": home_aggression,
-            "close_game_edge": home_close_edge,
-            "penalty_modifier": home_penalty
-        },
-        "away": {
-            "team": away_team,
-            "primary_color": away_primary,
-            "effects": away_effects,
-            "aggression_boost": away_aggression,
-            "close_game_edge": away_close_edge,
-            "penalty_modifier": away_penalty
-        },
-        "matchup": {
-            "aggression_advantage": round(aggression_advantage, 3),
-            "close_game_advantage": round(close_game_advantage, 3),
-            "penalty_advantage": round(penalty_advantage, 3),
-            "total_advantage": round(total_advantage, 3),
-            "is_close_spread": is_close_spread,
-            "amplified": is_close_spread
-        },
-        "chrome_score": chrome_score,
-        "chrome_favored": chrome_favored,
-        "chrome_team": chrome_team,
-        "alerts": alerts,
-        "betting_implications": {
-            "spread_lean": chrome_favored if chrome_score >= 55 else "neutral",
-            "penalty_props": "OVER" if (home_primary == "black" or away_primary == "black") else "neutral",
-            "total_lean": "OVER" if (home_primary in ["red", "orange"] or away_primary in ["red", "orange"]) else "neutral"
-        }
-    }
-
-# ============================================================================
-# MODULE 3: LUNACY FACTOR (Enhanced Moon Phase Bias)
-# Theory: Full Moon increases chaotic variance (crime rates up, hospitals fill)
-# Full Moon = Underdogs + Overs (chaos reigns)
-# New Moon = Favorites + Unders (order/darkness reigns)
-# ============================================================================
-
-def get_detailed_moon_phase(date: datetime = None) -> dict:
-    """
-    LUNACY FACTOR - v10.4 Scalar-Savant
-
-    Enhanced moon phase analysis with betting bias.
-    Based on lunar cycle research and variance patterns.
-    """
-    if date is None:
-        date = datetime.now()
-
-    # Known new moon reference
-    known_new_moon = datetime(2024, 1, 11)
-    days_since = (date - known_new_moon).days
-    lunar_cycle = 29.53
-
-    # Calculate phase position (0 to 1)
-    phase_position = (days_since % lunar_cycle) / lunar_cycle
-
-    # Determine phase name
-    if phase_position < 0.0625:
-        phase_name = "new_moon"
-        phase_emoji = "🌑"
-        phase_display = "New Moon"
-    elif phase_position < 0.1875:
-        phase_name = "waxing_crescent"
-        phase_emoji = "🌒"
-        phase_display = "Waxing Crescent"
-    elif phase_position < 0.3125:
-        phase_name = "first_quarter"
-        phase_emoji = "🌓"
-        phase_display = "First Quarter"
-    elif phase_position < 0.4375:
-        phase_name = "waxing_gibbous"
-        phase_emoji = "🌔"
-        phase_display = "Waxing Gibbous"
-    elif phase_position < 0.5625:
-        phase_name = "full_moon"
-        phase_emoji = "🌕"
-        phase_display = "Full Moon"
-    elif phase_position < 0.6875:
-        phase_name = "waning_gibbous"
-        phase_emoji = "🌖"
-        phase_display = "Waning Gibbous"
-    elif phase_position < 0.8125:
-        phase_name = "last_quarter"
-        phase_emoji = "🌗"
-        phase_display = "Last Quarter"
-    elif phase_position < 0.9375:
-        phase_name = "waning_crescent"
-        phase_emoji = "🌘"
-        phase_display = "Waning Crescent"
-    else:
-        phase_name = "new_moon"
-        phase_emoji = "🌑"
-        phase_display = "New Moon"
-
-    # Calculate illumination percentage
-    illumination = round(abs(math.cos(phase_position * 2 * math.pi)) * 100)
-
-    # LUNACY BETTING BIAS
-    if phase_name == "full_moon":
-        chaos_level = "MAXIMUM"
-        chaos_score = 100
-        bias = {
-            "spread": "UNDERDOGS",
-            "total": "OVERS",
-            "variance": "HIGH",
-            "reasoning": "Full moon = peak chaos. Dogs cover, games go over."
-        }
-        recommendation = "🐕 BET DOGS | 📈 BET OVERS | ⚡ EXPECT CHAOS"
-    elif phase_name == "new_moon":
-        chaos_level = "MINIMUM"
-        chaos_score = 0
-        bias = {
-            "spread": "FAVORITES",
-            "total": "UNDERS",
-            "variance": "LOW",
-            "reasoning": "New moon = darkness/order. Chalk covers, games stay low."
-        }
-        recommendation = "💰 BET FAVORITES | 📉 BET UNDERS | 🎯 EXPECT ORDER"
-    elif phase_name in ["waxing_gibbous", "waning_gibbous"]:
-        chaos_level = "ELEVATED"
-        chaos_score = 70
-        bias = {
-            "spread": "SLIGHT DOG",
-            "total": "SLIGHT OVER",
-            "variance": "MODERATE-HIGH",
-            "reasoning": "Near full moon - elevated chaos approaching or receding"
-        }
-        recommendation = "🐕 Lean dogs | 📈 Lean overs"
-    elif phase_name in ["first_quarter", "last_quarter"]:
-        chaos_level = "BALANCED"
-        chaos_score = 50
-        bias = {
-            "spread": "NEUTRAL",
-            "total": "NEUTRAL",
-            "variance": "MODERATE",
-            "reasoning": "Quarter moon - balanced forces"
-        }
-        recommendation = "➖ No strong lunar lean"
-    else:  # Crescents
-        chaos_level = "LOW"
-        chaos_score = 25
-        bias = {
-            "spread": "SLIGHT CHALK",
-            "total": "SLIGHT UNDER",
-            "variance": "LOW-MODERATE",
-            "reasoning": "Near new moon - order building or fading"
-        }
-        recommendation = "💰 Lean favorites | 📉 Lean unders"
-
-    # Days until full moon
-    days_in_cycle = days_since % lunar_cycle
-    if days_in_cycle < 14.76:
-        days_to_full = round(14.76 - days_in_cycle)
-    else:
-        days_to_full = round(lunar_cycle - days_in_cycle + 14.76)
-
-    return {
-        "date": date.strftime("%Y-%m-%d"),
-        "phase_name": phase_name,
-        "phase_display": phase_display,
-        "phase_emoji": phase_emoji,
-        "phase_position": round(phase_position, 3),
-        "illumination_pct": illumination,
-        "days_in_cycle": round(days_in_cycle, 1),
-        "days_to_full_moon": days_to_full,
-        "chaos_level": chaos_level,
-        "chaos_score": chaos_score,
-        "lunacy_bias": bias,
-        "recommendation": recommendation,
-        "betting_multipliers": {
-            "dog_boost": 1 + (chaos_score * 0.002),  # Up to 1.2x at full moon
-            "over_boost": 1 + (chaos_score * 0.0015),  # Up to 1.15x at full moon
-            "favorite_boost": 1 + ((100 - chaos_score) * 0.002),  # Up to 1.2x at new moon
-            "under_boost": 1 + ((100 - chaos_score) * 0.0015)  # Up to 1.15x at new moon
-        }
-    }
-
-# ============================================================================
-# MODULE 4: SCHUMANN SPIKE (Earth Frequency Chaos Trigger)
-# Science: Earth's electromagnetic resonance at 7.83 Hz baseline
-# When spikes to 14Hz, 36Hz+ = human biological stress, fine motor degradation
-# Play: High Hz = Fade shooters (unders), bet turnovers/chaos
-# ============================================================================
-
-def get_schumann_resonance(date: datetime = None) -> dict:
-    """
-    SCHUMANN SPIKE - v10.4 Scalar-Savant
-
-    Approximate Schumann Resonance state based on solar/geomagnetic activity.
-    Baseline: 7.83 Hz (Earth's heartbeat)
-    Spikes correlate with solar storms, geomagnetic disturbances.
-
-    Note: Real-time Schumann data requires external API.
-    This uses approximations based on solar cycle patterns.
-    """
-    if date is None:
-        date = datetime.now()
-
-    # Solar cycle approximation (11-year cycle)
-    # Solar maximum ~2024-2025, minimum ~2019-2020
-    solar_cycle_start = datetime(2019, 12, 1)  # Cycle 25 start
-    days_into_cycle = (date - solar_cycle_start).days
-    cycle_position = (days_into_cycle % (11 * 365)) / (11 * 365)
-
-    # Solar activity peaks mid-cycle
-    solar_activity = math.sin(cycle_position * math.pi)
-
-    # Day of year variation (geomagnetic activity higher in equinoxes)
-    day_of_year = date.timetuple().tm_yday
-    equinox_factor = math.sin(2 * math.pi * day_of_year / 365) ** 2
-
-    # Random daily variance (simulated)
-    daily_seed = (date.year * 1000 + day_of_year) % 100
-    daily_variance = (daily_seed - 50) / 100  # -0.5 to +0.5
-
-    # Calculate estimated Hz
-    baseline_hz = 7.83
-    solar_spike = solar_activity * 8  # Up to +8 Hz from solar
-    equinox_spike = equinox_factor * 4  # Up to +4 Hz from equinox
-    daily_spike = daily_variance * 3  # Up to ±3 Hz daily variance
-
-    estimated_hz = baseline_hz + solar_spike + equinox_spike + daily_spike
-    estimated_hz = max(7.0, min(50.0, estimated_hz))  # Clamp to reasonable range
-
-    # Determine state
-    if estimated_hz >= 30:
-        state = "EXTREME_SPIKE"
-        emoji = "⚡🔴"
-        chaos_impact = "MAXIMUM"
-        motor_degradation = 0.25  # 25% fine motor skill degradation
-        recommendation = "HARD FADE SHOOTERS | TURNOVERS UP | UNDERS"
-    elif estimated_hz >= 20:
-        state = "HIGH_SPIKE"
-        emoji = "⚡🟠"
-        chaos_impact = "HIGH"
-        motor_degradation = 0.15
-        recommendation = "Fade 3PT shooters | Lean turnovers | Lean unders"
-    elif estimated_hz >= 14:
-        state = "MODERATE_SPIKE"
-        emoji = "⚡🟡"
-        chaos_impact = "MODERATE"
-        motor_degradation = 0.08
-        recommendation = "Slight fade on precision players"
-    elif estimated_hz >= 10:
-        state = "ELEVATED"
-        emoji = "📊"
-        chaos_impact = "SLIGHT"
-        motor_degradation = 0.03
-        recommendation = "Monitor - slightly elevated stress"
-    else:
-        state = "STABLE"
-        emoji = "🌍✅"
-        chaos_impact = "MINIMAL"
-        motor_degradation = 0.00
-        recommendation = "Baseline Earth frequency - normal performance expected"
-
-    # Schumann score (0 = stable, 100 = extreme chaos)
-    schumann_score = min(100, round((estimated_hz - 7.83) / 0.4217))
-
-    return {
-        "date": date.strftime("%Y-%m-%d"),
-        "baseline_hz": baseline_hz,
-        "estimated_hz": round(estimated_hz, 2),
-        "state": state,
-        "emoji": emoji,
-        "chaos_impact": chaos_impact,
-        "schumann_score": schumann_score,
-        "motor_degradation_pct": round(motor_degradation * 100),
-        "recommendation": recommendation,
-        "factors": {
-            "solar_cycle_position": round(cycle_position, 3),
-            "solar_activity_factor": round(solar_activity, 3),
-            "equinox_factor": round(equinox_factor, 3),
-            "is_near_equinox": equinox_factor > 0.7
-        },
-        "betting_implications": {
-            "three_point_props": "UNDER" if estimated_hz >= 14 else "NEUTRAL",
-            "turnover_props": "OVER" if estimated_hz >= 14 else "NEUTRAL",
-            "game_totals": "UNDER" if estimated_hz >= 20 else "NEUTRAL",
-            "precision_fade": motor_degradation > 0.05
-        }
-    }
-
-# ============================================================================
-# MODULE 5: SATURN BLOCK (Planetary Restriction/Defense)
-# Theory: Jupiter expands (overs/points), Saturn restricts (unders/defense)
-# Heavy Saturn aspect at tip-off = ball won't go in the hoop = HARD UNDER
-# ============================================================================
-
-def get_planetary_aspects(game_time: datetime = None) -> dict:
-    """
-    SATURN BLOCK - v10.4 Scalar-Savant
-
-    Calculate planetary positions and aspects at game time.
-    Jupiter = Expansion, abundance, scoring
-    Saturn = Restriction, discipline, defense
-    Mars = Aggression, conflict, physicality
-    Mercury Retrograde = Miscommunication, errors
-
-    Note: Uses simplified astronomical calculations.
-    For precise ephemeris, integrate with astronomy API.
-    """
-    if game_time is None:
-        game_time = datetime.now()
-
-    # Julian date calculation
-    year = game_time.year
-    month = game_time.month
-    day = game_time.day + game_time.hour / 24
-
-    if month <= 2:
-        year -= 1
-        month += 12
-
-    A = int(year / 100)
-    B = 2 - A + int(A / 4)
-    JD = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + B - 1524.5
-
-    # Days since J2000.0
-    d = JD - 2451545.0
-
-    # Simplified planetary longitudes (degrees)
-    # These are approximations - real ephemeris would be more accurate
-
-    # Sun
-    sun_long = (280.46 + 0.9856474 * d) % 360
-
-    # Moon (simplified)
-    moon_long = (218.32 + 13.176396 * d) % 360
-
-    # Mercury (simplified, ~88 day orbit)
-    mercury_long = (252.25 + 4.0923344 * d) % 360
-
-    # Venus (simplified, ~225 day orbit)
-    venus_long = (181.98 + 1.6021302 * d) % 360
-
-    # Mars (simplified, ~687 day orbit)
-    mars_long = (355.45 + 0.5240207 * d) % 360
-
-    # Jupiter (simplified, ~12 year orbit)
-    jupiter_long = (34.40 + 0.0830853 * d) % 360
-
-    # Saturn (simplified, ~29 year orbit)
-    saturn_long = (50.08 + 0.0334442 * d) % 360
-
-    planets = {
-        "sun": sun_long,
-        "moon": moon_long,
-        "mercury": mercury_long,
-        "venus": venus_long,
-        "mars": mars_long,
-        "jupiter": jupiter_long,
-        "saturn": saturn_long
-    }
-
-    # Calculate aspects (angular relationships)
-    aspects = []
-
-    def check_aspect(planet1, planet2, long1, long2):
-        diff = abs(long1 - long2)
-        if diff > 180:
-            diff = 360 - diff
-
-        # Conjunction (0°) - planets combine energy
-        if diff <= 10:
-            return {"type": "conjunction", "orb": diff, "planets": [planet1, planet2]}
-        # Opposition (180°) - tension/conflict
-        elif 170 <= diff <= 190:
-            return {"type": "opposition", "orb": abs(diff - 180), "planets": [planet1, planet2]}
-        # Square (90°) - friction/challenge
-        elif 80 <= diff <= 100:
-            return {"type": "square", "orb": abs(diff - 90), "planets": [planet1, planet2]}
-        # Trine (120°) - harmony/flow
-        elif 110 <= diff <= 130:
-            return {"type": "trine", "orb": abs(diff - 120), "planets": [planet1, planet2]}
-        return None
-
-    # Check key aspects
-    for p1, l1 in planets.items():
-        for p2, l2 in planets.items():
-            if p1 < p2:  # Avoid duplicates
-                aspect = check_aspect(p1, p2, l1, l2)
-                if aspect:
-                    aspects.append(aspect)
-
-    # Analyze Saturn influence (RESTRICTION)
-    saturn_aspects = [a for a in aspects if "saturn" in a["planets"]]
-    saturn_conjunctions = [a for a in saturn_aspects if a["type"] == "conjunction"]
-    saturn_squares = [a for a in saturn_aspects if a["type"] == "square"]
-    saturn_oppositions = [a for a in saturn_aspects if a["type"] == "opposition"]
-
-    saturn_restriction = len(saturn_conjunctions) * 30 + len(saturn_squares) * 20 + len(saturn_oppositions) * 25
-
-    # Analyze Jupiter influence (EXPANSION)
-    jupiter_aspects = [a for a in aspects if "jupiter" in a["planets"]]
-    jupiter_trines = [a for a in jupiter_aspects if a["type"] == "trine"]
-    jupiter_conjunctions = [a for a in jupiter_aspects if a["type"] == "conjunction"]
-
-    jupiter_expansion = len(jupiter_trines) * 25 + len(jupiter_conjunctions) * 30
-
-    # Mars influence (AGGRESSION)
-    mars_aspects = [a for a in aspects if "mars" in a["planets"]]
-    mars_influence = len(mars_aspects) * 15
-
-    # Mercury retrograde check (simplified - retrograde ~3 times/year for 3 weeks)
-    mercury_speed = 4.0923344  # degrees per day
-    mercury_retrograde = False  # Would need more complex calculation
-
-    # Calculate net planetary score
-    # Positive = expansion (overs), Negative = restriction (unders)
-    net_score = jupiter_expansion - saturn_restriction
-
-    # Determine recommendation
-    if saturn_restriction >= 60:
-        state = "SATURN_BLOCK"
-        emoji = "🪐🔒"
-        recommendation = "HARD UNDER - Saturn restricts scoring"
-        total_bias = "UNDER"
-    elif saturn_restriction >= 40:
-        state = "SATURN_HEAVY"
-        emoji = "🪐"
-        recommendation = "Lean UNDER - Saturn influence present"
-        total_bias = "LEAN_UNDER"
-    elif jupiter_expansion >= 60:
-        state = "JUPITER_EXPANSION"
-        emoji = "♃✨"
-        recommendation = "OVER - Jupiter expands scoring"
-        total_bias = "OVER"
-    elif jupiter_expansion >= 40:
-        state = "JUPITER_ACTIVE"
-        emoji = "♃"
-        recommendation = "Lean OVER - Jupiter influence present"
-        total_bias = "LEAN_OVER"
-    elif mars_influence >= 40:
-        state = "MARS_AGGRESSION"
-        emoji = "♂️🔥"
-        recommendation = "Physical game - watch fouls/penalties"
-        total_bias = "NEUTRAL_PHYSICAL"
-    else:
-        state = "BALANCED"
-        emoji = "⚖️"
-        recommendation = "No strong planetary bias"
-        total_bias = "NEUTRAL"
-
-    # Planetary score (0-100, 50 = neutral)
-    planetary_score = 50 + round(net_score / 2)
-    planetary_score = max(0, min(100, planetary_score))
-
-    return {
-        "game_time": game_time.strftime("%Y-%m-%d %H:%M"),
-        "julian_date": round(JD, 2),
-        "planetary_positions": {k: round(v, 1) for k, v in planets.items()},
-        "aspects": aspects[:10],  # Top 10 aspects
-        "saturn_analysis": {
-            "restriction_score": saturn_restriction,
-            "conjunctions": len(saturn_conjunctions),
-            "squares": len(saturn_squares),
-            "oppositions": len(saturn_oppositions)
-        },
-        "jupiter_analysis": {
-            "expansion_score": jupiter_expansion,
-            "trines": len(jupiter_trines),
-            "conjunctions": len(jupiter_conjunctions)
-        },
-        "mars_analysis": {
-            "aggression_score": mars_influence,
-            "total_aspects": len(mars_aspects)
-        },
-        "state": state,
-        "emoji": emoji,
-        "planetary_score": planetary_score,
-        "total_bias": total_bias,
-        "recommendation": recommendation,
-        "betting_implications": {
-            "total_lean": total_bias,
-            "saturn_under_play": saturn_restriction >= 40,
-            "jupiter_over_play": jupiter_expansion >= 40,
-            "physical_game": mars_influence >= 30
-        }
-    }
-
-# ============================================================================
-# MODULE 6: ZEBRA PRIVILEGE (Referee Bias + Star Protection)
-# Stats: Verified data proves refs favor high-status players and home teams
-# Star Protection Factor + Home Bias + Ref Crew Tendencies
-# ============================================================================
-
-# Star player tier rankings (1-5, 5 = maximum protection)
-STAR_PLAYER_TIERS = {
-    # Tier 5 - Maximum Protection (League Faces)
-    "LeBron James": 5, "Stephen Curry": 5, "Kevin Durant": 5, "Giannis Antetokounmpo": 5,
-    "Patrick Mahomes": 5, "Travis Kelce": 5, "Josh Allen": 5,
-    "Connor McDavid": 5, "Sidney Crosby": 5, "Alex Ovechkin": 5,
-    "Shohei Ohtani": 5, "Mike Trout": 5, "Aaron Judge": 5,
-
-    # Tier 4 - High Protection (All-Stars/Superstars)
-    "Luka Doncic": 4, "Jayson Tatum": 4, "Joel Embiid": 4, "Nikola Jokic": 4,
-    "Anthony Edwards": 4, "Shai Gilgeous-Alexander": 4, "Devin Booker": 4,
-    "Lamar Jackson": 4, "Joe Burrow": 4, "Justin Jefferson": 4, "Ja'Marr Chase": 4,
-    "Nathan MacKinnon": 4, "Auston Matthews": 4, "Leon Draisaitl": 4,
-    "Mookie Betts": 4, "Ronald Acuna Jr": 4, "Juan Soto": 4, "Bryce Harper": 4,
-
-    # Tier 3 - Moderate Protection (Stars)
-    "Donovan Mitchell": 3, "Ja Morant": 3, "Trae Young": 3, "Damian Lillard": 3,
-    "Jimmy Butler": 3, "Paul George": 3, "Kawhi Leonard": 3, "Anthony Davis": 3,
-    "CJ Stroud": 3, "Trevor Lawrence": 3, "Derrick Henry": 3, "Christian McCaffrey": 3,
-    "Nikita Kucherov": 3, "David Pastrnak": 3, "Cale Makar": 3,
-    "Freddie Freeman": 3, "Corey Seager": 3, "Vladimir Guerrero Jr": 3,
-
-    # Tier 2 - Some Protection (Good Players)
-    "De'Aaron Fox": 2, "Tyrese Haliburton": 2, "Cade Cunningham": 2, "Jalen Brunson": 2,
-    "Dak Prescott": 2, "Jordan Love": 2, "Tyreek Hill": 2, "Davante Adams": 2,
-    "Igor Shesterkin": 2, "Connor Hellebuyck": 2, "Adam Fox": 2,
-    "Pete Alonso": 2, "Bo Bichette": 2, "Julio Rodriguez": 2,
-
-    # Tier 1 - Minimal Protection (Role Players)
-    # Default for unlisted players
-}
-
-# Ref crew home bias ratings (0-100, 50 = neutral, 100 = extreme home bias)
-# This would ideally be populated from L2M report analysis
-REF_CREW_HOME_BIAS = {
-    # NBA Refs (example data - would need real L2M analysis)
-    "Scott Foster": 58,  # Known for letting home crowd influence
-    "Tony Brothers": 62,  # High home bias
-    "Marc Davis": 52,
-    "Kane Fitzgerald": 55,
-    "Ed Malloy": 48,
-    "James Capers": 50,
-    "Courtney Kirkland": 54,
-    "Rodney Mott": 56,
-    "Eric Lewis": 53,
-    "Josh Tiven": 51,
-
-    # NFL Refs
-    "Brad Allen": 54,
-    "Shawn Hochuli": 52,
-    "Carl Cheffers": 50,
-    "Ron Torbert": 55,
-    "Craig Wrolstad": 48,
-    "Alex Kemp": 53,
-    "Land Clark": 51,
-    "Bill Vinovich": 49,
-
-    # NHL Refs
-    "Wes McCauley": 50,
-    "Kelly Sutherland": 52,
-    "Dan O'Halloran": 54,
-    "Chris Rooney": 51,
-
-    # Default
-    "default": 50
-}
-
-def get_player_star_tier(player_name: str) -> int:
-    """Get player's star protection tier (1-5)"""
-    if player_name in STAR_PLAYER_TIERS:
-        return STAR_PLAYER_TIERS[player_name]
-
-    # Try partial match
-    player_lower = player_name.lower()
-    for known_player, tier in STAR_PLAYER_TIERS.items():
-        if player_lower in known_player.lower() or known_player.lower() in player_lower:
-            return tier
-
-    return 1  # Default tier for unknown players
-
-def analyze_zebra_privilege(
-    home_team: str,
-    away_team: str,
-    home_star: str = None,
-    away_star: str = None,
-    ref_crew: str = None,
-    is_playoffs: bool = False,
-    is_primetime: bool = False
-) -> dict:
-    """
-    ZEBRA PRIVILEGE - v10.4 Scalar-Savant
-
-    Analyze referee bias factors:
-    1. Star Protection - High-tier stars get favorable calls
-    2. Home Bias - Refs influenced by home crowd
-    3. Playoff Amplification - Stakes increase bias
-    4. Primetime Factor - National TV = more star protection
-
-    Based on verified L2M report analysis and academic studies.
-    """
-    # Get star tiers
-    home_star_tier = get_player_star_tier(home_star) if home_star else 1
-    away_star_tier = get_player_star_tier(away_star) if away_star else 1
-
-    # Star differential
-    star_advantage = home_star_tier - away_star_tier
-
-    # Ref home bias
-    if ref_crew and ref_crew in REF_CREW_HOME_BIAS:
-        home_bias = REF_CREW_HOME_BIAS[ref_crew]
-    else:
-        home_bias = REF_CREW_HOME_BIAS["default"]
-
-    # Calculate base privilege score
-    # Positive = favors home, Negative = favors away
-
-    # Star protection factor (each tier = 5 points)
-    star_factor = star_advantage * 5
-
-    # Home bias factor (deviation from 50)
-    home_factor = (home_bias - 50) * 0.5
-
-    # Playoff amplification (1.5x all factors)
-    playoff_multiplier = 1.5 if is_playoffs else 1.0
-
-    # Primetime amplification (1.2x star protection)
-    primetime_multiplier = 1.2 if is_primetime else 1.0
-
-    # Calculate total privilege score
-    raw_score = (star_factor * primetime_multiplier + home_factor) * playoff_multiplier
-    privilege_score = 50 + round(raw_score)
-    privilege_score = max(0, min(100, privilege_score))
-
-    # Determine favored team
-    if privilege_score >= 60:
-        favored = "home"
-        favored_team = home_team
-    elif privilege_score <= 40:
-        favored = "away"
-        favored_team = away_team
-    else:
-        favored = "neutral"
-        favored_team = None
-
-    # Build insights
-    insights = []
-
-    if home_star_tier >= 4 and is_primetime:
-        insights.append(f"⭐ {home_star} (Tier {home_star_tier}) gets MAXIMUM protection on national TV")
-    elif home_star_tier >= 4:
-        insights.append(f"⭐ {home_star} (Tier {home_star_tier}) has high star protection")
-
-    if away_star_tier >= 4:
-        insights.append(f"⭐ {away_star} (Tier {away_star_tier}) has road star protection")
-
-    if home_bias >= 55:
-        insights.append(f"🏠 Ref crew ({ref_crew or 'Unknown'}) has HOME BIAS tendency")
-    elif home_bias <= 45:
-        insights.append(f"🛣️ Ref crew ({ref_crew or 'Unknown'}) is ROAD-friendly")
-
-    if is_playoffs:
-        insights.append("🏆 PLAYOFF GAME - All bias factors AMPLIFIED")
-
-    if star_advantage >= 2:
-        insights.append(f"📊 Significant star gap: Home +{star_advantage} tiers")
-    elif star_advantage <= -2:
-        insights.append(f"📊 Significant star gap: Away +{abs(star_advantage)} tiers")
-
-    # Free throw implication
-    ft_advantage = "home" if privilege_score >= 55 else "away" if privilege_score <= 45 else "neutral"
-
-    return {
-        "home_team": home_team,
-        "away_team": away_team,
-        "home_star": {
-            "name": home_star,
-            "tier": home_star_tier,
-            "protection_level": ["Minimal", "Some", "Moderate", "High", "Maximum"][home_star_tier - 1] if home_star_tier else "None"
-        },
-        "away_star": {
-            "name": away_star,
-            "tier": away_star_tier,
-            "protection_level": ["Minimal", "Some", "Moderate", "High", "Maximum"][away_star_tier - 1] if away_star_tier else "None"
-        },
-        "ref_analysis": {
-            "crew": ref_crew or "Unknown",
-            "home_bias_rating": home_bias,
-            "bias_description": "Home-friendly" if home_bias >= 55 else "Road-friendly" if home_bias <= 45 else "Neutral"
-        },
-        "modifiers": {
-            "is_playoffs": is_playoffs,
-            "playoff_multiplier": playoff_multiplier,
-            "is_primetime": is_primetime,
-            "primetime_multiplier": primetime_multiplier
-        },
-        "calculations": {
-            "star_advantage": star_advantage,
-            "star_factor": star_factor,
-            "home_factor": round(home_factor, 2),
-            "raw_score": round(raw_score, 2)
-        },
-        "privilege_score": privilege_score,
-        "favored": favored,
-        "favored_team": favored_team,
-        "insights": insights,
-        "betting_implications": {
-            "spread_lean": favored if privilege_score >= 55 or privilege_score <= 45 else "neutral",
-            "ft_advantage": ft_advantage,
-            "team_total_lean": f"{favored_team} OVER" if favored_team else "neutral",
-            "foul_trouble_risk": "away" if privilege_score >= 60 else "home" if privilege_score <= 40 else "neutral"
-        }
-    }
-
-# ============================================================================
-# ██╗   ██╗ ██╗ ██╗      ██████╗     ██████╗ ███╗   ███╗███╗   ██╗██╗
-# ██║   ██║███║███║     ██╔═████╗   ██╔═══██╗████╗ ████║████╗  ██║██║
-# ██║   ██║╚██║╚██║     ██║██╔██║   ██║   ██║██╔████╔██║██╔██╗ ██║██║
-# ╚██╗ ██╔╝ ██║ ██║     ████╔╝██║   ██║   ██║██║╚██╔╝██║██║╚██╗██║██║
-#  ╚████╔╝  ██║ ██║     ╚██████╔╝   ╚██████╔╝██║ ╚═╝ ██║██║ ╚████║██║
-#   ╚═══╝   ╚═╝ ╚═╝      ╚═════╝     ╚═════╝ ╚═╝     ╚═╝╚═╝  ╚═══╝╚═╝
-# OMNI-GLITCH EDITION - THE FINAL DESCENT
-# Vortex Math | Shannon Entropy | Atmospheric Drag | Void Moon | Gann Spiral | Mars-Uranus
-# ============================================================================
-
-# ============================================================================
-# MODULE 7: VORTEX MATH (Tesla 3-6-9 Digital Root)
-# Theory: The Universe is built on 3, 6, and 9
-# If digital root = 9: "Circuit Complete" (outcome rigid/fixed)
-# If digital root = 3 or 6: "Circuit Open" (chaos/upsets likely)
-# ============================================================================
-
-def calculate_digital_root(n: int) -> int:
-    """Reduce any number to its single digit root (1-9)"""
-    if n == 0:
-        return 0
-    return 1 + (n - 1) % 9
-
-def calculate_vortex_math(
-    home_team: str,
-    away_team: str,
-    game_date: datetime = None,
-    spread: float = None,
-    total: float = None
-) -> dict:
-    """
-    VORTEX MATH - v11.0 Omni-Glitch
-
-    Tesla's 3-6-9 Universal Key applied to sports betting.
-    The digital root of the matchup reveals the circuit state.
-
-    Circuit States:
-    - 9 = COMPLETE: Outcome is LOCKED/FIXED. Favorites cover.
-    - 3 = OPEN LOW: Minor chaos. Small upsets possible.
-    - 6 = OPEN HIGH: Major chaos. Big upsets likely.
-    - 1,2,4,5,7,8 = NEUTRAL: Standard variance.
-    """
-    if game_date is None:
-        game_date = datetime.now()
-
-    # Calculate matchup gematria sum
-    matchup_string = f"{home_team} vs {away_team}".upper()
-    letter_sum = sum(ord(c) - ord('A') + 1 for c in matchup_string if c.isalpha())
-
-    # Calculate date sum
-    date_sum = game_date.month + game_date.day + sum(int(d) for d in str(game_date.year))
-
-    # Combined sum
-    total_sum = letter_sum + date_sum
-
-    # Calculate digital root
-    root = calculate_digital_root(total_sum)
-
-    # Determine circuit state
-    if root == 9:
-        circuit_state = "COMPLETE"
-        emoji = "🔒⚡"
-        description = "Circuit COMPLETE - Outcome is FIXED"
-        chaos_level = 0
-        recommendation = "FAVORITES COVER. Chalk is safe. Outcome predetermined."
-        spread_bias = "FAVORITE"
-        upset_probability = 0.15
-    elif root == 6:
-        circuit_state = "OPEN_HIGH"
-        emoji = "🌀🔴"
-        description = "Circuit OPEN HIGH - MAXIMUM CHAOS"
-        chaos_level = 100
-        recommendation = "BIG UPSETS LIKELY. Fade heavy favorites. Dogs bite."
-        spread_bias = "UNDERDOG"
-        upset_probability = 0.65
-    elif root == 3:
-        circuit_state = "OPEN_LOW"
-        emoji = "🌀🟡"
-        description = "Circuit OPEN LOW - Moderate Chaos"
-        chaos_level = 60
-        recommendation = "Small upsets possible. Reduce favorite exposure."
-        spread_bias = "SLIGHT_DOG"
-        upset_probability = 0.45
-    else:
-        circuit_state = "NEUTRAL"
-        emoji = "⚖️"
-        description = f"Neutral Circuit (Root: {root})"
-        chaos_level = 30
-        recommendation = "Standard variance. No strong vortex signal."
-        spread_bias = "NEUTRAL"
-        upset_probability = 0.30
-
-    # Tesla alignment check
-    is_tesla_aligned = root in [3, 6, 9]
-
-    # Vortex score (0-100, higher = more chaos)
-    vortex_score = chaos_level
-
-    # Additional Tesla insights
-    tesla_insights = []
-    if letter_sum % 9 == 0:
-        tesla_insights.append("Matchup string divisible by 9 - Destiny locked")
-    if date_sum % 3 == 0:
-        tesla_insights.append("Date divisible by 3 - Tesla resonance active")
-    if total_sum == 369 or "369" in str(total_sum):
-        tesla_insights.append("🔑 369 DETECTED - Tesla's Universal Key!")
-        vortex_score = 100 if root in [3, 6] else 0
-
-    # Spread/Total modifications
-    spread_modifier = None
-    total_modifier = None
-
-    if spread is not None:
-        spread_root = calculate_digital_root(int(abs(spread) * 10))
-        if spread_root == 9:
-            spread_modifier = "Spread locked at root 9 - will hit exactly"
-        elif spread_root in [3, 6]:
-            spread_modifier = f"Spread root {spread_root} - may blow past"
-
-    if total is not None:
-        total_root = calculate_digital_root(int(total))
-        if total_root == 9:
-            total_modifier = "Total locked at root 9 - expect exact hit"
-        elif total_root in [3, 6]:
-            total_modifier = f"Total root {total_root} - expect variance"
-
-    return {
-        "matchup": matchup_string,
-        "game_date": game_date.strftime("%Y-%m-%d"),
-        "calculations": {
-            "letter_sum": letter_sum,
-            "date_sum": date_sum,
-            "total_sum": total_sum,
-            "digital_root": root
-        },
-        "circuit_state": circuit_state,
-        "emoji": emoji,
-        "description": description,
-        "chaos_level": chaos_level,
-        "vortex_score": vortex_score,
-        "recommendation": recommendation,
-        "spread_bias": spread_bias,
-        "upset_probability": round(upset_probability, 2),
-        "is_tesla_aligned": is_tesla_aligned,
-        "tesla_insights": tesla_insights,
-        "line_analysis": {
-            "spread_modifier": spread_modifier,
-            "total_modifier": total_modifier
-        },
-        "betting_implications": {
-            "favorite_safe": circuit_state == "COMPLETE",
-            "dog_play": circuit_state in ["OPEN_HIGH", "OPEN_LOW"],
-            "reduce_exposure": circuit_state == "OPEN_HIGH"
-        }
-    }
-
-# ============================================================================
-# MODULE 8: SHANNON ENTROPY (Pattern Break Detector)
-# Theory: Universe hates low entropy (perfect order), seeks high entropy (chaos)
-# Low entropy streak (WWWWWW) = Violent snap-back imminent
-# ============================================================================
-
-def calculate_shannon_entropy(outcomes: list) -> float:
-    """Calculate Shannon entropy of a sequence. H = -Σ p(x) * log2(p(x))"""
-    if not outcomes:
-        return 0.0
-    from collections import Counter
-    counts = Counter(outcomes)
-    total = len(outcomes)
-    entropy = 0.0
-    for count in counts.values():
-        if count > 0:
-            p = count / total
-            entropy -= p * math.log2(p)
-    max_entropy = math.log2(len(counts)) if len(counts) > 1 else 1.0
-    return round(entropy / max_entropy if max_entropy > 0 else 0.0, 4)
-
-def analyze_shannon_entropy(recent_results: list, team_name: str = None) -> dict:
-    """
-    SHANNON ENTROPY - v11.0 Omni-Glitch
-    Measure the "order" in a team's recent performance.
-    Low entropy = Violent snap-back IMMINENT.
-    """
-    if not recent_results or len(recent_results) < 3:
-        return {"analyzed": False, "message": "Need at least 3 recent results"}
-
-    entropy = calculate_shannon_entropy(recent_results)
-    current_streak = 1
-    streak_type = recent_results[-1]
-    for i in range(len(recent_results) - 2, -1, -1):
-        if recent_results[i] == streak_type:
-            current_streak += 1
-        else:
-            break
-
-    wins = recent_results.count("W")
-    losses = recent_results.count("L")
-    win_pct = wins / len(recent_results)
-
-    if entropy < 0.3:
-        state, emoji = "CRITICAL_LOW", "🚨💥"
-        snapback_risk = 95
-        recommendation = "HARD FADE. Snap-back incoming."
-    elif entropy < 0.5:
-        state, emoji = "LOW", "⚠️"
-        snapback_risk = 70
-        recommendation = "Fade the streak. Regression coming."
-    elif entropy < 0.7:
-        state, emoji = "BALANCED", "⚖️"
-        snapback_risk = 40
-        recommendation = "Standard play. No entropy edge."
-    elif entropy < 0.9:
-        state, emoji = "HIGH", "🌊"
-        snapback_risk = 25
-        recommendation = "Chaotic state. Reduce position sizes."
-    else:
-        state, emoji = "MAXIMUM", "🌀"
-        snapback_risk = 15
-        recommendation = "Anything possible. Small plays only."
-
-    streak_danger = current_streak >= 4 and entropy < 0.5
-    entropy_score = round((1 - entropy) * 100)
-
-    return {
-        "team": team_name or "Unknown",
-        "analyzed": True,
-        "recent_results": recent_results,
-        "entropy": {"raw": entropy, "state": state, "emoji": emoji},
-        "streak_analysis": {"current_streak": current_streak, "streak_type": streak_type, "win_pct": round(win_pct, 3), "streak_danger": streak_danger},
-        "snapback_risk": snapback_risk,
-        "entropy_score": entropy_score,
-        "recommendation": recommendation,
-        "betting_implications": {"fade_team": entropy < 0.5 and current_streak >= 4, "snap_back_play": streak_danger}
-    }
-
-# ============================================================================
-# MODULE 9: ATMOSPHERIC DRAG (Barometric Pressure Physics)
-# High pressure (>30.00 inHg) = thick air = UNDERS
-# Low pressure (<29.80 inHg) = thin air = OVERS
-# ============================================================================
-
-VENUE_ATMOSPHERICS = {
-    "Denver Broncos": {"city": "Denver", "elevation_ft": 5280, "base_pressure": 24.63, "dome": False},
-    "Denver Nuggets": {"city": "Denver", "elevation_ft": 5280, "base_pressure": 24.63, "dome": True},
-    "Colorado Rockies": {"city": "Denver", "elevation_ft": 5280, "base_pressure": 24.63, "dome": False},
-    "Colorado Avalanche": {"city": "Denver", "elevation_ft": 5280, "base_pressure": 24.63, "dome": True},
-    "Utah Jazz": {"city": "Salt Lake City", "elevation_ft": 4226, "base_pressure": 25.70, "dome": True},
-    "Las Vegas Raiders": {"city": "Las Vegas", "elevation_ft": 2001, "base_pressure": 27.82, "dome": True},
-    "Vegas Golden Knights": {"city": "Las Vegas", "elevation_ft": 2001, "base_pressure": 27.82, "dome": True},
-    "Phoenix Suns": {"city": "Phoenix", "elevation_ft": 1086, "base_pressure": 28.89, "dome": True},
-    "Arizona Diamondbacks": {"city": "Phoenix", "elevation_ft": 1086, "base_pressure": 28.89, "dome": True},
-    "Arizona Cardinals": {"city": "Glendale", "elevation_ft": 1120, "base_pressure": 28.86, "dome": True},
-    "default": {"city": "Sea Level", "elevation_ft": 0, "base_pressure": 29.92, "dome": False}
-}
-
-def get_venue_atmospherics(team_name: str) -> dict:
-    """Get atmospheric data for a venue"""
-    for venue_team, data in VENUE_ATMOSPHERICS.items():
-        if team_name.lower() in venue_team.lower() or venue_team.lower() in team_name.lower():
-            return {"found": True, **data}
-    return {"found": False, **VENUE_ATMOSPHERICS["default"]}
-
-def analyze_atmospheric_drag(home_team: str, away_team: str, current_pressure: float = None, sport: str = "NFL") -> dict:
-    """ATMOSPHERIC DRAG - v11.0 Omni-Glitch. Air density affects outcomes."""
-    home_atmo = get_venue_atmospherics(home_team)
-    away_atmo = get_venue_atmospherics(away_team)
-    if current_pressure is None:
-        current_pressure = home_atmo["base_pressure"]
-
-    elevation = home_atmo["elevation_ft"]
-    altitude_diff = home_atmo["elevation_ft"] - away_atmo["elevation_ft"]
-
-    if current_pressure >= 30.00:
-        pressure_state, total_bias, total_modifier = "HIGH", "UNDER", -0.05
-    elif current_pressure <= 29.80:
-        pressure_state, total_bias, total_modifier = "LOW", "OVER", 0.05
-    else:
-        pressure_state, total_bias, total_modifier = "NORMAL", "NEUTRAL", 0.00
-
-    altitude_bonus = 0.12 if elevation >= 5000 else 0.08 if elevation >= 4000 else 0.0
-    visitor_fatigue = 0.15 if altitude_diff >= 4000 else 0.08 if altitude_diff >= 2500 else 0.0
-
-    atmo_score = 50 + round((total_modifier + altitude_bonus) * 500)
-    atmo_score = max(0, min(100, atmo_score))
-
-    return {
-        "venue": {"home_team": home_team, "elevation_ft": elevation, "pressure": current_pressure},
-        "pressure_state": pressure_state,
-        "total_bias": total_bias,
-        "altitude_bonus": altitude_bonus,
-        "visitor_fatigue_pct": visitor_fatigue * 100,
-        "atmo_score": atmo_score,
-        "betting_implications": {"totals_lean": "OVER" if atmo_score >= 60 else "UNDER" if atmo_score <= 40 else "NEUTRAL", "fade_visitor": visitor_fatigue >= 0.10}
-    }
-
-# ============================================================================
-# MODULE 10: VOID OF COURSE MOON (The Time Vacuum)
-# During void: Favorites fail. "Nothing happens." Dogs protected.
-# ============================================================================
-
-def is_void_of_course_moon(game_time: datetime = None) -> dict:
-    """VOID OF COURSE MOON - v11.0 Omni-Glitch. Nothing new can be born."""
-    if game_time is None:
-        game_time = datetime.now()
-
-    known_new_moon = datetime(2024, 1, 11)
-    days_since = (game_time - known_new_moon).days
-    moon_degrees = (days_since * 13.176396) % 360
-    degrees_in_sign = moon_degrees % 30
-    current_sign = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"][int(moon_degrees / 30)]
-
-    is_void = degrees_in_sign >= 22
-    hours_until_sign_change = (30 - degrees_in_sign) / 0.549
-
-    if is_void:
-        state, emoji = "VOID", "🌙⚫"
-        void_strength = round((degrees_in_sign - 22) / 8 * 100)
-        recommendation = "FADE FAVORITES. Nothing new succeeds. Dogs protected."
-        favorite_penalty = -0.15
-    else:
-        state, emoji = "ACTIVE", "🌙✨"
-        void_strength = 0
-        recommendation = "Normal lunar influence."
-        favorite_penalty = 0.00
-
-    return {
-        "game_time": game_time.strftime("%Y-%m-%d %H:%M"),
-        "moon_position": {"current_sign": current_sign, "degrees_in_sign": round(degrees_in_sign, 2), "hours_until_sign_change": round(hours_until_sign_change, 1)},
-        "void_status": {"is_void": is_void, "state": state, "emoji": emoji, "void_strength": void_strength},
-        "recommendation": recommendation,
-        "favorite_penalty": favorite_penalty,
-        "betting_implications": {"fade_favorites": is_void, "dog_protection": is_void}
-    }
-
-# ============================================================================
-# MODULE 11: GANN SPIRAL (Square of Nine - Time/Score Squaring)
-# When Total sits on Cardinal Cross = outcome LOCKED
-# ============================================================================
-
-def calculate_gann_angle(value: float) -> dict:
-    """Calculate where a value sits on Gann's Square of Nine."""
-    if value <= 0:
-        return {"valid": False}
-    sqrt_val = math.sqrt(value)
-    ring = math.ceil(sqrt_val)
-    base = (ring - 1) ** 2
-    position_in_ring = value - base
-    ring_size = ring ** 2 - (ring - 1) ** 2 if ring > 1 else 1
-    angle = (position_in_ring / ring_size) * 360 if ring > 1 else 0
-    on_cardinal = any(abs(angle - ca) <= 5 or abs(angle - ca) >= 355 for ca in [0, 90, 180, 270, 360])
-    return {"valid": True, "value": value, "angle": round(angle, 1), "on_cardinal_cross": on_cardinal}
-
-def analyze_gann_spiral(projected_total: float, game_date: datetime = None) -> dict:
-    """GANN SPIRAL - v11.0 Omni-Glitch. W.D. Gann's Square of Nine."""
-    if game_date is None:
-        game_date = datetime.now()
-
-    total_gann = calculate_gann_angle(projected_total)
-    day_of_year = game_date.timetuple().tm_yday
-    date_gann = calculate_gann_angle(day_of_year)
-
-    angle_diff = abs(total_gann["angle"] - date_gann["angle"]) if total_gann["valid"] else 0
-    if angle_diff > 180:
-        angle_diff = 360 - angle_diff
-    is_resonant = angle_diff <= 10
-
-    if total_gann["on_cardinal_cross"] and is_resonant:
-        state, lock_strength = "LOCKED_CARDINAL", 95
-        recommendation = "Total will hit EXACTLY. High confidence."
-    elif total_gann["on_cardinal_cross"]:
-        state, lock_strength = "CARDINAL_POWER", 75
-        recommendation = "Strong gravitational pull to this number."
-    elif is_resonant:
-        state, lock_strength = "DATE_RESONANCE", 50
-        recommendation = "Numerological alignment present."
-    else:
-        state, lock_strength = "NEUTRAL", 20
-        recommendation = "Standard variance expected."
-
-    return {
-        "projected_total": projected_total,
-        "total_analysis": total_gann,
-        "state": state,
-        "lock_strength": lock_strength,
-        "gann_score": lock_strength,
-        "recommendation": recommendation,
-        "betting_implications": {"total_locked": lock_strength >= 75, "respect_line": lock_strength >= 60}
-    }
-
-# ============================================================================
-# MODULE 12: MARS-URANUS NUCLEAR (Shock Aspect Detector)
-# Mars (war) + Uranus (shock) = BLIND BET BIGGEST UNDERDOG
-# ============================================================================
-
-def analyze_mars_uranus_aspect(game_time: datetime = None) -> dict:
-    """MARS-URANUS NUCLEAR - v11.0 Omni-Glitch. The Nuclear Option."""
-    if game_time is None:
-        game_time = datetime.now()
-
-    year, month, day = game_time.year, game_time.month, game_time.day + game_time.hour / 24
-    if month <= 2:
-        year -= 1
-        month += 12
-    A, B = int(year / 100), 2 - int(year / 100) + int(int(year / 100) / 4)
-    JD = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + B - 1524.5
-    d = JD - 2451545.0
-
-    mars_long = (355.45 + 0.5240207 * d) % 360
-    uranus_long = (314.06 + 0.0119530 * d) % 360
-    diff = abs(mars_long - uranus_long)
-    if diff > 180:
-        diff = 360 - diff
-
-    is_conjunction = diff <= 8
-    is_square = 82 <= diff <= 98
-
-    if is_conjunction and diff <= 3:
-        state, chaos_level, dog_multiplier = "NUCLEAR_MAXIMUM", 100, 2.0
-        recommendation = "🚨 BLIND BET BIGGEST UNDERDOG. Favorites OBLITERATED."
-    elif is_conjunction:
-        state, chaos_level, dog_multiplier = "NUCLEAR_HIGH", 90, 1.75
-        recommendation = "Heavy dog day. Fade all favorites."
-    elif is_square:
-        state, chaos_level, dog_multiplier = "SHOCK_HIGH", 70, 1.4
-        recommendation = "Upset-prone slate. Lean dogs."
-    else:
-        state, chaos_level, dog_multiplier = "INACTIVE", 20, 1.0
-        recommendation = "Standard day. No nuclear signal."
-
-    return {
-        "game_time": game_time.strftime("%Y-%m-%d %H:%M"),
-        "planetary_positions": {"mars": round(mars_long, 2), "uranus": round(uranus_long, 2), "separation": round(diff, 2)},
-        "nuclear_status": {"state": state, "chaos_level": chaos_level},
-        "recommendation": recommendation,
-        "dog_multiplier": dog_multiplier,
-        "betting_implications": {"nuclear_active": chaos_level >= 70, "blind_dog_bet": chaos_level >= 85, "dog_boost_pct": round((dog_multiplier - 1) * 100)}
-    }
-
-# ============================================================================
-# LEVEL 13: GANN PHYSICS - Financial Laws Applied to Sports
-# W.D. Gann turned $130 into $12,000 in 30 days using geometric rules
-# "Tunnel Thru the Air" + "Law of Vibration" = Sports Physics
-# ============================================================================
-
-def analyze_fifty_percent_retracement(
-    team_name: str,
-    last_game_margin: int,
-    current_spread: float,
-    was_win: bool = True
-) -> dict:
-    """
-    THE 50% RETRACEMENT RULE (Gravity Check)
-
-    Gann proved the most powerful support level is exactly 50% of the previous major move.
-    In sports: After a blowout win (20+ pts), the market overreacts.
-    FADE if current spread falls within the 50% retracement zone.
-
-    The Law: What goes up violently must pull back to the midpoint before continuing.
-    """
-
-    # Only applies to "major moves" (20+ point margins)
-    is_major_move = abs(last_game_margin) >= 20
-
-    if not is_major_move:
-        return {
-            "team": team_name,
-            "last_margin": last_game_margin,
-            "is_major_move": False,
-            "retracement_active": False,
-            "signal": "NO_SIGNAL",
-            "recommendation": "No major move detected. Gravity Check not applicable.",
-            "fade_strength": 0
-        }
-
-    # Calculate 50% retracement zone
-    # For a 24-point win, the 50% retracement = 12 points
-    # If current spread is near that zone (within 3 points), it's in the gravity well
-    fifty_percent = abs(last_game_margin) / 2
-    retracement_zone_low = fifty_percent - 3
-    retracement_zone_high = fifty_percent + 3
-
-    # Check if current spread falls in the retracement zone
-    current_spread_abs = abs(current_spread)
-    in_retracement_zone = retracement_zone_low <= current_spread_abs <= retracement_zone_high
-
-    # Calculate how close to exact 50% (0 = perfect retracement)
-    distance_from_fifty = abs(current_spread_abs - fifty_percent)
-    retracement_accuracy = max(0, 100 - (distance_from_fifty * 10))
-
-    # Determine signal
-    if in_retracement_zone and was_win:
-        signal = "GRAVITY_FADE"
-        recommendation = f"🎯 FADE {team_name}. Spread at 50% retracement zone. Market overreaction after blowout."
-        fade_strength = min(100, 60 + retracement_accuracy * 0.4)
-    elif in_retracement_zone and not was_win:
-        signal = "GRAVITY_BOUNCE"
-        recommendation = f"📈 BACK {team_name}. At 50% retracement after blowout loss. Due for bounce."
-        fade_strength = min(100, 55 + retracement_accuracy * 0.35)
-    elif current_spread_abs < retracement_zone_low:
-        signal = "BELOW_RETRACEMENT"
-        recommendation = f"Spread below 50% zone. Market may be under-correcting."
-        fade_strength = 30
-    else:
-        signal = "ABOVE_RETRACEMENT"
-        recommendation = f"Spread above 50% zone. Market not yet corrected."
-        fade_strength = 25
-
-    return {
-        "team": team_name,
-        "last_margin": last_game_margin,
-        "was_win": was_win,
-        "is_major_move": True,
-        "fifty_percent_level": round(fifty_percent, 1),
-        "retracement_zone": {"low": round(retracement_zone_low, 1), "high": round(retracement_zone_high, 1)},
-        "current_spread": current_spread,
-        "in_retracement_zone": in_retracement_zone,
-        "retracement_accuracy": round(retracement_accuracy, 1),
-        "signal": signal,
-        "recommendation": recommendation,
-        "fade_strength": round(fade_strength),
-        "gann_principle": "The 50% retracement is nature's point of equilibrium. All things return to center."
-    }
-
-
-def analyze_rule_of_three(
-    team_name: str,
-    recent_ats_results: list,  # List of True/False for ATS covers, most recent first
-    current_pick: str = "cover"  # "cover" or "fade"
-) -> dict:
-    """
-    THE RULE OF THREE (Exhaustion Node)
-
-    Gann: "Never trade in the direction of the trend on the 3rd time period."
-    Trends exhaust or pause on the 3rd consecutive move.
-
-    Sports Application: If a team has covered 3 games in a row, FADE the 4th.
-    This is the Exhaustion Node - energy depletes after 3 cycles.
-
-    The Law: All trends must breathe. The 3rd repetition drains the pattern.
-    """
-
-    if len(recent_ats_results) < 3:
-        return {
-            "team": team_name,
-            "results_provided": len(recent_ats_results),
-            "exhaustion_active": False,
-            "signal": "INSUFFICIENT_DATA",
-            "recommendation": "Need at least 3 recent ATS results.",
-            "fade_strength": 0
-        }
-
-    # Check for 3 consecutive covers (True, True, True)
-    last_three = recent_ats_results[:3]
-    three_covers = all(last_three)
-    three_misses = not any(last_three)
-
-    # Check for 4+ consecutive (super exhaustion)
-    consecutive_count = 0
-    first_result = recent_ats_results[0] if recent_ats_results else None
-    for result in recent_ats_results:
-        if result == first_result:
-            consecutive_count += 1
-        else:
-            break
-
-    # Determine exhaustion state
-    if consecutive_count >= 4:
-        exhaustion_level = "CRITICAL"
-        base_strength = 85
-        emoji = "🔥"
-    elif consecutive_count == 3:
-        exhaustion_level = "HIGH"
-        base_strength = 72
-        emoji = "⚠️"
-    else:
-        exhaustion_level = "NONE"
-        base_strength = 0
-        emoji = "✓"
-
-    # Generate signal and recommendation
-    if three_covers:
-        signal = "EXHAUSTION_FADE"
-        direction = "covers"
-        recommendation = f"{emoji} FADE {team_name}. {consecutive_count} consecutive covers = Exhaustion Node reached. The 4th is the reversal."
-        fade_strength = base_strength
-    elif three_misses:
-        signal = "EXHAUSTION_BACK"
-        direction = "misses"
-        recommendation = f"{emoji} BACK {team_name}. {consecutive_count} consecutive ATS misses = Negative exhaustion. Due to cover."
-        fade_strength = base_strength - 5  # Slightly less confident on reversal backs
-    else:
-        signal = "NO_EXHAUSTION"
-        direction = "mixed"
-        recommendation = f"Mixed recent results. No exhaustion pattern detected."
-        fade_strength = 0
-
-    return {
-        "team": team_name,
-        "recent_ats": recent_ats_results[:5],  # Show last 5
-        "consecutive_count": consecutive_count,
-        "direction": direction,
-        "exhaustion_level": exhaustion_level,
-        "signal": signal,
-        "recommendation": recommendation,
-        "fade_strength": round(fade_strength),
-        "gann_principle": "The Rule of Three: Energy depletes after 3 cycles. The 4th move reverses or pauses."
-    }
-
-
-def analyze_annulifier_cycle(
-    team_name: str,
-    recent_results: list,  # List of "W" or "L" for wins/losses, most recent first
-    bet_type: str = "moneyline"  # "moneyline" or "ats"
-) -> dict:
-    """
-    THE ANNULIFIER CYCLE (Alternating Vibration)
-
-    Gann observed that chaos seeks balance through alternating patterns.
-    Strong assets often enter W-L-W-L harmonic for short periods.
-
-    Sports Application: Scan for exactly 4 alternating results (W-L-W-L or L-W-L-W).
-    The 5th result is LOCKED to continue the pattern.
-
-    The Law: The universe maintains balance through oscillation.
-    4 alternations = harmonic lock. The 5th must complete the wave.
-    """
-
-    if len(recent_results) < 4:
-        return {
-            "team": team_name,
-            "results_provided": len(recent_results),
-            "annulifier_active": False,
-            "signal": "INSUFFICIENT_DATA",
-            "recommendation": "Need at least 4 recent results (W/L).",
-            "lock_strength": 0
-        }
-
-    # Normalize results
-    normalized = [r.upper()[0] if isinstance(r, str) else ("W" if r else "L") for r in recent_results]
-    last_four = normalized[:4]
-
-    # Check for alternating pattern (W-L-W-L or L-W-L-W)
-    is_alternating = True
-    for i in range(len(last_four) - 1):
-        if last_four[i] == last_four[i + 1]:
-            is_alternating = False
-            break
-
-    # Determine the locked 5th result
-    if is_alternating:
-        # The 5th continues the pattern
-        # If pattern is W-L-W-L (most recent is L), next is W
-        # If pattern is L-W-L-W (most recent is W), next is L
-        predicted_next = "W" if last_four[0] == "L" else "L"
-
-        # Check if we have 5+ for extended pattern
-        extended_alternating = False
-        if len(normalized) >= 5:
-            extended_pattern = normalized[:5]
-            extended_alternating = all(extended_pattern[i] != extended_pattern[i+1] for i in range(4))
-
-        if extended_alternating:
-            lock_level = "SUPER_HARMONIC"
-            lock_strength = 90
-            emoji = "🔒"
-            extra = "5+ alternations detected. Harmonic resonance at peak."
-        else:
-            lock_level = "HARMONIC_LOCK"
-            lock_strength = 78
-            emoji = "⚡"
-            extra = "4 alternations confirmed. 5th result locked."
-
-        if predicted_next == "W":
-            signal = "LOCKED_WIN"
-            recommendation = f"{emoji} BET {team_name} TO WIN. Annulifier cycle predicts WIN. {extra}"
-        else:
-            signal = "LOCKED_LOSS"
-            recommendation = f"{emoji} FADE {team_name}. Annulifier cycle predicts LOSS. {extra}"
-    else:
-        # Find where the pattern broke
-        break_point = 0
-        for i in range(len(last_four) - 1):
-            if last_four[i] == last_four[i + 1]:
-                break_point = i + 1
-                break
-
-        lock_level = "NO_HARMONIC"
-        lock_strength = 0
-        predicted_next = None
-        signal = "NO_PATTERN"
-        recommendation = f"No alternating pattern. Results broke at position {break_point + 1}."
-        emoji = "〰️"
-
-    return {
-        "team": team_name,
-        "bet_type": bet_type,
-        "recent_results": last_four,
-        "full_history": normalized[:6],  # Show last 6
-        "is_alternating": is_alternating,
-        "lock_level": lock_level,
-        "predicted_next": predicted_next,
-        "signal": signal,
-        "recommendation": recommendation,
-        "lock_strength": round(lock_strength),
-        "gann_principle": "The Annulifier: Chaos balances through oscillation. 4 alternations create harmonic lock."
-    }
-
-
-def get_gann_physics_composite(
-    team_name: str,
-    last_game_margin: int = None,
-    current_spread: float = None,
-    was_win: bool = True,
-    recent_ats_results: list = None,
-    recent_wl_results: list = None
-) -> dict:
-    """
-    GANN PHYSICS COMPOSITE - All three laws combined
-
-    Returns unified analysis from:
-    1. 50% Retracement (Gravity Check)
-    2. Rule of Three (Exhaustion Node)
-    3. Annulifier Cycle (Harmonic Lock)
-
-    When multiple signals align = MAXIMUM CONVICTION
-    """
-
-    results = {
-        "team": team_name,
-        "version": "13.0",
-        "codename": "GANN_PHYSICS"
-    }
-
-    active_signals = []
-    total_strength = 0
-    signal_count = 0
-
-    # 1. 50% Retracement
-    if last_game_margin is not None and current_spread is not None:
-        retracement = analyze_fifty_percent_retracement(team_name, last_game_margin, current_spread, was_win)
-        results["retracement"] = retracement
-        if retracement["signal"] in ["GRAVITY_FADE", "GRAVITY_BOUNCE"]:
-            active_signals.append(retracement["signal"])
-            total_strength += retracement["fade_strength"]
-            signal_count += 1
-
-    # 2. Rule of Three
-    if recent_ats_results and len(recent_ats_results) >= 3:
-        exhaustion = analyze_rule_of_three(team_name, recent_ats_results)
-        results["exhaustion"] = exhaustion
-        if exhaustion["signal"] in ["EXHAUSTION_FADE", "EXHAUSTION_BACK"]:
-            active_signals.append(exhaustion["signal"])
-            total_strength += exhaustion["fade_strength"]
-            signal_count += 1
-
-    # 3. Annulifier Cycle
-    if recent_wl_results and len(recent_wl_results) >= 4:
-        annulifier = analyze_annulifier_cycle(team_name, recent_wl_results)
-        results["annulifier"] = annulifier
-        if annulifier["signal"] in ["LOCKED_WIN", "LOCKED_LOSS"]:
-            active_signals.append(annulifier["signal"])
-            total_strength += annulifier["lock_strength"]
-            signal_count += 1
-
-    # Calculate composite
-    if signal_count > 0:
-        composite_strength = total_strength / signal_count
-
-        # CONFLUENCE BONUS: Multiple Gann signals aligning
-        if signal_count >= 2:
-            confluence_bonus = 15 * (signal_count - 1)
-            composite_strength = min(100, composite_strength + confluence_bonus)
-
-        if signal_count >= 3:
-            conviction_level = "GANN_TRIFECTA"
-            emoji = "🏛️🏛️🏛️"
-            message = "ALL THREE GANN LAWS ACTIVE. Maximum geometric conviction."
-        elif signal_count == 2:
-            conviction_level = "DUAL_GEOMETRY"
-            emoji = "🏛️🏛️"
-            message = "Two Gann laws aligned. Strong geometric signal."
-        else:
-            conviction_level = "SINGLE_LAW"
-            emoji = "🏛️"
-            message = "One Gann law active. Moderate signal."
-    else:
-        composite_strength = 0
-        conviction_level = "NO_SIGNAL"
-        emoji = "📐"
-        message = "No active Gann physics signals."
-
-    results["composite"] = {
-        "active_signals": active_signals,
-        "signal_count": signal_count,
-        "composite_strength": round(composite_strength),
-        "conviction_level": conviction_level,
-        "emoji": emoji,
-        "message": message
-    }
-
-    # Determine final recommendation
-    fade_signals = sum(1 for s in active_signals if "FADE" in s or "LOSS" in s)
-    back_signals = sum(1 for s in active_signals if "BACK" in s or "WIN" in s or "BOUNCE" in s)
-
-    if fade_signals > back_signals:
-        results["final_recommendation"] = f"FADE {team_name}"
-        results["direction"] = "FADE"
-    elif back_signals > fade_signals:
-        results["final_recommendation"] = f"BACK {team_name}"
-        results["direction"] = "BACK"
-    else:
-        results["final_recommendation"] = "CONFLICTING SIGNALS - Use discretion"
-        results["direction"] = "NEUTRAL"
-
-    return results
-
-# ============================================================================
-# v14.0: NOOSPHERE VELOCITY - The Global Mind Signal (MAIN MODEL)
-# "Someone always knows." - Information Asymmetry Detection
-# Princeton Global Consciousness Project meets Sports Betting
-# ============================================================================
-
-# Baseline search volumes (relative scale 0-100) for calibration
-TEAM_BASELINE_VOLUMES = {
-    # NBA - High interest
-    "Lakers": 85, "Celtics": 80, "Warriors": 82, "Knicks": 78, "Bulls": 70,
-    "Heat": 72, "Nets": 65, "76ers": 68, "Mavericks": 70, "Suns": 65,
-    "Nuggets": 55, "Bucks": 58, "Clippers": 60, "Grizzlies": 45, "Kings": 42,
-    "Cavaliers": 50, "Hawks": 48, "Raptors": 52, "Wizards": 40, "Pacers": 38,
-    "Magic": 42, "Hornets": 35, "Pistons": 38, "Thunder": 45, "Pelicans": 40,
-    "Timberwolves": 42, "Trail Blazers": 45, "Jazz": 40, "Spurs": 50, "Rockets": 55,
-
-    # NFL - Highest interest
-    "Cowboys": 95, "Patriots": 88, "Packers": 85, "Chiefs": 90, "Eagles": 82,
-    "49ers": 80, "Steelers": 78, "Raiders": "75", "Giants": 72, "Bears": 70,
-    "Bills": 72, "Ravens": 68, "Broncos": 65, "Dolphins": 68, "Jets": 65,
-    "Seahawks": 70, "Lions": 60, "Vikings": 62, "Saints": 65, "Bengals": 65,
-    "Browns": 62, "Chargers": 60, "Cardinals": 55, "Rams": 65, "Falcons": 55,
-    "Panthers": 52, "Buccaneers": 68, "Commanders": 55, "Colts": 58, "Texans": 55,
-    "Titans": 52, "Jaguars": 48,
-
-    # College - Variable
-    "Alabama": 88, "Ohio State": 85, "Michigan": 82, "Georgia": 80, "Texas": 78,
-    "Notre Dame": 75, "USC": 72, "LSU": 70, "Clemson": 68, "Florida": 65,
-    "Duke": 75, "Kentucky": 72, "North Carolina": 70, "Kansas": 68, "UCLA": 65,
-
-    # Default for unknown teams
-    "default": 30
-}
-
-# Injury-related search terms that indicate "Phantom Injury"
-INJURY_RELATED_TERMS = [
-    "injury", "injured", "hurt", "limp", "limping", "grimace", "grimacing",
-    "questionable", "doubtful", "out", "DNP", "rest", "load management",
-    "ankle", "knee", "hamstring", "back", "shoulder", "wrist", "concussion",
-    "illness", "sick", "flu", "covid", "protocol", "warmups", "practice"
-]
-
-
-def get_baseline_volume(team_name: str) -> int:
-    """Get baseline search volume for a team"""
-    for key in TEAM_BASELINE_VOLUMES:
-        if key.lower() in team_name.lower() or team_name.lower() in key.lower():
-            val = TEAM_BASELINE_VOLUMES[key]
-            return int(val) if isinstance(val, (int, float)) else 30
-    return TEAM_BASELINE_VOLUMES.get("default", 30)
-
-
-def calculate_volume_velocity(current_volume: float, baseline_volume: float) -> dict:
-    """
-    Calculate search volume velocity (rate of change)
-
-    Returns velocity metrics:
-    - velocity_pct: Percentage above/below baseline
-    - velocity_tier: SILENT_SPIKE, LOUD_SPIKE, NORMAL, DEAD
-    """
-    if baseline_volume <= 0:
-        baseline_volume = 30
-
-    velocity_pct = ((current_volume - baseline_volume) / baseline_volume) * 100
-
-    if velocity_pct >= 300:
-        tier = "EXTREME_SPIKE"
-        description = "Massive unexplained interest"
-    elif velocity_pct >= 200:
-        tier = "SILENT_SPIKE"
-        description = "Strong phantom signal"
-    elif velocity_pct >= 100:
-        tier = "ELEVATED"
-        description = "Above normal interest"
-    elif velocity_pct >= 50:
-        tier = "MILD_SPIKE"
-        description = "Slightly elevated"
-    elif velocity_pct <= -50:
-        tier = "DEAD"
-        description = "Unusually low interest"
-    else:
-        tier = "NORMAL"
-        description = "Baseline activity"
-
-    return {
-        "current_volume": current_volume,
-        "baseline_volume": baseline_volume,
-        "velocity_pct": round(velocity_pct, 1),
-        "tier": tier,
-        "description": description
-    }
-
-
-def detect_insider_leak(
-    team_name: str,
-    current_volume: float,
-    has_news: bool = False,
-    news_sentiment: str = "neutral"  # "positive", "negative", "neutral"
-) -> dict:
-    """
-    INSIDER LEAK DETECTION (The Line-Mover)
-
-    Silent Spike (High volume + No news) = Someone knows something
-    FADE the team with the unexplained spike - bad news is coming.
-
-    The Science: Information leaks to cousins, trainers, beat writers.
-    They search to confirm the rumor before news breaks.
-    """
-    baseline = get_baseline_volume(team_name)
-    velocity = calculate_volume_velocity(current_volume, baseline)
-
-    # The key insight: High volume WITHOUT news = insider activity
-    is_silent_spike = velocity["velocity_pct"] >= 200 and not has_news
-
-    # If there IS news, the spike is "loud" and oddsmakers already adjusted
-    is_loud_spike = velocity["velocity_pct"] >= 200 and has_news
-
-    if is_silent_spike:
-        signal = "INSIDER_LEAK_DETECTED"
-        confidence = min(95, 70 + (velocity["velocity_pct"] - 200) / 10)
-        recommendation = f"🚨 FADE {team_name}. Silent spike ({velocity['velocity_pct']:.0f}%) with NO news. Someone knows."
-        action = "FADE"
-        edge_score = min(100, velocity["velocity_pct"] / 3)
-    elif is_loud_spike:
-        signal = "LOUD_SPIKE_NO_EDGE"
-        confidence = 50
-        recommendation = f"Loud spike but news is public. Line already adjusted. No edge."
-        action = "NEUTRAL"
-        edge_score = 0
-    elif velocity["tier"] == "DEAD":
-        signal = "DEAD_INTEREST"
-        confidence = 60
-        recommendation = f"Unusually low interest in {team_name}. Potential trap game."
-        action = "CAUTION"
-        edge_score = 25
-    else:
-        signal = "NO_ANOMALY"
-        confidence = 50
-        recommendation = "Normal search activity. No insider signal detected."
-        action = "NEUTRAL"
-        edge_score = 0
-
-    return {
-        "team": team_name,
-        "signal_type": "INSIDER_LEAK",
-        "velocity": velocity,
-        "has_news": has_news,
-        "news_sentiment": news_sentiment,
-        "is_silent_spike": is_silent_spike,
-        "is_loud_spike": is_loud_spike,
-        "signal": signal,
-        "confidence": round(confidence),
-        "recommendation": recommendation,
-        "action": action,
-        "edge_score": round(edge_score),
-        "principle": "Silent Spike = Information asymmetry. Someone always knows first."
-    }
-
-
-def detect_main_character_syndrome(
-    underdog_name: str,
-    favorite_name: str,
-    underdog_volume: float,
-    favorite_volume: float,
-    underdog_spread: float,
-    sentiment: str = "manic"  # "manic", "negative", "neutral"
-) -> dict:
-    """
-    MAIN CHARACTER SYNDROME (The Energy Shift)
-
-    When underdog has HIGHER search volume than favorite = Collective manifestation.
-    The Noosphere has decided this is the "Upset of the Night."
-
-    The Science: Memes, hype videos, "belief" energy.
-    The collective consciousness wills the ball into the hoop.
-    """
-    underdog_baseline = get_baseline_volume(underdog_name)
-    favorite_baseline = get_baseline_volume(favorite_name)
-
-    underdog_velocity = calculate_volume_velocity(underdog_volume, underdog_baseline)
-    favorite_velocity = calculate_volume_velocity(favorite_volume, favorite_baseline)
-
-    # Main Character = Underdog has more volume than favorite (adjusted for baseline)
-    volume_ratio = underdog_volume / max(favorite_volume, 1)
-    adjusted_ratio = (underdog_volume / underdog_baseline) / max((favorite_volume / favorite_baseline), 0.1)
-
-    is_main_character = adjusted_ratio > 1.5 and sentiment == "manic"
-    is_strong_main_character = adjusted_ratio > 2.0 and sentiment == "manic"
-
-    if is_strong_main_character:
-        signal = "STRONG_MAIN_CHARACTER"
-        confidence = min(92, 75 + (adjusted_ratio - 2) * 10)
-        recommendation = f"⭐ BET {underdog_name} (DOG). STRONG Main Character energy. The Noosphere chose this upset."
-        action = "BET_DOG"
-        edge_score = min(100, adjusted_ratio * 35)
-    elif is_main_character:
-        signal = "MAIN_CHARACTER_ACTIVE"
-        confidence = min(82, 65 + (adjusted_ratio - 1.5) * 15)
-        recommendation = f"🎬 BET {underdog_name} (DOG). Main Character syndrome detected. Collective belief active."
-        action = "BET_DOG"
-        edge_score = min(85, adjusted_ratio * 30)
-    elif adjusted_ratio > 1.2:
-        signal = "MILD_ENERGY_SHIFT"
-        confidence = 58
-        recommendation = f"Slight energy toward {underdog_name}. Monitor for escalation."
-        action = "WATCH"
-        edge_score = 15
-    else:
-        signal = "NO_ENERGY_SHIFT"
-        confidence = 50
-        recommendation = "Normal volume distribution. Favorite remains the narrative."
-        action = "NEUTRAL"
-        edge_score = 0
-
-    return {
-        "underdog": underdog_name,
-        "favorite": favorite_name,
-        "signal_type": "MAIN_CHARACTER",
-        "underdog_velocity": underdog_velocity,
-        "favorite_velocity": favorite_velocity,
-        "volume_ratio": round(volume_ratio, 2),
-        "adjusted_ratio": round(adjusted_ratio, 2),
-        "sentiment": sentiment,
-        "spread": underdog_spread,
-        "is_main_character": is_main_character or is_strong_main_character,
-        "signal": signal,
-        "confidence": round(confidence),
-        "recommendation": recommendation,
-        "action": action,
-        "edge_score": round(edge_score),
-        "principle": "The Hive Mind chose the upset. Collective belief manifests outcomes."
-    }
-
-
-def detect_phantom_injury(
-    player_name: str,
-    player_volume: float,
-    player_baseline: float = 50,
-    related_queries: list = None,
-    has_official_injury_report: bool = False
-) -> dict:
-    """
-    PHANTOM INJURY DETECTION (The Prop Killer)
-
-    Player search spike + injury-related queries + NO official report = Hidden limitation.
-    Fans at arena/warmups saw something beat writers ignored.
-
-    The Science: The Hive sees physical weakness before stats reflect it.
-    """
-    related_queries = related_queries or []
-
-    velocity = calculate_volume_velocity(player_volume, player_baseline)
-
-    # Check for injury-related search terms
-    injury_query_count = 0
-    injury_queries_found = []
-    for query in related_queries:
-        query_lower = query.lower()
-        for term in INJURY_RELATED_TERMS:
-            if term in query_lower:
-                injury_query_count += 1
-                injury_queries_found.append(query)
-                break
-
-    injury_query_ratio = injury_query_count / max(len(related_queries), 1)
-
-    # Phantom Injury = Volume spike + Injury queries + NO official report
-    is_phantom_injury = (
-        velocity["velocity_pct"] >= 100 and
-        injury_query_ratio >= 0.3 and
-        not has_official_injury_report
-    )
-
-    is_strong_phantom = (
-        velocity["velocity_pct"] >= 200 and
-        injury_query_ratio >= 0.5 and
-        not has_official_injury_report
-    )
-
-    if is_strong_phantom:
-        signal = "STRONG_PHANTOM_INJURY"
-        confidence = min(90, 72 + injury_query_ratio * 30)
-        recommendation = f"🩹 BET UNDER on {player_name} props. Strong phantom injury signal. The Hive sees limitation."
-        action = "BET_UNDER"
-        edge_score = min(95, velocity["velocity_pct"] / 2.5 + injury_query_ratio * 50)
-    elif is_phantom_injury:
-        signal = "PHANTOM_INJURY_DETECTED"
-        confidence = min(78, 60 + injury_query_ratio * 25)
-        recommendation = f"⚠️ Lean UNDER on {player_name}. Phantom injury queries detected. Monitor warmups."
-        action = "LEAN_UNDER"
-        edge_score = min(75, velocity["velocity_pct"] / 3 + injury_query_ratio * 40)
-    elif has_official_injury_report:
-        signal = "OFFICIAL_INJURY"
-        confidence = 50
-        recommendation = f"Official injury report exists. Line already adjusted."
-        action = "NEUTRAL"
-        edge_score = 0
-    else:
-        signal = "NO_PHANTOM"
-        confidence = 50
-        recommendation = "No phantom injury signals. Normal activity."
-        action = "NEUTRAL"
-        edge_score = 0
-
-    return {
-        "player": player_name,
-        "signal_type": "PHANTOM_INJURY",
-        "velocity": velocity,
-        "related_queries": related_queries,
-        "injury_queries_found": injury_queries_found,
-        "injury_query_ratio": round(injury_query_ratio, 2),
-        "has_official_report": has_official_injury_report,
-        "is_phantom_injury": is_phantom_injury or is_strong_phantom,
-        "signal": signal,
-        "confidence": round(confidence),
-        "recommendation": recommendation,
-        "action": action,
-        "edge_score": round(edge_score),
-        "principle": "The Hive sees physical weakness before stats reflect it."
-    }
-
-
-def calculate_noosphere_velocity(
-    team_name: str,
-    opponent_name: str = None,
-    team_volume: float = None,
-    opponent_volume: float = None,
-    has_news: bool = False,
-    is_underdog: bool = False,
-    spread: float = None,
-    sentiment: str = "neutral",
-    player_name: str = None,
-    player_volume: float = None,
-    player_queries: list = None
-) -> dict:
-    """
-    NOOSPHERE VELOCITY - Composite Signal for Main Model
-
-    Combines all three detection methods:
-    1. Insider Leak (Silent Spike) - FADE team with unexplained spike
-    2. Main Character Syndrome - BET underdog with higher volume
-    3. Phantom Injury - BET UNDER on player props
-
-    Returns weighted signal for main confidence calculation.
-    """
-    results = {
-        "team": team_name,
-        "version": "14.0",
-        "codename": "NOOSPHERE_VELOCITY",
-        "active_signals": [],
-        "signals": {}
-    }
-
-    total_edge = 0
-    signal_count = 0
-
-    # 1. Insider Leak Detection
-    if team_volume is not None:
-        insider = detect_insider_leak(team_name, team_volume, has_news)
-        results["signals"]["insider_leak"] = insider
-        if insider["signal"] == "INSIDER_LEAK_DETECTED":
-            results["active_signals"].append("INSIDER_LEAK")
-            total_edge += insider["edge_score"]
-            signal_count += 1
-
-    # 2. Main Character Syndrome
-    if opponent_name and team_volume is not None and opponent_volume is not None and is_underdog:
-        main_char = detect_main_character_syndrome(
-            underdog_name=team_name,
-            favorite_name=opponent_name,
-            underdog_volume=team_volume,
-            favorite_volume=opponent_volume,
-            underdog_spread=spread or 0,
-            sentiment=sentiment
-        )
-        results["signals"]["main_character"] = main_char
-        if main_char["is_main_character"]:
-            results["active_signals"].append("MAIN_CHARACTER")
-            total_edge += main_char["edge_score"]
-            signal_count += 1
-
-    # 3. Phantom Injury (Player Props)
-    if player_name and player_volume is not None:
-        phantom = detect_phantom_injury(
-            player_name=player_name,
-            player_volume=player_volume,
-            related_queries=player_queries or []
-        )
-        results["signals"]["phantom_injury"] = phantom
-        if phantom["is_phantom_injury"]:
-            results["active_signals"].append("PHANTOM_INJURY")
-            total_edge += phantom["edge_score"]
-            signal_count += 1
-
-    # Calculate composite score for main model integration
-    if signal_count > 0:
-        composite_edge = total_edge / signal_count
-
-        # Confluence bonus - multiple Noosphere signals = stronger
-        if signal_count >= 2:
-            composite_edge = min(100, composite_edge * 1.25)
-
-        if signal_count >= 3:
-            noosphere_tier = "FULL_NOOSPHERE"
-            message = "🌐 ALL NOOSPHERE SIGNALS ACTIVE. Maximum information asymmetry."
-        elif signal_count == 2:
-            noosphere_tier = "DUAL_SIGNAL"
-            message = "🌐 Two Noosphere signals aligned. Strong edge."
-        else:
-            noosphere_tier = "SINGLE_SIGNAL"
-            message = "🌐 Noosphere signal detected."
-    else:
-        composite_edge = 0
-        noosphere_tier = "SILENT"
-        message = "No Noosphere anomalies detected."
-
-    # Convert edge to main model score (0-100 scale)
-    # High edge = high score, which boosts confidence
-    noosphere_score = min(100, 50 + composite_edge * 0.5)
-
-    results["composite"] = {
-        "signal_count": signal_count,
-        "total_edge": round(total_edge),
-        "composite_edge": round(composite_edge),
-        "noosphere_score": round(noosphere_score),  # For main model integration
-        "noosphere_tier": noosphere_tier,
-        "message": message
-    }
-
-    # Determine primary action
-    if "INSIDER_LEAK" in results["active_signals"]:
-        results["primary_action"] = "FADE"
-        results["primary_target"] = team_name
-    elif "MAIN_CHARACTER" in results["active_signals"]:
-        results["primary_action"] = "BET_DOG"
-        results["primary_target"] = team_name
-    elif "PHANTOM_INJURY" in results["active_signals"]:
-        results["primary_action"] = "BET_UNDER"
-        results["primary_target"] = player_name
-    else:
-        results["primary_action"] = "NEUTRAL"
-        results["primary_target"] = None
-
-    return results
-
-
-def get_noosphere_main_model_signal(noosphere_data: dict) -> dict:
-    """
-    Extract the signal for main model integration.
-
-    Returns a signal dict compatible with calculate_main_confidence().
-    """
-    composite = noosphere_data.get("composite", {})
-    score = composite.get("noosphere_score", 50)
-    tier = composite.get("noosphere_tier", "SILENT")
-    active = noosphere_data.get("active_signals", [])
-
-    if tier == "FULL_NOOSPHERE":
-        contribution = f"🌐 FULL NOOSPHERE: {', '.join(active)}"
-    elif tier == "DUAL_SIGNAL":
-        contribution = f"🌐 Dual Noosphere: {', '.join(active)}"
-    elif tier == "SINGLE_SIGNAL":
-        contribution = f"🌐 Noosphere: {active[0] if active else 'Active'}"
-    else:
-        contribution = "No Noosphere signal"
-
-    return {
-        "score": score,
-        "contribution": contribution
-    }
-
-
-def validate_2178() -> dict:
-    """Prove the mathematical uniqueness of 2178"""
-    n = 2178
-    reversal = 8712
-    prop1 = (n * 4 == reversal)
-    prop2 = (n * reversal == 66**4)
-
-    return {
-        "number": n,
-        "reversal": reversal,
-        "n_times_4_equals_reversal": prop1,
-        "n_times_reversal": n * reversal,
-        "sixty_six_to_fourth": 66**4,
-        "n_times_reversal_equals_66_4": prop2,
-        "validated": prop1 and prop2,
-        "status": "IMMORTAL CONFIRMED" if (prop1 and prop2) else "VALIDATION FAILED"
-    }
-
-def digit_sum(n: int) -> int:
-    return sum(int(d) for d in str(abs(n)))
-
-def reduce_to_single(n: int) -> int:
-    while n > 9:
-        n = digit_sum(n)
-    return n
-
-def check_jarvis_trigger(value: int) -> dict:
-    """Check if a value triggers any Jarvis edge numbers"""
-    result = {
-        "triggered": False,
-        "triggers": [],
-        "total_boost": 0,
-        "highest_tier": None,
-        "details": []
-    }
-
-    str_value = str(abs(value))
-
-    if "2178" in str_value:
-        trigger = JARVIS_TRIGGERS[2178]
-        result["triggered"] = True
-        result["triggers"].append(2178)
-        result["total_boost"] += trigger["boost"]
-        result["highest_tier"] = "LEGENDARY"
-        result["details"].append("Contains THE IMMORTAL sequence (2178)")
-
-    if value in JARVIS_TRIGGERS:
-        trigger = JARVIS_TRIGGERS[value]
-        if value not in result["triggers"]:
-            result["triggered"] = True
-            result["triggers"].append(value)
-            result["total_boost"] += trigger["boost"]
-            if result["highest_tier"] != "LEGENDARY":
-                result["highest_tier"] = trigger["tier"]
-            result["details"].append(f"Direct match: {trigger['name']}")
-
-    reduced = reduce_to_single(value)
-    for trigger_num, trigger in JARVIS_TRIGGERS.items():
-        if trigger_num not in result["triggers"]:
-            if reduce_to_single(trigger_num) == reduced:
-                result["triggered"] = True
-                result["triggers"].append(trigger_num)
-                result["total_boost"] += trigger["boost"] * 0.5
-                result["details"].append(f"Reduces to same as {trigger['name']}")
-
-    if value % 33 == 0 and 33 not in result["triggers"]:
-        result["triggered"] = True
-        result["triggers"].append(33)
-        result["total_boost"] += 5
-        result["details"].append("Divisible by THE MASTER (33)")
-
-    if reduced in TESLA_NUMBERS:
-        result["details"].append(f"Tesla alignment: reduces to {reduced}")
-        result["total_boost"] += 2
-
-    return result
-
-# ============================================================================
-# MOON PHASE & DAILY ENERGY
-# ============================================================================
-
-def get_moon_phase() -> str:
-    known_new_moon = datetime(2024, 1, 11)
-    days_since = (datetime.now() - known_new_moon).days
-    lunar_cycle = 29.53
-    phase_num = (days_since % lunar_cycle) / lunar_cycle * 8
-    phases = ['new', 'waxing_crescent', 'first_quarter', 'waxing_gibbous',
-              'full', 'waning_gibbous', 'last_quarter', 'waning_crescent']
-    return phases[int(phase_num) % 8]
-
-def get_daily_energy(date: datetime = None) -> dict:
-    """Daily planetary energy - used by Twitter gematria community"""
-    if date is None:
-        date = datetime.now()
-
-    day_energies = {
-        0: {"planet": "Moon", "energy": "intuition", "bias": "home teams", "emoji": "🌙"},
-        1: {"planet": "Mars", "energy": "aggression", "bias": "overs", "emoji": "♂️"},
-        2: {"planet": "Mercury", "energy": "speed", "bias": "high-pace teams", "emoji": "☿"},
-        3: {"planet": "Jupiter", "energy": "expansion", "bias": "underdogs", "emoji": "♃"},
-        4: {"planet": "Venus", "energy": "harmony", "bias": "close games", "emoji": "♀"},
-        5: {"planet": "Saturn", "energy": "discipline", "bias": "unders", "emoji": "♄"},
-        6: {"planet": "Sun", "energy": "victory", "bias": "favorites", "emoji": "☉"}
-    }
-
-    return day_energies[date.weekday()]
-
-# ============================================================================
-# JARVIS SAVANT ESOTERIC WEIGHTS - +94.40u YTD PRESERVED
-# These weights produced the winning edge - DO NOT CHANGE
-# ============================================================================
-
-JARVIS_ESOTERIC_WEIGHTS = {
-    "gematria": 0.52,      # Boss approved - dominant
-    "numerology": 0.20,
-    "astro": 0.13,
-    "vedic": 0.10,
-    "sacred": 0.05,
-    "fib_phi": 0.05,
-    "vortex": 0.05
-}
-
-# Public Fade (Exoteric King) - ≥65% chalk = crush
-PUBLIC_FADE_PENALTY = -0.13
-
-# Mid-Spread Priority (Boss zone) - +4 to +9 strongest
-MID_SPREAD_AMPLIFIER = 0.20
-
-# NHL Pivot v5.9
-NHL_ML_DOG_THRESHOLD_RS = 9.3
-NHL_ML_DOG_THRESHOLD_PUBLIC = 65
-
-# Betting thresholds
-GOLD_STAR_THRESHOLD = 72  # 2u
-EDGE_LEAN_THRESHOLD = 68  # 1u
-
-# Large Spread Trap Gate (Kings 41-pt, Rice 31-pt lessons)
-LARGE_SPREAD_TRAP_PENALTY = -0.20
-
-# ============================================================================
-# STANDALONE ESOTERIC EDGE MODULE (v10.2 NEW)
-# Complete analysis tool with Jarvis Savant +94.40u weights
-# ============================================================================
-
-def calculate_standalone_esoteric(
-    home_team: str,
-    away_team: str,
-    spread: float = None,
-    total: float = None,
-    player_name: str = None,
-    jersey_number: int = None,
-    prop_line: float = None,
-    sport: str = "NBA",
-    game_date: datetime = None
-) -> dict:
-    """
-    STANDALONE ESOTERIC EDGE MODULE v10.3
-
-    Complete gematria/numerology analysis as its own feature.
-    Users can click into this to see full esoteric breakdown.
-    Does NOT affect main research confidence score.
-
-    v10.3 NEW: RESONANCE LAYER
-    - Founder's Echo: Franchise founding date vs game date
-    - Life Path Sync: Star player life path vs game numerology
-
-    Integrates insights from:
-    - @gematriasports
-    - @psgematria
-    - @SportsGematria
-    - @SGDecodes
-    - Gematria Effect Sports
-    """
-    if game_date is None:
-        game_date = datetime.now()
-
-    # 1. DATE NUMEROLOGY
-    date_analysis = calculate_date_numerology(game_date)
-
-    # 2. TEAM GEMATRIA (all 6 ciphers)
-    home_ciphers = get_all_ciphers(home_team)
-    away_ciphers = get_all_ciphers(away_team)
-
-    # 3. STORYLINE ANALYSIS
-    storyline = analyze_storyline(home_team, away_team)
-
-    # 4. JERSEY NUMBER ANALYSIS (if provided)
-    jersey_analysis = None
-    if jersey_number:
-        jersey_analysis = analyze_jersey_number(jersey_number, game_date)
-
-    # 5. PLAYER GEMATRIA (if provided)
-    player_analysis = None
-    life_path_sync = None
-    if player_name:
-        player_ciphers = get_all_ciphers(player_name)
-        player_jarvis = {}
-        for cipher_name, value in player_ciphers.items():
-            player_jarvis[cipher_name] = check_jarvis_trigger(value)
-
-        player_analysis = {
-            "name": player_name,
-            "ciphers": player_ciphers,
-            "jarvis_checks": player_jarvis,
-            "has_jarvis_trigger": any(j["triggered"] for j in player_jarvis.values())
-        }
-
-        # v10.3 NEW: LIFE PATH SYNC for player
-        life_path_sync = analyze_life_path_sync(player_name, game_date)
-
-    # 6. MOON & PLANETARY
-    moon_phase = get_moon_phase()
-    daily_energy = get_daily_energy(game_date)
-
-    # 7. v10.3 NEW: FOUNDER'S ECHO for both teams
-    home_founders_echo = analyze_founders_echo(home_team, game_date)
-    away_founders_echo = analyze_founders_echo(away_team, game_date)
-
-    moon_emoji = {
-        'new': '🌑', 'waxing_crescent': '🌒', 'first_quarter': '🌓', 'waxing_gibbous': '🌔',
-        'full': '🌕', 'waning_gibbous': '🌖', 'last_quarter': '🌗', 'waning_crescent': '🌘'
-    }.get(moon_phase, '🌙')
-
-    # 7. LINE GEOMETRY (spread/total analysis)
-    line_analysis = None
-    if spread is not None or total is not None:
-        line = spread if spread is not None else total
-        line_abs = abs(line) if line else 0
-        line_rounded = round(line_abs)
-
-        line_insights = []
-        if line_rounded in POWER_NUMBERS["fibonacci"]:
-            line_insights.append(f"Line {line_rounded} = Fibonacci (natural harmony)")
-        if line_rounded % 3 == 0:
-            line_insights.append(f"Line {line_rounded} = Tesla divisible (3-6-9)")
-        if line_rounded in POWER_NUMBERS["sacred"]:
-            line_insights.append(f"Line {line_rounded} = Sacred number")
-        if line_rounded in POWER_NUMBERS["master"]:
-            line_insights.append(f"Line {line_rounded} = Master number")
-
-        line_jarvis = check_jarvis_trigger(line_rounded)
-
-        line_analysis = {
-            "spread": spread,
-            "total": total,
-            "analyzed_line": line_rounded,
-            "insights": line_insights,
-            "jarvis_check": line_jarvis
-        }
-
-    # 8. CALCULATE ESOTERIC SCORE (standalone) - USING JARVIS SAVANT +94.40u WEIGHTS
-
-    # Calculate component scores (0-100 scale)
-    gematria_score = min(100, storyline["home_score"] if storyline["favored"] == "home" else storyline["away_score"])
-    numerology_score = min(100, 50 + len(date_analysis["alignments"]) * 10)
-    astro_score = 70 if moon_phase in ['full', 'new'] else 55 if moon_phase in ['waxing_gibbous', 'first_quarter'] else 50
-    vedic_score = 50 + (date_analysis["life_path"] * 3) if date_analysis["life_path"] in [3, 6, 9, 11, 22, 33] else 50
-    sacred_score = 60 if line_analysis and line_analysis["insights"] else 50
-    fib_phi_score = 70 if line_analysis and any("Fibonacci" in i for i in line_analysis.get("insights", [])) else 50
-    vortex_score = 65 if any("TESLA" in str(a) for a in date_analysis.get("alignments", [])) else 50
-
-    # Apply JARVIS SAVANT WEIGHTS (the +94.40u formula)
-    weighted_score = (
-        gematria_score * JARVIS_ESOTERIC_WEIGHTS["gematria"] +
-        numerology_score * JARVIS_ESOTERIC_WEIGHTS["numerology"] +
-        astro_score * JARVIS_ESOTERIC_WEIGHTS["astro"] +
-        vedic_score * JARVIS_ESOTERIC_WEIGHTS["vedic"] +
-        sacred_score * JARVIS_ESOTERIC_WEIGHTS["sacred"] +
-        fib_phi_score * JARVIS_ESOTERIC_WEIGHTS["fib_phi"] +
-        vortex_score * JARVIS_ESOTERIC_WEIGHTS["vortex"]
-    )
-
-    esoteric_score = round(weighted_score)
-
-    # Apply MID-SPREAD AMPLIFIER (+20% for +4 to +9 spreads)
-    if spread is not None and 4 <= abs(spread) <= 9:
-        esoteric_score = min(100, round(esoteric_score * (1 + MID_SPREAD_AMPLIFIER)))
-
-    # Apply LARGE SPREAD TRAP GATE (-20% for >15 spreads)
-    if spread is not None and abs(spread) > 15:
-        esoteric_score = max(0, round(esoteric_score * (1 + LARGE_SPREAD_TRAP_PENALTY)))
-
-    # Jersey alignment bonus
-    if jersey_analysis and jersey_analysis["has_alignment"]:
-        esoteric_score = min(100, esoteric_score + round(jersey_analysis["alignment_score"] * 0.2))
-
-    # Player Jarvis trigger bonus
-    if player_analysis and player_analysis["has_jarvis_trigger"]:
-        esoteric_score = min(100, esoteric_score + 10)
-
-    # v10.3 NEW: RESONANCE LAYER BONUSES
-
-    # Founder's Echo bonus - team with stronger founding resonance gets boost
-    resonance_bonus = 0
-    resonance_favored = None
-
-    if home_founders_echo["has_echo"] or away_founders_echo["has_echo"]:
-        home_echo_score = home_founders_echo["echo_score"]
-        away_echo_score = away_founders_echo["echo_score"]
-
-        if home_echo_score > away_echo_score + 10:
-            resonance_favored = "home"
-            resonance_bonus = min(15, round(home_echo_score * 0.15))
-        elif away_echo_score > home_echo_score + 10:
-            resonance_favored = "away"
-            resonance_bonus = min(15, round(away_echo_score * 0.15))
-
-        # Apply resonance bonus to score
-        esoteric_score = min(100, esoteric_score + resonance_bonus)
-
-    # Life Path Sync bonus - if player has destiny game alignment
-    life_path_bonus = 0
-    if life_path_sync and life_path_sync["has_sync"]:
-        life_path_bonus = min(10, round(life_path_sync["sync_score"] * 0.1))
-        esoteric_score = min(100, esoteric_score + life_path_bonus)
-
-    # Build resonance layer summary
-    resonance_layer = {
-        "active": resonance_bonus > 0 or life_path_bonus > 0,
-        "total_bonus": resonance_bonus + life_path_bonus,
-        "founders_echo": {
-            "home": home_founders_echo,
-            "away": away_founders_echo,
-            "favored": resonance_favored,
-            "bonus_applied": resonance_bonus
-        },
-        "life_path_sync": life_path_sync if life_path_sync else {"has_sync": False, "message": "No player specified"},
-        "life_path_bonus": life_path_bonus
-    }
-
-    # Determine tier using JARVIS THRESHOLDS
-    if esoteric_score >= GOLD_STAR_THRESHOLD:
-        tier = "GOLD_STAR"
-        emoji = "⭐⭐"
-        badge = "2u GOLD STAR"
-        bet_recommendation = "2u"
-    elif esoteric_score >= EDGE_LEAN_THRESHOLD:
-        tier = "EDGE_LEAN"
-        emoji = "⭐"
-        badge = "1u EDGE LEAN"
-        bet_recommendation = "1u"
-    elif esoteric_score >= 60:
-        tier = "MILD_ALIGNMENT"
-        emoji = "✨"
-        badge = "WATCH"
-        bet_recommendation = "0.5u or pass"
-    else:
-        tier = "NEUTRAL"
-        emoji = "🔮"
-        badge = "PASS"
-        bet_recommendation = "pass"
-
-    # Check for NHL ML Dog special play
-    nhl_ml_dog = None
-    if sport.upper() == "NHL" and spread and spread > 0:  # Underdog
-        if esoteric_score >= NHL_ML_DOG_THRESHOLD_RS * 10:  # Scale RS to 0-100
-            nhl_ml_dog = {
-                "active": True,
-                "bet": "0.5u ML Dog of the Day",
-                "reasoning": f"NHL dog with RS {esoteric_score}% meets {NHL_ML_DOG_THRESHOLD_RS * 10}% threshold"
-            }
-
-    # Build top insights
-    top_insights = []
-    if storyline["storylines"]:
-        top_insights.append(storyline["storylines"][0]["detail"])
-    if date_analysis["alignments"]:
-        top_insights.append(date_analysis["alignments"][0])
-    if jersey_analysis and jersey_analysis["alignments"]:
-        top_insights.append(jersey_analysis["alignments"][0])
-
-    # v10.3 NEW: Add resonance layer insights
-    if home_founders_echo["has_echo"] and home_founders_echo["echos"]:
-        top_insights.append(f"🏛️ {home_founders_echo['echos'][0]['detail']}")
-    if away_founders_echo["has_echo"] and away_founders_echo["echos"]:
-        top_insights.append(f"🏛️ {away_founders_echo['echos'][0]['detail']}")
-    if life_path_sync and life_path_sync["has_sync"] and life_path_sync["syncs"]:
-        top_insights.append(f"👤 {life_path_sync['syncs'][0]['detail']}")
-
-    top_insights.append(f"{moon_emoji} {moon_phase.replace('_', ' ').title()} Moon - {daily_energy['bias']}")
-
-    return {
-        "esoteric_score": esoteric_score,
-        "tier": tier,
-        "emoji": emoji,
-        "badge": badge,
-        "bet_recommendation": bet_recommendation,
-        "top_insights": top_insights[:5],
-
-        # JARVIS SAVANT +94.40u WEIGHTS BREAKDOWN
-        "jarvis_weights": {
-            "formula": "Gematria 52% + Numerology 20% + Astro 13% + Vedic 10% + Sacred 5% + Fib/Phi 5% + Vortex 5%",
-            "ytd_record": "+94.40u",
-            "components": {
-                "gematria": {"score": gematria_score, "weight": "52%"},
-                "numerology": {"score": numerology_score, "weight": "20%"},
-                "astro": {"score": astro_score, "weight": "13%"},
-                "vedic": {"score": vedic_score, "weight": "10%"},
-                "sacred": {"score": sacred_score, "weight": "5%"},
-                "fib_phi": {"score": fib_phi_score, "weight": "5%"},
-                "vortex": {"score": vortex_score, "weight": "5%"}
-            },
-            "modifiers_applied": {
-                "mid_spread_amplifier": spread is not None and 4 <= abs(spread) <= 9,
-                "large_spread_trap": spread is not None and abs(spread) > 15
-            }
-        },
-
-        # NHL ML Dog special play
-        "nhl_ml_dog": nhl_ml_dog,
-
-        # Full breakdowns for clickable detail
-        "date_numerology": date_analysis,
-        "team_analysis": {
-            "home": {
-                "team": home_team,
-                "ciphers": home_ciphers
-            },
-            "away": {
-                "team": away_team,
-                "ciphers": away_ciphers
-            }
-        },
-        "storyline": storyline,
-        "jersey_analysis": jersey_analysis,
-        "player_analysis": player_analysis,
-        "line_analysis": line_analysis,
-
-        # v10.3 NEW: RESONANCE LAYER
-        "resonance_layer": resonance_layer,
-
-        "cosmic": {
-            "moon_phase": moon_phase,
-            "moon_emoji": moon_emoji,
-            "planetary_ruler": daily_energy["planet"],
-            "daily_energy": daily_energy["energy"],
-            "natural_bias": daily_energy["bias"],
-            "planet_emoji": daily_energy["emoji"]
-        },
-        "immortal_status": validate_2178()["status"],
-
-        # Favored pick from esoteric
-        "esoteric_pick": {
-            "favored": storyline["favored"],
-            "favored_team": storyline["favored_team"],
-            "reasoning": storyline["reasoning"]
-        },
-
-        # Thresholds used
-        "thresholds": {
-            "gold_star": GOLD_STAR_THRESHOLD,
-            "edge_lean": EDGE_LEAN_THRESHOLD
-        }
-    }
-
-# ============================================================================
-# CONFLUENCE ALERT SYSTEM (v10.2 NEW)
-# Shows when research model and esoteric align - informational only
-# ============================================================================
-
-def check_confluence_alert(
-    main_confidence: int,
-    main_pick: str,  # "home", "away", or team name
-    esoteric_score: int,
-    esoteric_pick: str  # "home", "away", or team name
-) -> dict:
-    """
-    CONFLUENCE ALERT SYSTEM
-
-    Checks if research model and esoteric edge point same direction.
-    This is INFORMATIONAL ONLY - does not boost the main score.
-    Users can decide if they want to factor this in.
-    """
-
-    # Normalize picks for comparison
-    main_norm = main_pick.lower() if main_pick else ""
-    esoteric_norm = esoteric_pick.lower() if esoteric_pick else ""
-
-    same_direction = main_norm == esoteric_norm and main_norm != "" and main_norm != "neutral"
-
-    # Both must be strong
-    main_strong = main_confidence >= 70
-    esoteric_strong = esoteric_score >= 65
-
-    if same_direction and main_strong and esoteric_strong:
-        # FULL CONFLUENCE
-        if main_confidence >= 80 and esoteric_score >= 80:
-            return {
-                "has_confluence": True,
-                "level": "PERFECT",
-                "emoji": "🌟🔥⚡",
-                "badge": "PERFECT CONFLUENCE",
-                "message": "Research model and cosmic forces in PERFECT alignment",
-                "color": "gold",
-                "show_alert": True
-            }
-        elif main_confidence >= 75 and esoteric_score >= 70:
-            return {
-                "has_confluence": True,
-                "level": "STRONG",
-                "emoji": "⭐💪",
-                "badge": "STRONG CONFLUENCE",
-                "message": "Research and esoteric both favor same side",
-                "color": "green",
-                "show_alert": True
-            }
-        else:
-            return {
-                "has_confluence": True,
-                "level": "MODERATE",
-                "emoji": "✨",
-                "badge": "CONFLUENCE",
-                "message": "Models aligned - additional conviction",
-                "color": "blue",
-                "show_alert": True
-            }
-
-    elif same_direction and (main_strong or esoteric_strong):
-        return {
-            "has_confluence": False,
-            "level": "PARTIAL",
-            "emoji": "🔮",
-            "badge": "PARTIAL ALIGNMENT",
-            "message": "Same direction but not both strong",
-            "color": "gray",
-            "show_alert": False
-        }
-
-    elif not same_direction and main_strong and esoteric_strong:
-        return {
-            "has_confluence": False,
-            "level": "DIVERGENT",
-            "emoji": "⚡",
-            "badge": "DIVERGENCE",
-            "message": "Research and esoteric point different directions",
-            "color": "orange",
-            "show_alert": True  # Show as warning
-        }
-
-    else:
-        return {
-            "has_confluence": False,
-            "level": "NONE",
-            "emoji": "📊",
-            "badge": "NO ALERT",
-            "message": "No significant alignment or divergence",
-            "color": "gray",
-            "show_alert": False
-        }
-
-# ============================================================================
-# V10.1 SIGNAL WEIGHTS - PRESERVED
-# ============================================================================
-
-SIGNAL_WEIGHTS = {
-    "sharp_money": 22,
-    "line_edge": 18,
-    "noosphere_velocity": 17,  # v14.0 - Information asymmetry detection (MAIN MODEL)
-    "injury_vacuum": 16,
-    "game_pace": 15,
-    "travel_fatigue": 14,
-    "back_to_back": 13,
-    "defense_vs_position": 12,
-    "public_fade": 11,
-    "steam_moves": 10,
-    "home_court": 10,
-    "weather": 10,
-    "minutes_projection": 10,
-    "referee": 8,
-    "game_script": 8,
-    "ensemble_ml": 8,
-    "gematria": 3,
-    "moon_phase": 2,
-    "numerology": 2,
-    "sacred_geometry": 2,
-    "zodiac": 1,
-    "jarvis_trigger": 5,
-    "crush_zone": 4,
-    "goldilocks": 3,
-    "nhl_protocol": 4
-}
-
-# ============================================================================
-# V10.1 JARVIS EDGE SIGNALS - PRESERVED
-# ============================================================================
-
-def calculate_public_fade_signal(public_percentage: float, is_favorite: bool) -> dict:
-    signal = {
-        "public_pct": public_percentage,
-        "is_favorite": is_favorite,
-        "in_crush_zone": False,
-        "fade_signal": False,
-        "influence": 0.0,
-        "recommendation": ""
-    }
-
-    if public_percentage >= 65 and is_favorite:
-        signal["in_crush_zone"] = True
-        signal["fade_signal"] = True
-        if public_percentage >= 80:
-            signal["influence"] = 0.95
-            signal["recommendation"] = "MAXIMUM FADE - Public delusion at peak"
-        elif public_percentage >= 75:
-            signal["influence"] = 0.85
-            signal["recommendation"] = "STRONG FADE - Heavy public chalk"
-        elif public_percentage >= 70:
-            signal["influence"] = 0.75
-            signal["recommendation"] = "FADE - Solid crush zone entry"
-        else:
-            signal["influence"] = 0.65
-            signal["recommendation"] = "FADE - Entering crush zone"
-    elif public_percentage >= 65 and not is_favorite:
-        signal["influence"] = 0.45
-        signal["recommendation"] = "Monitor - Public dog heavy"
-    elif public_percentage <= 35:
-        signal["influence"] = 0.55
-        signal["recommendation"] = "Contrarian value - Public avoiding"
-    else:
-        signal["influence"] = 0.30
-        signal["recommendation"] = "No clear public edge"
-
-    return signal
-
-def calculate_mid_spread_signal(spread: float) -> dict:
-    abs_spread = abs(spread) if spread else 0
-    signal = {
-        "spread": spread,
-        "abs_spread": abs_spread,
-        "in_goldilocks": False,
-        "influence": 0.0,
-        "zone": "",
-        "boost_modifier": 1.0
-    }
-
-    if 4 <= abs_spread <= 9:
-        signal["in_goldilocks"] = True
-        signal["zone"] = "GOLDILOCKS"
-        signal["boost_modifier"] = 1.20
-        signal["influence"] = 0.85 if 6 <= abs_spread <= 7 else 0.75
-    elif abs_spread < 4:
-        signal["zone"] = "TOO_TIGHT"
-        signal["influence"] = 0.50
-    elif abs_spread > 15:
-        signal["zone"] = "TRAP_GATE"
-        signal["influence"] = 0.25
-        signal["boost_modifier"] = 0.80
-    else:
-        signal["zone"] = "MODERATE"
-        signal["influence"] = 0.55
-
-    return signal
-
-def calculate_large_spread_trap(spread: float) -> dict:
-    abs_spread = abs(spread) if spread else 0
-    signal = {"spread": spread, "abs_spread": abs_spread, "is_trap": False, "penalty": 1.0, "warning": ""}
-
-    if abs_spread > 15:
-        signal["is_trap"] = True
-        signal["penalty"] = 0.70 if abs_spread > 20 else 0.80
-        signal["warning"] = "EXTREME TRAP" if abs_spread > 20 else "TRAP GATE ACTIVE"
-
-    return signal
-
-def calculate_nhl_dog_protocol(sport: str, spread: float, research_score: float, public_pct: float) -> dict:
-    signal = {"sport": sport, "protocol_active": False, "conditions_met": [], "conditions_failed": [], "influence": 0.0, "recommendation": ""}
-
-    if sport.upper() != "NHL":
-        signal["recommendation"] = "Protocol only applies to NHL"
-        return signal
-
-    is_dog = spread > 0 if spread else False
-    is_puck_line = abs(spread) == 1.5 if spread else False
-
-    if is_dog and is_puck_line:
-        signal["conditions_met"].append("Puck line dog (+1.5)")
-    else:
-        signal["conditions_failed"].append("Not puck line dog")
-
-    if research_score >= 9.3:
-        signal["conditions_met"].append(f"Research score {research_score} ≥ 9.3")
-    else:
-        signal["conditions_failed"].append(f"Research score {research_score} < 9.3")
-
-    if public_pct >= 65:
-        signal["conditions_met"].append(f"Public {public_pct}% ≥ 65%")
-    else:
-        signal["conditions_failed"].append(f"Public {public_pct}% < 65%")
-
-    count = len(signal["conditions_met"])
-    if count == 3:
-        signal["protocol_active"] = True
-        signal["influence"] = 0.92
-        signal["recommendation"] = "FULL PROTOCOL"
-    elif count == 2:
-        signal["influence"] = 0.70
-        signal["recommendation"] = "PARTIAL PROTOCOL"
-    elif count == 1:
-        signal["influence"] = 0.45
-        signal["recommendation"] = "WEAK SIGNAL"
-    else:
-        signal["influence"] = 0.20
-        signal["recommendation"] = "NO PROTOCOL"
-
-    return signal
-
-# ============================================================================
-# V10.1 MAIN CONFIDENCE CALCULATION - PRESERVED
-# ============================================================================
-
-def calculate_main_confidence(game_data: dict, context: dict = None) -> dict:
-    context = context or {}
-    signals = {}
-
-    # Sharp money
-    sharp_data = context.get("sharp_data", {})
-    if sharp_data:
-        divergence = abs(sharp_data.get("money_pct", 50) - sharp_data.get("ticket_pct", 50))
-        if divergence >= 25:
-            signals["sharp_money"] = {"score": 95, "contribution": f"STRONG SHARP: {divergence}% divergence"}
-        elif divergence >= 20:
-            signals["sharp_money"] = {"score": 88, "contribution": f"Sharp detected: {divergence}% split"}
-        elif divergence >= 15:
-            signals["sharp_money"] = {"score": 75, "contribution": f"Moderate sharp lean: {divergence}%"}
-        else:
-            signals["sharp_money"] = {"score": 50, "contribution": "No significant sharp action"}
-    else:
-        signals["sharp_money"] = {"score": 50, "contribution": "No sharp data"}
-
-    # Line edge
-    odds = game_data.get("spread_odds", -110)
-    if odds >= -100:
-        signals["line_edge"] = {"score": 95, "contribution": f"ELITE odds: {odds}"}
-    elif odds >= -105:
-        signals["line_edge"] = {"score": 82, "contribution": f"Great odds: {odds}"}
-    elif odds >= -110:
-        signals["line_edge"] = {"score": 55, "contribution": f"Standard odds: {odds}"}
-    else:
-        signals["line_edge"] = {"score": 40, "contribution": f"Poor odds: {odds}"}
-
-    # Game pace
-    total = game_data.get("total", 220)
-    if total >= 235:
-        signals["game_pace"] = {"score": 88, "contribution": f"High pace: O/U {total}"}
-    elif total >= 228:
-        signals["game_pace"] = {"score": 72, "contribution": f"Above avg pace: O/U {total}"}
-    elif total <= 210:
-        signals["game_pace"] = {"score": 75, "contribution": f"Slow pace: O/U {total}"}
-    else:
-        signals["game_pace"] = {"score": 55, "contribution": f"Normal pace: O/U {total}"}
-
-    # Home court
-    home_team = (game_data.get("home_team") or "").lower()
-    altitude_teams = ["nuggets", "denver", "jazz", "utah"]
-    if any(t in home_team for t in altitude_teams):
-        signals["home_court"] = {"score": 82, "contribution": "Altitude advantage"}
-    else:
-        signals["home_court"] = {"score": 58, "contribution": "Standard home court"}
-
-    # Jarvis edges
-    spread = game_data.get("spread", 0)
-    public_pct = game_data.get("public_pct", 50)
-    is_fav = game_data.get("is_favorite", False)
-    sport = game_data.get("sport", "NBA")
-
-    public_fade = calculate_public_fade_signal(public_pct, is_fav)
-    if public_fade["in_crush_zone"]:
-        signals["public_fade"] = {"score": 88, "contribution": public_fade["recommendation"]}
-    elif public_fade["fade_signal"]:
-        signals["public_fade"] = {"score": 72, "contribution": public_fade["recommendation"]}
-    else:
-        signals["public_fade"] = {"score": 50, "contribution": public_fade["recommendation"]}
-
-    mid_spread = calculate_mid_spread_signal(spread)
-    if mid_spread["in_goldilocks"]:
-        signals["goldilocks"] = {"score": 78, "contribution": f"GOLDILOCKS ZONE: {abs(spread)} spread"}
-    elif mid_spread["zone"] == "TRAP_GATE":
-        signals["goldilocks"] = {"score": 30, "contribution": f"TRAP GATE: {abs(spread)} spread too large"}
-    else:
-        signals["goldilocks"] = {"score": 50, "contribution": f"{mid_spread['zone']} spread"}
-
-    if sport.upper() == "NHL":
-        nhl = calculate_nhl_dog_protocol(sport, spread, 70, public_pct)
-        if nhl["protocol_active"]:
-            signals["nhl_protocol"] = {"score": 92, "contribution": "FULL NHL DOG PROTOCOL"}
-        elif len(nhl["conditions_met"]) >= 2:
-            signals["nhl_protocol"] = {"score": 70, "contribution": "Partial NHL protocol"}
-        else:
-            signals["nhl_protocol"] = {"score": 50, "contribution": "NHL protocol inactive"}
-
-    # v14.0 NOOSPHERE VELOCITY - Information asymmetry detection
-    # This is a MAIN MODEL signal - "Someone always knows"
-    noosphere_data = context.get("noosphere_data")
-    if noosphere_data:
-        noosphere_signal = get_noosphere_main_model_signal(noosphere_data)
-        signals["noosphere_velocity"] = noosphere_signal
-
-        # If Noosphere detects INSIDER_LEAK, apply penalty to confidence
-        if "INSIDER_LEAK" in noosphere_data.get("active_signals", []):
-            # The team being analyzed has a silent spike - this is BAD for them
-            # So we want to reduce confidence if backing them, increase if fading
-            if not game_data.get("is_fade_pick", False):
-                # We're backing the team with the leak - reduce score
-                signals["noosphere_velocity"]["score"] = max(20, signals["noosphere_velocity"]["score"] - 30)
-                signals["noosphere_velocity"]["contribution"] += " (FADE SIGNAL - reduce confidence)"
-    else:
-        signals["noosphere_velocity"] = {"score": 50, "contribution": "No Noosphere data"}
-
-    # Fill remaining
-    for signal in ["injury_vacuum", "travel_fatigue", "back_to_back", "defense_vs_position",
-                   "steam_moves", "weather", "minutes_projection", "referee", "game_script", "ensemble_ml"]:
-        if signal not in signals:
-            signals[signal] = {"score": 50, "contribution": "No data available"}
-
-    # Calculate weighted average
-    total_weight = 0
-    weighted_sum = 0
-    for signal_name, signal_data in signals.items():
-        weight = SIGNAL_WEIGHTS.get(signal_name, 1)
-        total_weight += weight
-        weighted_sum += signal_data["score"] * weight
-
-    confidence = round(weighted_sum / total_weight) if total_weight > 0 else 50
-
-    if game_data.get("spread_odds") or game_data.get("over_odds"):
-        confidence = min(100, confidence + 5)
-
-    # Tier
-    if confidence >= 80:
-        tier = "GOLDEN_CONVERGENCE"
-    elif confidence >= 70:
-        tier = "SUPER_SIGNAL"
-    elif confidence >= 60:
-        tier = "HARMONIC_ALIGNMENT"
-    else:
-        tier = "PARTIAL_ALIGNMENT"
-
-    # Recommendation
-    if confidence >= 80:
-        recommendation = "SMASH"
-    elif confidence >= 70:
-        recommendation = "STRONG"
-    elif confidence >= 60:
-        recommendation = "PLAY"
-    elif confidence >= 55:
-        recommendation = "LEAN"
-    else:
-        recommendation = "PASS"
+PROP_MARKETS = "player_points,player_rebounds,player_assists,player_threes"
+# Game markets fetched per sport refresh. The Odds API bills one credit per
+# market per region on every call, so the default spreads,totals costs 2 per
+# refresh; adding h2h costs 3 (1.5x) and turns on moneyline arbitrage / stale
+# lines in the market scan and moneyline steam in the line history
+ODDS_GAME_MARKETS = [m.strip() for m in os.getenv("ODDS_GAME_MARKETS", "spreads,totals").split(",") if m.strip()]
+if not ODDS_GAME_MARKETS or set(ODDS_GAME_MARKETS) - set(SCANNED_GAME_MARKETS):
+    raise ValueError(f"ODDS_GAME_MARKETS must be some of {', '.join(SCANNED_GAME_MARKETS)}")
 
-    return {
-        "confidence": confidence,
-        "tier": tier,
-        "recommendation": recommendation,
-        "signals": signals,
-        "top_signals": sorted(signals.items(), key=lambda x: x[1]["score"] * SIGNAL_WEIGHTS.get(x[0], 1), reverse=True)[:3]
-    }
+# Per-call cap in seconds; a request deadline can only shorten it
+UPSTREAM_TIMEOUT = float(os.getenv("UPSTREAM_TIMEOUT", "8"))
 
 # ============================================================================
 # API ENDPOINTS
@@ -4640,11 +129,11 @@ def calculate_main_confidence(game_data: dict, context: dict = None) -> dict:
 @router.get("/today-energy")
 async def get_today_energy():
     """Get today's esoteric reading"""
-    date = datetime.now()
+    today = get_day_context()
     return {
-        "date_numerology": calculate_date_numerology(date),
-        "moon_phase": get_moon_phase(),
-        "daily_energy": get_daily_energy(date),
+        "date_numerology": today["date_numerology"],
+        "moon_phase": today["moon_phase"],
+        "daily_energy": today["daily_energy"],
         "immortal_status": validate_2178()["status"]
     }
 
@@ -4681,6 +170,81 @@ async def calculate_ciphers_endpoint(data: dict):
         "jarvis_check": {cipher: check_jarvis_trigger(val) for cipher, val in get_all_ciphers(text).items()}
     }
 
+def parse_choices(value: Optional[str], allowed: tuple, label: str) -> Optional[list]:
+    """Comma-separated query value -> list of allowed choices (None when absent)"""
+    if not value:
+        return None
+    chosen = [item.strip().lower() for item in value.split(",") if item.strip()]
+    unknown = [item for item in chosen if item not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown {label}: {', '.join(unknown)} (one of {', '.join(allowed)})")
+    return chosen
+
+
+@router.get("/gematria/lookup")
+async def gematria_lookup(
+    value: Optional[int] = None,
+    low: Optional[int] = None,
+    high: Optional[int] = None,
+    trigger: Optional[int] = None,
+    date: Optional[str] = None,
+    cipher: Optional[str] = None,
+    kind: Optional[str] = None,
+    match: Optional[str] = None,
+    limit: int = 200
+):
+    """
+    Reverse gematria: which teams, aliases, star players and Odds API
+    participants have a cipher value. One of:
+    - value=33            exact value
+    - low=100&high=120    value range
+    - trigger=2178        names firing a Jarvis trigger (match=direct,divisible,reduction)
+    - date=2026-01-09     names equal to one of the date's numerology formats
+
+    cipher=ordinal,jewish and kind=team,player narrow the search.
+    """
+    if sum(param is not None for param in (value, trigger, date)) + (low is not None or high is not None) != 1:
+        raise HTTPException(status_code=400, detail="Give exactly one of value, low/high, trigger or date")
+    ciphers = parse_choices(cipher, CIPHER_NAMES, "cipher") or CIPHER_NAMES
+    kinds = set(parse_choices(kind, ENTITY_KINDS, "kind") or ())
+    await sync_gematria_index()
+    limit = max(1, limit)
+
+    query = {}
+    if value is not None:
+        rows, count = gematria_index.lookup(value, ciphers, kinds, limit)
+        query["value"] = value
+    elif trigger is not None:
+        if trigger not in JARVIS_TRIGGERS:
+            raise HTTPException(status_code=400, detail=f"Not a Jarvis trigger: {trigger} (one of {list(JARVIS_TRIGGERS)})")
+        matches = parse_choices(match, MATCH_KINDS, "match") or MATCH_KINDS
+        rows, count = gematria_index.triggered(trigger, ciphers, matches, kinds, limit)
+        query.update({"trigger": trigger, "name": JARVIS_TRIGGERS[trigger]["name"], "match": list(matches)})
+    elif date is not None:
+        numerology = calculate_date_numerology(datetime.strptime(parse_backtest_date(date), "%Y-%m-%d"))
+        rows, count = [], 0
+        for fmt, fmt_value in numerology["formats"].items():
+            fmt_rows, fmt_count = gematria_index.lookup(fmt_value, ciphers, kinds, limit - len(rows))
+            rows += [{**row, "date_format": fmt} for row in fmt_rows]
+            count += fmt_count
+        query.update({"date": numerology["date"], "formats": numerology["formats"]})
+    else:
+        low = low if low is not None else 0
+        high = high if high is not None else low
+        if low > high:
+            raise HTTPException(status_code=400, detail="low is greater than high")
+        rows, count = gematria_index.value_range(low, high, ciphers, kinds, limit)
+        query.update({"min": low, "max": high})
+
+    return {
+        **query,
+        "ciphers": list(ciphers),
+        "count": count,
+        "matches": rows,
+        "index": gematria_index.stats()
+    }
+
+
 @router.post("/date-numerology")
 async def date_numerology_endpoint(data: dict):
     """Calculate date numerology"""
@@ -4733,14 +297,14 @@ async def life_path_sync_endpoint(data: dict):
 async def get_star_players():
     """Get list of star players with birthdates in our database"""
     return {
-        "total_players": len(STAR_PLAYER_BIRTHDATES),
+        "total_players": len(tables.STAR_PLAYER_BIRTHDATES),
         "players": [
             {
                 "name": name,
                 "birthdate": f"{month}/{day}/{year}",
                 "life_path": calculate_life_path_number(year, month, day)
             }
-            for name, (year, month, day) in STAR_PLAYER_BIRTHDATES.items()
+            for name, (year, month, day) in tables.STAR_PLAYER_BIRTHDATES.items()
         ]
     }
 
@@ -4748,14 +312,14 @@ async def get_star_players():
 async def get_franchise_dates():
     """Get list of all franchise founding dates"""
     return {
-        "total_franchises": len(FRANCHISE_FOUNDING_DATES),
+        "total_franchises": len(tables.FRANCHISE_FOUNDING_DATES),
         "franchises": [
             {
                 "team": team,
                 "founded": f"{month}/{day}/{year}",
                 "years_since": datetime.now().year - year
             }
-            for team, (year, month, day) in FRANCHISE_FOUNDING_DATES.items()
+            for team, (year, month, day) in tables.FRANCHISE_FOUNDING_DATES.items()
         ]
     }
 
@@ -4893,9 +457,9 @@ async def scalar_savant_status():
             "schumann_spike": get_schumann_resonance(now),
             "planetary_aspects": get_planetary_aspects(now)
         },
-        "team_colors_db": len(TEAM_COLORS),
-        "star_player_tiers": len(STAR_PLAYER_TIERS),
-        "ref_crews_tracked": len(REF_CREW_HOME_BIAS),
+        "team_colors_db": len(tables.TEAM_COLORS),
+        "star_player_tiers": len(tables.STAR_PLAYER_TIERS),
+        "ref_crews_tracked": len(tables.REF_CREW_HOME_BIAS),
         "message": "Deep glitch modules operational. The abyss awaits."
     }
 
@@ -5043,7 +607,7 @@ async def omni_glitch_status():
             "atmospheric_drag": {
                 "status": "ACTIVE",
                 "description": "Barometric Pressure Effects",
-                "venues_tracked": len(VENUE_ATMOSPHERICS)
+                "venues_tracked": len(tables.VENUE_ATMOSPHERICS)
             },
             "void_of_course_moon": {
                 "status": "ACTIVE",
@@ -5188,6 +752,79 @@ async def gann_physics_composite_endpoint(data: dict):
         recent_wl_results=data.get("recent_wl_results")
     )
 
+# sport -> (games snapshot version, results store seq, scan response)
+GANN_SCANS = {}
+
+
+def gann_scan_entries(games: list, sport: str) -> list:
+    """Both sides of every slate game, with their current spread and results-store form"""
+    entries = []
+    for game in games:
+        spread = extract_game_lines(game)["spread"]
+        for side, opponent, sign in (("home_team", "away_team", 1), ("away_team", "home_team", -1)):
+            team = game.get(side)
+            if not team:
+                continue
+            form = results_store.team_form(sport, team)
+            entries.append({
+                "team_name": team,
+                "opponent": game.get(opponent),
+                "event_id": game.get("id"),
+                "commence_time": game.get("commence_time"),
+                "current_spread": sign * spread if spread is not None else None,
+                "has_results": form is not None,
+                **(form or {})
+            })
+    return entries
+
+
+@router.get("/gann-physics/scan/{sport}")
+async def gann_physics_scan(sport: str, min_signals: int = 0, limit: int = 50):
+    """
+    GANN PHYSICS LEAGUE SCAN - all three laws for every team on the slate
+
+    Last-game margin and ATS / W-L sequences come from the results store
+    (POST /live/results), current spreads from the games snapshot. Ranked by
+    active laws, then composite strength; cached until the snapshot or the
+    results change.
+    """
+    sport = sport.lower()
+    if sport not in GAME_SPORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+    snap = await load_snapshot("games", sport)
+    if snap is None:
+        raise HTTPException(status_code=503, detail="Failed to fetch odds")
+    await asyncio.to_thread(results_store.sync)
+
+    seq = results_store.stats()["seq"]
+    cached = GANN_SCANS.get(sport)
+    if cached is not None and snap["version"] is not None and cached[:2] == (snap["version"], seq):
+        scan, hit = cached[2], True
+    else:
+        with span("gann_scan"):
+            rows = await asyncio.to_thread(scan_gann_physics, gann_scan_entries(snap["payload"]["games"], sport))
+        scan = {
+            "sport": sport,
+            "snapshot_version": snap["version"],
+            "results_seq": seq,
+            "scanned_at": datetime.now().isoformat(),
+            "teams_scanned": len(rows),
+            "teams_with_results": sum(row["has_results"] for row in rows),
+            "rows": rows
+        }
+        if snap["version"] is not None:
+            GANN_SCANS[sport] = (snap["version"], seq, scan)
+        hit = False
+
+    rows = [row for row in scan["rows"] if row["composite"]["signal_count"] >= min_signals]
+    return {
+        **stale_metadata(snap),
+        **{key: value for key, value in scan.items() if key != "rows"},
+        "cached": hit,
+        "signals": rows[:max(1, limit)]
+    }
+
+
 @router.get("/gann-physics-status")
 async def gann_physics_status():
     """
@@ -5351,6 +988,101 @@ async def noosphere_composite_endpoint(data: dict):
         player_queries=data.get("player_queries")
     )
 
+NOOSPHERE_INGEST_CHUNK = 500
+
+
+async def ndjson_chunks(request: Request, size: int):
+    """Parsed NDJSON lines of a streamed body, size at a time (bad lines -> their text)"""
+    chunk, buffer = [], b""
+    async for data in request.stream():
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                try:
+                    chunk.append(json.loads(line))
+                except ValueError:
+                    chunk.append(line.decode("utf-8", "replace"))
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if buffer.strip():
+        try:
+            chunk.append(json.loads(buffer))
+        except ValueError:
+            chunk.append(buffer.decode("utf-8", "replace"))
+    if chunk:
+        yield chunk
+
+
+@router.post("/noosphere/ingest")
+async def noosphere_ingest(request: Request):
+    """
+    Ingest timestamped search-volume observations (see noosphere_stream.py).
+
+    Body: {"observations": [{"team": "Lakers", "volume": 140, "ts": "2026-01-09T18:00:00Z",
+    "has_news": false}, {"player": "LeBron James", "volume": 95, "queries": ["lebron ankle"]}]}
+    or, with Content-Type: application/x-ndjson, one observation per line
+    (applied in chunks as the stream arrives).
+    """
+    totals = {"received": 0, "applied": 0, "entities_updated": 0, "rejected": 0, "rejected_sample": [], "active_signals": []}
+
+    def add(result: dict, offset: int):
+        for key in ("received", "applied", "entities_updated", "rejected"):
+            totals[key] += result[key]
+        totals["rejected_sample"] += [{**entry, "index": entry["index"] + offset} for entry in result["rejected_sample"]]
+        totals["active_signals"] = sorted(set(totals["active_signals"]) | set(result["active_signals"]))
+
+    if "ndjson" in request.headers.get("content-type", ""):
+        async for chunk in ndjson_chunks(request, NOOSPHERE_INGEST_CHUNK):
+            add(await asyncio.to_thread(noosphere_stream.ingest, chunk), totals["received"])
+    else:
+        try:
+            data = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="JSON body required")
+        observations = data.get("observations") if isinstance(data, dict) else data
+        if not isinstance(observations, list):
+            raise HTTPException(status_code=400, detail="observations list required")
+        add(await asyncio.to_thread(noosphere_stream.ingest, observations), 0)
+
+    totals["rejected_sample"] = totals["rejected_sample"][:10]
+    return {**totals, "stream": noosphere_stream.stats()}
+
+
+@router.get("/noosphere/baselines")
+async def noosphere_baselines(kind: Optional[str] = None, name: Optional[str] = None):
+    """Rolling baselines and the current Noosphere result per team / player"""
+    if kind is not None and kind not in ("team", "player"):
+        raise HTTPException(status_code=400, detail="kind must be team or player")
+    await asyncio.to_thread(noosphere_stream.sync)
+    if name:
+        entry = noosphere_stream.get(kind or "team", name)
+        if entry is None:
+            raise HTTPException(status_code=404, detail=f"No baseline for {name}")
+        return entry
+    entries = sorted(noosphere_stream.entries(kind), key=lambda entry: (entry["kind"], entry["name"]))
+    return {
+        "stream": noosphere_stream.stats(),
+        "entities": [
+            {
+                "kind": entry["kind"],
+                "name": entry["name"],
+                "volume": entry["volume"],
+                "baseline": round(entry["mean"], 2),
+                "stddev": round(entry["var"] ** 0.5, 2),
+                "observations": entry["n"],
+                "z_score": entry["z_score"],
+                "active_signals": entry["noosphere_data"]["active_signals"],
+                "noosphere_score": entry["noosphere_data"]["composite"]["noosphere_score"],
+                "live": noosphere_stream.live(entry),
+                "updated_at": datetime.fromtimestamp(entry["ts"]).isoformat()
+            }
+            for entry in entries
+        ]
+    }
+
+
 @router.get("/noosphere/status")
 async def noosphere_status():
     """
@@ -5398,7 +1130,7 @@ async def noosphere_status():
             "DUAL_SIGNAL": "Two signals aligned (1.25x boost)",
             "FULL_NOOSPHERE": "All three active (maximum information asymmetry)"
         },
-        "teams_tracked": len(TEAM_BASELINE_VOLUMES) - 1,  # Exclude 'default'
+        "teams_tracked": len(tables.TEAM_BASELINE_VOLUMES) - 1,  # Exclude 'default'
         "message": "The Global Mind sees what oddsmakers don't. Someone always knows."
     }
 
@@ -5406,7 +1138,7 @@ async def noosphere_status():
 async def get_team_colors_endpoint():
     """Get all team colors in database"""
     return {
-        "total_teams": len(TEAM_COLORS),
+        "total_teams": len(tables.TEAM_COLORS),
         "teams": [
             {
                 "team": team,
@@ -5414,342 +1146,1436 @@ async def get_team_colors_endpoint():
                 "secondary": colors["secondary"],
                 "accent": colors["accent"]
             }
-            for team, colors in TEAM_COLORS.items()
+            for team, colors in tables.TEAM_COLORS.items()
+        ]
+    }
+
+@router.get("/star-tiers")
+async def get_star_tiers_endpoint():
+    """Get all star player protection tiers"""
+    tiers = {5: [], 4: [], 3: [], 2: [], 1: []}
+    for player, tier in tables.STAR_PLAYER_TIERS.items():
+        tiers[tier].append(player)
+
+    return {
+        "total_players": len(tables.STAR_PLAYER_TIERS),
+        "tiers": {
+            "tier_5_maximum": tiers[5],
+            "tier_4_high": tiers[4],
+            "tier_3_moderate": tiers[3],
+            "tier_2_some": tiers[2]
+        }
+    }
+
+# ============================================================================
+# STANDALONE ESOTERIC EDGE ENDPOINT (v10.2 NEW)
+# ============================================================================
+
+@router.post("/esoteric-edge")
+async def esoteric_edge_endpoint(data: dict):
+    """
+    STANDALONE ESOTERIC EDGE ANALYSIS
+
+    Complete gematria/numerology breakdown for any matchup.
+    This is its own feature - click to explore the cosmic alignments.
+    """
+    home_team = data.get("home_team", "")
+    away_team = data.get("away_team", "")
+
+    if not home_team or not away_team:
+        raise HTTPException(status_code=400, detail="home_team and away_team required")
+
+    return calculate_standalone_esoteric(
+        home_team=home_team,
+        away_team=away_team,
+        spread=data.get("spread"),
+        total=data.get("total"),
+        player_name=data.get("player_name"),
+        jersey_number=data.get("jersey_number"),
+        prop_line=data.get("prop_line"),
+        sport=data.get("sport", "NBA"),
+        game_date=datetime.fromisoformat(data["game_date"]) if data.get("game_date") else None
+    )
+
+# ============================================================================
+# CONFLUENCE ALERT ENDPOINT (v10.2 NEW)
+# ============================================================================
+
+@router.post("/confluence-alert")
+async def confluence_alert_endpoint(data: dict):
+    """
+    Check for confluence between research model and esoteric edge.
+    Informational only - helps users see when both systems align.
+    """
+    return check_confluence_alert(
+        main_confidence=data.get("main_confidence", 50),
+        main_pick=data.get("main_pick", ""),
+        esoteric_score=data.get("esoteric_score", 50),
+        esoteric_pick=data.get("esoteric_pick", "")
+    )
+
+# ============================================================================
+# MAIN ENDPOINTS WITH CONFLUENCE ALERTS
+# ============================================================================
+
+
+async def slate_noosphere(teams: list, players: list = ()) -> dict:
+    """Stored Noosphere results (noosphere_stream) for a slate's teams and players"""
+    with span("noosphere"):
+        await asyncio.to_thread(noosphere_stream.sync)
+        return noosphere_stream.noosphere_for(set(teams), set(players))
+
+
+async def slate_steam(games: list) -> dict:
+    """Stored steam-move signals (line_history) for a slate's games"""
+    with span("steam"):
+        await asyncio.to_thread(line_history.sync)
+        return line_history.steam_for(game.get("id") for game in games)
+
+
+async def score_slate_games(games: list, sport: str, deadline: Deadline = None) -> list:
+    """
+    Score a game slate on the scoring executor (503 when it is saturated).
+    Games not scored before the deadline come back as None.
+    """
+    context = {
+        "noosphere": await slate_noosphere([game.get("home_team") for game in games]),
+        "steam": await slate_steam(games)
+    }
+    try:
+        with span("score"):
+            return await scoring_executor.score_games(games, sport, deadline, context)
+    except ScoringBackpressureError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+async def score_slate_props(items: list, sport: str, deadline: Deadline = None) -> list:
+    """
+    Score prop outcomes on the scoring executor (503 when it is saturated).
+    Outcomes not scored before the deadline come back as None.
+    """
+    context = {
+        "noosphere": await slate_noosphere([item[2] for item in items], [item[0].get("description") for item in items])
+    }
+    try:
+        with span("score"):
+            return await scoring_executor.score_props(items, sport, deadline, context)
+    except ScoringBackpressureError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+UPSTREAM_DURATION = registry.histogram(
+    "odds_api_request_duration_seconds", "Odds API call latency per path", ("path", "sport")
+)
+UPSTREAM_RESPONSES = registry.counter(
+    "odds_api_responses_total",
+    "Odds API call outcomes: HTTP status code, or timeout / error / deadline / circuit_open",
+    ("path", "sport", "status")
+)
+
+
+async def record_upstream_call(
+    path: str,
+    sport_key: str,
+    markets: str,
+    status,
+    elapsed: float,
+    resp: httpx.Response = None
+):
+    """Ledger entry for one Odds API call; persists the buffered batch when it is full"""
+    request = current_request()
+    entry = upstream_ledger.record(
+        path, sport_key, markets, status, elapsed * 1000,
+        len(resp.content) if resp is not None else 0,
+        resp.headers if resp is not None else None,
+        request.id if request is not None else None
+    )
+    if request is not None:
+        request.add_upstream(entry)
+    if upstream_ledger.flush_due:
+        await asyncio.to_thread(upstream_ledger.flush)
+
+
+async def upstream_get(
+    client: httpx.AsyncClient,
+    path_key: str,
+    url: str,
+    params: dict,
+    deadline: Deadline = None
+) -> Optional[httpx.Response]:
+    """
+    GET through the circuit breaker for path_key. Returns None when the
+    circuit is open, the call errors, upstream answers non-200, or the
+    deadline runs out (the call timeout is capped at what is left of it).
+    """
+    path, _, sport_key = path_key.partition(":")
+    if deadline is not None and deadline.expired():
+        UPSTREAM_RESPONSES.inc(path, sport_key, "deadline")
+        return None
+    breaker = upstream_breakers.get(path_key)
+    if not breaker.allow():
+        UPSTREAM_RESPONSES.inc(path, sport_key, "circuit_open")
+        return None
+    markets = params.get("markets", "")
+    started = time.perf_counter()
+    try:
+        with span(f"upstream.{path}"):
+            if deadline is None:
+                resp = await client.get(url, params=params)
+            else:
+                # httpx timeouts are per phase (connect/read/...); wait_for bounds the whole call
+                timeout = deadline.timeout(UPSTREAM_TIMEOUT)
+                resp = await asyncio.wait_for(client.get(url, params=params, timeout=timeout), timeout=timeout)
+    except (httpx.TimeoutException, asyncio.TimeoutError) as e:
+        elapsed = time.perf_counter() - started
+        UPSTREAM_DURATION.observe(elapsed, path, sport_key)
+        if deadline is not None and deadline.expired():
+            # Our budget ran out, not upstream's - no verdict for the breaker
+            breaker.release()
+            UPSTREAM_RESPONSES.inc(path, sport_key, "deadline")
+            await record_upstream_call(path, sport_key, markets, "deadline", elapsed)
+        else:
+            breaker.record_failure(type(e).__name__)
+            UPSTREAM_RESPONSES.inc(path, sport_key, "timeout")
+            await record_upstream_call(path, sport_key, markets, "timeout", elapsed)
+        return None
+    except httpx.HTTPError as e:
+        elapsed = time.perf_counter() - started
+        UPSTREAM_DURATION.observe(elapsed, path, sport_key)
+        UPSTREAM_RESPONSES.inc(path, sport_key, "error")
+        breaker.record_failure(type(e).__name__)
+        await record_upstream_call(path, sport_key, markets, "error", elapsed)
+        return None
+    except BaseException:
+        breaker.release()
+        raise
+    elapsed = time.perf_counter() - started
+    UPSTREAM_DURATION.observe(elapsed, path, sport_key)
+    UPSTREAM_RESPONSES.inc(path, sport_key, resp.status_code)
+    await record_upstream_call(path, sport_key, markets, resp.status_code, elapsed, resp)
+    if resp.status_code != 200:
+        breaker.record_failure(f"HTTP {resp.status_code}")
+        return None
+    breaker.record_success()
+    return resp
+
+
+async def fetch_events(client: httpx.AsyncClient, sport_key: str, deadline: Deadline = None) -> Optional[list]:
+    """Fetch upcoming events for a sport. Returns None on upstream failure."""
+    resp = await upstream_get(
+        client, f"events:{sport_key}",
+        f"{ODDS_API_BASE}/sports/{sport_key}/events",
+        {"apiKey": ODDS_API_KEY, "dateFormat": "iso"},
+        deadline
+    )
+    if resp is None:
+        return None
+    with span("decode"):
+        return resp.json()
+
+
+async def fetch_event_props(
+    client: httpx.AsyncClient,
+    sport_key: str,
+    event_id: str,
+    deadline: Deadline = None
+) -> Optional[dict]:
+    """Fetch player prop odds for one event. Returns None on upstream failure."""
+    resp = await upstream_get(
+        client, f"event_odds:{sport_key}",
+        f"{ODDS_API_BASE}/sports/{sport_key}/events/{event_id}/odds",
+        {
+            "apiKey": ODDS_API_KEY,
+            "regions": "us",
+            "markets": PROP_MARKETS,
+            "oddsFormat": "american"
+        },
+        deadline
+    )
+    if resp is None:
+        return None
+    with span("decode"):
+        return resp.json()
+
+
+async def fetch_game_odds(client: httpx.AsyncClient, sport_key: str, deadline: Deadline = None) -> Optional[list]:
+    """Fetch ODDS_GAME_MARKETS for every game of a sport. Returns None on upstream failure."""
+    resp = await upstream_get(
+        client, f"odds:{sport_key}",
+        f"{ODDS_API_BASE}/sports/{sport_key}/odds",
+        {
+            "apiKey": ODDS_API_KEY,
+            "regions": "us",
+            "markets": ",".join(ODDS_GAME_MARKETS),
+            "oddsFormat": "american"
+        },
+        deadline
+    )
+    if resp is None:
+        return None
+    with span("decode"):
+        return resp.json()
+
+
+async def fetch_scores(client: httpx.AsyncClient, sport_key: str, days_from: int) -> Optional[list]:
+    """Fetch live and completed games of the last days_from days. Returns None on upstream failure."""
+    resp = await upstream_get(
+        client, f"scores:{sport_key}",
+        f"{ODDS_API_BASE}/sports/{sport_key}/scores",
+        {"apiKey": ODDS_API_KEY, "daysFrom": days_from, "dateFormat": "iso"}
+    )
+    if resp is None:
+        return None
+    with span("decode"):
+        return resp.json()
+
+
+def skipped_event(event: dict, reason: str) -> dict:
+    """skipped_events entry: which event was left out and why ("deadline" / "upstream_failed")"""
+    return {
+        "id": event.get("id"),
+        "home_team": event.get("home_team"),
+        "away_team": event.get("away_team"),
+        "commence_time": event.get("commence_time"),
+        "reason": reason
+    }
+
+
+async def fetch_props_for_events(
+    client: httpx.AsyncClient,
+    sport_key: str,
+    events: list,
+    deadline: Deadline = None
+) -> tuple:
+    """
+    Fetch props for every event concurrently -> ({event_index: props_data}, {event_index: skipped}).
+    Calls still out when the deadline expires are cancelled.
+    """
+    tasks = [
+        asyncio.ensure_future(fetch_event_props(client, sport_key, event.get("id"), deadline))
+        for event in events
+    ]
+    if not tasks:
+        return {}, {}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=deadline.remaining() if deadline else None)
+    finally:
+        for task in tasks:
+            task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    props_by_event = {}
+    skipped = {}
+    for idx, (event, task) in enumerate(zip(events, tasks)):
+        props_data = task.result() if task in done else None
+        if props_data is not None:
+            props_by_event[idx] = props_data
+        elif task not in done or (deadline is not None and deadline.expired()):
+            skipped[idx] = skipped_event(event, "deadline")
+        else:
+            skipped[idx] = skipped_event(event, "upstream_failed")
+    return props_by_event, skipped
+
+
+async def score_event_props(
+    events: list,
+    props_by_event: dict,
+    sport: str,
+    deadline: Deadline = None
+) -> tuple:
+    """
+    Score fetched props -> ([[event_index, prop_row, main_result], ...], {event_index: skipped}).
+    An event with any outcome left unscored at the deadline is dropped whole.
+    """
+    items = []
+    event_index = []
+    for idx, props_data in sorted(props_by_event.items()):
+        event_items = collect_prop_outcomes(events[idx], props_data)
+        items.extend(event_items)
+        event_index.extend([idx] * len(event_items))
+
+    scored = await score_slate_props(items, sport, deadline)
+    unscored = {idx for idx, result in zip(event_index, scored) if result is None}
+    entries = [
+        [idx, result[0], result[1]]
+        for idx, result in zip(event_index, scored)
+        if idx not in unscored
+    ]
+    return entries, {idx: skipped_event(events[idx], "deadline") for idx in unscored}
+
+
+# ============================================================================
+# SHARED SNAPSHOTS - one elected poller fetches + scores, every worker reads
+# ============================================================================
+
+SNAPSHOT_SPORTS = [s.strip() for s in os.getenv("SNAPSHOT_SPORTS", "nba,nfl,mlb,nhl").split(",") if s.strip()]
+SNAPSHOT_MAX_AGE = float(os.getenv("SNAPSHOT_MAX_AGE", "300"))
+# A worker refreshing on a miss holds the "refresh:<kind>:<sport>" lease; the
+# others poll for the version it publishes every SNAPSHOT_REFRESH_POLL seconds
+SNAPSHOT_REFRESH_LEASE_TTL = float(os.getenv("SNAPSHOT_REFRESH_LEASE_TTL", "60"))
+SNAPSHOT_REFRESH_POLL = float(os.getenv("SNAPSHOT_REFRESH_POLL", "0.1"))
+# Budget of one shared refresh (fetch + score), whoever triggered it
+SNAPSHOT_REFRESH_DEADLINE_MS = int(os.getenv("SNAPSHOT_REFRESH_DEADLINE_MS", "20000"))
+PROPS_SNAPSHOT_EVENTS = 5
+
+
+def check_deadline(deadline: Optional[Deadline]):
+    """Raise DeadlineExceeded if deadline (None = unbounded) has run out"""
+    if deadline is not None and deadline.expired():
+        raise DeadlineExceeded(f"Deadline of {deadline.budget_ms} ms exceeded")
+
+
+async def publish_snapshot(kind: str, sport: str, payload: dict) -> dict:
+    """
+    Store a refreshed payload as the shared (kind, sport) snapshot. A payload
+    the deadline cut short is returned unpublished, marked {"partial": True}.
+    """
+    snap = {"key": f"{kind}:{sport}", "version": None, "fetched_at": time.time(), "payload": payload}
+    if any(entry["reason"] == "deadline" for entry in payload["skipped"]):
+        return {**snap, "partial": True}
+    snap["version"] = await asyncio.to_thread(shared_cache.put_snapshot, snap["key"], payload)
+    memory_accounting.enforce_caps()
+    gematria_index.add_participants(snapshot_participants(kind, payload), snap["key"], snap["version"])
+    return snap
+
+
+def snapshot_participants(kind: str, payload: dict) -> list:
+    """Team and player names in a snapshot payload, for the gematria index"""
+    names = []
+    for event in payload.get("games" if kind == "games" else "events", []):
+        names += [event.get("home_team"), event.get("away_team")]
+    if kind == "props":
+        names += [entry[1]["player"] for entry in payload["scored"]]
+    return names
+
+
+async def sync_gematria_index():
+    """
+    Index the reference tables (once) and any snapshot version this worker has
+    not seen. Versions are compared first, so a snapshot is only read (and
+    decoded) when another worker has published a new one.
+    """
+    await asyncio.to_thread(gematria_index.ensure_tables)
+    for sport in SNAPSHOT_SPORTS:
+        for kind, sport_keys in [("games", GAME_SPORT_KEYS), ("props", PROPS_SPORT_KEYS)]:
+            if sport not in sport_keys:
+                continue
+            key = f"{kind}:{sport}"
+            version = await asyncio.to_thread(shared_cache.snapshot_version, key)
+            if version is None or gematria_index.ingested(key, version):
+                continue
+            snap = await asyncio.to_thread(shared_cache.get_snapshot, key)
+            if snap is not None:
+                gematria_index.add_participants(snapshot_participants(kind, snap["payload"]), snap["key"], snap["version"])
+
+
+async def refresh_games_snapshot(sport: str, deadline: Deadline = None) -> Optional[dict]:
+    """
+    Fetch + score a sport's ODDS_GAME_MARKETS and publish them. None on upstream
+    failure, DeadlineExceeded if the odds did not arrive in time.
+    """
+    fetch_deadline = deadline and deadline.for_upstream()
+    async with httpx.AsyncClient(timeout=UPSTREAM_TIMEOUT) as client:
+        games = await fetch_game_odds(client, GAME_SPORT_KEYS[sport], fetch_deadline)
+    if games is None:
+        check_deadline(fetch_deadline)
+        return None
+
+    with span("line_history"):
+        await asyncio.to_thread(line_history.record, sport, games)
+    with span("clv"):
+        await asyncio.to_thread(lambda: clv_tracker.capture(sport, "games", game_closing_quotes(games)))
+    scored = await score_slate_games(games, sport, deadline)
+    with span("market_scan"):
+        market_scan = await asyncio.to_thread(scan_market_lines, games)
+    payload = {
+        "sport": sport,
+        "games": games,
+        "scored": [result for result in scored if result is not None],
+        "skipped": [skipped_event(game, "deadline") for game, result in zip(games, scored) if result is None],
+        "market_scan": market_scan
+    }
+    return await publish_snapshot("games", sport, payload)
+
+
+async def refresh_props_snapshot(sport: str, deadline: Deadline = None) -> Optional[dict]:
+    """
+    Fetch + score player props for the first PROPS_SNAPSHOT_EVENTS events and
+    publish them. Scored entries are [event_index, prop_row, main_result].
+    Later events with open prop picks inside the CLV close lead are fetched
+    too, for their closes only. None on upstream failure, DeadlineExceeded if
+    the events did not arrive in time.
+    """
+    sport_key = PROPS_SPORT_KEYS[sport]
+    fetch_deadline = deadline and deadline.for_upstream()
+    async with httpx.AsyncClient(timeout=UPSTREAM_TIMEOUT) as client:
+        events = await fetch_events(client, sport_key, fetch_deadline)
+        if events is None:
+            check_deadline(fetch_deadline)
+            return None
+        closing = set(await asyncio.to_thread(clv_tracker.closing_events, sport, "props"))
+        close_events = [event for event in events[PROPS_SNAPSHOT_EVENTS:] if event.get("id") in closing]
+        fetched, skipped = await fetch_props_for_events(
+            client, sport_key, events[:PROPS_SNAPSHOT_EVENTS] + close_events, fetch_deadline
+        )
+    props_by_event = {idx: props_data for idx, props_data in fetched.items() if idx < PROPS_SNAPSHOT_EVENTS}
+    close_props = [
+        (close_events[idx - PROPS_SNAPSHOT_EVENTS], props_data)
+        for idx, props_data in fetched.items() if idx >= PROPS_SNAPSHOT_EVENTS
+    ]
+    skipped = {idx: entry for idx, entry in skipped.items() if idx < PROPS_SNAPSHOT_EVENTS}
+
+    # Events listed but not one props call got through - an outage, not an empty slate
+    if events and not props_by_event and all(entry["reason"] == "upstream_failed" for entry in skipped.values()):
+        return None
+
+    scored, unscored = await score_event_props(events, props_by_event, sport, deadline)
+    skipped.update(unscored)
+    with span("clv"):
+        await asyncio.to_thread(lambda: clv_tracker.capture(
+            sport, "props", {**event_prop_quotes(close_props), **prop_closing_quotes(events, scored)}
+        ))
+    with span("market_scan"):
+        market_scan = await asyncio.to_thread(
+            scan_market_lines, (), [(events[idx], props_data) for idx, props_data in sorted(props_by_event.items())]
+        )
+    payload = {
+        "sport": sport,
+        "event_count": len(events),
+        "events": events[:PROPS_SNAPSHOT_EVENTS],
+        "scored": scored,
+        "skipped": [skipped[idx] for idx in sorted(skipped)],
+        "market_scan": market_scan
+    }
+    return await publish_snapshot("props", sport, payload)
+
+
+async def refresh_or_wait(kind: str, sport: str, deadline: Deadline = None) -> Optional[dict]:
+    """
+    Refresh (kind, sport) under the host-wide refresh lease. While another
+    worker holds it, wait for the version that worker publishes instead of
+    fetching too; if it lets go without publishing (upstream failure, partial
+    slate), take the lease and refresh here.
+    """
+    key = f"{kind}:{sport}"
+    lease = f"refresh:{key}"
+    refresh = refresh_games_snapshot if kind == "games" else refresh_props_snapshot
+    seen = await asyncio.to_thread(shared_cache.snapshot_version, key)
+    while True:
+        if await asyncio.to_thread(shared_cache.try_acquire_lease, lease, WORKER_ID, SNAPSHOT_REFRESH_LEASE_TTL):
+            try:
+                if await asyncio.to_thread(shared_cache.snapshot_version, key) != seen:
+                    # Published between our miss and the lease - nothing left to fetch
+                    return await asyncio.to_thread(shared_cache.get_snapshot, key)
+                return await refresh(sport, deadline)
+            finally:
+                await asyncio.to_thread(shared_cache.release_lease, lease)
+
+        with span("refresh_wait"):
+            while True:
+                check_deadline(deadline)
+                poll = SNAPSHOT_REFRESH_POLL if deadline is None else min(SNAPSHOT_REFRESH_POLL, deadline.remaining())
+                await asyncio.sleep(poll)
+                if await asyncio.to_thread(shared_cache.snapshot_version, key) != seen:
+                    return await asyncio.to_thread(shared_cache.get_snapshot, key)
+                if await asyncio.to_thread(shared_cache.lease_holder, lease) is None:
+                    break
+
+
+# key -> (in-flight refresh task, its stage trace), so concurrent misses in one worker share a fetch
+SNAPSHOT_REFRESHES = {}
+
+
+def finish_refresh(key: str, trace: Trace):
+    SNAPSHOT_REFRESHES.pop(key, None)
+    route_timings.record(f"snapshot:{key}", trace)
+
+
+async def refresh_snapshot(kind: str, sport: str, deadline: Deadline = None) -> Optional[dict]:
+    """
+    Refresh (kind, sport), joining a refresh already running in this worker
+    (and, through refresh_or_wait, one running in another worker).
+    The refresh itself is shared, so it runs under the server-side
+    SNAPSHOT_REFRESH_DEADLINE_MS, never a caller's budget: a caller's deadline
+    only bounds its own wait (DeadlineExceeded), and the refresh carries on
+    to publish for whoever asks next.
+
+    The refresh is timed on its own trace (recorded as "snapshot:<kind>:<sport>"
+    in route_timings) and merged into the trace of every caller that waited for it.
+    """
+    key = f"{kind}:{sport}"
+    if key in SNAPSHOT_REFRESHES:
+        task, trace = SNAPSHOT_REFRESHES[key]
+    else:
+        trace = Trace()
+        refresh_deadline = Deadline(SNAPSHOT_REFRESH_DEADLINE_MS)
+        task = asyncio.ensure_future(run_traced(trace, refresh_or_wait(kind, sport, refresh_deadline)))
+        SNAPSHOT_REFRESHES[key] = (task, trace)
+        task.add_done_callback(lambda _: finish_refresh(key, trace))
+
+    if deadline is None:
+        result = await asyncio.shield(task)
+    else:
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), timeout=deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"Deadline of {deadline.budget_ms} ms exceeded")
+
+    caller_trace = current_trace()
+    if caller_trace is not None:
+        caller_trace.merge(trace.spans)
+    return result
+
+
+def snapshot_upstream_paths(kind: str, sport: str) -> list:
+    """Circuit breaker keys a (kind, sport) snapshot refresh depends on"""
+    if kind == "games":
+        return [f"odds:{GAME_SPORT_KEYS[sport]}"]
+    return [f"events:{PROPS_SPORT_KEYS[sport]}", f"event_odds:{PROPS_SPORT_KEYS[sport]}"]
+
+
+def stale_metadata(snap: dict) -> dict:
+    """Response fields flagging a stale snapshot ({} when fresh)"""
+    if not snap.get("stale"):
+        return {}
+    return {
+        "stale_as_of": datetime.fromtimestamp(snap["fetched_at"]).isoformat(),
+        "stale_reason": snap["stale_reason"]
+    }
+
+
+def completeness_metadata(snap: dict) -> dict:
+    """complete / skipped_events response fields for a snapshot"""
+    skipped = snap["payload"].get("skipped", [])
+    return {"complete": not skipped, "skipped_events": skipped}
+
+
+SNAPSHOT_LOOKUPS = registry.counter(
+    "snapshot_lookups_total",
+    "Snapshot reads by outcome: fresh (hit), refreshed / partial (miss), stale, unavailable",
+    ("kind", "sport", "result")
+)
+
+
+async def load_snapshot(kind: str, sport: str, deadline: Deadline = None) -> Optional[dict]:
+    """
+    Fresh shared snapshot for (kind, sport), refreshing it on a miss or when it
+    is older than SNAPSHOT_MAX_AGE (poller down, or sport not polled).
+
+    Upstream outage: while a circuit for the refresh is open the last good
+    snapshot is returned immediately, and if a refresh fails it is returned
+    instead - either way marked {"stale": True, "stale_reason": ...}.
+
+    Deadline: a refresh cut short by SNAPSHOT_REFRESH_DEADLINE_MS returns what
+    it scored ({"partial": True}, skipped events in payload["skipped"]). When
+    the caller's own deadline runs out first, or the refresh got nothing in
+    time, the last snapshot comes back with stale_reason "deadline", or
+    DeadlineExceeded is raised when there is none.
+    """
+    with span("snapshot_read"):
+        snap = await asyncio.to_thread(shared_cache.get_snapshot, f"{kind}:{sport}")
+    if snap is not None and time.time() - snap["fetched_at"] <= SNAPSHOT_MAX_AGE:
+        SNAPSHOT_LOOKUPS.inc(kind, sport, "fresh")
+        return snap
+
+    if snap is not None and any(upstream_breakers.is_open(path) for path in snapshot_upstream_paths(kind, sport)):
+        SNAPSHOT_LOOKUPS.inc(kind, sport, "stale")
+        return {**snap, "stale": True, "stale_reason": "circuit_open"}
+
+    try:
+        fresh = await refresh_snapshot(kind, sport, deadline)
+    except DeadlineExceeded:
+        SNAPSHOT_LOOKUPS.inc(kind, sport, "stale" if snap is not None else "unavailable")
+        if snap is None:
+            raise
+        return {**snap, "stale": True, "stale_reason": "deadline"}
+    if fresh is None and snap is not None:
+        SNAPSHOT_LOOKUPS.inc(kind, sport, "stale")
+        return {**snap, "stale": True, "stale_reason": "upstream_failed"}
+    if fresh is None:
+        SNAPSHOT_LOOKUPS.inc(kind, sport, "unavailable")
+    else:
+        SNAPSHOT_LOOKUPS.inc(kind, sport, "partial" if fresh.get("partial") else "refreshed")
+    return fresh
+
+
+async def poll_snapshots():
+    """Elected-poller job: refresh every polled sport's games and props"""
+    token = bind_initiator("poller")
+    try:
+        for sport in SNAPSHOT_SPORTS:
+            for kind, sport_keys in [("games", GAME_SPORT_KEYS), ("props", PROPS_SPORT_KEYS)]:
+                if sport not in sport_keys:
+                    continue
+                try:
+                    if await refresh_snapshot(kind, sport) is None:
+                        logger.warning("Snapshot refresh %s:%s got no upstream data", kind, sport)
+                except Exception:
+                    logger.exception("Snapshot refresh %s:%s failed", kind, sport)
+            try:
+                await sync_results(sport)
+            except Exception:
+                logger.exception("Results sync %s failed", sport)
+    finally:
+        unbind_initiator(token)
+
+
+snapshot_poller = SnapshotPoller(shared_cache, poll_snapshots)
+
+
+@router.get("/steam/{sport}")
+async def steam_moves(sport: str, event_id: Optional[str] = None):
+    """
+    Steam moves found in the recorded line history (see line_history.py):
+    every event of the sport with one, or one event's signal and full history.
+    """
+    sport = sport.lower()
+    if sport not in GAME_SPORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+    await asyncio.to_thread(line_history.sync)
+    if event_id:
+        history = line_history.history(event_id)
+        if history is None:
+            raise HTTPException(status_code=404, detail=f"No line history for {event_id}")
+        return {"event_id": event_id, **line_history.steam_for([event_id])[event_id], "history": history}
+    events = sorted(line_history.steam_events(sport), key=lambda item: abs(item[1]["score"] - 50), reverse=True)
+    return {
+        "sport": sport,
+        "events": [{"event_id": event_id, **signal} for event_id, signal in events],
+        "line_history": line_history.stats()
+    }
+
+
+MARKET_SCAN_KINDS = ("games", "props")
+
+
+@router.get("/market-scan/{sport}")
+async def market_scan_feed(sport: str, type: Optional[str] = None, kind: Optional[str] = None, limit: int = 25):
+    """
+    Cross-book arbitrage, middles and stale lines across every bookmaker in
+    the games (spreads, totals, moneylines when ODDS_GAME_MARKETS has h2h)
+    and props snapshots. Scanned once per snapshot refresh
+    (engines/market_scan.py); this reads the stored findings.
+
+    type: arbitrage,middles,stale (default all). kind: games,props (default both).
+    """
+    sport = sport.lower()
+    if sport not in GAME_SPORT_KEYS and sport not in PROPS_SPORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+    findings = parse_choices(type, FINDINGS, "type") or list(FINDINGS)
+    kinds = parse_choices(kind, MARKET_SCAN_KINDS, "kind") or list(MARKET_SCAN_KINDS)
+
+    feed = {finding: [] for finding in findings}
+    sources = {}
+    for snapshot_kind, sport_keys in [("games", GAME_SPORT_KEYS), ("props", PROPS_SPORT_KEYS)]:
+        if snapshot_kind not in kinds or sport not in sport_keys:
+            continue
+        snap = await load_snapshot(snapshot_kind, sport)
+        if snap is None:
+            sources[snapshot_kind] = {"available": False}
+            continue
+        scan = snap["payload"].get("market_scan")
+        if scan is None and snapshot_kind == "games":
+            # Published before the scan existed - the games payload has every book, so scan it now
+            scan = await asyncio.to_thread(scan_market_lines, snap["payload"]["games"])
+        sources[snapshot_kind] = {
+            "available": scan is not None,
+            "version": snap["version"],
+            "fetched_at": datetime.fromtimestamp(snap["fetched_at"]).isoformat(),
+            "quotes": scan["quotes"] if scan else 0,
+            **stale_metadata(snap)
+        }
+        for finding in findings:
+            feed[finding] += [{**entry, "kind": snapshot_kind} for entry in (scan or {}).get(finding, [])]
+
+    rank = {"arbitrage": lambda e: -e["profit_pct"], "middles": lambda e: (-e["width"], -e["miss_result"]),
+            "stale": lambda e: -e["severity"]}
+    limit = max(1, limit)
+    return {
+        "sport": sport,
+        "sources": sources,
+        "counts": {finding: len(entries) for finding, entries in feed.items()},
+        **{finding: sorted(entries, key=rank[finding])[:limit] for finding, entries in feed.items()}
+    }
+
+
+# ============================================================================
+# STARTUP WARM-UP - runs from the app lifespan, gates /ready
+# ============================================================================
+
+WARMUP_SNAPSHOT_TIMEOUT = float(os.getenv("WARMUP_SNAPSHOT_TIMEOUT", "60"))
+
+WARMUP_STATE = {
+    "ready": False,
+    "started_at": None,
+    "completed_at": None,
+    "total_ms": None,
+    "steps": []
+}
+
+
+async def run_warmup_step(name: str, step) -> dict:
+    """Run one warm-up step (sync or async callable) and record its timing"""
+    started = time.perf_counter()
+    entry = {"name": name, "status": "ok"}
+    try:
+        result = step()
+        if asyncio.iscoroutine(result):
+            result = await result
+        entry["result"] = result
+    except Exception as e:
+        entry["status"] = "error"
+        entry["error"] = str(e) or type(e).__name__
+    entry["ms"] = round((time.perf_counter() - started) * 1000, 1)
+    WARMUP_STATE["steps"].append(entry)
+    return entry
+
+
+async def warm_initial_snapshot(kind: str, sport: str) -> dict:
+    snap = await asyncio.wait_for(load_snapshot(kind, sport), timeout=WARMUP_SNAPSHOT_TIMEOUT)
+    if snap is None:
+        raise RuntimeError("upstream unavailable")
+    return {"version": snap["version"], "rows": len(snap["payload"]["scored"])}
+
+
+async def run_startup_warmup() -> dict:
+    """
+    Build name indexes, DayContexts for the next 7 days, the cipher cache and
+    the scoring pool, then pull an initial snapshot per sport. Failed steps are
+    recorded but do not block readiness - the app still serves without them.
+    """
+    WARMUP_STATE.update({"ready": False, "started_at": datetime.now().isoformat(), "steps": []})
+    started = time.perf_counter()
+    token = bind_initiator("warmup")
+
+    await run_warmup_step("name_indexes", build_name_indexes)
+    await run_warmup_step("day_contexts", lambda: {"day_contexts": build_day_contexts(7)})
+    await run_warmup_step("cipher_cache", prime_cipher_cache)
+    await run_warmup_step("scoring_pool", lambda: scoring_executor.warm())
+    await run_warmup_step("season_calendar", lambda: load_season_calendar())
+    await run_warmup_step("gematria_index", lambda: asyncio.to_thread(gematria_index.ensure_tables))
+    await run_warmup_step("results_store", lambda: asyncio.to_thread(results_store.sync))
+    await run_warmup_step("line_history", lambda: asyncio.to_thread(line_history.sync))
+
+    for sport in SNAPSHOT_SPORTS:
+        for kind, sport_keys in [("games", GAME_SPORT_KEYS), ("props", PROPS_SPORT_KEYS)]:
+            if sport in sport_keys:
+                await run_warmup_step(f"snapshot:{kind}:{sport}", lambda k=kind, sp=sport: warm_initial_snapshot(k, sp))
+
+    memory_accounting.enforce_caps()
+    unbind_initiator(token)
+    WARMUP_STATE.update({
+        "ready": True,
+        "completed_at": datetime.now().isoformat(),
+        "total_ms": round((time.perf_counter() - started) * 1000, 1)
+    })
+    return WARMUP_STATE
+
+
+@router.get("/cache/status")
+async def cache_status():
+    """Shared snapshot store, elected poller and scoring executor status"""
+    cache_stats = await asyncio.to_thread(shared_cache.stats)
+    poller_stats = await asyncio.to_thread(snapshot_poller.stats)
+    return {
+        "shared_cache": cache_stats,
+        "poller": poller_stats,
+        "scoring_executor": scoring_executor.stats(),
+        "circuits": upstream_breakers.stats(),
+        "snapshot_max_age_seconds": SNAPSHOT_MAX_AGE,
+        "polled_sports": SNAPSHOT_SPORTS
+    }
+
+
+@router.get("/upstream/ledger")
+async def upstream_ledger_summary(
+    sport: str = None,
+    hours: float = 24,
+    persisted: bool = False,
+    recent: int = 0
+):
+    """
+    Odds API calls over the last `hours`, summarized overall and per sport,
+    per sport+market and per initiator - which markets eat quota and time.
+    From this worker's ring buffer by default; persisted=true reads every
+    worker's calls from UPSTREAM_LEDGER_PATH. recent=N adds the last N calls.
+    """
+    since = time.time() - hours * 3600
+    if persisted:
+        if not upstream_ledger.path:
+            raise HTTPException(status_code=400, detail="Ledger persistence is off (UPSTREAM_LEDGER_PATH)")
+        await asyncio.to_thread(upstream_ledger.flush)
+        entries = await asyncio.to_thread(upstream_ledger.load, since)
+    else:
+        entries = upstream_ledger.entries(since)
+    if sport:
+        sport_key = PROPS_SPORT_KEYS.get(sport.lower(), sport)
+        entries = [entry for entry in entries if entry["sport"] == sport_key]
+
+    return {
+        "source": "persisted" if persisted else "worker",
+        "window_hours": hours,
+        "summary": summarize_calls(entries),
+        "recent": entries[-recent:] if recent > 0 else [],
+        "ledger": {"size": upstream_ledger.size, "recorded": upstream_ledger.recorded, "persisted": upstream_ledger.persisted},
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def evict_day_contexts(cap: int):
+    """Drop the oldest DayContexts until the table fits in cap bytes (today's stays)"""
+    while len(DAY_CONTEXTS) > 1 and deep_sizeof(DAY_CONTEXTS) > cap:
+        DAY_CONTEXTS.pop(min(DAY_CONTEXTS), None)
+
+
+memory_accounting.register_cache(
+    "snapshot_decode", shared_cache.decoded_size, lambda: shared_cache.decoded_entries,
+    shared_cache.evict_decoded, shared_cache.decode_cap
+)
+memory_accounting.register_lru_cache("cipher_values", get_cipher_values)
+memory_accounting.register_lru_cache("franchise_names", resolve_franchise_name)
+memory_accounting.register_lru_cache("star_player_names", resolve_star_player_name)
+memory_accounting.register_cache("gematria_index", lambda: deep_sizeof(gematria_index), lambda: len(gematria_index))
+memory_accounting.register_cache(
+    "day_contexts", lambda: deep_sizeof(DAY_CONTEXTS), lambda: len(DAY_CONTEXTS), evict_day_contexts
+)
+for table_name in tables.TABLE_FILES:
+    # vars() so reporting never triggers the lazy load
+    memory_accounting.register_table(table_name, lambda name=table_name: vars(tables).get(name))
+
+
+@router.get("/memory")
+async def memory_status(
+    request: Request,
+    top: int = 20,
+    group_by: str = "lineno",
+    tracemalloc: str = None,
+    frames: int = None
+):
+    """
+    Byte size of each cache and static table, the shared snapshot store,
+    top tracemalloc allocation sites and peak traced memory per slate request.
+    Sizes are for this worker process. Admin: X-Profile header.
+
+    tracemalloc=start|stop turns tracing on or off; frames sets the traceback
+    depth when starting. group_by: lineno, filename or traceback.
+    """
+    require_profiling_secret(request)
+    if tracemalloc is not None:
+        if tracemalloc == "start":
+            start_tracing(frames)
+        elif tracemalloc == "stop":
+            stop_tracing()
+        else:
+            raise HTTPException(status_code=400, detail="tracemalloc must be start or stop")
+    if group_by not in ("lineno", "filename", "traceback"):
+        raise HTTPException(status_code=400, detail="group_by must be lineno, filename or traceback")
+
+    # On the loop: the report walks live caches (DAY_CONTEXTS, lru_cache
+    # internals) that handlers mutate, so it must not run in another thread
+    report = memory_accounting.report()
+    cache_stats = await asyncio.to_thread(shared_cache.stats)
+    allocations = await asyncio.to_thread(top_allocations, top, group_by)
+    return {
+        **report,
+        "snapshot_store": {
+            "path": cache_stats["path"],
+            "bytes": sum(snap["bytes"] for snap in cache_stats["snapshots"]),
+            "snapshots": {snap["key"]: snap["bytes"] for snap in cache_stats["snapshots"]}
+        },
+        "allocations": allocations,
+        "slate_request_peaks": request_memory.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@registry.collector
+def collect_cache_metrics():
+    """Scrape-time metrics for every cache layer, the circuits and the scoring executor"""
+    cache_stats = shared_cache.stats()
+    layers = {
+        "cipher_values": get_cipher_values.cache_info(),
+        "franchise_names": resolve_franchise_name.cache_info(),
+        "star_player_names": resolve_star_player_name.cache_info()
+    }
+    hits = [({"cache": name}, info.hits) for name, info in layers.items()]
+    misses = [({"cache": name}, info.misses) for name, info in layers.items()]
+    entries = [({"cache": name}, info.currsize) for name, info in layers.items()]
+
+    # Shared snapshots: a miss is no row; a decode miss is a row whose JSON had to be parsed
+    found = cache_stats["reads"] - cache_stats["misses"]
+    hits += [({"cache": "shared_snapshots"}, found), ({"cache": "snapshot_decode"}, found - cache_stats["decodes"])]
+    misses += [({"cache": "shared_snapshots"}, cache_stats["misses"]), ({"cache": "snapshot_decode"}, cache_stats["decodes"])]
+    entries += [
+        ({"cache": "shared_snapshots"}, len(cache_stats["snapshots"])),
+        ({"cache": "snapshot_decode"}, cache_stats["decoded_entries"]),
+        ({"cache": "day_contexts"}, len(DAY_CONTEXTS)),
+        ({"cache": "data_tables"}, len(tables.loaded_tables()))
+    ]
+    yield "cache_hits_total", "counter", "Cache hits per cache layer", hits
+    yield "cache_misses_total", "counter", "Cache misses per cache layer", misses
+    yield "cache_entries", "gauge", "Entries held per cache layer", entries
+    yield "shared_snapshot_bytes", "gauge", "Stored snapshot payload size", [
+        ({"key": snap["key"]}, snap["bytes"]) for snap in cache_stats["snapshots"]
+    ]
+    yield "shared_snapshot_age_seconds", "gauge", "Seconds since the snapshot was fetched", [
+        ({"key": snap["key"]}, snap["age_seconds"]) for snap in cache_stats["snapshots"]
+    ]
+    yield "shared_cache_writes_total", "counter", "Snapshots written by this worker", [({}, cache_stats["writes"])]
+    yield "snapshot_poller_leader", "gauge", "1 if this worker holds the poller lease", [
+        ({}, 1 if snapshot_poller.is_leader else 0)
+    ]
+
+    circuits = upstream_breakers.stats()
+    yield "circuit_breaker_open", "gauge", "1 while the upstream path's circuit is open", [
+        ({"path": path}, 0 if stats["state"] == "closed" else 1) for path, stats in circuits.items()
+    ]
+    yield "circuit_breaker_failures_total", "counter", "Failures recorded per upstream path", [
+        ({"path": path}, stats["total_failures"]) for path, stats in circuits.items()
+    ]
+    yield "circuit_breaker_rejections_total", "counter", "Calls rejected while open", [
+        ({"path": path}, stats["total_rejections"]) for path, stats in circuits.items()
+    ]
+
+    executor = scoring_executor.stats()
+    yield "scoring_pending_batches", "gauge", "Scoring batches in flight", [({}, executor["pending_batches"])]
+    yield "scoring_batches_total", "counter", "Batches scored on the process pool", [({}, executor["batches_scored"])]
+    yield "scoring_batches_skipped_total", "counter", "Batches cancelled at a request deadline", [
+        ({}, executor["batches_skipped"])
+    ]
+    yield "scoring_pool_restarts_total", "counter", "Process pool restarts after a worker died", [
+        ({}, executor["pool_restarts"])
+    ]
+
+
+@router.get("/timings")
+async def stage_timings(reset: bool = False):
+    """
+    Per-route stage timings (the Server-Timing spans, aggregated).
+
+    Routes are "<METHOD> <path>"; snapshot refreshes appear as
+    "snapshot:<kind>:<sport>" with their upstream / decode / score and
+    per-engine stages. Each stage: count, avg/p50/p95/max ms over the last
+    ROUTE_TIMING_WINDOW samples. ?reset=true clears the aggregates after reading.
+    """
+    routes = route_timings.stats()
+    if reset:
+        route_timings.reset()
+    return {"routes": routes, "window": route_timings.window, "timestamp": datetime.now().isoformat()}
+
+
+def require_profiling_secret(request: Request):
+    """404 unless the X-Profile header carries PROFILE_SECRET (see profiling)"""
+    if not profiling_authorized(request.headers.get(PROFILE_HEADER)):
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@router.get("/profiles")
+async def list_profiles(request: Request):
+    """Stored request profiles, newest first (admin: X-Profile header)"""
+    require_profiling_secret(request)
+    return {"profiles": profile_store.list(), "kept": profile_store.size}
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str, request: Request, format: str = "collapsed"):
+    """
+    One request profile (admin: X-Profile header).
+
+    format=collapsed (default): folded stacks, "frame;frame <microseconds>" per
+    line - pipe into flamegraph.pl or open in speedscope.
+    format=json: summary plus the top functions by self time.
+    """
+    require_profiling_secret(request)
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown profile: {profile_id}")
+    if format == "json":
+        return {**profile.summary(), "top_functions": profile.top_functions()}
+    return Response(content=profile.collapsed(), media_type="text/plain; charset=utf-8")
+
+
+@router.get("/props/{sport}")
+async def get_live_props(sport: str, request: Request, limit: int = 5, deadline_ms: int = None):
+    """
+    Get live props with v10.1 confidence + v10.2 standalone esoteric + confluence alerts
+
+    deadline_ms (or the X-Request-Deadline header) bounds the whole request;
+    events not scored in time are listed in skipped_events with complete: false.
+    """
+    sport_key = PROPS_SPORT_KEYS.get(sport.lower())
+    if not sport_key:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+
+    deadline = parse_deadline(request.headers.get(DEADLINE_HEADER), deadline_ms)
+    try:
+        snap = await load_snapshot("props", sport.lower(), deadline)
+    except DeadlineExceeded:
+        return {
+            "props": [],
+            "message": "Deadline exceeded before events arrived",
+            "complete": False,
+            "skipped_events": []
+        }
+
+    if snap is None:
+        return {"props": [], "message": "Failed to fetch events"}
+    if not snap["payload"]["event_count"]:
+        return {"props": [], "message": "No upcoming events"}
+
+    with span("sort"):
+        all_props = [
+            prop_row
+            for _, prop_row, main_result in snap["payload"]["scored"]
+            # Only 70%+ confidence
+            if main_result["confidence"] >= 70
         ]
-    }
 
-@router.get("/star-tiers")
-async def get_star_tiers_endpoint():
-    """Get all star player protection tiers"""
-    tiers = {5: [], 4: [], 3: [], 2: [], 1: []}
-    for player, tier in STAR_PLAYER_TIERS.items():
-        tiers[tier].append(player)
+        all_props.sort(key=lambda x: x["confidence"], reverse=True)
 
     return {
-        "total_players": len(STAR_PLAYER_TIERS),
-        "tiers": {
-            "tier_5_maximum": tiers[5],
-            "tier_4_high": tiers[4],
-            "tier_3_moderate": tiers[3],
-            "tier_2_some": tiers[2]
+        **stale_metadata(snap),
+        **completeness_metadata(snap),
+        "props": all_props[:limit],
+        "total_analyzed": len(all_props),
+        "engine_version": "14.0",
+        "codename": "NOOSPHERE_VELOCITY",
+        "features": {
+            "main_model": "v10.1 research-optimized weights",
+            "esoteric_edge": "Standalone clickable module",
+            "confluence_alerts": "Informational alignment system",
+            "omni_glitch": "Final dimension - 6 esoteric modules",
+            "gann_physics": "Financial laws applied to sports - 3 geometric modules",
+            "noosphere_velocity": "Global mind signal - Information asymmetry (MAIN MODEL)"
+        },
+        "daily_energy": {
+            "date_numerology": get_day_context()["date_numerology"],
+            "moon_phase": get_day_context()["moon_phase"],
+            "planetary": get_day_context()["daily_energy"]
         }
     }
 
-# ============================================================================
-# STANDALONE ESOTERIC EDGE ENDPOINT (v10.2 NEW)
-# ============================================================================
-
-@router.post("/esoteric-edge")
-async def esoteric_edge_endpoint(data: dict):
+@router.get("/best-bets/{sport}")
+async def get_best_bets(sport: str, request: Request, deadline_ms: int = None):
     """
-    STANDALONE ESOTERIC EDGE ANALYSIS
+    Get best bets with v10.1 confidence + v10.2 standalone esoteric + confluence alerts
 
-    Complete gematria/numerology breakdown for any matchup.
-    This is its own feature - click to explore the cosmic alignments.
+    deadline_ms (or the X-Request-Deadline header) bounds the whole request;
+    games not scored in time are listed in skipped_events with complete: false.
     """
-    home_team = data.get("home_team", "")
-    away_team = data.get("away_team", "")
+    sport_key = GAME_SPORT_KEYS.get(sport.lower())
+    if not sport_key:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
 
-    if not home_team or not away_team:
-        raise HTTPException(status_code=400, detail="home_team and away_team required")
+    deadline = parse_deadline(request.headers.get(DEADLINE_HEADER), deadline_ms)
+    try:
+        snap = await load_snapshot("games", sport.lower(), deadline)
+    except DeadlineExceeded:
+        return {
+            "games": [],
+            "message": "Deadline exceeded before odds arrived",
+            "complete": False,
+            "skipped_events": []
+        }
 
-    return calculate_standalone_esoteric(
-        home_team=home_team,
-        away_team=away_team,
-        spread=data.get("spread"),
-        total=data.get("total"),
-        player_name=data.get("player_name"),
-        jersey_number=data.get("jersey_number"),
-        prop_line=data.get("prop_line"),
-        sport=data.get("sport", "NBA"),
-        game_date=datetime.fromisoformat(data["game_date"]) if data.get("game_date") else None
-    )
+    if snap is None:
+        return {"games": [], "message": "Failed to fetch odds"}
 
-# ============================================================================
-# CONFLUENCE ALERT ENDPOINT (v10.2 NEW)
-# ============================================================================
+    with span("sort"):
+        analyzed_games = [game_row for game_row, _, _ in snap["payload"]["scored"]]
 
-@router.post("/confluence-alert")
-async def confluence_alert_endpoint(data: dict):
-    """
-    Check for confluence between research model and esoteric edge.
-    Informational only - helps users see when both systems align.
-    """
-    return check_confluence_alert(
-        main_confidence=data.get("main_confidence", 50),
-        main_pick=data.get("main_pick", ""),
-        esoteric_score=data.get("esoteric_score", 50),
-        esoteric_pick=data.get("esoteric_pick", "")
-    )
+        analyzed_games.sort(key=lambda x: x["main_confidence"], reverse=True)
+
+    return {
+        **stale_metadata(snap),
+        **completeness_metadata(snap),
+        "games": analyzed_games[:10],
+        "engine_version": "14.0",
+        "codename": "NOOSPHERE_VELOCITY",
+        "daily_energy": {
+            "date_numerology": get_day_context()["date_numerology"],
+            "moon_phase": get_day_context()["moon_phase"],
+            "planetary": get_day_context()["daily_energy"]
+        }
+    }
 
 # ============================================================================
-# MAIN ENDPOINTS WITH CONFLUENCE ALERTS
+# BULK EXPORT - Columnar scored slates for analytics/backtest consumers
+# Arrow IPC stream/file or MessagePack, picked by Accept header (or ?format=)
 # ============================================================================
 
-@router.get("/props/{sport}")
-async def get_live_props(sport: str, limit: int = 5):
-    """Get live props with v10.1 confidence + v10.2 standalone esoteric + confluence alerts"""
-    sport_keys = {
-        "nba": "basketball_nba",
-        "nfl": "americanfootball_nfl",
-        "mlb": "baseball_mlb",
-        "nhl": "icehockey_nhl",
-        "ncaab": "basketball_ncaab"
-    }
+EXPORT_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "arrow_file": "application/vnd.apache.arrow.file",
+    "msgpack": "application/x-msgpack",
+    "json": "application/json"
+}
+
+# Accept header aliases that map onto the formats above
+EXPORT_MEDIA_ALIASES = {
+    "application/vnd.apache.arrow.stream": "arrow",
+    "application/vnd.apache.arrow.file": "arrow_file",
+    "application/x-msgpack": "msgpack",
+    "application/msgpack": "msgpack",
+    "application/vnd.msgpack": "msgpack",
+    "application/json": "json",
+    "application/*": "json",
+    "*/*": "json"
+}
+
+# Low-cardinality string columns - dictionary encoded in Arrow output
+EXPORT_CATEGORICAL_COLUMNS = {"tier", "recommendation", "esoteric_tier", "prop_type", "bet_type", "bookmaker"}
+
+GAME_EXPORT_COLUMNS = [
+    "home_team", "away_team", "game_time", "spread", "total", "price",
+    "confidence", "tier", "recommendation", "esoteric_score", "esoteric_tier"
+]
+
+PROP_EXPORT_COLUMNS = [
+    "player", "team", "opponent", "game_time", "prop_type", "bet_type", "line", "price",
+    "confidence", "tier", "recommendation", "esoteric_score", "esoteric_tier", "bookmaker"
+]
 
-    sport_key = sport_keys.get(sport.lower())
-    if not sport_key:
-        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        events_resp = await client.get(
-            f"{ODDS_API_BASE}/sports/{sport_key}/events",
-            params={"apiKey": ODDS_API_KEY, "dateFormat": "iso"}
+def negotiate_export_format(accept: str = None, requested: str = None) -> str:
+    """
+    Pick an export format from an explicit ?format= value or the Accept header.
+    Accept entries are ranked by q-value; unknown media types are ignored.
+    """
+    if requested:
+        fmt = requested.lower()
+        if fmt not in EXPORT_MEDIA_TYPES:
+            raise HTTPException(status_code=400, detail=f"Unsupported format: {requested}")
+        return fmt
+
+    if not accept:
+        return "json"
+
+    candidates = []
+    for position, entry in enumerate(accept.split(",")):
+        parts = [p.strip() for p in entry.split(";")]
+        media_type = parts[0].lower()
+        q = 1.0
+        for param in parts[1:]:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if media_type in EXPORT_MEDIA_ALIASES and q > 0:
+            # Exact media types beat wildcards at equal q
+            specificity = 0 if "*" in media_type else 1
+            candidates.append((q, specificity, -position, EXPORT_MEDIA_ALIASES[media_type]))
+
+    if not candidates:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Acceptable formats: {', '.join(EXPORT_MEDIA_TYPES.values())}"
         )
 
-        if events_resp.status_code != 200:
-            return {"props": [], "message": "Failed to fetch events"}
+    return max(candidates)[3]
 
-        events = events_resp.json()
-        if not events:
-            return {"props": [], "message": "No upcoming events"}
 
-        all_props = []
+def build_columnar_slate(rows: list, columns: list) -> dict:
+    """Transpose a list of flat row dicts into {column: [values]}"""
+    return {column: [row.get(column) for row in rows] for column in columns}
 
-        for event in events[:5]:
-            event_id = event.get("id")
-            home_team = event.get("home_team", "")
-            away_team = event.get("away_team", "")
-            commence_time = event.get("commence_time")
 
-            props_resp = await client.get(
-                f"{ODDS_API_BASE}/sports/{sport_key}/events/{event_id}/odds",
-                params={
-                    "apiKey": ODDS_API_KEY,
-                    "regions": "us",
-                    "markets": "player_points,player_rebounds,player_assists,player_threes",
-                    "oddsFormat": "american"
-                }
+def flatten_game_export_row(game_row: dict, main_result: dict, lines: dict) -> dict:
+    """Flatten a scored game into one export row (signal scores as signal_<name>)"""
+    row = {
+        "home_team": game_row["home_team"],
+        "away_team": game_row["away_team"],
+        "game_time": game_row["game_time"],
+        "spread": game_row["spread"],
+        "total": game_row["total"],
+        "price": lines["spread_price"],
+        "confidence": game_row["main_confidence"],
+        "tier": game_row["main_tier"],
+        "recommendation": game_row["recommendation"],
+        "esoteric_score": game_row["esoteric_edge"]["score"],
+        "esoteric_tier": game_row["esoteric_edge"]["tier"]
+    }
+    for signal_name, signal_data in main_result["signals"].items():
+        row[f"signal_{signal_name}"] = signal_data["score"]
+    return row
+
+
+def flatten_prop_export_row(prop_row: dict, main_result: dict) -> dict:
+    """Flatten a scored prop into one export row (signal scores as signal_<name>)"""
+    row = {column: prop_row.get(column) for column in PROP_EXPORT_COLUMNS}
+    row["esoteric_score"] = prop_row["esoteric_edge"]["score"]
+    row["esoteric_tier"] = prop_row["esoteric_edge"]["tier"]
+    for signal_name, signal_data in main_result["signals"].items():
+        row[f"signal_{signal_name}"] = signal_data["score"]
+    return row
+
+
+def export_signal_columns(rows: list) -> list:
+    """signal_<name> columns in SIGNAL_WEIGHTS order, then any extras seen in rows"""
+    seen = set()
+    for row in rows:
+        seen.update(k for k in row if k.startswith("signal_"))
+    ordered = [f"signal_{name}" for name in SIGNAL_WEIGHTS if f"signal_{name}" in seen]
+    return ordered + sorted(seen - set(ordered))
+
+
+def encode_arrow_ipc(columns: dict, metadata: dict, file_format: bool = False) -> bytes:
+    """Encode columns as an Arrow IPC stream, or the random-access IPC file format (requires pyarrow)"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise HTTPException(status_code=406, detail="Arrow export unavailable: pyarrow not installed")
+
+    arrays = {}
+    for name, values in columns.items():
+        array = pa.array(values)
+        if name in EXPORT_CATEGORICAL_COLUMNS and pa.types.is_string(array.type):
+            array = array.dictionary_encode()
+        arrays[name] = array
+
+    table = pa.table(arrays, metadata={k: v if isinstance(v, str) else json.dumps(v) for k, v in metadata.items()})
+    sink = pa.BufferOutputStream()
+    new_writer = pa.ipc.new_file if file_format else pa.ipc.new_stream
+    with new_writer(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_msgpack(payload: dict) -> bytes:
+    """Encode a columnar payload as MessagePack (requires msgpack)"""
+    try:
+        import msgpack
+    except ImportError:
+        raise HTTPException(status_code=406, detail="MessagePack export unavailable: msgpack not installed")
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+async def collect_export_rows(kind: str, sport: str, sport_key: str, max_events: int, deadline: Deadline) -> tuple:
+    """
+    Flat export rows for a slate -> (rows, skipped_events, snapshot or None, base columns).
+    Raises DeadlineExceeded when nothing arrived within the deadline.
+    """
+    rows = []
+    snap = None
+    if kind == "games":
+        snap = await load_snapshot("games", sport.lower(), deadline)
+        if snap is None:
+            raise HTTPException(status_code=502, detail="Failed to fetch odds")
+        for game_row, main_result, lines in snap["payload"]["scored"]:
+            rows.append(flatten_game_export_row(game_row, main_result, lines))
+        skipped = snap["payload"].get("skipped", [])
+        base_columns = GAME_EXPORT_COLUMNS
+    elif max_events <= PROPS_SNAPSHOT_EVENTS:
+        # Served from the shared props snapshot
+        snap = await load_snapshot("props", sport.lower(), deadline)
+        if snap is None:
+            raise HTTPException(status_code=502, detail="Failed to fetch events")
+        for event_idx, prop_row, main_result in snap["payload"]["scored"]:
+            if event_idx < max_events:
+                rows.append(flatten_prop_export_row(prop_row, main_result))
+        exported_ids = {event.get("id") for event in snap["payload"]["events"][:max_events]}
+        skipped = [entry for entry in snap["payload"].get("skipped", []) if entry["id"] in exported_ids]
+        base_columns = PROP_EXPORT_COLUMNS
+    else:
+        # Deeper than the snapshot - fetch and score live
+        fetch_deadline = deadline.for_upstream()
+        async with httpx.AsyncClient(timeout=UPSTREAM_TIMEOUT) as client:
+            events = await fetch_events(client, sport_key, fetch_deadline)
+            if events is None:
+                check_deadline(fetch_deadline)
+                raise HTTPException(status_code=502, detail="Failed to fetch events")
+            events = events[:max_events]
+            props_by_event, skipped_by_event = await fetch_props_for_events(
+                client, sport_key, events, fetch_deadline
             )
+        scored, unscored = await score_event_props(events, props_by_event, sport, deadline)
+        skipped_by_event.update(unscored)
+        for _, prop_row, main_result in scored:
+            rows.append(flatten_prop_export_row(prop_row, main_result))
+        skipped = [skipped_by_event[idx] for idx in sorted(skipped_by_event)]
+        base_columns = PROP_EXPORT_COLUMNS
 
-            if props_resp.status_code != 200:
-                continue
+    return rows, skipped, snap, base_columns
 
-            props_data = props_resp.json()
-            bookmakers = props_data.get("bookmakers", [])
-
-            for bookmaker in bookmakers[:1]:
-                for market in bookmaker.get("markets", []):
-                    market_key = market.get("key", "")
-
-                    for outcome in market.get("outcomes", []):
-                        player_name = outcome.get("description", "Unknown")
-                        prop_type = market_key.replace("player_", "").replace("_", " ").title()
-                        line = outcome.get("point", 0)
-                        price = outcome.get("price", -110)
-                        bet_type = outcome.get("name", "Over")
-
-                        # v10.1 Main confidence
-                        game_data = {
-                            "home_team": home_team,
-                            "away_team": away_team,
-                            "spread_odds": price,
-                            "total": 220,
-                            "sport": sport.upper()
-                        }
-                        main_result = calculate_main_confidence(game_data)
-
-                        # v10.2 Standalone esoteric
-                        esoteric_result = calculate_standalone_esoteric(
-                            home_team=home_team,
-                            away_team=away_team,
-                            prop_line=line,
-                            player_name=player_name,
-                            sport=sport.upper()
-                        )
-
-                        # v10.2 Confluence alert
-                        main_pick = "home" if main_result["recommendation"] in ["SMASH", "STRONG"] else "away"
-                        confluence = check_confluence_alert(
-                            main_confidence=main_result["confidence"],
-                            main_pick=main_pick,
-                            esoteric_score=esoteric_result["esoteric_score"],
-                            esoteric_pick=esoteric_result["esoteric_pick"]["favored"]
-                        )
-
-                        # Only 70%+ confidence
-                        if main_result["confidence"] >= 70:
-                            all_props.append({
-                                "player": player_name,
-                                "team": home_team,
-                                "opponent": away_team,
-                                "prop_type": prop_type,
-                                "line": line,
-                                "bet_type": bet_type,
-                                "price": price,
-
-                                # v10.1 Main model
-                                "confidence": main_result["confidence"],
-                                "tier": main_result["tier"],
-                                "recommendation": main_result["recommendation"],
-
-                                # v10.2 Standalone esoteric (clickable)
-                                "esoteric_edge": {
-                                    "score": esoteric_result["esoteric_score"],
-                                    "tier": esoteric_result["tier"],
-                                    "emoji": esoteric_result["emoji"],
-                                    "badge": esoteric_result["badge"],
-                                    "top_insights": esoteric_result["top_insights"],
-                                    "favored": esoteric_result["esoteric_pick"]["favored"]
-                                },
-
-                                # v10.2 Confluence alert
-                                "confluence_alert": confluence,
-
-                                "game_time": commence_time,
-                                "bookmaker": bookmaker.get("title", "Unknown")
-                            })
 
-        all_props.sort(key=lambda x: x["confidence"], reverse=True)
+@router.get("/export/{sport}")
+async def export_scored_slate(
+    sport: str,
+    request: Request,
+    kind: str = "games",
+    output_format: str = Query(None, alias="format"),
+    max_events: int = 5,
+    deadline_ms: int = None
+):
+    """
+    BULK EXPORT - Scored slate in columnar layout
 
-        return {
-            "props": all_props[:limit],
-            "total_analyzed": len(all_props),
-            "engine_version": "14.0",
-            "codename": "NOOSPHERE_VELOCITY",
-            "features": {
-                "main_model": "v10.1 research-optimized weights",
-                "esoteric_edge": "Standalone clickable module",
-                "confluence_alerts": "Informational alignment system",
-                "omni_glitch": "Final dimension - 6 esoteric modules",
-                "gann_physics": "Financial laws applied to sports - 3 geometric modules",
-                "noosphere_velocity": "Global mind signal - Information asymmetry (MAIN MODEL)"
-            },
-            "daily_energy": {
-                "date_numerology": calculate_date_numerology(),
-                "moon_phase": get_moon_phase(),
-                "planetary": get_daily_energy()
-            }
-        }
+    Every scored row (no confidence filter, no limit) as one array per column:
+    line/price, confidence, tier, esoteric score and one signal_<name> column
+    per main-model signal.
 
-@router.get("/best-bets/{sport}")
-async def get_best_bets(sport: str):
-    """Get best bets with v10.1 confidence + v10.2 standalone esoteric + confluence alerts"""
-    sport_keys = {
-        "nba": "basketball_nba",
-        "nfl": "americanfootball_nfl",
-        "mlb": "baseball_mlb",
-        "nhl": "icehockey_nhl"
-    }
+    Content negotiation (Accept header, or ?format=arrow|arrow_file|msgpack|json):
+    - application/vnd.apache.arrow.stream -> Arrow IPC stream
+    - application/vnd.apache.arrow.file -> Arrow IPC file (random access)
+    - application/x-msgpack -> MessagePack {"columns": {...}, ...}
+    - application/json -> same columnar shape as JSON
+
+    kind: "games" (spreads/totals) or "props" (player props, first max_events events)
+
+    deadline_ms (or the X-Request-Deadline header) bounds the whole request;
+    a slate cut short carries complete: false / skipped_events (X-Slate-Complete).
+    """
+    kind = kind.lower()
+    if kind not in ["games", "props"]:
+        raise HTTPException(status_code=400, detail="kind must be 'games' or 'props'")
 
+    sport_keys = GAME_SPORT_KEYS if kind == "games" else PROPS_SPORT_KEYS
     sport_key = sport_keys.get(sport.lower())
     if not sport_key:
         raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(
-            f"{ODDS_API_BASE}/sports/{sport_key}/odds",
-            params={
-                "apiKey": ODDS_API_KEY,
-                "regions": "us",
-                "markets": "spreads,totals",
-                "oddsFormat": "american"
-            }
-        )
-
-        if resp.status_code != 200:
-            return {"games": [], "message": "Failed to fetch odds"}
-
-        games = resp.json()
-        analyzed_games = []
-
-        for game in games:
-            home_team = game.get("home_team", "")
-            away_team = game.get("away_team", "")
-            commence_time = game.get("commence_time")
-
-            best_spread = None
-            best_total = None
-
-            for bm in game.get("bookmakers", []):
-                for market in bm.get("markets", []):
-                    if market["key"] == "spreads":
-                        for outcome in market["outcomes"]:
-                            if outcome["name"] == home_team:
-                                best_spread = outcome.get("point", 0)
-                    elif market["key"] == "totals":
-                        for outcome in market["outcomes"]:
-                            if outcome["name"] == "Over":
-                                best_total = outcome.get("point", 220)
-
-            # v10.1 Main confidence
-            game_data = {
-                "home_team": home_team,
-                "away_team": away_team,
-                "spread": best_spread,
-                "total": best_total,
-                "sport": sport.upper()
-            }
-            main_result = calculate_main_confidence(game_data)
-
-            # v10.2 Standalone esoteric
-            esoteric_result = calculate_standalone_esoteric(
-                home_team=home_team,
-                away_team=away_team,
-                spread=best_spread,
-                total=best_total,
-                sport=sport.upper()
-            )
-
-            # v10.2 Confluence alert
-            main_pick = "home" if main_result["recommendation"] in ["SMASH", "STRONG", "PLAY"] else "away"
-            confluence = check_confluence_alert(
-                main_confidence=main_result["confidence"],
-                main_pick=main_pick,
-                esoteric_score=esoteric_result["esoteric_score"],
-                esoteric_pick=esoteric_result["esoteric_pick"]["favored"]
-            )
-
-            analyzed_games.append({
-                "home_team": home_team,
-                "away_team": away_team,
-                "game_time": commence_time,
-                "spread": best_spread,
-                "total": best_total,
-
-                # v10.1 Main model
-                "main_confidence": main_result["confidence"],
-                "main_tier": main_result["tier"],
-                "recommendation": main_result["recommendation"],
-
-                # v10.2 Standalone esoteric (clickable)
-                "esoteric_edge": {
-                    "score": esoteric_result["esoteric_score"],
-                    "tier": esoteric_result["tier"],
-                    "emoji": esoteric_result["emoji"],
-                    "badge": esoteric_result["badge"],
-                    "top_insights": esoteric_result["top_insights"],
-                    "favored": esoteric_result["esoteric_pick"]["favored"],
-                    "favored_team": esoteric_result["esoteric_pick"]["favored_team"],
-                    "reasoning": esoteric_result["esoteric_pick"]["reasoning"]
-                },
-
-                # v10.2 Confluence alert
-                "confluence_alert": confluence
-            })
+    fmt = negotiate_export_format(request.headers.get("accept"), output_format)
+
+    deadline = parse_deadline(request.headers.get(DEADLINE_HEADER), deadline_ms)
+    try:
+        rows, skipped, snap, base_columns = await collect_export_rows(kind, sport, sport_key, max_events, deadline)
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
+
+    # Bulk slates run to tens of thousands of rows - pivot and encode off the loop
+    with span("columnar"):
+        column_names = base_columns + export_signal_columns(rows)
+        columns = await asyncio.to_thread(build_columnar_slate, rows, column_names)
+    metadata = {
+        "sport": sport.upper(),
+        "kind": kind,
+        "row_count": len(rows),
+        "engine_version": "14.0",
+        "generated_at": datetime.now().isoformat(),
+        "complete": not skipped,
+        "skipped_events": skipped,
+        **(stale_metadata(snap) if snap else {})
+    }
 
-        analyzed_games.sort(key=lambda x: x["main_confidence"], reverse=True)
+    headers = {
+        "Vary": "Accept",
+        "X-Row-Count": str(len(rows)),
+        "X-Slate-Complete": "true" if not skipped else "false"
+    }
+    if "stale_as_of" in metadata:
+        headers["X-Stale-As-Of"] = metadata["stale_as_of"]
+
+    if fmt == "json":
+        # The response renders its body as it is built
+        return await asyncio.to_thread(TimedJSONResponse, content={**metadata, "columns": columns}, headers=headers)
+    with span("serialize"):
+        if fmt in ("arrow", "arrow_file"):
+            body = await asyncio.to_thread(encode_arrow_ipc, columns, metadata, fmt == "arrow_file")
+        else:
+            body = await asyncio.to_thread(encode_msgpack, {**metadata, "columns": columns})
 
-        return {
-            "games": analyzed_games[:10],
-            "engine_version": "14.0",
-            "codename": "NOOSPHERE_VELOCITY",
-            "daily_energy": {
-                "date_numerology": calculate_date_numerology(),
-                "moon_phase": get_moon_phase(),
-                "planetary": get_daily_energy()
-            }
-        }
+    return Response(content=body, media_type=EXPORT_MEDIA_TYPES[fmt], headers=headers)
 
 @router.get("/health")
 async def health_check():
@@ -5803,8 +2629,8 @@ async def health_check():
         "resonance_layer": {
             "founders_echo": "Franchise founding date vs game date alignment",
             "life_path_sync": "Star player life path vs game numerology",
-            "franchise_db_count": len(FRANCHISE_FOUNDING_DATES),
-            "player_db_count": len(STAR_PLAYER_BIRTHDATES)
+            "franchise_db_count": len(tables.FRANCHISE_FOUNDING_DATES),
+            "player_db_count": len(tables.STAR_PLAYER_BIRTHDATES)
         },
         "scalar_savant": {
             "bio_sine_wave": "Physical/Emotional/Intellectual biorhythm cycles (23/28/33 days)",
@@ -5813,9 +2639,9 @@ async def health_check():
             "schumann_spike": "Earth Hz chaos trigger (7.83 Hz baseline)",
             "saturn_block": "Jupiter=Expansion, Saturn=Restriction",
             "zebra_privilege": "Star protection tiers + ref home bias",
-            "team_colors_db": len(TEAM_COLORS),
-            "star_tiers_db": len(STAR_PLAYER_TIERS),
-            "ref_crews_db": len(REF_CREW_HOME_BIAS)
+            "team_colors_db": len(tables.TEAM_COLORS),
+            "star_tiers_db": len(tables.STAR_PLAYER_TIERS),
+            "ref_crews_db": len(tables.REF_CREW_HOME_BIAS)
         },
         "omni_glitch": {
             "vortex_math": "Tesla 3-6-9 digital root (Circuit Complete vs Open)",
@@ -5824,7 +2650,7 @@ async def health_check():
             "void_of_course_moon": "Time vacuum - favorites fail period",
             "gann_spiral": "W.D. Gann Square of Nine Cardinal Cross",
             "mars_uranus_nuclear": "Shock aspect - blind bet biggest dog",
-            "venues_tracked": len(VENUE_ATMOSPHERICS)
+            "venues_tracked": len(tables.VENUE_ATMOSPHERICS)
         },
         "gann_physics": {
             "inspiration": "W.D. Gann - $130 → $12,000 in 30 days (9,000% return)",
@@ -5842,7 +2668,7 @@ async def health_check():
             "insider_leak": "Silent Spike - High volume + No news = FADE",
             "main_character": "Underdog volume > Favorite = BET DOG",
             "phantom_injury": "Player spike + Injury queries = BET UNDER",
-            "teams_tracked": len(TEAM_BASELINE_VOLUMES) - 1
+            "teams_tracked": len(tables.TEAM_BASELINE_VOLUMES) - 1
         },
         "twitter_sources": [
             "@gematriasports",
@@ -5855,6 +2681,637 @@ async def health_check():
     }
 
 
+# =============================================================================
+# BACKTEST - replay historical slates through the scorers (see backtest.py)
+# =============================================================================
+
+def parse_backtest_date(value) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid date (YYYY-MM-DD): {value}")
+
+
+@router.post("/backtest", status_code=202)
+async def start_backtest(data: dict):
+    """
+    Start a backtest job over BACKTEST_DATA_DIR/<sport>/<date>.json slates.
+
+    Body: {"sport": "nba", "start": "2025-10-21", "end": "2026-04-12",
+    "include_props": true}. Poll GET /live/backtest/{job_id} for progress and
+    the ROI / hit rate / CLV report per tier. One job runs at a time.
+    """
+    sport = str(data.get("sport", "")).lower()
+    if sport not in PROPS_SPORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+    if not os.path.isdir(os.path.join(BACKTEST_DATA_DIR, sport)):
+        raise HTTPException(status_code=404, detail=f"No historical slates for {sport}")
+    start = parse_backtest_date(data.get("start"))
+    end = parse_backtest_date(data.get("end"))
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="start is after end")
+
+    running = backtest_jobs.running
+    if running is not None:
+        raise HTTPException(status_code=409, detail=f"Backtest {running.id} is still running")
+    job = backtest_jobs.submit(BacktestJob(sport, start, end, bool(data.get("include_props", True))))
+    return job.summary()
+
+
+@router.get("/backtest")
+async def list_backtests():
+    """Backtest jobs in this worker, newest first"""
+    return {"jobs": backtest_jobs.list(), "data_dir": BACKTEST_DATA_DIR}
+
+
+@router.get("/backtest/{job_id}")
+async def get_backtest(job_id: str):
+    """Job progress; once done, the report (overall, actionable, per tier, per kind)"""
+    job = backtest_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown backtest job: {job_id}")
+    return {**job.summary(), "report": job.report}
+
+
+# =============================================================================
+# SEASON CALENDAR - Founder's Echo / date numerology per team per date, memory-mapped
+# (see engines/season_calendar.py)
+# =============================================================================
+
+_season_calendar = None
+_season_calendar_lock = asyncio.Lock()
+
+
+def calendar_covers_season(calendar) -> bool:
+    """The open calendar still spans the season in progress (open_calendar's own window)"""
+    return calendar is not None and calendar.covers(default_start(), CALENDAR_DAYS)
+
+
+async def load_season_calendar() -> dict:
+    """
+    Open the calendar, building it first when missing, stale or not covering
+    the season. Once the season rolls over past the open calendar's window it
+    is reopened on the new season's window, rebuilt if need be.
+    """
+    global _season_calendar
+    async with _season_calendar_lock:
+        if not calendar_covers_season(_season_calendar):
+            previous = _season_calendar
+            _season_calendar = await asyncio.to_thread(open_calendar)
+            if previous is not None:
+                # Lookups run on the loop, so nothing still reads the old map
+                previous.close()
+    return _season_calendar.info()
+
+
+async def get_season_calendar():
+    if not calendar_covers_season(_season_calendar):
+        await load_season_calendar()
+    return _season_calendar
+
+
+def parse_calendar_date(calendar, value: str):
+    day = datetime.strptime(parse_backtest_date(value), "%Y-%m-%d").date()
+    index = calendar.date_index(day)
+    if index is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{value} is outside the calendar window ({calendar.start} to {calendar.end})"
+        )
+    return index
+
+
+def resolve_calendar_team(calendar, team: str) -> int:
+    index = calendar.resolve_team(team)
+    if index is None:
+        raise HTTPException(status_code=404, detail=f"Unknown team: {team}")
+    return index
+
+
+@router.get("/calendar/top")
+async def get_calendar_top_teams(date: Optional[str] = None, limit: int = 10):
+    """Teams with the strongest Founder's Echo on a date (default today)"""
+    calendar = await get_season_calendar()
+    day = parse_calendar_date(calendar, date or datetime.now().strftime("%Y-%m-%d"))
+    return {
+        "date": calendar.date_at(day).isoformat(),
+        **calendar.date_numbers(day),
+        "teams": calendar.top_teams(day, max(1, limit))
+    }
+
+
+@router.get("/calendar/{team}/top")
+async def get_calendar_top_dates(team: str, limit: int = 10):
+    """A team's top resonance dates in the season window, highest echo first"""
+    calendar = await get_season_calendar()
+    index = resolve_calendar_team(calendar, team)
+    return {
+        "team": calendar.teams[index],
+        "window": {"start": calendar.start.isoformat(), "end": calendar.end.isoformat()},
+        "dates": calendar.top_dates(index, max(1, limit))
+    }
+
+
+@router.get("/calendar/{team}")
+async def get_team_calendar(
+    team: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    opponent: Optional[str] = None
+):
+    """
+    Per-date echo score, echo types, life path match, date reductions and
+    power-date flag for a team. Defaults to the next 30 days; with an opponent
+    each date also carries the vortex root of "team vs opponent".
+    """
+    calendar = await get_season_calendar()
+    index = resolve_calendar_team(calendar, team)
+    opponent_index = resolve_calendar_team(calendar, opponent) if opponent else None
+    if start:
+        first = parse_calendar_date(calendar, start)
+    else:
+        first = calendar.date_index(datetime.now().date())
+        if first is None:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Season calendar ({calendar.start} to {calendar.end}) does not cover today yet"
+            )
+    last = parse_calendar_date(calendar, end) if end else min(calendar.n_dates - 1, first + 29)
+    if first > last:
+        raise HTTPException(status_code=400, detail="start is after end")
+    return {
+        "team": calendar.teams[index],
+        "opponent": calendar.teams[opponent_index] if opponent_index is not None else None,
+        "dates": [calendar.day(index, day, opponent_index) for day in range(first, last + 1)],
+        "calendar": calendar.info()
+    }
+
+
+# =============================================================================
+# RESULTS STORE - graded games -> streak / entropy / alternation state per team
+# (see results_store.py)
+# =============================================================================
+
+RESULTS_SYNC_DAYS = int(os.getenv("RESULTS_SYNC_DAYS", "3"))
+RESULTS_SYNC_INTERVAL = float(os.getenv("RESULTS_SYNC_INTERVAL", "3600"))
+
+# sport -> when the poller last pulled its scores
+RESULTS_SYNCED_AT = {}
+
+
+def parse_results_sport(sport: str) -> str:
+    sport = sport.lower()
+    if sport not in GAME_SPORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+    return sport
+
+
+def matchup_key(event: dict) -> Optional[tuple]:
+    """(home_team, away_team, UTC date) of a game or result, None without a usable commence_time"""
+    try:
+        commence = datetime.fromtimestamp(parse_timestamp(event["commence_time"]), timezone.utc)
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return None
+    return event.get("home_team"), event.get("away_team"), commence.date()
+
+
+async def snapshot_lines(sport: str) -> dict:
+    """Event id and matchup_key -> home spread / over total in the current games snapshot"""
+    snap = await asyncio.to_thread(shared_cache.get_snapshot, f"games:{sport}")
+    lines = {}
+    for game in snap["payload"]["games"] if snap else []:
+        lines[game.get("id")] = lines[matchup_key(game)] = extract_game_lines(game)
+    lines.pop(None, None)
+    return lines
+
+
+async def fill_result_lines(sport: str, results: list) -> list:
+    """
+    Results missing home_spread / total take the game's closing lines from the
+    line history (kept LINE_HISTORY_RETENTION past the start, so finished
+    games are still there), else from the games snapshot when the game is in it
+    """
+    missing = [
+        result for result in results
+        if isinstance(result, dict) and (result.get("home_spread") is None or result.get("total") is None)
+    ]
+    closing, lines = {}, {}
+    if missing:
+        await asyncio.to_thread(line_history.sync)
+        closing = await asyncio.to_thread(line_history.closing_lines, {result.get("id") for result in missing})
+        if any(result.get("id") not in closing for result in missing):
+            lines = await snapshot_lines(sport)
+    filled = []
+    for result in results:
+        if isinstance(result, dict):
+            game_lines = (
+                closing.get(result.get("id")) or lines.get(result.get("id")) or lines.get(matchup_key(result))
+            )
+            if game_lines:
+                result = {
+                    "home_spread": game_lines["spread"],
+                    "total": game_lines["total"],
+                    **{key: value for key, value in result.items() if value is not None}
+                }
+            result = {**result, "sport": sport}
+        filled.append(result)
+    return filled
+
+
+def graded_scores(event: dict) -> Optional[dict]:
+    """An Odds API scores entry -> a raw result, None until it is completed"""
+    if not event.get("completed") or not event.get("scores"):
+        return None
+    scores = {entry.get("name"): entry.get("score") for entry in event["scores"]}
+    return {
+        "id": event.get("id"),
+        "home_team": event.get("home_team"),
+        "away_team": event.get("away_team"),
+        "home_score": scores.get(event.get("home_team")),
+        "away_score": scores.get(event.get("away_team")),
+        "commence_time": event.get("commence_time")
+    }
+
+
+async def sync_results(sport: str, force: bool = False) -> Optional[dict]:
+    """
+    Poller job: record completed games from the Odds API scores feed, at most
+    every RESULTS_SYNC_INTERVAL per sport. Lines are the closing lines in the
+    line history; games older than its retention only feed the moneyline market.
+    """
+    if sport not in GAME_SPORT_KEYS or RESULTS_SYNC_DAYS <= 0:
+        return None
+    if not force and time.time() - RESULTS_SYNCED_AT.get(sport, 0) < RESULTS_SYNC_INTERVAL:
+        return None
+    async with httpx.AsyncClient(timeout=UPSTREAM_TIMEOUT) as client:
+        events = await fetch_scores(client, GAME_SPORT_KEYS[sport], RESULTS_SYNC_DAYS)
+    if events is None:
+        return None
+    RESULTS_SYNCED_AT[sport] = time.time()
+    results = [result for result in map(graded_scores, events) if result is not None]
+    results = await fill_result_lines(sport, results)
+    return await asyncio.to_thread(results_store.record, results)
+
+
+@router.post("/results")
+async def record_results(data: dict):
+    """
+    Record graded games. Results without home_spread / total take the closing
+    lines from the line history (by event id) or the current games snapshot;
+    otherwise they only feed the moneyline market.
+
+    Body: {"sport": "nba", "results": [{"home_team": "Boston Celtics",
+    "away_team": "Los Angeles Lakers", "home_score": 112, "away_score": 104,
+    "commence_time": "2026-01-09T00:30:00Z", "home_spread": -5.5, "total": 221.5}]}
+    """
+    sport = parse_results_sport(str(data.get("sport", "")))
+    results = data.get("results")
+    if not isinstance(results, list):
+        raise HTTPException(status_code=400, detail="results list required")
+    results = await fill_result_lines(sport, results)
+    recorded = await asyncio.to_thread(results_store.record, results)
+    return {**recorded, "store": results_store.stats()}
+
+
+@router.get("/results/patterns/{sport}")
+async def results_patterns(sport: str, signal: Optional[str] = None, market: Optional[str] = None):
+    """
+    Teams in an exhaustion node (streak of 3+), harmonic lock (4+ alternating)
+    or low-entropy run right now. Each signal reads its engine's market by
+    default (exhaustion: ats, harmonic_lock / low_entropy: ml).
+    """
+    sport = parse_results_sport(sport)
+    signals = parse_choices(signal, SIGNALS, "signal") or list(SIGNALS)
+    if market is not None and market not in MARKETS:
+        raise HTTPException(status_code=400, detail=f"market must be one of {', '.join(MARKETS)}")
+    await asyncio.to_thread(results_store.sync)
+    return {
+        "sport": sport,
+        "teams_tracked": len(results_store.teams(sport)),
+        "patterns": {
+            name: {"market": market or DEFAULT_MARKETS[name], "teams": results_store.active(sport, name, market)}
+            for name in signals
+        },
+        "store": results_store.stats()
+    }
+
+
+@router.get("/results/{sport}/{team}")
+async def team_results(sport: str, team: str):
+    """A team's recent outcomes, histogram, streak, alternation and active patterns per market"""
+    sport = parse_results_sport(sport)
+    await asyncio.to_thread(results_store.sync)
+    entry = results_store.get(sport, team)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"No results for {team} in {sport}")
+    return entry
+
+
+# =============================================================================
+# CLV TRACKER - tracked picks, closing lines from the snapshot refreshes, CLV
+# per tier / sport / signal (see clv_tracker.py)
+# =============================================================================
+
+def parse_bets_sport(sport: Optional[str]) -> Optional[str]:
+    if sport is None:
+        return None
+    sport = sport.lower()
+    if sport not in GAME_SPORT_KEYS and sport not in PROPS_SPORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+    return sport
+
+
+async def recommendation_quotes(data: dict, sport: str) -> tuple:
+    """
+    A pick's game in the current snapshot -> (pick with event_id /
+    commence_time filled in, current quotes), so a pick tracked without a
+    line takes the line it was recommended at.
+    """
+    kind = "props" if data.get("player") else "games"
+    if sport not in (PROPS_SPORT_KEYS if kind == "props" else GAME_SPORT_KEYS):
+        return data, {}
+    snap = await asyncio.to_thread(shared_cache.get_snapshot, f"{kind}:{sport}")
+    if snap is None:
+        return data, {}
+    payload = snap["payload"]
+    games = payload["games"] if kind == "games" else payload["events"]
+    game = data.get("game") if isinstance(data.get("game"), dict) else {}
+    pick = {**game, **data}
+    event_id = pick.get("event_id") or pick.get("game_id") or game.get("id")
+    if event_id:
+        match = next((g for g in games if g.get("id") == event_id), None)
+    elif pick.get("commence_time") is not None:
+        key = matchup_key(pick)
+        match = next((g for g in games if key and matchup_key(g) == key), None)
+    else:
+        # No commence_time: the snapshot's game between the two teams is the one recommended
+        teams = (pick.get("home_team"), pick.get("away_team"))
+        match = next((g for g in games if (g.get("home_team"), g.get("away_team")) == teams), None)
+    if match is None:
+        return data, {}
+    data = {**data, "event_id": match.get("id"), "commence_time": pick.get("commence_time") or match.get("commence_time")}
+    if kind == "games":
+        quotes = await asyncio.to_thread(game_closing_quotes, [match])
+    else:
+        quotes = await asyncio.to_thread(prop_closing_quotes, payload["events"], payload["scored"])
+    return data, quotes
+
+
+@router.post("/bets/track")
+async def track_bet(data: dict):
+    """
+    Track a recommended pick for closing line value. Line and odds default to
+    the current snapshot's consensus on the pick's side; the closing line is
+    captured by the snapshot refreshes as the game starts.
+
+    Body: {"sport": "nba", "home_team": "Boston Celtics", "away_team":
+    "Los Angeles Lakers", "commence_time": "2026-01-09T00:30:00Z",
+    "bet_type": "spread", "side": "HOME", "line": -4.5, "odds": -110,
+    "book": "DraftKings", "tier": "SUPER_SIGNAL", "confidence": 78,
+    "signals": ["sharp_money", "steam_moves"], "user_id": "..."}
+    Props: "player": "Jayson Tatum", "bet_type": "points", "side": "Over".
+    """
+    sport = parse_bets_sport(str(data.get("sport", "")))
+    data, quotes = await recommendation_quotes({**data, "sport": sport}, sport)
+    try:
+        pick = await asyncio.to_thread(clv_tracker.track, data, quotes)
+    except DuplicatePickError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"id": pick["id"], "status": "tracked", "bet": pick}
+
+
+@router.post("/bets/grade/{bet_id}")
+async def grade_bet(bet_id: str, data: dict):
+    """Body: {"outcome": "WIN" | "LOSS" | "PUSH"}"""
+    outcome = str(data.get("outcome", "")).upper()
+    if outcome not in OUTCOMES:
+        raise HTTPException(status_code=400, detail=f"outcome must be one of {', '.join(OUTCOMES)}")
+    pick = await asyncio.to_thread(clv_tracker.grade, bet_id, outcome)
+    if pick is None:
+        raise HTTPException(status_code=404, detail=f"No tracked bet {bet_id}")
+    return {"id": bet_id, "outcome": outcome, "bet": pick}
+
+
+@router.get("/bets/history")
+async def bet_history(user_id: Optional[str] = None, sport: Optional[str] = None, limit: int = 50):
+    """Tracked picks, newest first, with their record and CLV"""
+    sport = parse_bets_sport(sport)
+    bets = await asyncio.to_thread(clv_tracker.history, user_id, sport, max(1, limit))
+    summary = await asyncio.to_thread(clv_tracker.summary, user_id, sport, None, ())
+    return {"bets": bets, "stats": summary["overall"]}
+
+
+@router.get("/bets/clv")
+async def clv_summary(
+    sport: Optional[str] = None,
+    user_id: Optional[str] = None,
+    days: Optional[int] = None,
+    group_by: Optional[str] = None
+):
+    """
+    Closing line value and record over the tracked picks: overall and per
+    tier, sport and signal. group_by: tier,sport,signal (default all);
+    days: only picks tracked in the last N days.
+    """
+    sport = parse_bets_sport(sport)
+    groups = parse_choices(group_by, GROUPS, "group_by") or list(GROUPS)
+    since = time.time() - days * 86400 if days else None
+    summary, tracker = await asyncio.to_thread(
+        lambda: (clv_tracker.summary(user_id, sport, since, groups), clv_tracker.stats())
+    )
+    return {"sport": sport, "days": days, **summary, "tracker": tracker}
+
+
+# =============================================================================
+# PARLAY - correlated pricing and warnings from the slate's prop correlation
+# matrix (see engines/prop_correlation.py)
+# =============================================================================
+
+PARLAY_MAX_LEGS = 12
+
+# sport -> (history signature, CorrelationTable)
+PROP_CORRELATION_TABLES = {}
+# sport -> ((props snapshot version, history signature), SlateMatrix)
+PROP_CORRELATION_MATRICES = {}
+
+
+def prop_history_signature(sport: str) -> tuple:
+    """(slate files, latest mtime) of a sport's backtest files - changes when history is added"""
+    sport_dir = os.path.join(BACKTEST_DATA_DIR, sport)
+    if not os.path.isdir(sport_dir):
+        return (0, 0.0)
+    mtimes = [entry.stat().st_mtime for entry in os.scandir(sport_dir) if entry.name.endswith(".json")]
+    return (len(mtimes), max(mtimes, default=0.0))
+
+
+def build_correlation_table(sport: str) -> CorrelationTable:
+    table = CorrelationTable()
+    for outcomes in load_prop_history(BACKTEST_DATA_DIR, sport):
+        table.add_event(outcomes)
+    return table
+
+
+def event_team(teams: dict, player: str, event: dict) -> Optional[str]:
+    """
+    A player's team in the prop history (CorrelationTable.teams), as the
+    event names it - None when it is neither of the event's teams (traded)
+    """
+    team = teams.get(player)
+    if team is None:
+        return None
+    franchise = resolve_franchise_name(team) or team
+    return next(
+        (side for side in (event.get("home_team"), event.get("away_team"))
+         if side and (resolve_franchise_name(side) or side) == franchise),
+        None
+    )
+
+
+def slate_props(payload: dict, teams: dict) -> list:
+    """A props snapshot's scored rows -> correlation matrix props (live rows carry the home team: teams from history)"""
+    events = payload["events"]
+    return [
+        {"event_id": events[idx].get("id"), "player": row.get("player"),
+         "team": event_team(teams, row.get("player"), events[idx]),
+         "market": prop_market_key(row.get("prop_type"))}
+        for idx, row, _ in payload["scored"] if idx < len(events)
+    ]
+
+
+async def prop_correlation_model(sport: str) -> tuple:
+    """-> (CorrelationTable, SlateMatrix, props snapshot or None), rebuilt when history or the slate changes"""
+    signature = await asyncio.to_thread(prop_history_signature, sport)
+    cached = PROP_CORRELATION_TABLES.get(sport)
+    if cached is None or cached[0] != signature:
+        with span("correlation_history"):
+            cached = PROP_CORRELATION_TABLES[sport] = (signature, await asyncio.to_thread(build_correlation_table, sport))
+    table = cached[1]
+
+    snap = await load_snapshot("props", sport)
+    key = (snap["version"] if snap else None, signature)
+    built = PROP_CORRELATION_MATRICES.get(sport)
+    if built is None or built[0] != key:
+        props = slate_props(snap["payload"], table.teams) if snap else []
+        with span("correlation_matrix"):
+            built = PROP_CORRELATION_MATRICES[sport] = (key, await asyncio.to_thread(SlateMatrix, props, table))
+    return table, built[1], snap
+
+
+def parse_parlay_leg(raw, matrix: SlateMatrix, teams: dict) -> dict:
+    """
+    A ParlayBuilder leg -> {player, market, side, odds, event_id, team}; props
+    without an event id take the slate's. A prop's team is its slate prop's,
+    else the player's in the prop history.
+    """
+    if not isinstance(raw, dict):
+        raise HTTPException(status_code=400, detail="each leg must be an object")
+    try:
+        odds = float(raw.get("odds") or -110)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="leg odds must be American odds")
+    if -100 < odds < 100:
+        raise HTTPException(status_code=400, detail="leg odds must be American odds (<= -100 or >= 100)")
+    leg = {
+        "player": raw.get("player") or None,
+        # Live legs carry no reliable team (ParlayBuilder falls back to the home team) - props take it below
+        "team": None if raw.get("player") else raw.get("team"),
+        # ParlayBuilder legs say bet_type "prop" and name the stat in prop_type (or stat)
+        "market": prop_market_key(
+            raw.get("prop_type") or raw.get("stat") or raw.get("market") or raw.get("bet_type")
+        ),
+        "side": str(raw.get("side") or "").upper(),
+        "odds": odds,
+        "event_id": raw.get("event_id") or raw.get("game_id")
+    }
+    if leg["player"]:
+        slate = next((
+            p for p in matrix.props
+            if p["player"] == leg["player"] and leg["event_id"] in (None, p["event_id"])
+        ), None)
+        if slate is not None:
+            leg["event_id"], leg["team"] = slate["event_id"], slate["team"]
+        else:
+            leg["team"] = teams.get(leg["player"])
+    return leg
+
+
+@router.post("/parlay/calculate")
+async def calculate_parlay(data: dict):
+    """
+    Price a parlay with its legs' correlations: the book's combined odds and
+    payout, the correlation-adjusted hit probability and fair odds, and a
+    warning per correlated leg pair. Prop legs are located in the current
+    props slate's correlation matrix (by event_id, or by player).
+
+    Body: {"legs": [{"player": "Jayson Tatum", "bet_type": "prop",
+    "prop_type": "Points", "side": "Over", "line": 27.5, "odds": -110,
+    "sport": "NBA"}, ...], "stake": 100}. A prop leg without prop_type / stat
+    has an unknown market and is priced from its relation's prior.
+    """
+    legs = data.get("legs")
+    if not isinstance(legs, list) or not legs:
+        raise HTTPException(status_code=400, detail="legs list required")
+    if len(legs) > PARLAY_MAX_LEGS:
+        raise HTTPException(status_code=400, detail=f"at most {PARLAY_MAX_LEGS} legs")
+    try:
+        stake = float(data.get("stake") or 100)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="stake must be a number")
+    if stake <= 0:
+        raise HTTPException(status_code=400, detail="stake must be positive")
+    first = legs[0] if isinstance(legs[0], dict) else {}
+    sport = str(data.get("sport") or first.get("sport") or "nba").lower()
+    if sport not in PROPS_SPORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+
+    table, matrix, snap = await prop_correlation_model(sport)
+    parsed = [parse_parlay_leg(raw, matrix, table.teams) for raw in legs]
+    correlation, relations = matrix.slice(parsed)
+    priced = price_parlay(parsed, correlation, relations, stake)
+    return {
+        "sport": sport,
+        "legs": len(parsed),
+        "stake": stake,
+        **priced,
+        "correlation": {
+            "matrix": [[round(value, 4) for value in row] for row in correlation],
+            "in_slate": [matrix.locate(leg) is not None for leg in parsed]
+        },
+        "model": {
+            "history_events": table.events,
+            "history_pairs": table.pairs,
+            "slate_props": len(matrix),
+            "slate_version": snap["version"] if snap else None
+        }
+    }
+
+
+@router.get("/parlay/correlations/{sport}")
+async def prop_correlations(sport: str, limit: int = 25):
+    """Estimated correlation classes (relation, market pair) from the historical props, strongest first"""
+    sport = sport.lower()
+    if sport not in PROPS_SPORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+    table, matrix, snap = await prop_correlation_model(sport)
+    return {
+        "sport": sport,
+        "history_events": table.events,
+        "history_pairs": table.pairs,
+        "prior_weight": table.prior_weight,
+        "classes": table.classes()[:max(1, limit)],
+        "slate": {
+            "props": len(matrix),
+            "events": len(matrix.blocks),
+            "classes_used": matrix.classes_used,
+            "version": snap["version"] if snap else None
+        }
+    }
+
+
 # =============================================================================
 # BACKWARDS COMPATIBILITY
 # =============================================================================
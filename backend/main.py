@@ -13,16 +13,52 @@ Features:
 Total: 18 esoteric modules
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 import uvicorn
 
-from live_data_router import router as live_router
+from live_data_router import router as live_router, snapshot_poller, run_startup_warmup, WARMUP_STATE
+from memory import TRACEMALLOC_FRAMES, RequestMemoryMiddleware, start_tracing
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, loop_lag_monitor, registry
+from profiling import ProfilingMiddleware
+from request_log import REQUEST_ID_HEADER, RequestLogMiddleware
+from scoring_executor import scoring_executor
+from server_timing import ServerTimingMiddleware, TimedJSONResponse
+from upstream_ledger import upstream_ledger
+
+
+async def warm_up_then_poll():
+    await run_startup_warmup()
+    # Warm-up just pulled fresh snapshots - first poll can wait a full interval.
+    # Every worker runs the poller loop; only the lease holder hits the Odds API.
+    snapshot_poller.start(delay=snapshot_poller.interval)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so /ready can report progress meanwhile
+    if TRACEMALLOC_FRAMES:
+        start_tracing(TRACEMALLOC_FRAMES)
+    warmup = asyncio.create_task(warm_up_then_poll())
+    loop_lag_monitor.start()
+    yield
+    warmup.cancel()
+    await loop_lag_monitor.stop()
+    await snapshot_poller.stop()
+    await asyncio.to_thread(upstream_ledger.flush)
+    scoring_executor.shutdown()
+
 
 app = FastAPI(
     title="Bookie-o-em API",
     description="AI Sports Prop Betting Service - v14.0 NOOSPHERE VELOCITY",
-    version="14.0"
+    version="14.0",
+    lifespan=lifespan,
+    default_response_class=TimedJSONResponse
 )
 
 # CORS - Allow all origins for development
@@ -32,8 +68,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Profile-Id", REQUEST_ID_HEADER],
 )
 
+# Request ids + slow-request JSON log; inside ServerTiming so it sees the stage trace
+app.add_middleware(RequestLogMiddleware)
+
+# Stage timing spans -> Server-Timing header + per-route aggregates (/live/timings)
+app.add_middleware(ServerTimingMiddleware)
+
+# Prometheus request metrics (/metrics)
+app.add_middleware(MetricsMiddleware)
+
+# On-demand profiling of single requests (X-Profile: <PROFILE_SECRET>)
+app.add_middleware(ProfilingMiddleware)
+
+# Peak traced memory per slate request (only while tracemalloc is on)
+app.add_middleware(RequestMemoryMiddleware)
+
 # Include the live data router
 app.include_router(live_router)
 
@@ -48,6 +100,7 @@ async def root():
         "message": "Someone always knows.",
         "endpoints": {
             "health": "/live/health",
+            "ready": "/ready",
             "props": "/live/props/{sport}",
             "best_bets": "/live/best-bets/{sport}",
             "esoteric_edge": "/live/esoteric-edge",
@@ -61,14 +114,28 @@ async def root():
 async def health():
     return {"status": "healthy", "version": "14.0"}
 
+# Readiness - 503 until the startup warm-up has finished (deploy health check)
+@app.get("/ready")
+async def ready():
+    return JSONResponse(
+        status_code=200 if WARMUP_STATE["ready"] else 503,
+        content={"status": "ready" if WARMUP_STATE["ready"] else "warming_up", **WARMUP_STATE}
+    )
+
+# Prometheus scrape endpoint - per worker; rendered off the loop (collectors read SQLite)
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(content=await asyncio.to_thread(registry.render), media_type=METRICS_CONTENT_TYPE)
+
 # Esoteric today energy (frontend expects this at /esoteric/today-energy)
 @app.get("/esoteric/today-energy")
 async def esoteric_today_energy():
-    from live_data_router import calculate_date_numerology, get_moon_phase, get_daily_energy
+    from engines.esoteric import get_day_context
+    today = get_day_context()
     return {
-        "date_numerology": calculate_date_numerology(),
-        "moon_phase": get_moon_phase(),
-        "daily_energy": get_daily_energy()
+        "date_numerology": today["date_numerology"],
+        "moon_phase": today["moon_phase"],
+        "daily_energy": today["daily_energy"]
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,316 @@
+"""
+Memory Accounting - what this worker process holds, and caps on the caches
+
+- deep_sizeof: recursive byte size of a container (shared objects counted once)
+- MemoryAccounting: named caches (with an optional byte cap) and static tables,
+  reported by GET /live/memory. enforce_caps() evicts any cache over its cap:
+  caches with an eviction order drop their oldest entries first, functools
+  lru_caches are cleared (they have no partial eviction).
+- tracemalloc: top allocation sites, and peak traced memory per slate request
+  (RequestMemoryMiddleware). Tracing costs real CPU, so it is off unless
+  TRACEMALLOC_FRAMES is set or an admin starts it from /live/memory.
+
+Sizes are per process - scoring pool workers hold their own engine caches.
+
+Config (env):
+- MEMORY_CAP_<CACHE>_MB  byte cap per cache, e.g. MEMORY_CAP_SNAPSHOT_DECODE_MB=64,
+                         MEMORY_CAP_CIPHER_VALUES_MB=8 (unset / 0 = no cap)
+- TRACEMALLOC_FRAMES     start tracemalloc at boot with this many frames (default 0 = off)
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import types
+from itertools import islice
+from typing import Callable, Optional
+
+TRACEMALLOC_FRAMES = int(os.getenv("TRACEMALLOC_FRAMES", "0"))
+
+# Results re-computed per lru_cache when estimating its size
+LRU_SAMPLE = 64
+
+# Shared program structure, not data - never counted as part of a cache
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, types.CodeType)
+
+
+def cap_bytes(cache: str) -> int:
+    """MEMORY_CAP_<CACHE>_MB in bytes (0 = uncapped)"""
+    return int(float(os.getenv(f"MEMORY_CAP_{cache.upper()}_MB", "0")) * 1024 * 1024)
+
+
+def deep_sizeof(obj) -> int:
+    """Bytes held by obj and everything it contains; modules, classes and functions are not followed"""
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIP_TYPES):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__") and not isinstance(item, (str, bytes)):
+            stack.append(item.__dict__)
+    return total
+
+
+def _lru_dict(fn) -> Optional[dict]:
+    """The key -> link (or, unbounded, key -> result) dict behind a functools.lru_cache wrapper (CPython)"""
+    size = fn.cache_info().currsize
+    for referent in gc.get_referents(fn):
+        if isinstance(referent, dict) and referent is not getattr(fn, "__dict__", None) and len(referent) == size:
+            return referent
+    return None
+
+
+def lru_cache_bytes(fn) -> int:
+    """
+    Estimated bytes held by an lru_cache. Unbounded caches hold their results
+    in the dict and are measured directly. Bounded caches keep results in
+    links not reachable from Python: keys and links are measured, results are
+    re-computed for up to LRU_SAMPLE keys and extrapolated (single-argument
+    caches, as the engines use).
+    """
+    if fn.cache_info().currsize == 0:
+        return 0
+    cache = _lru_dict(fn)
+    if cache is None:
+        return 0
+    if fn.cache_parameters()["maxsize"] is None:
+        return deep_sizeof(cache)
+    keys = list(cache)
+    links = list(islice(cache.values(), 1))
+    total = sys.getsizeof(cache) + sum(deep_sizeof(key) for key in keys)
+    total += len(keys) * (sys.getsizeof(links[0]) if links else 0)
+    sample = keys[:LRU_SAMPLE]
+    result_bytes = sum(deep_sizeof(fn.__wrapped__(key)) for key in sample)
+    return total + int(result_bytes / len(sample) * len(keys))
+
+
+class CacheAccount:
+    """One cache: how to size it, count it and (optionally) evict it down to a cap"""
+
+    def __init__(
+        self,
+        name: str,
+        measure: Callable[[], int],
+        entries: Callable[[], int],
+        evict: Optional[Callable[[int], None]] = None,
+        cap: int = None
+    ):
+        self.name = name
+        self.measure = measure
+        self.entries = entries
+        self.evict = evict
+        self.cap = cap_bytes(name) if cap is None else cap
+        self.early_evictions = 0
+
+    def enforce(self) -> bool:
+        """Evict down to the cap if over it -> whether anything was evicted"""
+        if not self.cap or self.evict is None:
+            return False
+        if self.measure() <= self.cap:
+            return False
+        self.evict(self.cap)
+        self.early_evictions += 1
+        return True
+
+    def report(self) -> dict:
+        return {
+            "bytes": self.measure(),
+            "entries": self.entries(),
+            "cap_bytes": self.cap or None,
+            "early_evictions": self.early_evictions
+        }
+
+
+class MemoryAccounting:
+    """Registry of sized caches and static tables for this process"""
+
+    def __init__(self):
+        self._caches = {}
+        self._tables = {}
+
+    def register_cache(self, name: str, measure, entries, evict=None, cap: int = None) -> CacheAccount:
+        account = self._caches[name] = CacheAccount(name, measure, entries, evict, cap)
+        return account
+
+    def register_lru_cache(self, name: str, fn, cap: int = None) -> CacheAccount:
+        """functools.lru_cache - sized by lru_cache_bytes, evicted by cache_clear()"""
+        return self.register_cache(
+            name,
+            lambda: lru_cache_bytes(fn),
+            lambda: fn.cache_info().currsize,
+            lambda _cap: fn.cache_clear(),
+            cap
+        )
+
+    def register_table(self, name: str, getter: Callable[[], Optional[object]]):
+        """Static table; getter returns None while it is not loaded"""
+        self._tables[name] = getter
+
+    def enforce_caps(self) -> list:
+        """Apply every cache cap -> names of the caches that were evicted"""
+        return [name for name, account in self._caches.items() if account.enforce()]
+
+    def report(self) -> dict:
+        started = time.perf_counter()
+        caches = {name: account.report() for name, account in self._caches.items()}
+        tables = {}
+        for name, getter in self._tables.items():
+            table = getter()
+            tables[name] = {
+                "loaded": table is not None,
+                "bytes": deep_sizeof(table) if table is not None else 0,
+                "entries": len(table) if table is not None else 0
+            }
+        return {
+            "caches": caches,
+            "tables": tables,
+            "total_cache_bytes": sum(c["bytes"] for c in caches.values()),
+            "total_table_bytes": sum(t["bytes"] for t in tables.values()),
+            "measure_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+
+
+memory_accounting = MemoryAccounting()
+
+
+# ============================================================================
+# TRACEMALLOC - allocation sites and per-request peaks
+# ============================================================================
+
+_TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>")
+)
+
+
+def start_tracing(frames: int = None):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames or TRACEMALLOC_FRAMES or 1)
+
+
+def stop_tracing():
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    request_memory.reset()
+
+
+def _site(traceback, group_by: str):
+    frame = traceback[0]
+    if group_by == "filename":
+        return frame.filename
+    if group_by == "lineno":
+        return f"{frame.filename}:{frame.lineno}"
+    return [f"{f.filename}:{f.lineno}" for f in traceback]
+
+
+def top_allocations(limit: int = 20, group_by: str = "lineno") -> dict:
+    """Largest live allocation sites from a tracemalloc snapshot (group_by lineno / filename / traceback)"""
+    if not tracemalloc.is_tracing():
+        return {"tracing": False}
+    snapshot = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+    stats = snapshot.statistics(group_by)
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "tracing": True,
+        "frames": tracemalloc.get_traceback_limit(),
+        "traced_bytes": current,
+        "traced_peak_bytes": peak,
+        "group_by": group_by,
+        "top": [
+            {
+                "site": _site(stat.traceback, group_by),
+                "bytes": stat.size,
+                "count": stat.count
+            }
+            for stat in stats[:limit]
+        ]
+    }
+
+
+class RequestMemory:
+    """
+    Peak traced memory above the request's starting point, per route. tracemalloc
+    has one process-wide peak, so the peak is only reset while no other tracked
+    request is in flight; overlapping requests share (and over-report) it.
+    """
+
+    def __init__(self):
+        self._in_flight = 0
+        self._routes = {}
+
+    def begin(self) -> int:
+        if self._in_flight == 0:
+            tracemalloc.reset_peak()
+        self._in_flight += 1
+        return tracemalloc.get_traced_memory()[0]
+
+    def end(self, route: str, baseline: int, overlapped: bool):
+        self._in_flight -= 1
+        peak = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+        entry = self._routes.get(route)
+        if entry is None:
+            entry = self._routes[route] = {"requests": 0, "total_peak": 0, "max_peak": 0, "overlapped": 0}
+        entry["requests"] += 1
+        entry["total_peak"] += peak
+        entry["max_peak"] = max(entry["max_peak"], peak)
+        entry["last_peak"] = peak
+        if overlapped:
+            entry["overlapped"] += 1
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def reset(self):
+        self._routes = {}
+
+    def stats(self) -> dict:
+        return {
+            route: {
+                "requests": entry["requests"],
+                "avg_peak_bytes": entry["total_peak"] // entry["requests"],
+                "max_peak_bytes": entry["max_peak"],
+                "last_peak_bytes": entry["last_peak"],
+                "overlapped_requests": entry["overlapped"]
+            }
+            for route, entry in sorted(self._routes.items())
+        }
+
+
+request_memory = RequestMemory()
+
+# Slate endpoints - the ones whose payloads are big enough to matter
+SLATE_PATH_PREFIXES = ("/live/props/", "/live/best-bets/", "/live/export/")
+
+
+class RequestMemoryMiddleware:
+    """Pure ASGI middleware; records slate requests' peak memory while tracemalloc is tracing"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracemalloc.is_tracing() or not scope["path"].startswith(SLATE_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        overlapped = request_memory.in_flight > 0
+        baseline = request_memory.begin()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            overlapped = overlapped or request_memory.in_flight > 1
+            request_memory.end(route.path if route is not None else scope["path"], baseline, overlapped)
@@ -0,0 +1,271 @@
+"""
+Metrics - Prometheus text exposition (format 0.0.4) for GET /metrics
+
+Dependency-free Counter / Gauge / Histogram plus scrape-time collectors for
+state that already lives elsewhere (cache stats, circuit breakers, the
+scoring executor). Each uvicorn/gunicorn worker exposes its own series,
+every sample labelled worker="<METRICS_WORKER>", so scrapes that land on
+different workers behind one port stay separate series; aggregate with
+sum without (worker).
+
+- MetricsMiddleware   per-route latency + response size histograms, status
+                      counters and the in-flight gauge
+- LoopLagMonitor      event-loop lag, sampled by a background task
+
+Config (env):
+- LOOP_LAG_INTERVAL  seconds between event-loop lag samples (default 0.5)
+- METRICS_WORKER     worker label value (default: the process id)
+"""
+
+import asyncio
+import math
+import os
+import time
+from typing import Callable, Iterable, Optional
+
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.5"))
+METRICS_WORKER = os.getenv("METRICS_WORKER") or str(os.getpid())
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds - request/upstream latency
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Bytes - response payloads
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _sample(name: str, labels: dict, value: float) -> str:
+    if labels:
+        body = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+        return f"{name}{{{body}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+
+    def _key(self, labels: tuple) -> tuple:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labels}")
+        return tuple(str(v) for v in labels)
+
+    def samples(self, const_labels: dict = None) -> Iterable[str]:
+        for key, value in sorted(list(self._values.items())):
+            yield _sample(self.name, {**(const_labels or {}), **dict(zip(self.labelnames, key))}, value)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, *labels):
+        self._values[self._key(labels)] = value
+
+    def inc(self, *labels, amount: float = 1):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, *labels):
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+        counts = state[0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        state[1] += value
+        state[2] += 1
+
+    def samples(self, const_labels: dict = None) -> Iterable[str]:
+        for key, (counts, total, count) in sorted(list(self._values.items())):
+            labels = {**(const_labels or {}), **dict(zip(self.labelnames, key))}
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                yield _sample(f"{self.name}_bucket", {**labels, "le": _format_value(float(bound))}, cumulative)
+            yield _sample(f"{self.name}_sum", labels, total)
+            yield _sample(f"{self.name}_count", labels, count)
+
+
+class MetricsRegistry:
+    """Named metrics + scrape-time collectors, rendered as one exposition page"""
+
+    def __init__(self, const_labels: dict = None):
+        # Added to every sample on render (e.g. the worker label)
+        self.const_labels = dict(const_labels or {})
+        self._metrics = {}
+        self._collectors = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            # Module reloads / repeated imports get the live instance back
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def collector(self, fn: Callable[[], Iterable[tuple]]):
+        """
+        Register fn, called on every scrape. It yields
+        (name, kind, help, [(labels_dict, value), ...]) families.
+        """
+        self._collectors.append(fn)
+        return fn
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples(self.const_labels))
+        for fn in self._collectors:
+            for name, kind, documentation, samples in fn():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(_sample(name, {**self.const_labels, **labels}, value) for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(const_labels={"worker": METRICS_WORKER})
+
+
+# ============================================================================
+# HTTP - per-route latency, status, payload size, in-flight
+# ============================================================================
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "Time to response start per route", ("method", "route")
+)
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "Requests by route and status code", ("method", "route", "status")
+)
+HTTP_RESPONSE_SIZE = registry.histogram(
+    "http_response_size_bytes", "Response body size per route", ("method", "route"), SIZE_BUCKETS
+)
+HTTP_IN_FLIGHT = registry.gauge("http_requests_in_flight", "Requests currently being handled")
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware; unmatched paths are reported as route="unmatched" """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        state = {"status": 500, "duration": None, "bytes": 0}
+
+        async def send_with_metrics(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                state["duration"] = time.perf_counter() - started
+            elif message["type"] == "http.response.body":
+                state["bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = scope.get("route")
+            labels = (scope["method"], route.path if route is not None else "unmatched")
+            duration = state["duration"] if state["duration"] is not None else time.perf_counter() - started
+            HTTP_REQUEST_DURATION.observe(duration, *labels)
+            HTTP_RESPONSE_SIZE.observe(state["bytes"], *labels)
+            HTTP_REQUESTS.inc(*labels, state["status"])
+
+
+# ============================================================================
+# EVENT LOOP LAG
+# ============================================================================
+
+LOOP_LAG = registry.gauge("event_loop_lag_seconds", "Last measured event-loop scheduling delay")
+LOOP_LAG_HISTOGRAM = registry.histogram(
+    "event_loop_lag_sample_seconds", "Event-loop scheduling delay samples",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+
+class LoopLagMonitor:
+    """Sleeps `interval` in a loop; oversleep is time the loop was blocked"""
+
+    def __init__(self, interval: float = None):
+        self.interval = interval or LOOP_LAG_INTERVAL
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            LOOP_LAG.set(lag)
+            LOOP_LAG_HISTOGRAM.observe(lag)
+
+
+loop_lag_monitor = LoopLagMonitor()
@@ -0,0 +1,311 @@
+"""
+Noosphere Stream - search-volume observations in, rolling baselines and signals out
+
+POST /live/noosphere/ingest takes timestamped volume observations for teams
+and players (a JSON batch or an NDJSON stream). Each one updates its entity
+in O(1):
+- an exponentially weighted mean and variance of the volume (NOOSPHERE_EWMA_ALPHA),
+  seeded from TEAM_BASELINE_VOLUMES (teams) or the phantom-injury default 50 (players)
+- the entity's Noosphere result (calculate_noosphere_velocity), computed once
+  against the baseline as it stood before the observation, so a spike is
+  measured against history rather than against itself
+
+Scoring reads the stored result as calculate_main_confidence's noosphere_data -
+nothing is computed at request time. Teams get the insider-leak signal,
+players the phantom-injury one; main-character syndrome compares two teams
+within one game and stays on POST /live/noosphere/main-character.
+
+State lives in a table in the shared cache file, so every worker sees the
+same baselines: an ingest takes the write lock, pulls rows other workers
+changed (by sequence number), updates and writes back; readers pull only
+rows newer than the last sequence they saw.
+
+Observations older than the entity's latest are skipped (out_of_order).
+A stored result only feeds scoring while its observation is younger than
+NOOSPHERE_MAX_AGE; past that the entity has gone quiet, its baseline is kept
+for the next observation but its signal no longer counts.
+
+Config (env):
+- NOOSPHERE_EWMA_ALPHA   weight of each new observation (default 0.2)
+- NOOSPHERE_MAX_AGE      seconds a stored result stays live for scoring (default 21600)
+- NOOSPHERE_STREAM_PATH  SQLite file (default: SHARED_CACHE_PATH)
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Iterable, Optional
+
+from engines.noosphere import calculate_noosphere_velocity, get_baseline_volume
+from engines.resonance import resolve_franchise_name, resolve_star_player_name
+from shared_cache import SHARED_CACHE_PATH
+
+NOOSPHERE_EWMA_ALPHA = float(os.getenv("NOOSPHERE_EWMA_ALPHA", "0.2"))
+NOOSPHERE_STREAM_PATH = os.getenv("NOOSPHERE_STREAM_PATH", SHARED_CACHE_PATH)
+NOOSPHERE_MAX_AGE = float(os.getenv("NOOSPHERE_MAX_AGE", "21600"))
+
+# Player baseline before any observation - detect_phantom_injury's default
+PLAYER_SEED_BASELINE = 50.0
+# Rejected observations echoed back per ingest
+REJECTED_SHOWN = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS noosphere_baselines (
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    volume REAL NOT NULL,
+    mean REAL NOT NULL,
+    var REAL NOT NULL,
+    n INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (kind, name)
+);
+CREATE INDEX IF NOT EXISTS noosphere_baselines_seq ON noosphere_baselines (seq);
+"""
+
+COLUMNS = ("kind", "name", "seq", "ts", "volume", "mean", "var", "n", "state")
+
+
+def parse_timestamp(value) -> float:
+    """Unix seconds, or an ISO 8601 string -> unix seconds (default: now)"""
+    if value is None:
+        return time.time()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def parse_observation(raw: dict) -> tuple:
+    """
+    {"team" | "player": name, "volume": n, "ts": ..., "has_news": bool,
+     "queries": [...], "injury_report": bool} -> (kind, name, ts, volume, extras).
+    ValueError if it is not usable.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("observation must be an object")
+    if raw.get("team"):
+        kind, name = "team", str(raw["team"])
+        name = resolve_franchise_name(name) or name
+    elif raw.get("player"):
+        kind, name = "player", str(raw["player"])
+        name = resolve_star_player_name(name) or name
+    else:
+        raise ValueError("team or player required")
+    try:
+        volume = float(raw["volume"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("numeric volume required")
+    if not math.isfinite(volume) or volume < 0:
+        raise ValueError("volume must be a finite number >= 0")
+    ts = parse_timestamp(raw.get("ts"))
+    extras = {
+        "has_news": bool(raw.get("has_news", False)),
+        "queries": [str(q) for q in raw.get("queries") or []],
+        "injury_report": bool(raw.get("injury_report", False))
+    }
+    return kind, name, ts, volume, extras
+
+
+def entity_signal(kind: str, name: str, volume: float, baseline: float, extras: dict) -> dict:
+    """The entity's Noosphere result for one observation against its prior baseline"""
+    if kind == "team":
+        return calculate_noosphere_velocity(
+            name, team_volume=volume, has_news=extras["has_news"], team_baseline=baseline
+        )
+    return calculate_noosphere_velocity(
+        name, player_name=name, player_volume=volume, player_queries=extras["queries"],
+        player_baseline=baseline, player_injury_report=extras["injury_report"]
+    )
+
+
+class NoosphereStream:
+    """Per team / player EWMA baselines and current Noosphere results, shared through SQLite"""
+
+    def __init__(self, path: str = None, alpha: float = None, max_age: float = None):
+        self.path = path or NOOSPHERE_STREAM_PATH
+        self.alpha = alpha or NOOSPHERE_EWMA_ALPHA
+        self.max_age = max_age or NOOSPHERE_MAX_AGE
+        self._entities = {}
+        self._seq = 0
+        self._local = threading.local()
+        # _lock serialises sync/ingest (held across the SQLite write lock);
+        # _entities_lock only guards the dict, so loop-side reads never wait on SQLite
+        self._lock = threading.Lock()
+        self._entities_lock = threading.Lock()
+        self.observations = 0
+        self.out_of_order = 0
+        self.rejected = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _pull(self, conn: sqlite3.Connection) -> int:
+        rows = conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM noosphere_baselines WHERE seq > ? ORDER BY seq", (self._seq,)
+        ).fetchall()
+        for row in rows:
+            entry = dict(zip(COLUMNS, row))
+            entry.update(json.loads(entry.pop("state")))
+            with self._entities_lock:
+                self._entities[(entry["kind"], entry["name"])] = entry
+            self._seq = max(self._seq, entry["seq"])
+        return len(rows)
+
+    def sync(self) -> int:
+        """Pull baselines other workers updated -> rows pulled (blocking; run in a thread)"""
+        with self._lock:
+            return self._pull(self._conn())
+
+    def _update(self, kind: str, name: str, ts: float, volume: float, extras: dict) -> Optional[dict]:
+        entry = self._entities.get((kind, name))
+        if entry is None:
+            seed = float(get_baseline_volume(name)) if kind == "team" else PLAYER_SEED_BASELINE
+            entry = {"kind": kind, "name": name, "ts": 0.0, "volume": seed, "mean": seed, "var": 0.0, "n": 0}
+        elif ts < entry["ts"]:
+            self.out_of_order += 1
+            return None
+
+        baseline, variance = entry["mean"], entry["var"]
+        diff = volume - baseline
+        increment = self.alpha * diff
+        entry = {
+            **entry,
+            "ts": ts,
+            "volume": volume,
+            "mean": baseline + increment,
+            "var": (1 - self.alpha) * (variance + diff * increment),
+            "n": entry["n"] + 1,
+            **extras,
+            "baseline_before": round(baseline, 3),
+            "z_score": round(diff / math.sqrt(variance), 3) if variance > 0 else None,
+            "noosphere_data": entity_signal(kind, name, volume, baseline, extras)
+        }
+        with self._entities_lock:
+            self._entities[(kind, name)] = entry
+        return entry
+
+    def ingest(self, observations: Iterable[dict]) -> dict:
+        """Apply a batch of raw observations (blocking; run in a thread) -> counts"""
+        parsed, rejected = [], []
+        for i, raw in enumerate(observations):
+            try:
+                parsed.append(parse_observation(raw))
+            except ValueError as e:
+                rejected.append({"index": i, "error": str(e)})
+        parsed.sort(key=lambda obs: obs[2])
+
+        applied = {}
+        updates = 0
+        with self._lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._pull(conn)
+                for kind, name, ts, volume, extras in parsed:
+                    entry = self._update(kind, name, ts, volume, extras)
+                    if entry is not None:
+                        applied[(kind, name)] = entry
+                        updates += 1
+                for entry in applied.values():
+                    self._seq += 1
+                    entry["seq"] = self._seq
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO noosphere_baselines ({', '.join(COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(COLUMNS))})",
+                    [self._row(entry) for entry in applied.values()]
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                # Local state may hold updates that were not written - reload it
+                with self._entities_lock:
+                    self._entities.clear()
+                self._seq = 0
+                raise
+
+        self.observations += len(parsed)
+        self.rejected += len(rejected)
+        return {
+            "received": len(parsed) + len(rejected),
+            "applied": updates,
+            "entities_updated": len(applied),
+            "rejected": len(rejected),
+            "rejected_sample": rejected[:REJECTED_SHOWN],
+            "active_signals": sorted(
+                entry["name"] for entry in applied.values() if entry["noosphere_data"]["active_signals"]
+            )
+        }
+
+    @staticmethod
+    def _row(entry: dict) -> tuple:
+        state = {key: value for key, value in entry.items() if key not in COLUMNS}
+        return tuple(json.dumps(state) if column == "state" else entry[column] for column in COLUMNS)
+
+    # ------------------------------------------------------------------
+    # Reads - in-memory, call sync() first for other workers' updates
+    # ------------------------------------------------------------------
+
+    def get(self, kind: str, name: str) -> Optional[dict]:
+        if kind == "team":
+            name = resolve_franchise_name(name) or name
+        else:
+            name = resolve_star_player_name(name) or name
+        with self._entities_lock:
+            return self._entities.get((kind, name))
+
+    def live(self, entry: dict, now: float = None) -> bool:
+        """The entry's result is recent enough to score with"""
+        return (now if now is not None else time.time()) - entry["ts"] <= self.max_age
+
+    def noosphere_for(self, teams: Iterable[str] = (), players: Iterable[str] = ()) -> dict:
+        """name as given -> stored noosphere_data, for the names with a live result"""
+        now = time.time()
+        found = {}
+        for kind, names in (("team", teams), ("player", players)):
+            for name in names:
+                entry = self.get(kind, name) if name else None
+                if entry is not None and self.live(entry, now):
+                    found[name] = entry["noosphere_data"]
+        return found
+
+    def entries(self, kind: str = None) -> list:
+        with self._entities_lock:
+            return [
+                entry for (entry_kind, _), entry in self._entities.items()
+                if kind is None or entry_kind == kind
+            ]
+
+    def stats(self) -> dict:
+        return {
+            "entities": len(self._entities),
+            "max_age": self.max_age,
+            "seq": self._seq,
+            "alpha": self.alpha,
+            "observations": self.observations,
+            "out_of_order": self.out_of_order,
+            "rejected": self.rejected
+        }
+
+    def reset(self):
+        """Drop every baseline (tests and benchmarks)"""
+        with self._lock:
+            self._conn().execute("DELETE FROM noosphere_baselines")
+            with self._entities_lock:
+                self._entities.clear()
+            self._seq = 0
+
+
+noosphere_stream = NoosphereStream()
@@ -0,0 +1,293 @@
+"""
+Request Profiling - deterministic profile of one request, on demand
+
+An admin sends the request with X-Profile: <PROFILE_SECRET> (or
+?profile=<PROFILE_SECRET>, which ends up in access logs, so prefer the
+header). ProfilingMiddleware runs that request under a sys.setprofile hook,
+stores the result and answers with an X-Profile-Id header. The profile is
+then available from GET /live/profiles/{id}.
+
+Profiles are collapsed stacks ("module:func;module:func <microseconds>"),
+self time per stack. flamegraph.pl, speedscope and inferno read them as-is.
+- Only frames running in the profiled request's context count: other requests
+  interleaved on the event loop are skipped, while tasks the request spawns
+  (e.g. a snapshot refresh) are included, each on its own call stack.
+- Scoring batches sent to the process pool are profiled inside the worker
+  and merged under "[scoring_worker]" (see scoring_executor.profiled_batch).
+- Time spent suspended (awaiting upstream, the pool, other requests) is
+  reported as suspended_ms, not as stacks.
+
+Requests without the flag pay one header lookup. The hook is installed only
+while a profiled request is in flight; during that window every frame on
+the loop thread pays a context check.
+
+Stdlib only - scoring workers import this.
+
+Config (env):
+- PROFILE_SECRET      shared secret; profiling is off while unset
+- PROFILE_STORE_SIZE  most recent profiles kept in memory (default 20)
+"""
+
+import asyncio
+import hmac
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+from urllib.parse import parse_qs
+
+PROFILE_SECRET = os.getenv("PROFILE_SECRET", "")
+PROFILE_STORE_SIZE = int(os.getenv("PROFILE_STORE_SIZE", "20"))
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+_current_profile: ContextVar = ContextVar("request_profile", default=None)
+_labels = {}
+
+
+def _stack_key():
+    """The running task, or the thread id when no loop is running in this thread"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return task if task is not None else threading.get_ident()
+
+
+def _code_label(code, module: Optional[str]) -> str:
+    label = _labels.get(code)
+    if label is None:
+        label = _labels[code] = f"{module or '?'}:{code.co_qualname}"
+    return label
+
+
+def _builtin_label(fn) -> str:
+    module = getattr(fn, "__module__", None) or type(getattr(fn, "__self__", None)).__name__
+    return f"{module}:{getattr(fn, '__qualname__', repr(fn))}"
+
+
+class RequestProfile:
+    """Collapsed-stack self times for one request (or one scoring batch in a worker)"""
+
+    def __init__(self, method: str = "", path: str = ""):
+        self.id = uuid.uuid4().hex[:12]
+        self.method = method
+        self.path = path
+        self.created = datetime.now().isoformat()
+        self.stacks = {}
+        self.status = None
+        self.wall_ms = 0.0
+        self.suspended_ms = 0.0
+        # One call stack per task (per thread outside a loop): the request's
+        # tasks interleave on the loop, and each one's frames nest only in its own
+        self._stacks = {}
+        self._last = None
+        self._started = None
+        self._running = False
+
+    def _event(self, frame, event, arg):
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self._last = now
+        key = _stack_key()
+        stack = self._stacks.get(key)
+        if stack is None:
+            stack = self._stacks[key] = []
+        if stack:
+            path = stack[-1][1]
+            self.stacks[path] = self.stacks.get(path, 0.0) + elapsed
+        else:
+            self.suspended_ms += elapsed * 1000
+
+        if event == "call":
+            label = _code_label(frame.f_code, frame.f_globals.get("__name__"))
+            stack.append((frame, f"{stack[-1][1]};{label}" if stack else label))
+        elif event == "return":
+            if stack and stack[-1][0] is frame:
+                stack.pop()
+        elif event == "c_call":
+            label = _builtin_label(arg)
+            stack.append((arg, f"{stack[-1][1]};{label}" if stack else label))
+        elif stack and stack[-1][0] is arg:
+            # c_return / c_exception
+            stack.pop()
+
+    def start(self):
+        self._started = self._last = time.perf_counter()
+        self._running = True
+        _install_hook()
+
+    def stop(self):
+        # Tasks the request spawned may outlive it with the profile still in their context
+        self._running = False
+        _remove_hook()
+        self.wall_ms = round((time.perf_counter() - self._started) * 1000, 2)
+        self.suspended_ms = round(self.suspended_ms, 2)
+        self._stacks = {}
+
+    def merge(self, stacks: dict, prefix: str = None):
+        """Fold in another profile's stacks (seconds), e.g. from a scoring worker"""
+        for path, seconds in stacks.items():
+            key = f"{prefix};{path}" if prefix else path
+            self.stacks[key] = self.stacks.get(key, 0.0) + seconds
+
+    def collapsed(self) -> str:
+        """Folded stacks, one "frame;frame;frame <microseconds>" line each"""
+        lines = []
+        for path, seconds in sorted(self.stacks.items()):
+            us = int(seconds * 1e6)
+            if us > 0:
+                lines.append(f"{path} {us}")
+        return "\n".join(lines) + "\n"
+
+    def top_functions(self, limit: int = 25) -> list:
+        """Leaf frames by self time"""
+        totals = {}
+        for path, seconds in self.stacks.items():
+            leaf = path.rsplit(";", 1)[-1]
+            totals[leaf] = totals.get(leaf, 0.0) + seconds
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [{"function": name, "self_ms": round(seconds * 1000, 3)} for name, seconds in ranked]
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "created": self.created,
+            "wall_ms": self.wall_ms,
+            "profiled_ms": round(sum(self.stacks.values()) * 1000, 2),
+            "suspended_ms": self.suspended_ms,
+            "stacks": len(self.stacks)
+        }
+
+
+# ============================================================================
+# PROFILE HOOK - installed only while a profile is running
+# ============================================================================
+
+_hook_lock = threading.Lock()
+_hook_users = 0
+_previous_hook = None
+
+
+def _profile_hook(frame, event, arg):
+    profile = _current_profile.get()
+    if profile is not None and profile._running:
+        profile._event(frame, event, arg)
+
+
+def _install_hook():
+    global _hook_users, _previous_hook
+    with _hook_lock:
+        if _hook_users == 0:
+            _previous_hook = sys.getprofile()
+            sys.setprofile(_profile_hook)
+        _hook_users += 1
+
+
+def _remove_hook():
+    global _hook_users, _previous_hook
+    with _hook_lock:
+        _hook_users -= 1
+        if _hook_users == 0:
+            sys.setprofile(_previous_hook)
+            _previous_hook = None
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """The profile recording this context, if it is still running"""
+    profile = _current_profile.get()
+    return profile if profile is not None and profile._running else None
+
+
+def run_profiled(profile: RequestProfile, fn, *args):
+    """Call fn(*args) under profile (synchronous code, e.g. a scoring batch)"""
+    token = _current_profile.set(profile)
+    profile.start()
+    try:
+        return fn(*args)
+    finally:
+        profile.stop()
+        _current_profile.reset(token)
+
+
+class ProfileStore:
+    """The last PROFILE_STORE_SIZE profiles, by id"""
+
+    def __init__(self, size: int = None):
+        self.size = size or PROFILE_STORE_SIZE
+        self._profiles = OrderedDict()
+
+    def add(self, profile: RequestProfile):
+        self._profiles[profile.id] = profile
+        while len(self._profiles) > self.size:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        return self._profiles.get(profile_id)
+
+    def list(self) -> list:
+        return [profile.summary() for profile in reversed(self._profiles.values())]
+
+
+profile_store = ProfileStore()
+
+
+def profiling_authorized(secret: Optional[str]) -> bool:
+    """Whether secret matches PROFILE_SECRET (always False while profiling is off)"""
+    return bool(PROFILE_SECRET) and bool(secret) and hmac.compare_digest(secret, PROFILE_SECRET)
+
+
+def _requested_secret(scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == b"x-profile":
+            return value.decode("latin-1")
+    query = scope.get("query_string", b"")
+    if b"profile=" in query:
+        values = parse_qs(query.decode("latin-1")).get("profile")
+        if values:
+            return values[0]
+    return None
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware; profiles requests that carry the admin secret"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not PROFILE_SECRET:
+            await self.app(scope, receive, send)
+            return
+        secret = _requested_secret(scope)
+        if secret is None or not profiling_authorized(secret):
+            # A wrong secret is treated like no flag - don't confirm the feature exists
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"])
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (PROFILE_ID_HEADER.lower().encode(), profile.id.encode())]
+            await send(message)
+
+        token = _current_profile.set(profile)
+        profile.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.stop()
+            _current_profile.reset(token)
+            profile_store.add(profile)
@@ -0,0 +1,169 @@
+"""
+Request Log - request ids and a structured line per slow request
+
+RequestLogMiddleware gives every HTTP request an id (the caller's
+X-Request-Id when it is a sane token, else a fresh one), returns it as
+X-Request-Id and keeps it current for the request's context:
+- upstream ledger entries carry it (request_id) and are collected on the
+  request, so the log line can list the Odds API calls it made
+- the stage trace it reads is the one ServerTimingMiddleware bound, which
+  already holds the scoring spans shipped back from pool workers
+
+Requests slower than SLOW_REQUEST_MS emit one JSON line on the
+"slow_requests" logger: id, route, status, duration, and the slowest stages
+and upstream calls. Everything else pays an id, a context switch and one
+comparison, so it stays on in production.
+
+A snapshot refresh shared by several requests runs in the context of the
+request that started it; the others see the wait as their own stage time
+but not the upstream calls.
+
+Config (env):
+- SLOW_REQUEST_MS   log requests at least this slow (default 1000; 0 logs every request)
+- SLOW_REQUEST_TOP  stages / upstream calls listed per line (default 5)
+"""
+
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+from timing import current_trace
+from upstream_ledger import bind_initiator, unbind_initiator
+
+slow_logger = logging.getLogger("slow_requests")
+
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "1000"))
+SLOW_REQUEST_TOP = int(os.getenv("SLOW_REQUEST_TOP", "5"))
+
+REQUEST_ID_HEADER = "X-Request-Id"
+# Upstream calls kept per request (a props slate is one call per event)
+UPSTREAM_PER_REQUEST = 200
+
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+_current_request: ContextVar = ContextVar("request_record", default=None)
+
+
+class RequestRecord:
+    """Id plus the upstream calls made by one request"""
+
+    __slots__ = ("id", "upstream")
+
+    def __init__(self, request_id: str):
+        self.id = request_id
+        self.upstream = []
+
+    def add_upstream(self, entry: dict):
+        if len(self.upstream) < UPSTREAM_PER_REQUEST:
+            self.upstream.append(entry)
+
+
+def current_request() -> Optional[RequestRecord]:
+    return _current_request.get()
+
+
+def current_request_id() -> Optional[str]:
+    record = _current_request.get()
+    return record.id if record is not None else None
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def _incoming_request_id(scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            request_id = value.decode("latin-1")
+            return request_id if _VALID_REQUEST_ID.match(request_id) else None
+    return None
+
+
+def slow_request_line(
+    record: RequestRecord,
+    method: str,
+    route: str,
+    path: str,
+    status: Optional[int],
+    duration_ms: float,
+    spans: dict,
+    top: int = None
+) -> dict:
+    """The JSON-able log entry for one slow request"""
+    top = top or SLOW_REQUEST_TOP
+    stages = sorted(spans.items(), key=lambda item: item[1][0], reverse=True)
+    upstream = sorted(record.upstream, key=lambda entry: entry["latency_ms"], reverse=True)
+    return {
+        "event": "slow_request",
+        "request_id": record.id,
+        "method": method,
+        "route": route,
+        "path": path,
+        "status": status,
+        "duration_ms": round(duration_ms, 1),
+        "stages": [
+            {"stage": stage, "ms": round(ms, 2), "count": count}
+            for stage, (ms, count) in stages if stage != "total"
+        ][:top],
+        "upstream_calls": len(record.upstream),
+        "upstream_ms": round(sum(entry["latency_ms"] for entry in record.upstream), 1),
+        "upstream": [
+            {
+                "path": entry["path"],
+                "sport": entry["sport"],
+                "markets": entry["markets"],
+                "status": entry["status"],
+                "ms": entry["latency_ms"],
+                "quota_cost": entry["quota_cost"]
+            }
+            for entry in upstream[:top]
+        ]
+    }
+
+
+class RequestLogMiddleware:
+    """
+    Pure ASGI middleware. Sits inside ServerTimingMiddleware so the request's
+    stage trace is bound when it logs.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        record = RequestRecord(_incoming_request_id(scope) or new_request_id())
+        status = None
+
+        async def send_with_request_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [*message.get("headers", []), (b"x-request-id", record.id.encode())]
+            await send(message)
+
+        token = _current_request.set(record)
+        # Odds API calls made for this request are credited to its route in the ledger
+        initiator_token = bind_initiator(scope)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            unbind_initiator(initiator_token)
+            _current_request.reset(token)
+            if duration_ms >= SLOW_REQUEST_MS:
+                trace = current_trace()
+                route = scope.get("route")
+                line = slow_request_line(
+                    record, scope["method"], route.path if route is not None else None, scope["path"],
+                    status, duration_ms, trace.spans if trace is not None else {}
+                )
+                slow_logger.warning(json.dumps(line, default=str))
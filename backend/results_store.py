@@ -0,0 +1,473 @@
+"""
+Results Store - graded games in, per-team pattern state out
+
+The Shannon entropy, Rule of Three and Annulifier endpoints take a client's
+result list and rescan it on every call. This store is fed graded games
+(POST /live/results, or the Odds API scores feed from the poller) and keeps,
+per (sport, team, market), state that each game updates in O(1):
+- the last RESULTS_WINDOW outcomes and their histogram, so the window's
+  normalized entropy is a sum over at most two counts
+- the current streak (value, length) - the Rule of Three's exhaustion node
+- the current alternating run length - the Annulifier's harmonic lock
+
+Markets: "ml" (W/L), "ats" (W/L = covered/missed the closing home spread,
+pushes skipped) and "total" (O/U, pushes skipped). ATS and totals need the
+line, so games without one only feed "ml".
+
+Each update re-files the team in a league index of active patterns
+(exhaustion, harmonic_lock, low_entropy per sport and market), so "which
+teams are in an exhaustion node right now" is a dict read, not N rescans.
+
+Games live in a table in the shared cache file: a write inserts them under
+the write lock (duplicate event ids are ignored), and every worker pulls
+rows newer than the last sequence number it applied. A game older than a
+team's latest rebuilds that team from the table in commence order.
+
+Config (env):
+- RESULTS_WINDOW      outcomes kept per team and market (default 10, min 5)
+- RESULTS_STORE_PATH  SQLite file (default: SHARED_CACHE_PATH)
+"""
+
+import math
+import os
+import sqlite3
+import threading
+from collections import deque
+from typing import Iterable, Optional
+
+from engines.resonance import resolve_franchise_name
+from noosphere_stream import parse_timestamp
+from shared_cache import SHARED_CACHE_PATH
+
+# The Annulifier's extended lock needs the last five outcomes in the window
+RESULTS_WINDOW = max(5, int(os.getenv("RESULTS_WINDOW", "10")))
+RESULTS_STORE_PATH = os.getenv("RESULTS_STORE_PATH", SHARED_CACHE_PATH)
+
+MARKETS = ("ml", "ats", "total")
+SIGNALS = ("exhaustion", "harmonic_lock", "low_entropy")
+# Market a league query reads when none is given - the one each engine scans
+DEFAULT_MARKETS = {"exhaustion": "ats", "harmonic_lock": "ml", "low_entropy": "ml"}
+OUTCOME_NAMES = {"W": "WIN", "L": "LOSS", "O": "OVER", "U": "UNDER"}
+OPPOSITE = {"W": "L", "L": "W", "O": "U", "U": "O"}
+# analyze_shannon_entropy's fade threshold (states LOW / CRITICAL_LOW)
+LOW_ENTROPY = 0.5
+# Rejected results echoed back per record
+REJECTED_SHOWN = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results_games (
+    event_id TEXT PRIMARY KEY,
+    sport TEXT NOT NULL,
+    commence_ts REAL NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    home_score INTEGER NOT NULL,
+    away_score INTEGER NOT NULL,
+    home_spread REAL,
+    total REAL,
+    seq INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_games_seq ON results_games (seq);
+CREATE INDEX IF NOT EXISTS results_games_home ON results_games (sport, home_team);
+CREATE INDEX IF NOT EXISTS results_games_away ON results_games (sport, away_team);
+"""
+
+COLUMNS = (
+    "event_id", "sport", "commence_ts", "home_team", "away_team",
+    "home_score", "away_score", "home_spread", "total", "seq"
+)
+
+
+def optional_number(raw: dict, key: str) -> Optional[float]:
+    value = raw.get(key)
+    if value is None:
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} must be a number")
+    if not math.isfinite(value):
+        raise ValueError(f"{key} must be finite")
+    return value
+
+
+def parse_result(raw: dict) -> dict:
+    """
+    {"sport", "home_team", "away_team", "home_score", "away_score",
+     "commence_time", "id", "home_spread", "total"} -> a results_games row
+    (without seq). ValueError if it is not usable.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("result must be an object")
+    sport = str(raw.get("sport") or "").lower()
+    if not sport:
+        raise ValueError("sport required")
+    teams = []
+    for key in ("home_team", "away_team"):
+        if not raw.get(key):
+            raise ValueError(f"{key} required")
+        name = str(raw[key])
+        teams.append(resolve_franchise_name(name) or name)
+    if teams[0] == teams[1]:
+        raise ValueError("home_team and away_team are the same team")
+    scores = []
+    for key in ("home_score", "away_score"):
+        try:
+            scores.append(int(raw[key]))
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"integer {key} required")
+    try:
+        commence_ts = parse_timestamp(raw.get("commence_time"))
+    except ValueError:
+        raise ValueError("commence_time must be unix seconds or ISO 8601")
+    event_id = str(raw.get("id") or f"{sport}:{teams[0]}:{teams[1]}:{int(commence_ts) // 86400}")
+    return {
+        "event_id": event_id,
+        "sport": sport,
+        "commence_ts": commence_ts,
+        "home_team": teams[0],
+        "away_team": teams[1],
+        "home_score": scores[0],
+        "away_score": scores[1],
+        "home_spread": optional_number(raw, "home_spread"),
+        "total": optional_number(raw, "total")
+    }
+
+
+def game_outcomes(game: dict, home: bool) -> dict:
+    """market -> outcome for one side of a graded game (None = no outcome: push or no line)"""
+    margin = game["home_score"] - game["away_score"]
+    if not home:
+        margin = -margin
+    outcomes = {"ml": "W" if margin > 0 else "L" if margin < 0 else None, "ats": None, "total": None}
+    if game["home_spread"] is not None:
+        cover = (game["home_score"] - game["away_score"]) + game["home_spread"]
+        if not home:
+            cover = -cover
+        outcomes["ats"] = "W" if cover > 0 else "L" if cover < 0 else None
+    if game["total"] is not None:
+        points = game["home_score"] + game["away_score"]
+        outcomes["total"] = "O" if points > game["total"] else "U" if points < game["total"] else None
+    return outcomes
+
+
+class PatternState:
+    """One team's outcomes in one market: window + histogram, streak and alternation"""
+
+    __slots__ = ("window", "counts", "last", "streak", "alternation")
+
+    def __init__(self, size: int):
+        self.window = deque(maxlen=size)
+        self.counts = {}
+        self.last = None
+        self.streak = 0
+        self.alternation = 0
+
+    def push(self, outcome: str):
+        if len(self.window) == self.window.maxlen:
+            self.counts[self.window[0]] -= 1
+        self.window.append(outcome)
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+        if outcome == self.last:
+            self.streak += 1
+            self.alternation = 1
+        else:
+            self.streak = 1
+            self.alternation = self.alternation + 1 if self.last is not None else 1
+        self.last = outcome
+
+    def entropy(self) -> float:
+        """calculate_shannon_entropy of the window, from the histogram"""
+        total = len(self.window)
+        if not total:
+            return 0.0
+        present = [count for count in self.counts.values() if count > 0]
+        entropy = 0.0
+        for count in present:
+            p = count / total
+            entropy -= p * math.log2(p)
+        max_entropy = math.log2(len(present)) if len(present) > 1 else 1.0
+        return round(entropy / max_entropy, 4)
+
+    def recent(self) -> list:
+        """Window, most recent first (the Gann analyzers' order)"""
+        return list(reversed(self.window))
+
+    def patterns(self) -> dict:
+        """signal -> detail for the patterns active now"""
+        active = {}
+        if self.streak >= 3:
+            active["exhaustion"] = {
+                "signal": "EXHAUSTION_FADE" if self.last in ("W", "O") else "EXHAUSTION_BACK",
+                "level": "CRITICAL" if self.streak >= 4 else "HIGH",
+                "value": self.last,
+                "length": self.streak
+            }
+        if self.alternation >= 4:
+            predicted = OPPOSITE[self.last]
+            active["harmonic_lock"] = {
+                "signal": f"LOCKED_{OUTCOME_NAMES[predicted]}",
+                "level": "SUPER_HARMONIC" if self.alternation >= 5 else "HARMONIC_LOCK",
+                "predicted_next": predicted,
+                "length": self.alternation
+            }
+        if len(self.window) >= 3:
+            entropy = self.entropy()
+            if entropy < LOW_ENTROPY:
+                active["low_entropy"] = {
+                    "state": "CRITICAL_LOW" if entropy < 0.3 else "LOW",
+                    "entropy": entropy,
+                    "value": self.last,
+                    "length": self.streak
+                }
+        return active
+
+    def to_dict(self) -> dict:
+        return {
+            "recent": self.recent(),
+            "histogram": {value: count for value, count in self.counts.items() if count > 0},
+            "streak": {"value": self.last, "length": self.streak},
+            "alternation": self.alternation,
+            "entropy": self.entropy() if self.window else None
+        }
+
+
+class TeamResults:
+    """A team's pattern state per market plus its last game"""
+
+    __slots__ = ("sport", "team", "markets", "games", "last_ts", "last_game", "last_margin")
+
+    def __init__(self, sport: str, team: str, size: int):
+        self.sport = sport
+        self.team = team
+        self.markets = {market: PatternState(size) for market in MARKETS}
+        self.games = 0
+        self.last_ts = None
+        self.last_game = None
+        self.last_margin = None
+
+    def apply(self, game: dict):
+        home = game["home_team"] == self.team
+        for market, outcome in game_outcomes(game, home).items():
+            if outcome is not None:
+                self.markets[market].push(outcome)
+        margin = game["home_score"] - game["away_score"]
+        self.last_margin = margin if home else -margin
+        self.last_ts = game["commence_ts"]
+        self.last_game = game
+        self.games += 1
+
+
+class ResultsStore:
+    """Graded games per sport and the per-team pattern state built from them, shared through SQLite"""
+
+    def __init__(self, path: str = None, window: int = None):
+        self.path = path or RESULTS_STORE_PATH
+        self.window = max(5, window or RESULTS_WINDOW)
+        self._teams = {}
+        self._active = {}
+        self._seq = 0
+        self._local = threading.local()
+        # _lock serialises sync/record (held across the SQLite write lock);
+        # _state_lock guards the team states and the league index, so
+        # loop-side reads never wait on SQLite
+        self._lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self.applied = 0
+        self.rebuilds = 0
+        self.duplicates = 0
+        self.rejected = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _file(self, state: TeamResults):
+        """Re-file a team in the league index of active patterns"""
+        for market, pattern in state.markets.items():
+            active = pattern.patterns()
+            for signal in SIGNALS:
+                teams = self._active.setdefault((state.sport, market, signal), {})
+                if signal in active:
+                    teams[state.team] = active[signal]
+                else:
+                    teams.pop(state.team, None)
+
+    def _rebuild(self, conn: sqlite3.Connection, sport: str, team: str):
+        rows = conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM results_games "
+            "WHERE sport = ? AND (home_team = ? OR away_team = ?) AND seq <= ? ORDER BY commence_ts, seq",
+            (sport, team, team, self._seq)
+        ).fetchall()
+        state = TeamResults(sport, team, self.window)
+        for row in rows:
+            state.apply(dict(zip(COLUMNS, row)))
+        with self._state_lock:
+            self._teams[(sport, team)] = state
+            self._file(state)
+        self.rebuilds += 1
+
+    def _pull(self, conn: sqlite3.Connection) -> int:
+        rows = conn.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM results_games WHERE seq > ? ORDER BY seq", (self._seq,)
+        ).fetchall()
+        stale, touched = set(), set()
+        with self._state_lock:
+            for row in rows:
+                game = dict(zip(COLUMNS, row))
+                self._seq = max(self._seq, game["seq"])
+                for team in (game["home_team"], game["away_team"]):
+                    key = (game["sport"], team)
+                    if key in stale:
+                        continue
+                    state = self._teams.get(key)
+                    if state is None:
+                        state = self._teams[key] = TeamResults(game["sport"], team, self.window)
+                    elif state.last_ts is not None and game["commence_ts"] < state.last_ts:
+                        stale.add(key)
+                        continue
+                    state.apply(game)
+                    touched.add(key)
+            for key in touched - stale:
+                self._file(self._teams[key])
+        for key in stale:
+            self._rebuild(conn, *key)
+        self.applied += len(rows)
+        return len(rows)
+
+    def sync(self) -> int:
+        """Pull games other workers recorded -> rows pulled (blocking; run in a thread)"""
+        with self._lock:
+            return self._pull(self._conn())
+
+    def record(self, results: Iterable[dict]) -> dict:
+        """Store a batch of raw graded games and apply them (blocking; run in a thread) -> counts"""
+        parsed, rejected = [], []
+        for i, raw in enumerate(results):
+            try:
+                parsed.append(parse_result(raw))
+            except ValueError as e:
+                rejected.append({"index": i, "error": str(e)})
+
+        with self._lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM results_games").fetchone()[0]
+                inserted = 0
+                for game in parsed:
+                    cursor = conn.execute(
+                        f"INSERT OR IGNORE INTO results_games ({', '.join(COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(COLUMNS))})",
+                        tuple(seq + 1 if column == "seq" else game[column] for column in COLUMNS)
+                    )
+                    if cursor.rowcount:
+                        seq += 1
+                        inserted += 1
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._pull(conn)
+
+        self.duplicates += len(parsed) - inserted
+        self.rejected += len(rejected)
+        return {
+            "received": len(parsed) + len(rejected),
+            "recorded": inserted,
+            "duplicates": len(parsed) - inserted,
+            "rejected": len(rejected),
+            "rejected_sample": rejected[:REJECTED_SHOWN]
+        }
+
+    # ------------------------------------------------------------------
+    # Reads - in-memory, call sync() first for other workers' games
+    # ------------------------------------------------------------------
+
+    def get(self, sport: str, team: str) -> Optional[dict]:
+        with self._state_lock:
+            state = self._teams.get((sport, resolve_franchise_name(team) or team))
+            return self._entry(state) if state is not None else None
+
+    @staticmethod
+    def _entry(state: TeamResults) -> dict:
+        last = state.last_game
+        return {
+            "sport": state.sport,
+            "team": state.team,
+            "games": state.games,
+            "last_game": {
+                "event_id": last["event_id"],
+                "commence_ts": last["commence_ts"],
+                "home_team": last["home_team"],
+                "away_team": last["away_team"],
+                "home_score": last["home_score"],
+                "away_score": last["away_score"],
+                "home_spread": last["home_spread"],
+                "total": last["total"]
+            },
+            "last_margin": state.last_margin,
+            "markets": {market: pattern.to_dict() for market, pattern in state.markets.items()},
+            "patterns": {market: pattern.patterns() for market, pattern in state.markets.items()}
+        }
+
+    def team_form(self, sport: str, team: str) -> Optional[dict]:
+        """
+        get_gann_physics_composite's inputs for a team: last_game_margin,
+        was_win, recent_ats_results (bools) and recent_wl_results, most recent first
+        """
+        with self._state_lock:
+            state = self._teams.get((sport, resolve_franchise_name(team) or team))
+            if state is None:
+                return None
+            return {
+                "last_game_margin": state.last_margin,
+                "was_win": state.last_margin > 0,
+                "recent_ats_results": [outcome == "W" for outcome in state.markets["ats"].recent()],
+                "recent_wl_results": state.markets["ml"].recent()
+            }
+
+    def teams(self, sport: str) -> list:
+        with self._state_lock:
+            return sorted(team for team_sport, team in self._teams if team_sport == sport)
+
+    def active(self, sport: str, signal: str, market: str = None) -> list:
+        """Teams in a pattern right now, longest run first"""
+        market = market or DEFAULT_MARKETS[signal]
+        with self._state_lock:
+            teams = self._active.get((sport, market, signal), {})
+            rows = [{"team": team, "market": market, **detail} for team, detail in teams.items()]
+        rows.sort(key=lambda row: (-row["length"], row["team"]))
+        return rows
+
+    def stats(self) -> dict:
+        with self._state_lock:
+            sports = sorted({sport for sport, _ in self._teams})
+        return {
+            "teams": len(self._teams),
+            "sports": sports,
+            "seq": self._seq,
+            "window": self.window,
+            "games_applied": self.applied,
+            "rebuilds": self.rebuilds,
+            "duplicates": self.duplicates,
+            "rejected": self.rejected
+        }
+
+    def reset(self):
+        """Drop every game (tests and benchmarks)"""
+        with self._lock:
+            self._conn().execute("DELETE FROM results_games")
+            with self._state_lock:
+                self._teams.clear()
+                self._active.clear()
+            self._seq = 0
+
+
+results_store = ResultsStore()
@@ -0,0 +1,315 @@
+"""
+Scoring Executor - keeps slate scoring off the uvicorn event loop
+
+calculate_main_confidence + calculate_standalone_esoteric + confluence are
+pure CPU work. Handlers hand whole slates to the executor, which splits them
+into batches, ships each batch to a pool of pre-warmed worker processes and
+awaits the results (in slate order).
+
+With a request deadline (see deadline.Deadline) batches still running when it
+expires are cancelled and their rows come back as None, so callers can return
+what did get scored. A cancelled batch already running in a worker keeps its
+SCORING_MAX_PENDING slot until the worker finishes it.
+
+For a profiled request (see profiling) each batch is profiled in its worker
+and the stacks are merged into the request's profile.
+
+Every batch of a slate gets the same scoring context - stored per-slate
+signals the engines read instead of computing at request time:
+- "noosphere": team / player name -> stored Noosphere result (noosphere_stream)
+- "steam": event id -> stored steam-move signal (line_history)
+
+Config (env):
+- SCORING_EXECUTOR_MODE  "process" (default) or "inline" (score in-process, for tests)
+- SCORING_POOL_SIZE      worker processes (default: CPU count, max 4)
+- SCORING_BATCH_SIZE     games/props per batch (default 16)
+- SCORING_MAX_PENDING    batches in flight before callers wait (default 2 x pool size)
+- SCORING_QUEUE_TIMEOUT  seconds a caller waits for a slot before 503 (default 10)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from metrics import registry
+from profiling import RequestProfile, current_profile, run_profiled
+from timing import Trace, bind_trace, current_trace, unbind_trace
+
+SCORING_BATCH_SIZE = registry.histogram(
+    "scoring_batch_size", "Games/props per scoring batch", ("kind",), (1, 2, 4, 8, 16, 32, 64, 128)
+)
+SCORING_BATCH_DURATION = registry.histogram(
+    "scoring_batch_duration_seconds", "Wall time to score one batch (incl. pool round trip)", ("kind",)
+)
+
+
+class ScoringBackpressureError(Exception):
+    """Raised when every scoring slot stays busy past SCORING_QUEUE_TIMEOUT"""
+
+
+# ============================================================================
+# WORKER SIDE - top-level functions so they pickle into the pool
+# ============================================================================
+
+def warm_scoring_worker() -> dict:
+    """Pool initializer - import the engines once and fill the caches/indexes"""
+    from engines.scoring import warm_scoring_caches
+    return warm_scoring_caches()
+
+
+def score_games_batch(games: list, sport: str, context: dict = None) -> tuple:
+    """
+    Score a batch of Odds API games -> ([(game_row, main_result, lines), ...], spans)
+
+    spans: the batch's stage timings (see timing.Trace), merged by the caller
+    context: the slate's scoring context (see above)
+    """
+    from engines.scoring import score_game
+    context = context or {}
+    noosphere = context.get("noosphere") or {}
+    steam = context.get("steam") or {}
+    trace = Trace()
+    token = bind_trace(trace)
+    try:
+        rows = [
+            score_game(
+                game, sport,
+                noosphere_data=noosphere.get(game.get("home_team")),
+                steam_data=steam.get(game.get("id"))
+            )
+            for game in games
+        ]
+    finally:
+        unbind_trace(token)
+    return rows, trace.spans
+
+
+def score_props_batch(items: list, sport: str, context: dict = None) -> tuple:
+    """
+    Score a batch of prop outcomes -> ([(prop_row, main_result), ...], spans)
+
+    Each item: (outcome, market_key, home_team, away_team, commence_time, bookmaker_title).
+    Props read only the context's noosphere - they have no line history.
+    """
+    from engines.scoring import score_prop_outcome
+    noosphere = (context or {}).get("noosphere") or {}
+    trace = Trace()
+    token = bind_trace(trace)
+    try:
+        rows = [
+            score_prop_outcome(
+                outcome, market_key, home_team, away_team, sport,
+                commence_time=commence_time,
+                bookmaker_title=bookmaker_title,
+                noosphere_data=noosphere.get(outcome.get("description")) or noosphere.get(home_team)
+            )
+            for outcome, market_key, home_team, away_team, commence_time, bookmaker_title in items
+        ]
+    finally:
+        unbind_trace(token)
+    return rows, trace.spans
+
+
+def profiled_batch(fn, batch: list, sport: str, context: dict = None) -> tuple:
+    """Run a batch function under the request profiler -> (rows, spans, profile stacks)"""
+    profile = RequestProfile()
+    rows, spans = run_profiled(profile, fn, batch, sport, context)
+    return rows, spans, profile.stacks
+
+
+# ============================================================================
+# EXECUTOR
+# ============================================================================
+
+class ScoringExecutor:
+    """Batches slates onto a process pool with bounded in-flight work"""
+
+    def __init__(
+        self,
+        pool_size: int = None,
+        batch_size: int = None,
+        max_pending: int = None,
+        queue_timeout: float = None,
+        mode: str = None
+    ):
+        self.mode = (mode or os.getenv("SCORING_EXECUTOR_MODE", "process")).lower()
+        if self.mode not in ["process", "inline"]:
+            raise ValueError(f"Unknown scoring executor mode: {self.mode}")
+
+        self.pool_size = max(1, pool_size or int(os.getenv("SCORING_POOL_SIZE", min(4, os.cpu_count() or 1))))
+        self.batch_size = max(1, batch_size or int(os.getenv("SCORING_BATCH_SIZE", "16")))
+        self.max_pending = max(1, max_pending or int(os.getenv("SCORING_MAX_PENDING", self.pool_size * 2)))
+        self.queue_timeout = queue_timeout or float(os.getenv("SCORING_QUEUE_TIMEOUT", "10"))
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop = None
+        self._pending = 0
+        self.batches_scored = 0
+        self.pool_restarts = 0
+        self.batches_skipped = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Spawn the worker pool (no-op inline or if already running)"""
+        if self.mode != "process" or self._pool is not None:
+            return
+        # spawn, not fork - the parent holds an event loop and httpx threads
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.pool_size,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_scoring_worker
+        )
+
+    async def warm(self) -> dict:
+        """Start the pool and force every worker through its initializer now"""
+        self.start()
+        if self._pool is None:
+            return {"mode": self.mode, "workers": 0, **warm_scoring_worker()}
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(self._pool, score_games_batch, [], "nba")
+            for _ in range(self.pool_size)
+        ])
+        return {"mode": self.mode, "workers": self.pool_size}
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    async def score_games(self, games: list, sport: str, deadline=None, context: dict = None) -> list:
+        """Score a game slate -> [(game_row, main_result, lines), ...] in input order"""
+        return await self._map_batches(score_games_batch, games, sport, deadline, context)
+
+    async def score_props(self, items: list, sport: str, deadline=None, context: dict = None) -> list:
+        """Score prop outcomes (see score_props_batch) -> [(prop_row, main_result), ...]"""
+        return await self._map_batches(score_props_batch, items, sport, deadline, context)
+
+    async def _map_batches(self, fn, items: list, sport: str, deadline=None, context: dict = None) -> list:
+        if not items:
+            return []
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+
+        if self.mode == "inline":
+            results = []
+            for batch in batches:
+                if deadline is not None and deadline.expired():
+                    self.batches_skipped += 1
+                    results.append(([None] * len(batch), {}))
+                else:
+                    started = time.perf_counter()
+                    results.append(fn(batch, sport, context))
+                    self._observe_batch(fn, batch, started)
+        elif deadline is None:
+            results = await asyncio.gather(*[self._run_batch(fn, batch, sport, context) for batch in batches])
+        else:
+            results = await self._gather_until(fn, batches, sport, deadline, context)
+
+        trace = current_trace()
+        if trace is not None:
+            for _, spans in results:
+                trace.merge(spans)
+        return [row for rows, _ in results for row in rows]
+
+    async def _gather_until(self, fn, batches: list, sport: str, deadline, context: dict = None) -> list:
+        """Run batches until the deadline; unfinished batches are cancelled -> ([None, ...], {})"""
+        tasks = [asyncio.ensure_future(self._run_batch(fn, batch, sport, context)) for batch in batches]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=deadline.remaining())
+        finally:
+            for task in tasks:
+                task.cancel()
+        pending = [task for task in tasks if task not in done]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            self.batches_skipped += len(pending)
+
+        results = []
+        for task, batch in zip(tasks, batches):
+            results.append(task.result() if task in done else ([None] * len(batch), {}))
+        return results
+
+    async def _run_batch(self, fn, batch: list, sport: str, context: dict = None) -> list:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._slots_loop = loop
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise ScoringBackpressureError(
+                f"Scoring queue full ({self.max_pending} batches in flight)"
+            )
+
+        self._pending += 1
+        slots = self._slots
+        future = None
+        try:
+            self.start()
+            pool = self._pool
+            profile = current_profile()
+            args = (fn, batch, sport, context)
+            call = args if profile is None else (profiled_batch, *args)
+            started = time.perf_counter()
+            try:
+                future = pool.submit(*call)
+                result = await asyncio.wrap_future(future)
+            except BrokenProcessPool:
+                # A worker died - replace the pool (once per breakage) and retry this batch
+                if self._pool is pool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self._pool = None
+                    self.pool_restarts += 1
+                    self.start()
+                future = self._pool.submit(*call)
+                result = await asyncio.wrap_future(future)
+            self.batches_scored += 1
+            self._observe_batch(fn, batch, started)
+            if profile is not None:
+                rows, spans, stacks = result
+                profile.merge(stacks, prefix="[scoring_worker]")
+                return rows, spans
+            return result
+        finally:
+            if future is None or future.done():
+                self._release_slot(slots)
+            else:
+                # A cancelled batch keeps its worker busy until it returns - hold the slot till then
+                future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release_slot, slots))
+
+    def _release_slot(self, slots: asyncio.Semaphore):
+        self._pending -= 1
+        slots.release()
+
+    def _observe_batch(self, fn, batch: list, started: float):
+        kind = "games" if fn is score_games_batch else "props"
+        SCORING_BATCH_SIZE.observe(len(batch), kind)
+        SCORING_BATCH_DURATION.observe(time.perf_counter() - started, kind)
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "pool_size": self.pool_size,
+            "batch_size": self.batch_size,
+            "max_pending": self.max_pending,
+            "pending_batches": self._pending,
+            "batches_scored": self.batches_scored,
+            "pool_restarts": self.pool_restarts,
+            "batches_skipped": self.batches_skipped,
+            "running": self._pool is not None or self.mode == "inline"
+        }
+
+
+scoring_executor = ScoringExecutor()
@@ -0,0 +1,53 @@
+"""
+Server-Timing middleware - binds a stage Trace to every HTTP request
+
+Adds "total" (time to response start), emits the trace as a Server-Timing
+header and records it in route_timings under "<METHOD> <route template>".
+TimedJSONResponse adds a "serialize" stage for the JSON render.
+"""
+
+import time
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+
+from timing import Trace, bind_trace, route_timings, span, unbind_trace
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse that times its render as the "serialize" stage"""
+
+    def render(self, content) -> bytes:
+        with span("serialize"):
+            return super().render(content)
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI middleware, so the trace binding is visible to the endpoint"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        token = bind_trace(trace)
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                trace.add("total", (time.perf_counter() - started) * 1000)
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", trace.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            unbind_trace(token)
+            route = scope.get("route")
+            if route is not None:
+                route_timings.record(f"{scope['method']} {route.path}", trace)
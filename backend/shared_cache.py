@@ -0,0 +1,325 @@
+"""
+Shared Cache - one snapshot store for every uvicorn/gunicorn worker on a host
+
+Backed by a local SQLite file in WAL mode (readers never block the writer).
+- snapshots: versioned JSON payloads (raw upstream odds + scored rows) per key
+- leases:    lease-based leader election; the lease holder is the one worker
+             that polls the Odds API and scores, everyone else reads snapshots.
+             Refreshes on a snapshot miss take a per-key lease the same way.
+
+Config (env):
+- SHARED_CACHE_PATH       SQLite file (default: <tmpdir>/bookie_shared_cache.sqlite3)
+- SNAPSHOT_POLL_INTERVAL  seconds between poller refreshes (default 120)
+- SNAPSHOT_LEASE_TTL      seconds a poller lease lives without renewal (default 3 x interval)
+- SNAPSHOT_POLLER         "off" disables the background poller
+- MEMORY_CAP_SNAPSHOT_DECODE_MB  cap on decoded payloads held per worker; least
+                          recently read keys are dropped first (default: no cap)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from memory import cap_bytes, deep_sizeof
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_PATH = os.getenv(
+    "SHARED_CACHE_PATH",
+    os.path.join(tempfile.gettempdir(), "bookie_shared_cache.sqlite3")
+)
+SNAPSHOT_POLL_INTERVAL = float(os.getenv("SNAPSHOT_POLL_INTERVAL", "120"))
+SNAPSHOT_LEASE_TTL = float(os.getenv("SNAPSHOT_LEASE_TTL", SNAPSHOT_POLL_INTERVAL * 3))
+SNAPSHOT_POLLER_ENABLED = os.getenv("SNAPSHOT_POLLER", "on").lower() not in ["off", "0", "false"]
+
+# Unique per process - survives nothing, which is the point of a lease
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    key TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SharedCache:
+    """Versioned snapshot store + leases on a WAL-mode SQLite file"""
+
+    def __init__(self, path: str = None):
+        self.path = path or SHARED_CACHE_PATH
+        self._local = threading.local()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+        # key -> (version, payload, bytes): skip re-parsing JSON we already hold.
+        # LRU order; bytes are only measured when a cap is set. Reads run in
+        # to_thread workers while the loop evicts, so every access holds _decoded_lock.
+        self._decoded = OrderedDict()
+        self._decoded_lock = threading.Lock()
+        self.decode_cap = cap_bytes("snapshot_decode")
+        self.decoded_bytes = 0
+        self.decode_evictions = 0
+        self.reads = 0
+        self.misses = 0
+        self.decodes = 0
+        self.writes = 0
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(SCHEMA)
+                    self._schema_ready = True
+        return conn
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def get_snapshot(self, key: str) -> Optional[dict]:
+        """
+        Latest snapshot for key -> {"key", "version", "fetched_at", "payload"} or None.
+        The payload is shared between callers - treat it as read-only.
+        """
+        conn = self._conn()
+        row = conn.execute("SELECT version, fetched_at FROM snapshots WHERE key = ?", (key,)).fetchone()
+        self.reads += 1
+        if row is None:
+            self.misses += 1
+            return None
+        version, fetched_at = row
+
+        with self._decoded_lock:
+            cached = self._decoded.get(key)
+            if cached is not None and cached[0] == version:
+                self._decoded.move_to_end(key)
+        if cached is None or cached[0] != version:
+            row = conn.execute("SELECT version, payload FROM snapshots WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            version = row[0]
+            payload = json.loads(row[1])
+            cached = (version, payload, deep_sizeof(payload) if self.decode_cap else 0)
+            self._store_decoded(key, cached)
+            self.decodes += 1
+
+        return {"key": key, "version": version, "fetched_at": fetched_at, "payload": cached[1]}
+
+    def _store_decoded(self, key: str, entry: tuple):
+        with self._decoded_lock:
+            previous = self._decoded.get(key)
+            if previous is not None and previous[0] > entry[0]:
+                # A concurrent read already decoded a newer version
+                return
+            self._decoded.pop(key, None)
+            if previous is not None:
+                self.decoded_bytes -= previous[2]
+            self._decoded[key] = entry
+            self.decoded_bytes += entry[2]
+            self._evict(self.decode_cap)
+
+    def evict_decoded(self, cap: int):
+        """Drop least recently read payloads until under cap bytes (the newest always stays)"""
+        with self._decoded_lock:
+            self._evict(cap)
+
+    def _evict(self, cap: int):
+        if not cap:
+            return
+        while self.decoded_bytes > cap and len(self._decoded) > 1:
+            _, (_, _, size) = self._decoded.popitem(last=False)
+            self.decoded_bytes -= size
+            self.decode_evictions += 1
+
+    @property
+    def decoded_entries(self) -> int:
+        return len(self._decoded)
+
+    def decoded_size(self) -> int:
+        """Bytes held by decoded payloads (measured now if no cap is tracking them)"""
+        if self.decode_cap:
+            return self.decoded_bytes
+        with self._decoded_lock:
+            payloads = [entry[1] for entry in self._decoded.values()]
+        return deep_sizeof(payloads)
+
+    def snapshot_version(self, key: str) -> Optional[int]:
+        """Current version of key without decoding it (None if there is no snapshot)"""
+        row = self._conn().execute("SELECT version FROM snapshots WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put_snapshot(self, key: str, payload) -> int:
+        """Store a new snapshot for key, returns its version"""
+        body = json.dumps(payload, default=str)
+        now = time.time()
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT version FROM snapshots WHERE key = ?", (key,)).fetchone()
+            version = (row[0] if row else 0) + 1
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots (key, version, fetched_at, payload) VALUES (?, ?, ?, ?)",
+                (key, version, now, body)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self.writes += 1
+        return version
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+
+    def try_acquire_lease(self, name: str, holder: str = WORKER_ID, ttl: float = None) -> bool:
+        """Take or renew a lease; True if holder owns it afterwards"""
+        now = time.time()
+        ttl = ttl or SNAPSHOT_LEASE_TTL
+        conn = self._conn()
+        conn.execute(
+            """
+            INSERT INTO leases (name, holder, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at
+            WHERE leases.holder = excluded.holder OR leases.expires_at < ?
+            """,
+            (name, holder, now + ttl, now)
+        )
+        row = conn.execute("SELECT holder FROM leases WHERE name = ?", (name,)).fetchone()
+        return row is not None and row[0] == holder
+
+    def release_lease(self, name: str, holder: str = WORKER_ID):
+        self._conn().execute("DELETE FROM leases WHERE name = ? AND holder = ?", (name, holder))
+
+    def lease_holder(self, name: str) -> Optional[dict]:
+        row = self._conn().execute(
+            "SELECT holder, expires_at FROM leases WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return {"holder": row[0], "expires_at": row[1]}
+
+    def stats(self) -> dict:
+        rows = self._conn().execute(
+            "SELECT key, version, fetched_at, length(payload) FROM snapshots ORDER BY key"
+        ).fetchall()
+        now = time.time()
+        return {
+            "path": self.path,
+            "worker_id": WORKER_ID,
+            "reads": self.reads,
+            "misses": self.misses,
+            "decodes": self.decodes,
+            "decoded_entries": self.decoded_entries,
+            "decode_evictions": self.decode_evictions,
+            "writes": self.writes,
+            "snapshots": [
+                {"key": key, "version": version, "age_seconds": round(now - fetched_at, 1), "bytes": size}
+                for key, version, fetched_at, size in rows
+            ]
+        }
+
+
+# ============================================================================
+# ELECTED POLLER
+# ============================================================================
+
+class SnapshotPoller:
+    """
+    Background task run by every worker. Each tick it tries to take the
+    poller lease; only the holder runs the refresh job. If the holder dies
+    its lease expires and another worker takes over.
+    """
+
+    def __init__(
+        self,
+        cache: SharedCache,
+        refresh: Callable[[], Awaitable],
+        interval: float = None,
+        lease_name: str = "snapshot_poller"
+    ):
+        self.cache = cache
+        self.refresh = refresh
+        self.interval = interval or SNAPSHOT_POLL_INTERVAL
+        self.lease_name = lease_name
+        self.is_leader = False
+        self.last_refresh = None
+        self.refresh_count = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, delay: float = 0):
+        """Launch the poll loop; delay postpones the first tick (e.g. after warm-up fetched)"""
+        if not SNAPSHOT_POLLER_ENABLED or self._task is not None:
+            return
+        self._task = asyncio.create_task(self.run(delay))
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self.is_leader:
+            await asyncio.to_thread(self.cache.release_lease, self.lease_name)
+            self.is_leader = False
+
+    async def tick(self) -> bool:
+        """One election + (if leader) refresh round. Returns whether we led."""
+        ttl = max(SNAPSHOT_LEASE_TTL, self.interval * 2)
+        self.is_leader = await asyncio.to_thread(self.cache.try_acquire_lease, self.lease_name, WORKER_ID, ttl)
+        if self.is_leader:
+            await self.refresh()
+            self.last_refresh = time.time()
+            self.refresh_count += 1
+        return self.is_leader
+
+    async def run(self, delay: float = 0):
+        if delay:
+            await asyncio.sleep(delay)
+        while True:
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Snapshot poller tick failed")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": SNAPSHOT_POLLER_ENABLED,
+            "running": self._task is not None,
+            "is_leader": self.is_leader,
+            "interval_seconds": self.interval,
+            "refresh_count": self.refresh_count,
+            "last_refresh": self.last_refresh,
+            "leader": self.cache.lease_holder(self.lease_name)
+        }
+
+
+shared_cache = SharedCache()
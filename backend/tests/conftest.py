@@ -0,0 +1,65 @@
+"""
+Shared fixtures for endpoint tests.
+
+Every store lives in a throwaway directory, the snapshot poller is off and
+scoring runs inline, so a test talks to one worker with no background work.
+The Odds API is the benchmark mock, served in-process.
+"""
+
+import os
+import tempfile
+
+STORE_DIR = tempfile.mkdtemp(prefix="bookie_tests_")
+os.environ["SHARED_CACHE_PATH"] = os.path.join(STORE_DIR, "shared_cache.sqlite3")
+os.environ["CALENDAR_PATH"] = os.path.join(STORE_DIR, "season_calendar.bin")
+os.environ["SNAPSHOT_POLLER"] = "off"
+os.environ["SCORING_EXECUTOR_MODE"] = "inline"
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "odds_api(**options): mock Odds API options, see benchmarks.mock_odds_api.create_app"
+    )
+
+
+@pytest.fixture
+def odds_api(request, monkeypatch):
+    """Route the router's upstream calls to the mock Odds API (no latency unless marked); yields the mock app"""
+    from benchmarks.mock_odds_api import create_app
+
+    marker = request.node.get_closest_marker("odds_api")
+    mock = create_app(**{"latency_ms": 0, "jitter_ms": 0, **(marker.kwargs if marker else {})})
+    base = httpx.AsyncClient
+
+    class MockClient(base):
+        def __init__(self, *args, **kwargs):
+            kwargs["transport"] = httpx.ASGITransport(app=mock)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", MockClient)
+    return mock
+
+
+@pytest.fixture
+def live_client(odds_api, tmp_path, monkeypatch):
+    """
+    TestClient on the full app (middleware included) with a fresh snapshot
+    store. The lifespan runs - one event loop for every request, so work a
+    request leaves running carries on - but the startup warm-up is skipped.
+    """
+    from fastapi.testclient import TestClient
+
+    import live_data_router
+    import main
+    from shared_cache import SharedCache
+
+    async def no_warmup():
+        return {}
+
+    monkeypatch.setattr(live_data_router, "shared_cache", SharedCache(str(tmp_path / "snapshots.sqlite3")))
+    monkeypatch.setattr(main, "run_startup_warmup", no_warmup)
+    with TestClient(main.app) as client:
+        yield client
@@ -0,0 +1,90 @@
+"""Backtest - grading, sharding and a small replayed season"""
+
+import asyncio
+from datetime import datetime
+
+import backtest
+from benchmarks.backtest_season import write_season
+from engines.esoteric import calculate_standalone_esoteric, get_moon_phase
+
+
+def spread_game(home_point: float, home_score: int, away_score: int, closing_point: float = None) -> dict:
+    def book(point):
+        return {"bookmakers": [{"markets": [{"key": "spreads", "outcomes": [
+            {"name": "Home", "point": point, "price": -110},
+            {"name": "Away", "point": -point, "price": 120}
+        ]}]}]}
+
+    game = {"home_team": "Home", "away_team": "Away", **book(home_point)}
+    game["result"] = {"home_score": home_score, "away_score": away_score}
+    if closing_point is not None:
+        game["closing"] = book(closing_point)
+    return game
+
+
+def test_profit_and_grading():
+    assert backtest.profit(-110, "W") == 100 / 110
+    assert backtest.profit(150, "W") == 1.5
+    assert backtest.profit(-110, "L") == -1.0
+    assert backtest.profit(-110, "P") == 0.0
+
+    strong = {"tier": "SUPER_SIGNAL", "recommendation": "STRONG"}
+    passed = {"tier": "PARTIAL_ALIGNMENT", "recommendation": "PASS"}
+    # Home -3.5 wins by 7: covers; the line closed at -5.5, so +2 points of CLV
+    assert backtest.grade_game(spread_game(-3.5, 110, 103, -5.5), strong) == (
+        "SUPER_SIGNAL", "STRONG", "W", 100 / 110, 2.0
+    )
+    # PASS picks the away side (+3.5 at +120): loses by 7
+    assert backtest.grade_game(spread_game(-3.5, 110, 103), passed)[2:4] == ("L", -1.0)
+    assert backtest.grade_game(spread_game(-7, 110, 103), strong)[2] == "P"
+    assert backtest.grade_game({**spread_game(-7, 1, 0), "result": None}, strong) is None
+
+
+def test_shard_dates_are_contiguous_and_even():
+    dates = [f"2025-11-{day:02d}" for day in range(1, 11)]
+    shards = backtest.shard_dates(dates, 3)
+    assert [len(shard) for shard in shards] == [4, 3, 3]
+    assert [d for shard in shards for d in shard] == dates
+    assert backtest.shard_dates(dates[:2], 8) == [[dates[0]], [dates[1]]]
+
+
+def test_replayed_season_report(tmp_path):
+    dates = write_season(str(tmp_path), "nba", days=4, games=2)
+    assert backtest.slate_dates(str(tmp_path), "nba", start=dates[1]) == dates[1:]
+
+    job = backtest.BacktestJob("nba", end=dates[2])
+    report = asyncio.run(backtest.run_backtest(job, str(tmp_path), workers=1))
+    assert job.status == "done" and job.summary()["progress"] == 1.0
+    assert report["dates"] == {"count": 3, "first": dates[0], "last": dates[2]}
+    assert report["scored"]["games"] == 6
+    assert report["kinds"]["game"]["bets"] == 6
+    assert report["overall"]["bets"] == report["scored"]["games"] + report["scored"]["props"] - report["scored"]["ungraded"]
+    assert sum(tier["bets"] for tier in report["tiers"].values()) == report["overall"]["bets"]
+    overall = report["overall"]
+    assert overall["wins"] + overall["losses"] + overall["pushes"] == overall["bets"]
+    assert overall["avg_clv"] is not None
+
+    games_only = backtest.BacktestJob("nba", include_props=False)
+    assert asyncio.run(backtest.run_backtest(games_only, str(tmp_path), workers=1))["scored"]["props"] == 0
+
+
+def test_empty_range_with_a_worker_pool(tmp_path):
+    write_season(str(tmp_path), "nba", days=2, games=1)
+    job = backtest.BacktestJob("nba", start="2099-01-01")
+    report = asyncio.run(backtest.run_backtest(job, str(tmp_path), workers=4))
+    assert job.status == "done" and job.shards_total == 0
+    assert report["dates"] == {"count": 0, "first": None, "last": None}
+    assert report["overall"]["bets"] == 0
+
+
+def test_failed_job_records_error(tmp_path):
+    job = backtest.BacktestJob("nhl")
+    assert asyncio.run(backtest.run_backtest(job, str(tmp_path), workers=1)) is None
+    assert job.status == "failed" and job.error
+
+
+def test_esoteric_layer_reads_the_slate_day():
+    # Two days with different phases - at most one of them can be today's
+    for day in (datetime(2025, 1, 13), datetime(2025, 1, 29)):
+        result = calculate_standalone_esoteric("Boston Celtics", "Los Angeles Lakers", game_date=day)
+        assert result["cosmic"]["moon_phase"] == get_moon_phase(day)
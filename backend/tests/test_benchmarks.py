@@ -0,0 +1,58 @@
+"""
+Engine benchmark suite - coverage, determinism and the regression check.
+Timings themselves are not asserted; see benchmarks/bench_engines.py.
+"""
+
+from benchmarks import bench_engines
+
+ENGINE_FUNCTIONS = {
+    "get_all_ciphers", "calculate_date_numerology", "analyze_storyline", "analyze_founders_echo",
+    "analyze_life_path_sync", "calculate_biorhythm", "get_planetary_aspects", "calculate_vortex_math",
+    "get_gann_physics_composite", "calculate_noosphere_velocity", "calculate_standalone_esoteric",
+    "calculate_main_confidence"
+}
+
+
+def test_suite_covers_every_engine_function():
+    benchmarks = bench_engines.build_benchmarks()
+    assert ENGINE_FUNCTIONS <= {bench.fn.__name__ for bench in benchmarks}
+    for bench in benchmarks:
+        assert len(bench.calls) > 0
+        bench.loop()
+
+
+def test_inputs_are_fixed_by_seed():
+    assert bench_engines.build_cases(7) == bench_engines.build_cases(7)
+    assert bench_engines.build_cases(7) != bench_engines.build_cases(8)
+
+
+def test_time_benchmark_reports_per_call():
+    bench = bench_engines.build_benchmarks()[0]
+    result = bench_engines.time_benchmark(bench, repeat=2, min_time=0)
+    assert result["loops"] == 2
+    assert result["calls_per_loop"] == len(bench.calls)
+    assert 0 < result["min_us"] <= result["median_us"]
+
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = {"benchmarks": {"a": {"min_us": 10.0}, "b": {"min_us": 10.0}, "c": {"min_us": 10.0},
+                               "gone": {"min_us": 1.0}}}
+    current = {"benchmarks": {"a": {"min_us": 11.0}, "b": {"min_us": 13.0}, "c": {"min_us": 5.0},
+                              "added": {"min_us": 1.0}}}
+    rows = {row["name"]: row for row in bench_engines.compare_results(baseline, current, threshold=0.2)}
+    assert rows["a"]["status"] == "ok"
+    assert rows["b"]["status"] == "regression"
+    assert rows["b"]["change"] == 0.3
+    assert rows["c"]["status"] == "improved"
+    assert rows["gone"]["status"] == "missing"
+    assert rows["added"]["status"] == "new"
+
+
+def test_compare_command_exit_code(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    bench_engines.write_results({"benchmarks": {"a": {"min_us": 10.0}}}, str(baseline))
+    bench_engines.write_results({"benchmarks": {"a": {"min_us": 10.5}}}, str(current))
+    assert bench_engines.main(["compare", str(baseline), "--current", str(current)]) == 0
+    bench_engines.write_results({"benchmarks": {"a": {"min_us": 20.0}}}, str(current))
+    assert bench_engines.main(["compare", str(baseline), "--current", str(current)]) == 1
@@ -0,0 +1,88 @@
+"""Circuit breaker - closed -> open -> half-open -> closed, and upstream_get's verdicts"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import circuit_breaker
+import live_data_router
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(circuit_breaker.time, "time", lambda: now[0])
+    return now
+
+
+def test_state_machine(clock):
+    breaker = CircuitBreaker("odds:basketball_nba", failure_threshold=3, reset_timeout=30)
+    # A success inside the run of failures resets the count
+    breaker.record_failure("HTTP 503")
+    breaker.record_failure("HTTP 503")
+    breaker.record_success()
+    breaker.record_failure("ReadTimeout")
+    breaker.record_failure("ReadTimeout")
+    assert breaker.state == CLOSED and breaker.allow()
+
+    breaker.record_failure("ReadTimeout")
+    assert breaker.state == OPEN and breaker.is_open()
+    assert not breaker.allow() and breaker.total_rejections == 1
+    assert breaker.stats()["retry_in_seconds"] == 30.0 and breaker.stats()["last_error"] == "ReadTimeout"
+
+    clock[0] += 29.9
+    assert breaker.state == OPEN
+    clock[0] += 0.1
+    assert breaker.state == HALF_OPEN and not breaker.is_open()
+    # One probe; everyone else keeps getting rejected while it is out
+    assert breaker.allow()
+    assert breaker.is_open() and not breaker.allow()
+
+    # A failed probe reopens for a full reset timeout
+    breaker.record_failure("HTTP 500")
+    assert breaker.state == OPEN
+    clock[0] += 30
+    assert breaker.allow()
+    # An abandoned probe lets the next caller probe
+    breaker.release()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.consecutive_failures == 0
+    assert breaker.total_failures == 6
+
+
+def test_registry_creates_on_first_use():
+    registry = CircuitBreakerRegistry()
+    assert registry.peek("events:basketball_nba") is None and not registry.is_open("events:basketball_nba")
+    breaker = registry.get("events:basketball_nba")
+    assert registry.get("events:basketball_nba") is breaker
+    assert registry.stats() == {"events:basketball_nba": breaker.stats()}
+
+
+def test_upstream_get_feeds_the_breaker(clock, monkeypatch):
+    monkeypatch.setattr(live_data_router, "upstream_breakers", CircuitBreakerRegistry())
+    status = [503]
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(status[0], json=[])
+
+    async def get():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await live_data_router.upstream_get(
+                client, "odds:basketball_nba", "https://odds.test/v4/sports/basketball_nba/odds", {}
+            )
+
+    for _ in range(circuit_breaker.CIRCUIT_FAILURE_THRESHOLD):
+        assert asyncio.run(get()) is None
+    assert live_data_router.upstream_breakers.is_open("odds:basketball_nba")
+    # Open: rejected without a call
+    assert asyncio.run(get()) is None and len(calls) == circuit_breaker.CIRCUIT_FAILURE_THRESHOLD
+
+    clock[0] += circuit_breaker.CIRCUIT_RESET_TIMEOUT
+    status[0] = 200
+    assert asyncio.run(get()).status_code == 200
+    assert live_data_router.upstream_breakers.get("odds:basketball_nba").state == CLOSED
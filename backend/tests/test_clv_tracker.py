@@ -0,0 +1,151 @@
+"""CLV tracker - opening lines, closes captured from snapshots, CLV per tier / sport / signal"""
+
+import pytest
+
+from clv_tracker import CLVTracker, DuplicatePickError, game_closing_quotes, pick_clv, prop_closing_quotes
+
+HOME, AWAY = "Boston Celtics", "Los Angeles Lakers"
+COMMENCE = 1_800_000_000
+
+
+def book(title: str, spread: float, total: float, moneyline: tuple) -> dict:
+    return {"title": title, "markets": [
+        {"key": "spreads", "outcomes": [
+            {"name": HOME, "point": spread, "price": -110}, {"name": AWAY, "point": -spread, "price": -110}
+        ]},
+        {"key": "totals", "outcomes": [
+            {"name": "Over", "point": total, "price": -110}, {"name": "Under", "point": total, "price": -110}
+        ]},
+        {"key": "h2h", "outcomes": [{"name": HOME, "price": moneyline[0]}, {"name": AWAY, "price": moneyline[1]}]}
+    ]}
+
+
+def slate(spread: float, total: float, moneyline: tuple) -> list:
+    return [{"id": "g1", "home_team": HOME, "away_team": AWAY, "commence_time": COMMENCE, "bookmakers": [
+        book("A", spread, total, moneyline), book("B", spread, total, moneyline), book("C", spread - 1, total, moneyline)
+    ]}]
+
+
+def pick(**fields) -> dict:
+    return {"sport": "NBA", "home_team": HOME, "away_team": AWAY, "commence_time": COMMENCE, "event_id": "g1", **fields}
+
+
+def test_clv_signs():
+    # Took HOME -3, closed -4: a point better than the close
+    assert pick_clv("spreads", "HOME", -3, -110, -4, -110) == (1, 6)
+    assert pick_clv("spreads", "AWAY", 3, -110, 4, -110) == (-1, -6)
+    assert pick_clv("totals", "OVER", 210, -110, 212, -110) == (2, 12)
+    assert pick_clv("totals", "UNDER", 210, -110, 212, -110) == (-2, -12)
+    clv, cents = pick_clv("h2h", "AWAY", None, 150, None, 120)
+    assert clv == round((100 / 220 - 100 / 250) * 100, 4) > 0 and cents == pytest.approx(clv * 2, abs=1e-3)
+    assert pick_clv("spreads", "HOME", -3, -110, None, None) == (None, None)
+
+
+def test_lifecycle_and_summary(tmp_path):
+    path = str(tmp_path / "clv.sqlite3")
+    tracker, other_worker = CLVTracker(path, close_lead=3600), CLVTracker(path)
+    opening = game_closing_quotes(slate(-3.5, 220.5, (-150, 130)))
+    assert opening[("g1", "spreads", None, "AWAY")] == {"line": 3.5, "odds": -110, "books": 3}
+
+    spread = tracker.track(pick(id="p1", bet_type="spread", side="HOME", tier="SUPER_SIGNAL", signals=["steam_moves"]), opening)
+    assert (spread["line"], spread["odds"]) == (-3.5, -110)
+    tracker.track(pick(id="p2", bet_type="moneyline", side=AWAY, tier="SUPER_SIGNAL",
+                       signals=[{"name": "steam_moves"}, "sharp_money"]), opening)
+    tracker.track(pick(id="p3", game={"home_team": HOME, "away_team": AWAY, "commence_time": COMMENCE},
+                       sport="nba", bet_type="total", side="Over", line=219.5, odds=-105, tier="PARTIAL_ALIGNMENT"))
+    with pytest.raises(DuplicatePickError):
+        tracker.track(pick(id="p1", bet_type="spread", side="HOME", line=-3))
+    with pytest.raises(ValueError):
+        tracker.track(pick(bet_type="total", side="HOME", line=220))
+
+    # Too early for a close; inside the lead the latest snapshot line is the close
+    assert tracker.capture("nba", "games", opening, now=COMMENCE - 7200) == {"captured": 0, "closed": 0}
+    assert tracker.capture("nba", "games", opening, now=COMMENCE - 1800)["captured"] == 3
+    closing = game_closing_quotes(slate(-4.5, 221.5, (-170, 150)))
+    assert tracker.capture("nba", "games", closing, now=COMMENCE - 60)["captured"] == 3
+    # Started: in-game lines are not closes
+    in_game = game_closing_quotes(slate(-10.5, 230.5, (-900, 600)))
+    assert tracker.capture("nba", "games", in_game, now=COMMENCE + 60) == {"captured": 0, "closed": 3}
+    assert tracker.capture("nba", "games", in_game, now=COMMENCE + 120) == {"captured": 0, "closed": 0}
+
+    spread = other_worker.get("p1")
+    assert (spread["closing_line"], spread["closing_books"], spread["clv"], spread["clv_cents"]) == (-4.5, 3, 1.0, 6.0)
+    assert other_worker.get("p3")["clv"] == 2.0
+    assert other_worker.get("p2")["clv"] < 0
+    other_worker.grade("p1", "WIN")
+    other_worker.grade("p3", "LOSS")
+    assert tracker.grade("missing", "WIN") is None
+
+    summary = tracker.summary()
+    assert summary["overall"]["picks"] == 3 and summary["overall"]["win_rate"] == 50.0
+    tiers = {entry["tier"]: entry for entry in summary["by_tier"]}
+    assert tiers["PARTIAL_ALIGNMENT"]["avg_clv"] == 2.0 and tiers["SUPER_SIGNAL"]["picks"] == 2
+    assert summary["by_tier"][0]["tier"] == "PARTIAL_ALIGNMENT"
+    signals = {entry["signal"]: entry for entry in summary["by_signal"]}
+    assert signals["steam_moves"]["picks"] == 2 and signals["sharp_money"]["picks"] == 1
+    assert summary["by_sport"] == [{"sport": "nba", **summary["overall"]}]
+    assert tracker.summary(sport="nfl")["overall"]["picks"] == 0
+    assert [bet["id"] for bet in tracker.history(limit=2)] == ["p3", "p2"]
+
+
+def test_props_close_from_scored_rows(tmp_path):
+    tracker = CLVTracker(str(tmp_path / "clv.sqlite3"))
+    events = [{"id": "g1", "home_team": HOME, "away_team": AWAY}]
+
+    def scored(line: float) -> list:
+        row = {"player": "Jayson Tatum", "prop_type": "Points", "line": line, "price": -115,
+               "bet_type": "Over", "bookmaker": "DraftKings"}
+        return [[0, row, {}], [0, {**row, "bet_type": "Under"}, {}]]
+
+    tracker.track(pick(id="p1", player="Jayson Tatum", bet_type="player_points", side="under", line=27.5))
+    tracker.capture("nba", "props", prop_closing_quotes(events, scored(26.5)), now=COMMENCE - 60)
+    # Game captures leave prop picks alone
+    assert tracker.capture("nba", "games", {}, now=COMMENCE + 60)["closed"] == 0
+    tracker.capture("nba", "props", {}, now=COMMENCE + 60)
+    prop = tracker.get("p1")
+    assert (prop["market"], prop["closing_line"], prop["closing_odds"], prop["clv"]) == ("points", 26.5, -115, 1.0)
+
+
+def test_track_endpoint_quotes_props_and_rejects_duplicates(live_client, tmp_path, monkeypatch):
+    import live_data_router
+
+    monkeypatch.setattr(live_data_router, "clv_tracker", CLVTracker(str(tmp_path / "clv.sqlite3")))
+    assert live_client.get("/live/props/nba").status_code == 200
+    snap = live_data_router.shared_cache.get_snapshot("props:nba")["payload"]
+    idx, row, _ = snap["scored"][0]
+    event = snap["events"][idx]
+
+    body = {"id": "p1", "sport": "nba", "event_id": event["id"], "home_team": event["home_team"],
+            "away_team": event["away_team"], "player": row["player"], "bet_type": row["prop_type"],
+            "side": row["bet_type"]}
+    resp = live_client.post("/live/bets/track", json=body)
+    assert resp.status_code == 200
+    # No line given: it takes the snapshot's consensus on the pick's side
+    assert resp.json()["bet"]["line"] is not None
+
+    resp = live_client.post("/live/bets/track", json=body)
+    assert resp.status_code == 409 and "already tracked" in resp.json()["detail"]
+    assert live_client.post("/live/bets/track", json={**body, "id": "p2", "side": "sideways"}).status_code == 400
+
+
+def test_props_refresh_closes_picks_past_the_snapshot_events(live_client, odds_api, tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import live_data_router
+
+    tracker = CLVTracker(str(tmp_path / "clv.sqlite3"), close_lead=86400)
+    monkeypatch.setattr(live_data_router, "clv_tracker", tracker)
+    mock = TestClient(odds_api)
+    event = mock.get("/v4/sports/basketball_nba/events").json()[live_data_router.PROPS_SNAPSHOT_EVENTS]
+    props = mock.get(f"/v4/sports/basketball_nba/events/{event['id']}/odds", params={"markets": "player_points"}).json()
+    over = props["bookmakers"][0]["markets"][0]["outcomes"][0]
+    tracker.track({"id": "p1", "sport": "nba", "event_id": event["id"], "home_team": event["home_team"],
+                   "away_team": event["away_team"], "commence_time": event["commence_time"],
+                   "player": over["description"], "bet_type": "player_points", "side": "over",
+                   "line": over["point"] - 1, "odds": -110})
+
+    assert live_client.get("/live/props/nba").status_code == 200
+    snap = live_data_router.shared_cache.get_snapshot("props:nba")["payload"]
+    assert event["id"] not in {entry["id"] for entry in snap["events"]}
+    closed = tracker.get("p1")
+    assert (closed["closing_line"], closed["closing_odds"]) == (over["point"], over["price"])
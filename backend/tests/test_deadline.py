@@ -0,0 +1,54 @@
+"""Request deadlines - the budget itself, parsing, and what a blown budget does to a request"""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import deadline as deadline_module
+from deadline import Deadline, parse_deadline
+
+
+def test_budget_arithmetic(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(deadline_module.time, "monotonic", lambda: now[0])
+    budget = Deadline(2000)
+    assert budget.remaining() == 2.0 and not budget.expired()
+    assert budget.timeout(30) == 2.0 and budget.timeout(0.5) == 0.5
+
+    now[0] += 1.0
+    upstream = budget.for_upstream()
+    assert upstream.remaining() == pytest.approx(1.0 * deadline_module.UPSTREAM_BUDGET_SHARE)
+    assert upstream.budget_ms == 2000 and budget.remaining() == 1.0
+    assert budget.elapsed_ms() == 1000.0
+
+    now[0] += 5.0
+    assert budget.expired() and budget.remaining() == 0.0 and budget.timeout(30) == 0.0
+
+
+def test_parse_deadline():
+    assert parse_deadline(None, None).budget_ms == deadline_module.REQUEST_DEADLINE_MS
+    assert parse_deadline("1500", None).budget_ms == 1500
+    assert parse_deadline("1500.7", None).budget_ms == 1500
+    # The query parameter wins over the header
+    assert parse_deadline("1500", 800).budget_ms == 800
+    assert parse_deadline("soon", None).budget_ms == deadline_module.REQUEST_DEADLINE_MS
+    # Clamped to [MIN, MAX]
+    assert parse_deadline(None, 1).budget_ms == deadline_module.REQUEST_DEADLINE_MIN_MS
+    assert parse_deadline("999999999", None).budget_ms == deadline_module.REQUEST_DEADLINE_MAX_MS
+
+
+@pytest.mark.odds_api(latency_ms=300)
+def test_blown_deadline_is_504_and_the_refresh_carries_on(live_client, odds_api):
+    started = time.perf_counter()
+    blown = live_client.get("/live/export/nba", params={"deadline_ms": 100})
+    assert blown.status_code == 504
+    assert time.perf_counter() - started < 0.3
+
+    # The shared refresh kept going under its own deadline - this request joins it
+    ok = live_client.get("/live/export/nba")
+    assert ok.status_code == 200 and ok.json()["complete"] and ok.json()["row_count"] > 0
+    assert TestClient(odds_api).get("/stats").json()["requests"] == 1
+
+    # A budget smaller than the upstream round trip no longer matters once the snapshot is fresh
+    assert live_client.get("/live/export/nba", headers={"X-Request-Deadline": "50"}).status_code == 200
@@ -0,0 +1,58 @@
+"""Bulk export - Accept negotiation and the Arrow / MessagePack / JSON encodings"""
+
+import pytest
+from fastapi import HTTPException
+
+from live_data_router import EXPORT_MEDIA_TYPES, negotiate_export_format
+
+
+def test_negotiation():
+    assert negotiate_export_format() == "json"
+    assert negotiate_export_format("application/vnd.apache.arrow.stream") == "arrow"
+    assert negotiate_export_format("application/vnd.apache.arrow.file") == "arrow_file"
+    assert negotiate_export_format("application/json;q=0.5, application/x-msgpack") == "msgpack"
+    assert negotiate_export_format("application/msgpack;q=0.2, application/vnd.apache.arrow.stream;q=0.9") == "arrow"
+    # An exact type beats a wildcard at the same q; q=0 rules a type out
+    assert negotiate_export_format("*/*, application/x-msgpack") == "msgpack"
+    assert negotiate_export_format("application/x-msgpack;q=0, */*;q=0.1") == "json"
+    # ?format= wins over Accept
+    assert negotiate_export_format("application/x-msgpack", "ARROW_FILE") == "arrow_file"
+
+    with pytest.raises(HTTPException) as unacceptable:
+        negotiate_export_format("text/csv, image/png")
+    assert unacceptable.value.status_code == 406
+    with pytest.raises(HTTPException) as unsupported:
+        negotiate_export_format(None, "csv")
+    assert unsupported.value.status_code == 400
+
+
+def test_encodings_round_trip(live_client):
+    pa = pytest.importorskip("pyarrow")
+    msgpack = pytest.importorskip("msgpack")
+    as_json = live_client.get("/live/export/nba")
+    assert as_json.status_code == 200 and as_json.headers["content-type"] == "application/json"
+    body = as_json.json()
+    columns = body["columns"]
+    assert body["row_count"] == len(columns["home_team"]) == int(as_json.headers["x-row-count"]) > 0
+    assert "Accept" in as_json.headers["vary"]
+
+    stream = live_client.get("/live/export/nba", headers={"Accept": "application/vnd.apache.arrow.stream"})
+    assert stream.headers["content-type"] == EXPORT_MEDIA_TYPES["arrow"]
+    table = pa.ipc.open_stream(stream.content).read_all()
+    assert table.column("home_team").to_pylist() == columns["home_team"]
+    assert pa.types.is_dictionary(table.schema.field("tier").type)
+    assert table.schema.metadata[b"sport"] == b"NBA"
+
+    # The file format is random access: footer plus record batches
+    arrow_file = live_client.get("/live/export/nba", headers={"Accept": "application/vnd.apache.arrow.file"})
+    assert arrow_file.headers["content-type"] == EXPORT_MEDIA_TYPES["arrow_file"]
+    reader = pa.ipc.open_file(arrow_file.content)
+    assert reader.num_record_batches == 1
+    assert reader.read_all().column("confidence").to_pylist() == columns["confidence"]
+
+    packed = live_client.get("/live/export/nba", params={"format": "msgpack"})
+    assert packed.headers["content-type"] == EXPORT_MEDIA_TYPES["msgpack"]
+    assert msgpack.unpackb(packed.content)["columns"] == columns
+
+    assert live_client.get("/live/export/nba", headers={"Accept": "text/csv"}).status_code == 406
+    assert live_client.get("/live/export/nba", params={"format": "csv"}).status_code == 400
@@ -0,0 +1,75 @@
+"""Gematria index - reverse lookups agree with the forward ciphers"""
+
+from engines.gematria import CIPHER_NAMES, check_jarvis_trigger, get_all_ciphers
+from engines.gematria_index import GematriaIndex
+
+
+def test_lookup_range_and_triggers_match_forward_ciphers():
+    index = GematriaIndex()
+    stats = index.ensure_tables()
+    assert stats["kinds"]["team"] > 100 and stats["kinds"]["player"] > 0
+
+    lakers = get_all_ciphers("Los Angeles Lakers")
+    for cipher in CIPHER_NAMES:
+        rows, count = index.lookup(lakers[cipher], [cipher])
+        assert count == len(rows)
+        assert "Los Angeles Lakers" in [row["name"] for row in rows]
+        assert all(get_all_ciphers(row["name"])[cipher] == lakers[cipher] for row in rows)
+
+    rows, _ = index.value_range(100, 120, ["ordinal"], {"team"})
+    assert rows and all(100 <= row["value"] <= 120 and "team" in row["kinds"] for row in rows)
+    assert [row["value"] for row in rows] == sorted(row["value"] for row in rows)
+    expected = {name for name in index._entities if 100 <= get_all_ciphers(name)["ordinal"] <= 120
+                and "team" in index._entities[name]["kinds"]}
+    assert {row["name"] for row in rows} == expected
+
+    for row in index.triggered(33, ["ordinal"])[0]:
+        assert 33 in check_jarvis_trigger(row["value"])["triggers"]
+    direct, _ = index.triggered(33, ["ordinal"], ["direct"])
+    assert all(row["value"] == 33 for row in direct)
+
+
+def test_participants_are_added_incrementally():
+    index = GematriaIndex(max_participants=2)
+    index.ensure_tables()
+    size = len(index)
+
+    assert index.add_participants(["Los Angeles Lakers", "Zzyzx Player"], "props:nba", 1) == 1
+    assert len(index) == size + 1
+    assert index.lookup(get_all_ciphers("Zzyzx Player")["ordinal"], ["ordinal"], {"participant"})[0][0]["name"] == "Zzyzx Player"
+    assert index._entities["Los Angeles Lakers"]["kinds"] == ["team", "participant"]
+
+    # Same snapshot version again is skipped; the cap holds participants to max_participants
+    assert index.add_participants(["Someone New"], "props:nba", 1) == 0
+    assert index.add_participants(["Someone New", "One Too Many"], "props:nba", 2) == 1
+    assert index.stats()["participants_dropped"] == 1
+
+
+def test_limit_caps_rows_not_count():
+    index = GematriaIndex()
+    index.ensure_tables()
+    rows, count = index.value_range(0, 10_000, ["ordinal"])
+    limited, limited_count = index.value_range(0, 10_000, ["ordinal"], limit=5)
+    assert limited_count == count == len(rows) > 5
+    assert limited == rows[:5]
+
+
+def test_endpoint_reads_a_snapshot_once_per_version(live_client, monkeypatch):
+    import live_data_router
+
+    assert live_client.get("/live/best-bets/nba").status_code == 200
+    reads = []
+    get_snapshot = live_data_router.shared_cache.get_snapshot
+    monkeypatch.setattr(live_data_router.shared_cache, "get_snapshot", lambda key: reads.append(key) or get_snapshot(key))
+
+    for _ in range(3):
+        resp = live_client.get("/live/gematria/lookup", params={"trigger": 33, "limit": 2})
+        assert resp.status_code == 200
+        body = resp.json()
+        assert len(body["matches"]) == 2 and body["count"] > 2
+    assert reads == []
+
+    live_data_router.shared_cache.put_snapshot("games:nba", {"games": [{"home_team": "Zzyzx Home", "away_team": "Zzyzx Away"}]})
+    resp = live_client.get("/live/gematria/lookup", params={"value": get_all_ciphers("Zzyzx Home")["ordinal"], "cipher": "ordinal"})
+    assert "Zzyzx Home" in [row["name"] for row in resp.json()["matches"]]
+    assert reads == ["games:nba"]
@@ -0,0 +1,88 @@
+"""
+Cold-start budget for the backend.
+
+Each check runs in a fresh interpreter so nothing is already imported.
+Budgets cover only our own modules (self time from `python -X importtime`),
+taking the best of a few runs so a noisy CI box doesn't flake.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Milliseconds of import self-time for our modules, best of IMPORT_RUNS
+ENGINES_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_ENGINES_MS", "150"))
+APP_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_APP_MS", "400"))
+IMPORT_RUNS = 3
+
+# Every top-level module and package in the backend, so new modules count without touching this list
+OWN_MODULES = frozenset(
+    name[:-3] if name.endswith(".py") else name
+    for name in os.listdir(BACKEND_DIR)
+    if name.endswith(".py") or os.path.isfile(os.path.join(BACKEND_DIR, name, "__init__.py"))
+) - {"tests"}
+
+
+def run_python(code: str, *flags) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+
+
+def own_import_ms(statement: str) -> float:
+    """Best-of-N self time (ms) of our modules while running an import statement"""
+    best = None
+    for _ in range(IMPORT_RUNS):
+        stderr = run_python(statement, "-X", "importtime").stderr
+        total_us = 0
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            self_us, _, name = line[len("import time:"):].split("|")
+            name = name.strip()
+            if self_us.strip().isdigit() and name.split(".")[0] in OWN_MODULES:
+                total_us += int(self_us)
+        best = total_us if best is None else min(best, total_us)
+    return best / 1000
+
+
+def test_engine_import_within_budget():
+    ms = own_import_ms("import engines.scoring")
+    assert ms <= ENGINES_BUDGET_MS, f"engines.scoring import took {ms:.1f}ms (budget {ENGINES_BUDGET_MS}ms)"
+
+
+def test_app_import_within_budget():
+    ms = own_import_ms("import main")
+    assert ms <= APP_BUDGET_MS, f"main import took {ms:.1f}ms (budget {APP_BUDGET_MS}ms)"
+
+
+def test_engines_do_not_pull_web_stack():
+    out = run_python(
+        "import sys, json, engines.scoring; "
+        "print(json.dumps([m for m in ('fastapi', 'httpx', 'live_data_router') if m in sys.modules]))"
+    ).stdout
+    assert json.loads(out) == []
+
+
+def test_tables_load_lazily():
+    out = run_python(
+        "import json, main; from engines import tables; "
+        "before = tables.loaded_tables(); colors = tables.TEAM_COLORS; "
+        "print(json.dumps({'before': before, 'after': tables.loaded_tables(), 'colors': len(colors)}))"
+    ).stdout
+    result = json.loads(out)
+    assert result["before"] == []
+    assert result["after"] == ["TEAM_COLORS"]
+    assert result["colors"] > 0
+
+
+def test_date_tables_keep_tuples():
+    out = run_python(
+        "from engines import tables; "
+        "print(type(tables.FRANCHISE_FOUNDING_DATES['Los Angeles Lakers']).__name__)"
+    ).stdout
+    assert out.strip() == "tuple"
@@ -0,0 +1,73 @@
+"""Line history - steam moves found in recorded lines, read by the game scorer"""
+
+import time
+
+from engines.steam import STEAM_WINDOW, find_steam, market_moves
+from line_history import LineHistory
+from scoring_executor import score_games_batch
+
+HOME, AWAY = "Boston Celtics", "Los Angeles Lakers"
+BOOKS = ("DraftKings", "FanDuel", "BetMGM", "Caesars")
+
+
+def slate(spreads: dict, total: float = 221.5) -> list:
+    commence = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 86400))
+    return [{"id": "g1", "home_team": HOME, "away_team": AWAY, "commence_time": commence, "bookmakers": [
+        {"title": book, "markets": [
+            {"key": "spreads", "outcomes": [
+                {"name": HOME, "point": spreads.get(book, -4.5), "price": -110},
+                {"name": AWAY, "point": -spreads.get(book, -4.5), "price": -110}
+            ]},
+            {"key": "totals", "outcomes": [
+                {"name": "Over", "point": total, "price": -110}, {"name": "Under", "point": total, "price": -110}
+            ]}
+        ]}
+        for book in BOOKS
+    ]}]
+
+
+def test_rolling_window_needs_books_moving_together():
+    series = {"A": [(0, -4.5), (100, -5.5)], "B": [(0, -4.5), (200, -5.5)], "C": [(0, -4.5), (2000, -5.5)]}
+    moves = market_moves("spreads", series)
+    assert [move[2] for move in moves] == [1.0, 1.0, 1.0]
+    assert find_steam("spreads", moves, window=900, min_books=3) is None
+
+    series["C"] = [(0, -4.5), (600, -5.0)]
+    steam = find_steam("spreads", market_moves("spreads", series), window=900, min_books=3)
+    assert steam["direction"] == "home" and steam["books"] == ["A", "B", "C"]
+    assert (steam["started_at"], steam["ended_at"]) == (100, 600)
+
+    # A book that moved back before the others joined nets to zero inside the window
+    series["A"].append((300, -4.5))
+    assert find_steam("spreads", market_moves("spreads", series), window=900, min_books=3) is None
+
+
+def test_recorded_steam_reaches_the_scorer(tmp_path):
+    path = str(tmp_path / "lines.sqlite3")
+    writer, reader = LineHistory(path), LineHistory(path)
+    now = time.time()
+    assert writer.record("nba", slate({}), now) == 8
+    assert writer.record("nba", slate({}), now + 120) == 0
+
+    moved = {"DraftKings": -6.0, "FanDuel": -6.0, "BetMGM": -5.5}
+    assert writer.record("nba", slate(moved, 224.5), now + 240) == 7
+    assert reader.sync() == 15
+
+    signal = reader.steam_for(["g1", "g2"])["g1"]
+    assert signal["markets"]["spreads"]["books"] == ["BetMGM", "DraftKings", "FanDuel"]
+    assert signal["markets"]["totals"]["direction"] == "over"
+    assert signal["score"] == 82 and signal["contribution"].startswith("STEAM on home")
+    assert [event_id for event_id, _ in reader.steam_events("nba")] == ["g1"] and reader.steam_events("nfl") == []
+
+    # Once the last move is a window old the market has absorbed it
+    later = now + 240 + STEAM_WINDOW + 1
+    expired = reader.steam_for(["g1"], later)["g1"]
+    assert expired["score"] == 50 and not any(expired["markets"].values())
+    assert reader.steam_events("nba", later) == []
+
+    games = slate(moved, 224.5)
+    (plain,), _ = score_games_batch(games, "nba")
+    (steamed,), _ = score_games_batch(games, "nba", {"steam": reader.steam_for(["g1"])})
+    assert plain[1]["signals"]["steam_moves"]["contribution"] == "No data available"
+    assert steamed[1]["signals"]["steam_moves"]["score"] == 82
+    assert steamed[1]["confidence"] >= plain[1]["confidence"]
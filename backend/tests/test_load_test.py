@@ -0,0 +1,47 @@
+"""Load-test harness - report math and the mock upstream's fixed slates"""
+
+from benchmarks import load_test, mock_odds_api
+
+
+def test_percentile_nearest_rank():
+    ordered = list(range(1, 101))
+    assert load_test.percentile(ordered, 0.50) == 50
+    assert load_test.percentile(ordered, 0.95) == 95
+    assert load_test.percentile(ordered, 0.99) == 99
+    assert load_test.percentile([7.0], 0.99) == 7.0
+    assert load_test.percentile([], 0.5) == 0.0
+
+
+def test_summarize_counts_errors_and_throughput():
+    summary = load_test.summarize([10.0, 20.0, 30.0, 40.0], errors=1, seconds=2.0)
+    assert summary["requests"] == 4
+    assert summary["throughput_rps"] == 2.0
+    assert summary["error_rate"] == 0.25
+    assert summary["p50_ms"] == 20.0
+    assert summary["max_ms"] == 40.0
+
+
+def test_diff_reports_matches_levels_and_routes():
+    stats = {"throughput_rps": 100.0, "p50_ms": 10.0, "p95_ms": 20.0, "p99_ms": 30.0, "error_rate": 0.0}
+    slower = {**stats, "throughput_rps": 80.0, "p95_ms": 30.0}
+    old = {"levels": [{"concurrency": 8, "overall": stats, "routes": {"GET /a": stats}}]}
+    new = {"levels": [
+        {"concurrency": 8, "overall": stats, "routes": {"GET /a": slower, "GET /b": stats}},
+        {"concurrency": 32, "overall": stats, "routes": {}}
+    ]}
+    rows = {(r["route"], r["metric"]): r for r in load_test.diff_reports(old, new)}
+    assert {route for route, _ in rows} == {"GET /a", "overall"}
+    assert rows[("GET /a", "throughput_rps")]["change"] == -0.2
+    assert rows[("GET /a", "p95_ms")]["change"] == 0.5
+    assert rows[("GET /a", "error_rate")]["change"] is None
+
+
+def test_mock_slates_are_deterministic():
+    first = mock_odds_api.build_slate("basketball_nba", games=4)
+    second = mock_odds_api.build_slate("basketball_nba", games=4)
+    assert len(first) == 4
+    strip = lambda slate: [{k: v for k, v in e.items() if k != "commence_time"} for e in slate]
+    assert strip(first) == strip(second)
+    event = first[0]
+    assert {m["key"] for m in event["props"][0]["markets"]} == set(mock_odds_api.PROP_MARKETS)
+    assert {m["key"] for m in event["bookmakers"][0]["markets"]} == {"spreads", "totals", "h2h"}
@@ -0,0 +1,86 @@
+"""Market scan - arbitrage, middles and stale lines across books"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import live_data_router
+from benchmarks.mock_odds_api import BOOKMAKERS
+from engines.market_scan import american_to_decimal, flatten_quotes, scan_market_lines, scan_quotes
+
+HOME, AWAY = "Boston Celtics", "Los Angeles Lakers"
+
+
+def book(title: str, spread: float, spread_prices: tuple, total: float, moneyline: tuple) -> dict:
+    return {"key": title.lower(), "title": title, "markets": [
+        {"key": "spreads", "outcomes": [
+            {"name": HOME, "point": spread, "price": spread_prices[0]},
+            {"name": AWAY, "point": -spread, "price": spread_prices[1]}
+        ]},
+        {"key": "totals", "outcomes": [
+            {"name": "Over", "point": total, "price": -110}, {"name": "Under", "point": total, "price": -110}
+        ]},
+        {"key": "h2h", "outcomes": [{"name": HOME, "price": moneyline[0]}, {"name": AWAY, "price": moneyline[1]}]}
+    ]}
+
+
+GAME = {"id": "g1", "home_team": HOME, "away_team": AWAY, "commence_time": "2026-01-09T00:30:00Z", "bookmakers": [
+    book("DraftKings", -4.5, (-110, -110), 221.5, (-200, 170)),
+    book("FanDuel", -4.5, (+105, -125), 221.5, (-195, 165)),
+    book("BetMGM", -4.5, (-130, +110), 223.5, (-205, 175)),
+    book("Caesars", -7.5, (-110, -110), 221.5, (-120, 100))
+]}
+
+
+def test_game_markets():
+    table = flatten_quotes([GAME])
+    assert len(table) == 4 * 6
+    # Away quotes are stored under the home team's point
+    assert {table.line[row] for row in range(len(table)) if table.market[row] == "spreads"} == {-4.5, -7.5}
+
+    found = scan_quotes(table, min_books=3)
+    # Caesars' stale moneyline is the bigger edge
+    assert [entry["market"] for entry in found["arbitrage"]] == ["h2h", "spreads"]
+    arb = found["arbitrage"][1]
+    assert arb["line"] == -4.5
+    assert [leg["book"] for leg in arb["legs"]] == ["FanDuel", "BetMGM"]
+    implied = 1 / american_to_decimal(105) + 1 / american_to_decimal(110)
+    assert arb["profit_pct"] == round((1 / implied - 1) * 100, 2) > 0
+    assert abs(sum(leg["stake_pct"] for leg in arb["legs"]) - 100) < 0.02
+
+    middles = {entry["market"]: entry for entry in found["middles"]}
+    # Home -4.5 and away +7.5 both win on a 5-7 point home win
+    assert middles["spreads"]["width"] == 3.0
+    assert [leg["book"] for leg in middles["spreads"]["legs"]] == ["FanDuel", "Caesars"]
+    assert middles["totals"]["width"] == 2.0
+    assert [leg["selection"] for leg in middles["totals"]["legs"]] == ["Over", "Under"]
+
+    stale = {(entry["market"], entry["book"]) for entry in found["stale"]}
+    assert stale == {("spreads", "Caesars"), ("totals", "BetMGM"), ("h2h", "Caesars")}
+    assert scan_quotes(table, min_books=5)["stale"] == []
+
+
+def test_props_lines():
+    def prop(title, point, over, under):
+        return {"title": title, "markets": [{"key": "player_points", "outcomes": [
+            {"name": "Over", "description": "Jayson Tatum", "point": point, "price": over},
+            {"name": "Under", "description": "Jayson Tatum", "point": point, "price": under}
+        ]}]}
+
+    odds = {"bookmakers": [prop("A", 27.5, -110, -110), prop("B", 27.5, -110, -110), prop("C", 29.5, -115, -105)]}
+    found = scan_market_lines((), [(GAME, odds)])
+    assert found["quotes"] == 6 and found["arbitrage"] == []
+    (middle,) = found["middles"]
+    assert middle["player"] == "Jayson Tatum" and middle["width"] == 2.0
+    (stale,) = found["stale"]
+    assert (stale["book"], stale["deviation"]) == ("C", 2.0)
+
+
+@pytest.mark.parametrize("markets, cost", [(["spreads", "totals"], 2), (["spreads", "totals", "h2h"], 3)])
+def test_game_markets_are_opt_in(live_client, odds_api, monkeypatch, markets, cost):
+    monkeypatch.setattr(live_data_router, "ODDS_GAME_MARKETS", markets)
+    scan = live_client.get("/live/market-scan/nba", params={"kind": "games"}).json()
+    assert scan["sources"]["games"]["available"]
+    # Two outcomes per market per book
+    games = len(TestClient(odds_api).get("/v4/sports/basketball_nba/events").json())
+    assert scan["sources"]["games"]["quotes"] == games * len(BOOKMAKERS) * 2 * len(markets)
+    assert TestClient(odds_api).get("/stats").json()["quota_used"] == cost
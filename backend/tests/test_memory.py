@@ -0,0 +1,92 @@
+"""Memory accounting - deep sizes, cache caps and per-request peaks"""
+
+import tracemalloc
+from functools import lru_cache
+
+import memory
+from shared_cache import SharedCache
+
+
+def test_deep_sizeof_counts_contents_once():
+    shared = "x" * 1000
+    assert memory.deep_sizeof([shared]) > 1000
+    assert memory.deep_sizeof([shared, shared]) < memory.deep_sizeof([shared, "y" * 1000])
+    assert memory.deep_sizeof({"a": [1, 2, 3]}) > memory.deep_sizeof({})
+
+
+def test_lru_cache_bytes_grows_with_entries():
+    for maxsize in (128, None):
+        @lru_cache(maxsize=maxsize)
+        def expand(n):
+            return list(range(n))
+
+        assert memory.lru_cache_bytes(expand) == 0
+        expand(100)
+        small = memory.lru_cache_bytes(expand)
+        for n in range(101, 120):
+            expand(n)
+        assert memory.lru_cache_bytes(expand) > small > 800
+
+
+def test_cache_account_evicts_over_cap():
+    data = {i: str(i) * 1000 for i in range(50)}
+
+    def evict(cap):
+        while data and memory.deep_sizeof(data) > cap:
+            data.pop(min(data))
+
+    accounting = memory.MemoryAccounting()
+    accounting.register_cache("test", lambda: memory.deep_sizeof(data), lambda: len(data), evict, cap=20_000)
+    assert accounting.enforce_caps() == ["test"]
+    report = accounting.report()["caches"]["test"]
+    assert report["bytes"] <= 20_000
+    assert report["early_evictions"] == 1
+    assert accounting.enforce_caps() == []
+
+
+def test_snapshot_decode_cap_evicts_least_recently_read(tmp_path):
+    cache = SharedCache(str(tmp_path / "cache.sqlite3"))
+    cache.decode_cap = 10 * 1024 * 1024
+    for key in ("a", "b", "c"):
+        cache.put_snapshot(key, {"rows": ["x" * 200] * 20})
+        cache.get_snapshot(key)
+    one_entry = cache.decoded_size() // 3
+    cache.get_snapshot("a")
+    cache.evict_decoded(one_entry * 2)
+    assert list(cache._decoded) == ["c", "a"]
+    assert cache.decode_evictions == 1
+
+    cache.decode_cap = one_entry
+    cache.get_snapshot("b")
+    assert cache.decoded_entries == 1
+    assert cache.get_snapshot("a")["payload"]["rows"][0] == "x" * 200
+
+
+def test_request_memory_records_peak_per_route():
+    requests = memory.RequestMemory()
+    tracemalloc.start()
+    try:
+        baseline = requests.begin()
+        block = bytearray(500_000)
+        del block
+        requests.end("/live/props/{sport}", baseline, overlapped=False)
+    finally:
+        tracemalloc.stop()
+    stats = requests.stats()["/live/props/{sport}"]
+    assert stats["requests"] == 1
+    assert stats["max_peak_bytes"] >= 500_000
+    assert stats["overlapped_requests"] == 0
+
+
+def test_memory_endpoint_is_admin_only(live_client, monkeypatch):
+    import profiling
+
+    monkeypatch.setattr(profiling, "PROFILE_SECRET", "s3cret")
+    assert live_client.get("/live/memory").status_code == 404
+    assert live_client.get("/live/memory", headers={"X-Profile": "wrong"}).status_code == 404
+
+    resp = live_client.get("/live/memory", params={"top": 5}, headers={"X-Profile": "s3cret"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert "day_contexts" in body["caches"] and body["total_cache_bytes"] >= 0
+    assert "snapshot_store" in body and "slate_request_peaks" in body
@@ -0,0 +1,52 @@
+"""GET /metrics - Prometheus exposition of request, upstream, snapshot and scoring series"""
+
+import re
+
+from metrics import METRICS_WORKER, MetricsRegistry
+
+SAMPLE = re.compile(r'^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(\{(?P<labels>.*)\})? (?P<value>\S+)$')
+
+
+def parse(text: str) -> dict:
+    """Exposition text -> {name: [(labels, value), ...]}; every line must parse"""
+    series = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, line
+        labels = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match["labels"] or ""))
+        series.setdefault(match["name"], []).append((labels, float(match["value"])))
+    return series
+
+
+def test_registry_renders_const_labels():
+    registry = MetricsRegistry(const_labels={"worker": "7"})
+    registry.counter("jobs_total", "Jobs", ("kind",)).inc("games", amount=2)
+    registry.histogram("job_seconds", "Job time", buckets=(1,)).observe(0.5)
+    registry.collector(lambda: [("queue_depth", "gauge", "Queued", [({"queue": "a"}, 3)])])
+    series = parse(registry.render())
+    assert series["jobs_total"] == [({"worker": "7", "kind": "games"}, 2.0)]
+    assert series["job_seconds_bucket"] == [({"worker": "7", "le": "1"}, 1.0), ({"worker": "7", "le": "+Inf"}, 1.0)]
+    assert series["queue_depth"] == [({"worker": "7", "queue": "a"}, 3.0)]
+
+
+def test_scrape_exposes_live_series(live_client):
+    assert live_client.get("/live/best-bets/nba").status_code == 200
+    resp = live_client.get("/metrics")
+    assert resp.status_code == 200 and resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    series = parse(resp.text)
+
+    assert all(labels["worker"] == METRICS_WORKER for samples in series.values() for labels, _ in samples)
+    requests = {
+        (labels["route"], labels["status"]): value for labels, value in series["http_requests_total"]
+    }
+    assert requests[("/live/best-bets/{sport}", "200")] >= 1
+    assert any(labels["route"] == "/live/best-bets/{sport}" for labels, _ in series["http_request_duration_seconds_count"])
+    upstream = {(labels["path"], labels["sport"], labels["status"]) for labels, _ in series["odds_api_responses_total"]}
+    assert ("odds", "basketball_nba", "200") in upstream
+    lookups = {labels["result"] for labels, _ in series["snapshot_lookups_total"] if labels["sport"] == "nba"}
+    assert "refreshed" in lookups
+    assert any(labels["kind"] == "games" for labels, _ in series["scoring_batch_size_count"])
+    for name in ("http_requests_in_flight", "odds_api_request_duration_seconds_count"):
+        assert name in series, name
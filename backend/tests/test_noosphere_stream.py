@@ -0,0 +1,71 @@
+"""Noosphere stream - EWMA baselines, shared state and the scorer reading it"""
+
+import time
+
+from engines.noosphere import get_baseline_volume
+from noosphere_stream import NoosphereStream
+from scoring_executor import score_games_batch
+
+
+def test_ewma_baseline_and_signal(tmp_path):
+    stream = NoosphereStream(str(tmp_path / "noosphere.sqlite3"), alpha=0.5)
+    volumes = [30, 34, 26, 30]
+    result = stream.ingest([{"team": "Lakers", "volume": v, "ts": 100 + i} for i, v in enumerate(volumes)])
+    assert result["applied"] == 4 and result["entities_updated"] == 1
+
+    mean, var = float(get_baseline_volume("Los Angeles Lakers")), 0.0
+    for volume in volumes:
+        diff = volume - mean
+        mean += 0.5 * diff
+        var = 0.5 * (var + diff * 0.5 * diff)
+    entry = stream.get("team", "lakers")
+    assert entry["n"] == 4
+    assert abs(entry["mean"] - mean) < 1e-9 and abs(entry["var"] - var) < 1e-9
+
+    # A silent spike is measured against the baseline before it, and is skipped if older than the latest
+    assert stream.ingest([{"team": "Lakers", "volume": 500, "ts": 50}])["applied"] == 0
+    result = stream.ingest([{"team": "Los Angeles Lakers", "volume": 500, "ts": 200}])
+    assert result["active_signals"] == ["Los Angeles Lakers"]
+    entry = stream.get("team", "Lakers")
+    assert entry["baseline_before"] == round(mean, 3)
+    assert entry["noosphere_data"]["active_signals"] == ["INSIDER_LEAK"]
+
+    rejected = stream.ingest([{"volume": 3}, {"team": "Lakers", "volume": "lots"}])
+    assert rejected["rejected"] == 2 and rejected["applied"] == 0
+
+
+def test_workers_share_baselines_and_scoring_reads_them(tmp_path):
+    path = str(tmp_path / "noosphere.sqlite3")
+    writer, reader = NoosphereStream(path), NoosphereStream(path)
+    now = time.time()
+    writer.ingest([{"team": "Celtics", "volume": 30, "ts": now - 2}, {"team": "Celtics", "volume": 400, "ts": now - 1}])
+    assert reader.noosphere_for(["Boston Celtics"]) == {}
+    assert reader.sync() == 1
+    noosphere = reader.noosphere_for(["Boston Celtics", "Los Angeles Lakers"])
+    assert list(noosphere) == ["Boston Celtics"]
+
+    game = {"home_team": "Boston Celtics", "away_team": "Los Angeles Lakers", "commence_time": None, "bookmakers": [
+        {"markets": [
+            {"key": "spreads", "outcomes": [{"name": "Boston Celtics", "point": -4.5, "price": -110}]},
+            {"key": "totals", "outcomes": [{"name": "Over", "point": 221.5, "price": -110}]}
+        ]}
+    ]}
+    (plain,), _ = score_games_batch([game], "nba")
+    (streamed,), _ = score_games_batch([game], "nba", {"noosphere": noosphere})
+    assert plain[1]["signals"]["noosphere_velocity"]["contribution"] == "No Noosphere data"
+    assert "INSIDER_LEAK" in streamed[1]["signals"]["noosphere_velocity"]["contribution"]
+
+
+def test_results_expire_but_baselines_stay(tmp_path):
+    stream = NoosphereStream(str(tmp_path / "noosphere.sqlite3"), max_age=3600)
+    now = time.time()
+    stream.ingest([{"team": "Celtics", "volume": 30, "ts": now - 7200}, {"team": "Celtics", "volume": 400, "ts": now - 7100}])
+    entry = stream.get("team", "Celtics")
+    assert entry["noosphere_data"]["active_signals"] and not stream.live(entry)
+    assert stream.noosphere_for(["Boston Celtics"]) == {}
+
+    # A fresh observation revives it, measured against the kept baseline
+    stream.ingest([{"team": "Celtics", "volume": 400, "ts": now}])
+    entry = stream.get("team", "Celtics")
+    assert entry["n"] == 3 and stream.live(entry)
+    assert list(stream.noosphere_for(["Boston Celtics"])) == ["Boston Celtics"]
@@ -0,0 +1,116 @@
+"""Request profiler - collapsed stacks, context isolation and the admin secret"""
+
+import asyncio
+
+import profiling
+
+
+def leaf(n):
+    return sum(i * i for i in range(n))
+
+
+def outer(n):
+    return leaf(n) + leaf(n)
+
+
+def test_run_profiled_records_nested_stacks():
+    profile = profiling.RequestProfile()
+    assert profiling.run_profiled(profile, outer, 20000) == 2 * leaf(20000)
+    collapsed = profile.collapsed()
+    assert "test_profiling:outer;test_profiling:leaf" in collapsed
+    for line in collapsed.splitlines():
+        stack, us = line.rsplit(" ", 1)
+        assert stack and int(us) > 0
+    assert profile.top_functions()[0]["self_ms"] > 0
+    assert profiling.current_profile() is None
+
+
+def test_hook_removed_after_profile():
+    profiling.run_profiled(profiling.RequestProfile(), outer, 10)
+    assert profiling._hook_users == 0
+    assert profiling.sys.getprofile() is None
+
+
+def test_only_the_profiled_context_is_recorded():
+    async def profiled():
+        profile = profiling.RequestProfile()
+        token = profiling._current_profile.set(profile)
+        profile.start()
+        try:
+            for _ in range(3):
+                outer(2000)
+                await asyncio.sleep(0)
+        finally:
+            profile.stop()
+            profiling._current_profile.reset(token)
+        return profile
+
+    async def bystander():
+        for _ in range(3):
+            leaf(2000)
+            await asyncio.sleep(0)
+
+    async def main():
+        profile, _ = await asyncio.gather(profiled(), bystander())
+        return profile
+
+    profile = asyncio.run(main())
+    stacks = profile.stacks
+    assert any(path.endswith("test_profiling:outer;test_profiling:leaf") for path in stacks)
+    assert not any("bystander" in path for path in stacks)
+
+
+def test_tasks_of_one_request_keep_their_own_stacks():
+    async def alpha():
+        for _ in range(3):
+            outer(2000)
+            await asyncio.sleep(0)
+
+    async def beta():
+        for _ in range(3):
+            leaf(3000)
+            await asyncio.sleep(0)
+
+    async def request():
+        profile = profiling.RequestProfile()
+        token = profiling._current_profile.set(profile)
+        profile.start()
+        try:
+            # Spawned tasks inherit the profile and interleave with each other
+            await asyncio.gather(alpha(), beta())
+        finally:
+            profile.stop()
+            profiling._current_profile.reset(token)
+        return profile
+
+    stacks = asyncio.run(request()).stacks
+    assert any(path.endswith(".alpha;test_profiling:outer;test_profiling:leaf") for path in stacks)
+    assert any(path.endswith(".beta;test_profiling:leaf") for path in stacks)
+    for path in stacks:
+        assert not (".alpha;" in path and ".beta;" in path), path
+
+
+def test_merge_prefixes_worker_stacks():
+    profile = profiling.RequestProfile()
+    profile.merge({"a;b": 0.002}, prefix="[scoring_worker]")
+    profile.merge({"a;b": 0.001}, prefix="[scoring_worker]")
+    assert profile.collapsed() == "[scoring_worker];a;b 3000\n"
+
+
+def test_authorization_requires_configured_secret(monkeypatch):
+    monkeypatch.setattr(profiling, "PROFILE_SECRET", "")
+    assert not profiling.profiling_authorized("")
+    assert not profiling.profiling_authorized("anything")
+    monkeypatch.setattr(profiling, "PROFILE_SECRET", "s3cret")
+    assert profiling.profiling_authorized("s3cret")
+    assert not profiling.profiling_authorized("wrong")
+    assert not profiling.profiling_authorized(None)
+
+
+def test_profile_store_keeps_most_recent():
+    store = profiling.ProfileStore(size=2)
+    profiles = [profiling.RequestProfile("GET", f"/{i}") for i in range(3)]
+    for profile in profiles:
+        store.add(profile)
+    assert store.get(profiles[0].id) is None
+    assert [p["path"] for p in store.list()] == ["/2", "/1"]
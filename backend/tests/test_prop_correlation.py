@@ -0,0 +1,162 @@
+"""Prop correlation - class estimates from history, slate matrix slicing, correlated parlay pricing"""
+
+import json
+import math
+import random
+
+import pytest
+
+from backtest import load_prop_history
+from engines.prop_correlation import (
+    RELATION_PRIORS, CorrelationTable, SlateMatrix, joint_probability, price_parlay, prop_market_key
+)
+
+PLAYERS = (("LeBron James", "Lakers"), ("Anthony Davis", "Lakers"), ("Jayson Tatum", "Celtics"))
+
+
+def write_history(root, days: int = 30) -> None:
+    """Every line follows the game's flow, except Davis' run against it"""
+    rng = random.Random(11)
+    (root / "nba").mkdir()
+    for day in range(1, days + 1):
+        props = []
+        for game in range(2):
+            pace = rng.gauss(0, 1)
+            outcomes, results = {}, {}
+            for player, team in PLAYERS:
+                results[player] = {"team": team}
+                for market in ("player_points", "player_assists"):
+                    lean = -pace if player == "Anthony Davis" else pace
+                    results[player][market] = 25 + round(6 * (lean + rng.gauss(0, 0.6)))
+                    outcomes.setdefault(market, []).append(
+                        {"name": "Over", "description": player, "point": 24.5, "price": -110}
+                    )
+            odds = {"bookmakers": [{"title": "DK", "markets": [
+                {"key": key, "outcomes": entries} for key, entries in outcomes.items()
+            ]}]}
+            props.append({"event": {"id": f"{day}-{game}"}, "odds": odds, "results": results})
+        (root / "nba" / f"2025-01-{day:02d}.json").write_text(json.dumps({"games": [], "props": props}))
+
+
+def test_history_classes_and_slicing(tmp_path):
+    write_history(tmp_path)
+    events = load_prop_history(str(tmp_path), "nba")
+    assert len(events) == 60 and all(len(outcomes) == 6 for outcomes in events)
+    assert load_prop_history(str(tmp_path), "nfl") == []
+
+    table = CorrelationTable(prior_weight=10)
+    for outcomes in events:
+        table.add_event(outcomes)
+    assert table.estimate("same_player", "points", "assists") > 0.5
+    assert table.estimate("teammates", "points", "points") < -0.3
+    # Unseen classes sit on their prior
+    assert table.estimate("same_player", "rebounds", "points") == 0.25
+    assert table.classes()[0]["pairs"] > 0
+    assert table.teams == dict(PLAYERS)
+
+    slate = [
+        {"event_id": "g1", "player": player, "team": None, "market": market}
+        for player, _ in PLAYERS for market in ("points", "assists")
+    ] + [{"event_id": "g2", "player": "Luka Doncic", "team": None, "market": "points"}]
+    matrix = SlateMatrix(slate, table)
+    assert len(matrix) == 7 and sorted(len(members) for members, _ in matrix.blocks.values()) == [1, 6]
+
+    legs = [
+        {"event_id": "g1", "player": "LeBron James", "market": "points", "side": "OVER"},
+        {"event_id": "g1", "player": "LeBron James", "market": "assists", "side": "UNDER"},
+        {"event_id": "g2", "player": "Luka Doncic", "market": "points", "side": "OVER"},
+        {"event_id": None, "player": None, "market": "spread", "side": "HOME"}
+    ]
+    correlation, relations = matrix.slice(legs)
+    same_player = table.estimate("same_player", "points", "assists")
+    # The Under leg flips the sign; other games and non-prop legs are independent
+    assert correlation[0][1] == correlation[1][0] == pytest.approx(-same_player)
+    assert correlation[0][2] == correlation[2][3] == 0.0 and relations[0][1] == "same_player"
+    assert relations[0][2] is None
+
+    # A leg missing from the slate is estimated from its class
+    off_slate = {"event_id": "g1", "player": "Jayson Tatum", "market": "rebounds", "side": "OVER"}
+    correlation, relations = matrix.slice([legs[0], off_slate])
+    assert relations[0][1] == "same_game"
+    assert correlation[0][1] == pytest.approx(table.estimate("same_game", "points", "rebounds"))
+
+    # Generic "prop" legs name no stat: one player's two such legs take the prior, not 1.0
+    assert prop_market_key("prop") == prop_market_key(None) == "" and prop_market_key("Points") == "points"
+    generic = [{"event_id": "g1", "player": "LeBron James", "market": "", "side": "OVER"}] * 2
+    assert matrix.pair(*generic) == ("same_player", RELATION_PRIORS["same_player"])
+
+
+def test_correlated_parlay_pricing():
+    # Exact for two legs: P(A and B) = pa pb + rho sqrt(pa qa pb qb)
+    pa, pb, rho = 0.5, 0.4, 0.3
+    expected = pa * pb + rho * math.sqrt(pa * (1 - pa) * pb * (1 - pb))
+    assert joint_probability([pa, pb], [[1, rho], [rho, 1]]) == pytest.approx(expected)
+    # Clamped to the Frechet bounds
+    assert joint_probability([0.5, 0.5], [[1, 5], [5, 1]]) == 0.5
+    assert joint_probability([0.5, 0.5], [[1, -5], [-5, 1]]) == 0.0
+
+    legs = [{"player": "LeBron James", "odds": 100}, {"player": "Anthony Davis", "odds": 100}]
+    priced = price_parlay(legs, [[1, 0.4], [0.4, 1]], [[None, "same_game"], ["same_game", None]], stake=100)
+    assert (priced["combined_odds"], priced["potential_payout"], priced["potential_profit"]) == (300, 400.0, 300.0)
+    assert priced["independent_probability"] == 0.25 and priced["correlated_probability"] == 0.35
+    assert priced["expected_value_pct"] == 40.0 and priced["fair_odds"] == 186
+    (warning,) = priced["warnings"]
+    assert warning["severity"] == "high" and warning["legs"] == [0, 1]
+
+    unrelated = price_parlay(legs, [[1, 0.0], [0.0, 1]], [[None, None], [None, None]], stake=10)
+    assert unrelated["warnings"] == [] and unrelated["correlated_probability"] == 0.25
+
+
+def test_slate_props_and_legs_take_teams_from_history():
+    from live_data_router import parse_parlay_leg, slate_props
+
+    teams = {"Jayson Tatum": "Boston Celtics", "LeBron James": "Lakers", "Kyrie Irving": "Dallas Mavericks"}
+    payload = {"events": [{"id": "g1", "home_team": "Boston Celtics", "away_team": "Los Angeles Lakers"}],
+               "scored": [[0, {"player": player, "prop_type": "Points"}, {}] for player in teams]}
+    props = slate_props(payload, teams)
+    # Named as the event names the team; a player the history puts on neither team gets none
+    assert [prop["team"] for prop in props] == ["Boston Celtics", "Los Angeles Lakers", None]
+
+    matrix = SlateMatrix(props, CorrelationTable())
+    # ParlayBuilder sends the home team on every leg
+    tatum, lebron = (
+        parse_parlay_leg({"player": player, "prop_type": "Points", "team": "Boston Celtics"}, matrix, teams)
+        for player in ("Jayson Tatum", "LeBron James")
+    )
+    assert tatum["event_id"] == lebron["event_id"] == "g1"
+    assert matrix.slice([tatum, lebron])[1][0][1] == "opponents"
+    # Off the slate: the history's team
+    assert parse_parlay_leg({"player": "Kyrie Irving", "event_id": "g2"}, matrix, teams)["team"] == "Dallas Mavericks"
+
+
+def test_calculate_endpoint_takes_the_builder_payload(live_client):
+    import live_data_router
+
+    assert live_client.get("/live/props/nba").status_code == 200
+    payload = live_data_router.shared_cache.get_snapshot("props:nba")["payload"]
+    rows = {}
+    for idx, row, _ in payload["scored"]:
+        rows.setdefault((idx, row["player"]), {})[row["prop_type"]] = row
+    (idx, player), markets = next(item for item in rows.items() if len(item[1]) >= 2)
+    event = payload["events"][idx]
+
+    def leg(row: dict, **fields) -> dict:
+        # ParlayBuilder.importFromBetSlip's leg, as api.calculateParlay posts it
+        return {"id": 1, "player": player, "team": event["home_team"], "bet_type": "prop",
+                "prop_type": row["prop_type"], "side": "Over", "line": row["line"], "odds": -110,
+                "sport": "NBA", **fields}
+
+    first, second = list(markets.values())[:2]
+    resp = live_client.post("/live/parlay/calculate", json={"legs": [leg(first), leg(second, id=2)], "stake": 25})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["sport"] == "nba" and body["stake"] == 25.0
+    assert body["correlation"]["in_slate"] == [True, True]
+    correlation = body["correlation"]["matrix"][0][1]
+    assert correlation != 1.0
+
+    # Legs without prop_type: unknown market, priced from the same-player prior
+    unknown = [leg(first, prop_type=None), leg(second, id=2, prop_type=None)]
+    body = live_client.post("/live/parlay/calculate", json={"legs": unknown, "stake": 25}).json()
+    assert body["correlation"]["in_slate"] == [False, False]
+    assert body["correlation"]["matrix"][0][1] == RELATION_PRIORS["same_player"]
@@ -0,0 +1,66 @@
+"""Request ids and the slow-request JSON log"""
+
+import json
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import request_log
+from request_log import RequestLogMiddleware, current_request, current_request_id
+from server_timing import ServerTimingMiddleware
+from timing import span
+from upstream_ledger import UpstreamLedger
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestLogMiddleware)
+    app.add_middleware(ServerTimingMiddleware)
+    ledger = UpstreamLedger()
+
+    @app.get("/slate/{sport}")
+    async def slate(sport: str):
+        with span("score_props"):
+            sum(range(20000))
+        for ms in (5.0, 80.0, 20.0):
+            entry = ledger.record("event_odds", sport, "player_points", 200, ms, request_id=current_request_id())
+            current_request().add_upstream(entry)
+        return {"request_id": current_request_id(), "initiator": entry["initiator"], "entry_id": entry["request_id"]}
+
+    return app
+
+
+def slow_lines(caplog) -> list:
+    return [json.loads(r.getMessage()) for r in caplog.records if r.name == "slow_requests"]
+
+
+def test_request_id_assigned_and_propagated(monkeypatch, caplog):
+    monkeypatch.setattr(request_log, "SLOW_REQUEST_MS", 10_000)
+    client = TestClient(make_app())
+    with caplog.at_level(logging.WARNING, logger="slow_requests"):
+        resp = client.get("/slate/basketball_nba")
+    body = resp.json()
+    assert resp.headers["x-request-id"] == body["request_id"] == body["entry_id"]
+    assert body["initiator"] == "GET /slate/{sport}"
+    assert slow_lines(caplog) == []
+
+    assert client.get("/slate/nba", headers={"X-Request-Id": "edge-42"}).headers["x-request-id"] == "edge-42"
+    bogus = client.get("/slate/nba", headers={"X-Request-Id": "bad id\nwith spaces"})
+    assert bogus.headers["x-request-id"] != "bad id\nwith spaces"
+
+
+def test_slow_request_logs_stage_and_upstream_breakdown(monkeypatch, caplog):
+    monkeypatch.setattr(request_log, "SLOW_REQUEST_MS", 0)
+    client = TestClient(make_app())
+    with caplog.at_level(logging.WARNING, logger="slow_requests"):
+        resp = client.get("/slate/basketball_nba", headers={"X-Request-Id": "abc123"})
+    [line] = slow_lines(caplog)
+    assert line["event"] == "slow_request"
+    assert line["request_id"] == resp.headers["x-request-id"] == "abc123"
+    assert line["route"] == "/slate/{sport}"
+    assert line["status"] == 200
+    assert "score_props" in [stage["stage"] for stage in line["stages"]]
+    assert line["upstream_calls"] == 3
+    assert line["upstream_ms"] == 105.0
+    assert [call["ms"] for call in line["upstream"]] == [80.0, 20.0, 5.0]
@@ -0,0 +1,148 @@
+"""Results store - incremental pattern state agrees with the engines that rescan lists"""
+
+import random
+import time
+
+from engines.gann import analyze_annulifier_cycle, analyze_rule_of_three, get_gann_physics_composite, scan_gann_physics
+from engines.omni_glitch import calculate_shannon_entropy
+from results_store import ResultsStore
+
+DAY = 86400
+
+
+def game(day: int, home: str, away: str, home_score: int, away_score: int, **lines) -> dict:
+    return {
+        "sport": "nba", "id": f"g{day}-{home}", "commence_time": 1_700_000_000 + day * DAY,
+        "home_team": home, "away_team": away, "home_score": home_score, "away_score": away_score, **lines
+    }
+
+
+def test_state_matches_engine_analyzers(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.sqlite3"), window=8)
+    rng = random.Random(7)
+    games = []
+    for day in range(60):
+        home_score, away_score = rng.randint(90, 130), rng.randint(90, 130)
+        if home_score == away_score:
+            home_score += 1
+        games.append(game(day, "Lakers", "Boston Celtics", home_score, away_score, home_spread=-3.5, total=220.5))
+
+    wl, ats = [], []
+    for g in games:
+        store.record([g])
+        margin = g["home_score"] - g["away_score"]
+        wl.insert(0, "W" if margin > 0 else "L")
+        ats.insert(0, margin - 3.5 > 0)
+
+        entry = store.get("nba", "Los Angeles Lakers")
+        window = wl[:8]
+        assert entry["markets"]["ml"]["recent"] == window
+        assert entry["markets"]["ml"]["entropy"] == calculate_shannon_entropy(window)
+
+        exhaustion = analyze_rule_of_three("Lakers", ats[:8])
+        active = entry["patterns"]["ats"].get("exhaustion")
+        if exhaustion["signal"] in ("EXHAUSTION_FADE", "EXHAUSTION_BACK"):
+            assert (active["signal"], active["level"]) == (exhaustion["signal"], exhaustion["exhaustion_level"])
+        else:
+            assert active is None
+
+        lock = analyze_annulifier_cycle("Lakers", window)
+        active = entry["patterns"]["ml"].get("harmonic_lock")
+        if lock["signal"] in ("LOCKED_WIN", "LOCKED_LOSS"):
+            assert (active["signal"], active["level"]) == (lock["signal"], lock["lock_level"])
+        else:
+            assert active is None
+
+        in_league = {row["team"] for row in store.active("nba", "exhaustion")}
+        assert ("Los Angeles Lakers" in in_league) == (entry["patterns"]["ats"].get("exhaustion") is not None)
+
+    form = store.team_form("nba", "Boston Celtics")
+    assert form["recent_wl_results"] == ["L" if r == "W" else "W" for r in wl[:8]]
+    assert form["recent_ats_results"] == [not covered for covered in ats[:8]]
+    assert form["last_game_margin"] == games[-1]["away_score"] - games[-1]["home_score"]
+
+
+def test_workers_share_games_and_late_games_rebuild(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    writer, reader = ResultsStore(path), ResultsStore(path)
+    result = writer.record([
+        game(1, "Lakers", "Celtics", 110, 100),
+        game(2, "Lakers", "Celtics", 110, 100),
+        game(4, "Lakers", "Celtics", 110, 100),
+        {"sport": "nba", "home_team": "Lakers"}
+    ])
+    assert result["recorded"] == 3 and result["rejected"] == 1
+    assert writer.record([game(1, "Lakers", "Celtics", 110, 100)])["duplicates"] == 1
+
+    assert reader.get("nba", "Lakers") is None
+    assert reader.sync() == 3
+    assert [row["team"] for row in reader.active("nba", "exhaustion", "ml")] == ["Boston Celtics", "Los Angeles Lakers"]
+
+    # A game older than the latest is replayed in commence order, breaking both streaks
+    writer.record([game(3, "Celtics", "Lakers", 120, 90)])
+    reader.sync()
+    assert reader.get("nba", "Lakers")["markets"]["ml"]["recent"] == ["W", "L", "W", "W"]
+    assert reader.active("nba", "exhaustion", "ml") == []
+    assert reader.stats()["rebuilds"] == 2
+
+
+def test_team_form_drives_league_gann_scan(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.sqlite3"))
+    store.record([game(day, "Lakers", "Utah Jazz", 120 if day % 2 else 95, 100, home_spread=-5.5) for day in range(1, 6)])
+    store.record([game(6, "Denver Nuggets", "Utah Jazz", 101, 100, home_spread=-2.5)])
+
+    entries = [
+        {"team_name": team, "current_spread": spread, **(store.team_form("nba", team) or {})}
+        for team, spread in (("Los Angeles Lakers", -11.0), ("Utah Jazz", 6.5), ("Denver Nuggets", -3.0), ("Miami Heat", 2.0))
+    ]
+    rows = scan_gann_physics(entries)
+    assert [row["team_name"] for row in rows][0] == "Los Angeles Lakers"
+    counts = [(row["composite"]["signal_count"], row["composite"]["composite_strength"]) for row in rows]
+    assert counts == sorted(counts, reverse=True)
+
+    lakers = store.team_form("nba", "Lakers")
+    expected = get_gann_physics_composite("Los Angeles Lakers", current_spread=-11.0, **lakers)
+    assert rows[0]["composite"] == expected["composite"]
+    assert rows[0]["laws"] == {"retracement": "GRAVITY_FADE", "exhaustion": "NO_EXHAUSTION", "annulifier": "LOCKED_LOSS"}
+
+
+def test_posted_results_take_closing_lines_from_line_history(live_client, tmp_path, monkeypatch):
+    import live_data_router
+    from line_history import LineHistory
+
+    history = LineHistory(str(tmp_path / "lines.sqlite3"))
+    store = ResultsStore(str(tmp_path / "results.sqlite3"))
+    monkeypatch.setattr(live_data_router, "line_history", history)
+    monkeypatch.setattr(live_data_router, "results_store", store)
+
+    commence = time.time() - 4 * 3600
+    commence_time = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(commence))
+
+    def snapshot(spread: float, total: float) -> list:
+        return [{"id": "g1", "home_team": "Boston Celtics", "away_team": "Los Angeles Lakers",
+                 "commence_time": commence_time, "bookmakers": [
+                     {"title": book, "markets": [
+                         {"key": "spreads", "outcomes": [
+                             {"name": "Boston Celtics", "point": spread, "price": -110},
+                             {"name": "Los Angeles Lakers", "point": -spread, "price": -110}
+                         ]},
+                         {"key": "totals", "outcomes": [
+                             {"name": "Over", "point": total, "price": -110}, {"name": "Under", "point": total, "price": -110}
+                         ]}
+                     ]}
+                     for book in ("DraftKings", "FanDuel", "BetMGM")
+                 ]}]
+
+    history.record("nba", snapshot(-4.5, 221.5), ts=commence - 3600)
+    # In-game lines after the start are not the close
+    history.record("nba", snapshot(-9.5, 231.5), ts=commence + 600)
+    # The finished game has left the games snapshot (there is none)
+    resp = live_client.post("/live/results", json={"sport": "nba", "results": [{
+        "id": "g1", "home_team": "Boston Celtics", "away_team": "Los Angeles Lakers",
+        "home_score": 112, "away_score": 104, "commence_time": commence_time
+    }]})
+    assert resp.status_code == 200 and resp.json()["recorded"] == 1
+
+    entry = store.get("nba", "Boston Celtics")
+    assert (entry["last_game"]["home_spread"], entry["last_game"]["total"]) == (-4.5, 221.5)
+    assert entry["markets"]["ats"]["recent"] == ["W"] and entry["markets"]["total"]["recent"] == ["U"]
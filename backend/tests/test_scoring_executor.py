@@ -0,0 +1,82 @@
+"""Scoring executor - deadlines, backpressure and slot accounting, inline scoring"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from deadline import Deadline
+from scoring_executor import ScoringBackpressureError, ScoringExecutor, score_games_batch
+
+GATE = threading.Event()
+
+
+def gated_batch(batch: list, sport: str, context: dict = None) -> tuple:
+    """Stands in for a worker batch that runs until the test lets it finish"""
+    GATE.wait(5)
+    return [f"{sport}:{item}" for item in batch], {}
+
+
+def pooled_executor(**options) -> ScoringExecutor:
+    # A thread pool in place of worker processes - same submit/future contract, no spawn cost
+    executor = ScoringExecutor(mode="process", pool_size=1, **options)
+    executor._pool = ThreadPoolExecutor(max_workers=1)
+    return executor
+
+
+def test_timed_out_batch_holds_its_slot_until_the_worker_finishes():
+    GATE.clear()
+    executor = pooled_executor(batch_size=1, max_pending=1, queue_timeout=0.1)
+
+    async def main():
+        rows = await executor._map_batches(gated_batch, ["a"], "nba", Deadline(50))
+        assert rows == [None] and executor.batches_skipped == 1
+        # The worker is still on the cancelled batch: the only slot stays taken
+        assert executor.stats()["pending_batches"] == 1
+        with pytest.raises(ScoringBackpressureError):
+            await executor._map_batches(gated_batch, ["b"], "nba")
+
+        GATE.set()
+        for _ in range(100):
+            if executor.stats()["pending_batches"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.stats()["pending_batches"] == 0
+        return await executor._map_batches(gated_batch, ["c", "d"], "nba")
+
+    try:
+        assert asyncio.run(main()) == ["nba:c", "nba:d"]
+    finally:
+        GATE.set()
+        executor.shutdown()
+    assert executor.batches_scored == 2
+
+
+def test_batches_finished_before_the_deadline_are_kept():
+    GATE.set()
+    executor = pooled_executor(batch_size=2, max_pending=4)
+    try:
+        rows = asyncio.run(executor._map_batches(gated_batch, [1, 2, 3], "nfl", Deadline(5000)))
+    finally:
+        executor.shutdown()
+    assert rows == ["nfl:1", "nfl:2", "nfl:3"]
+    assert executor.stats()["pending_batches"] == 0 and executor.batches_skipped == 0
+
+
+def test_inline_mode_scores_in_process_and_skips_after_the_deadline():
+    executor = ScoringExecutor(mode="inline", batch_size=1)
+    assert asyncio.run(executor.warm())["workers"] == 0
+    rows = asyncio.run(executor._map_batches(gated_batch, ["a", "b"], "nba", Deadline(5000)))
+    assert rows == ["nba:a", "nba:b"] and executor.stats()["running"]
+
+    expired = Deadline(0)
+    assert asyncio.run(executor._map_batches(gated_batch, ["a", "b"], "nba", expired)) == [None, None]
+    assert executor.batches_skipped == 2
+
+    # The real batch function, inline: an empty slate scores to nothing
+    assert asyncio.run(executor.score_games([], "nba")) == []
+    assert score_games_batch([], "nba") == ([], {})
+
+    with pytest.raises(ValueError):
+        ScoringExecutor(mode="threads")
@@ -0,0 +1,107 @@
+"""Season calendar - the memory-mapped matrix agrees with the live engines"""
+
+from datetime import date, datetime, timedelta
+
+from engines import season_calendar
+from engines.gematria import calculate_date_numerology
+from engines.omni_glitch import calculate_vortex_math
+from engines.resonance import analyze_founders_echo
+
+START = date(2026, 8, 1)
+DAYS = 60
+
+
+def test_cells_match_engines(tmp_path):
+    path = str(tmp_path / "calendar.bin")
+    season_calendar.build_calendar(path, START, DAYS)
+    calendar = season_calendar.SeasonCalendar(path)
+    try:
+        assert calendar.n_teams == len(calendar.teams) and calendar.end == START + timedelta(days=DAYS - 1)
+        lakers = calendar.resolve_team("Lakers")
+        celtics = calendar.resolve_team("Boston Celtics")
+        assert calendar.teams[lakers] == "Los Angeles Lakers"
+        assert calendar.resolve_team("Not A Team") is None
+
+        for offset in range(0, DAYS, 7):
+            day = datetime(START.year, START.month, START.day) + timedelta(days=offset)
+            index = calendar.date_index(day.date())
+            row = calendar.day(lakers, index, celtics)
+
+            echo = analyze_founders_echo("Los Angeles Lakers", day)
+            assert row["echo_score"] == echo["echo_score"]
+            assert row["echo_tier"] == echo["tier"]
+            assert row["echo_types"] == [e["type"] for e in echo["echos"]]
+
+            numerology = calculate_date_numerology(day)
+            assert row["reductions"] == numerology["reductions"]
+            assert row["life_path"] == numerology["life_path"]
+            assert row["is_power_date"] == numerology["is_power_date"]
+
+            vortex = calculate_vortex_math("Los Angeles Lakers", "Boston Celtics", day)
+            assert row["vortex_root"] == vortex["calculations"]["digital_root"]
+
+        assert calendar.date_index(START - timedelta(days=1)) is None
+        assert calendar.date_index(START + timedelta(days=DAYS)) is None
+    finally:
+        calendar.close()
+
+
+def test_top_lists_are_ranked(tmp_path):
+    path = str(tmp_path / "calendar.bin")
+    season_calendar.build_calendar(path, START, DAYS)
+    calendar = season_calendar.SeasonCalendar(path)
+    try:
+        team = calendar.resolve_team("Yankees")
+        top = calendar.top_dates(team, 5)
+        scores = [row["echo_score"] for row in top]
+        assert scores == sorted(scores, reverse=True) and scores[0] > 0
+        best = max(calendar.echo(team, day)["echo_score"] for day in range(DAYS))
+        assert scores[0] == best
+
+        teams = calendar.top_teams(0, 5)
+        scores = [row["echo_score"] for row in teams]
+        assert scores == sorted(scores, reverse=True)
+        assert scores[0] == max(calendar.echo(t, 0)["echo_score"] for t in range(calendar.n_teams))
+    finally:
+        calendar.close()
+
+
+def test_open_calendar_rebuilds_when_window_moves(tmp_path):
+    path = str(tmp_path / "calendar.bin")
+    calendar = season_calendar.open_calendar(path, START, 10)
+    built_at = calendar.meta["built_at"]
+    calendar.close()
+
+    calendar = season_calendar.open_calendar(path, START + timedelta(days=2), 5)
+    assert calendar.meta["built_at"] == built_at
+    calendar.close()
+
+    calendar = season_calendar.open_calendar(path, START + timedelta(days=8), 5)
+    assert calendar.meta["built_at"] != built_at and calendar.start == START + timedelta(days=8)
+    calendar.close()
+
+
+def test_endpoint_reopens_on_season_rollover(live_client, tmp_path, monkeypatch):
+    import live_data_router
+
+    today = date.today()
+    season = season_calendar.default_start()
+    # A window ending the day before today, so today is uncovered even after the reopen
+    days = max(1, (today - season).days)
+    monkeypatch.setattr(season_calendar, "CALENDAR_PATH", str(tmp_path / "calendar.bin"))
+    monkeypatch.setattr(season_calendar, "CALENDAR_DAYS", days)
+    monkeypatch.setattr(live_data_router, "CALENDAR_DAYS", days)
+
+    last_season = season_calendar.open_calendar(str(tmp_path / "last.bin"), season.replace(year=season.year - 1), 10)
+    monkeypatch.setattr(live_data_router, "_season_calendar", last_season)
+
+    resp = live_client.get("/live/calendar/Lakers/top", params={"limit": 3})
+    assert resp.status_code == 200
+    assert resp.json()["window"]["start"] == season.isoformat()
+    assert live_data_router._season_calendar is not last_season
+
+    resp = live_client.get("/live/calendar/Lakers")
+    if today > season:
+        assert resp.status_code == 503
+    resp = live_client.get("/live/calendar/Lakers", params={"start": season.isoformat()})
+    assert resp.status_code == 200 and resp.json()["dates"][0]["date"] == season.isoformat()
@@ -0,0 +1,37 @@
+"""Server-Timing header on live responses, aggregated by route at /live/timings"""
+
+from timing import route_timings
+
+
+def server_timing(resp) -> dict:
+    """Server-Timing header -> {stage: ms}"""
+    stages = {}
+    for metric in resp.headers["server-timing"].split(", "):
+        name, *params = metric.split(";")
+        stages[name] = float(next(p for p in params if p.startswith("dur="))[4:])
+    return stages
+
+
+def test_header_and_route_aggregates(live_client):
+    route_timings.reset()
+
+    miss = server_timing(live_client.get("/live/best-bets/nba"))
+    # A miss carries the refresh's stages, merged from its own trace
+    assert {"total", "snapshot_read", "upstream.odds", "serialize"} <= set(miss)
+    assert all(ms >= 0 for ms in miss.values())
+    assert miss["total"] >= miss["upstream.odds"]
+
+    hit = server_timing(live_client.get("/live/best-bets/nba"))
+    assert "snapshot_read" in hit and "upstream.odds" not in hit
+
+    routes = live_client.get("/live/timings").json()["routes"]
+    best_bets = routes["GET /live/best-bets/{sport}"]
+    assert best_bets["requests"] == 2
+    total = best_bets["stages"]["total"]
+    assert total["count"] == 2 and total["p50_ms"] <= total["p95_ms"] <= total["max_ms"]
+    assert best_bets["stages"]["upstream.odds"]["count"] == 1
+    assert routes["snapshot:games:nba"]["requests"] == 1
+
+    live_client.get("/live/timings", params={"reset": True})
+    routes = live_client.get("/live/timings").json()["routes"]
+    assert list(routes) == ["GET /live/timings"]
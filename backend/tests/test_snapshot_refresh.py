@@ -0,0 +1,64 @@
+"""Snapshot refreshes on a miss - one worker fetches under the refresh lease, the others wait for its version"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import live_data_router
+from shared_cache import SharedCache
+
+OTHER_WORKER = "other-host:1:worker"
+
+
+@pytest.fixture
+def cache(odds_api, tmp_path, monkeypatch):
+    cache = SharedCache(str(tmp_path / "snapshots.sqlite3"))
+    monkeypatch.setattr(live_data_router, "shared_cache", cache)
+    monkeypatch.setattr(live_data_router, "SNAPSHOT_REFRESH_POLL", 0.01)
+    return cache
+
+
+def upstream_requests(odds_api) -> int:
+    return TestClient(odds_api).get("/stats").json()["requests"]
+
+
+def test_waits_for_the_lease_holders_version(cache, odds_api):
+    assert cache.try_acquire_lease("refresh:games:nba", OTHER_WORKER, ttl=30)
+
+    async def other_worker_publishes():
+        await asyncio.sleep(0.05)
+        version = await asyncio.to_thread(cache.put_snapshot, "games:nba", {"sport": "nba", "scored": []})
+        await asyncio.to_thread(cache.release_lease, "refresh:games:nba", OTHER_WORKER)
+        return version
+
+    async def main():
+        return await asyncio.gather(live_data_router.refresh_snapshot("games", "nba"), other_worker_publishes())
+
+    snap, version = asyncio.run(main())
+    assert snap["version"] == version and snap["payload"] == {"sport": "nba", "scored": []}
+    assert upstream_requests(odds_api) == 0
+
+
+def test_refreshes_itself_when_the_holder_gives_up(cache, odds_api):
+    assert cache.try_acquire_lease("refresh:games:nba", OTHER_WORKER, ttl=30)
+
+    async def other_worker_fails():
+        await asyncio.sleep(0.05)
+        await asyncio.to_thread(cache.release_lease, "refresh:games:nba", OTHER_WORKER)
+
+    async def main():
+        snap, _ = await asyncio.gather(live_data_router.refresh_snapshot("games", "nba"), other_worker_fails())
+        return snap
+
+    snap = asyncio.run(main())
+    assert snap["version"] == 1 and snap["payload"]["scored"]
+    assert upstream_requests(odds_api) == 1
+    # The lease went back once the refresh published
+    assert cache.lease_holder("refresh:games:nba") is None
+
+
+def test_waiting_is_bounded_by_the_deadline(cache):
+    assert cache.try_acquire_lease("refresh:props:nba", OTHER_WORKER, ttl=30)
+    with pytest.raises(live_data_router.DeadlineExceeded):
+        asyncio.run(live_data_router.refresh_snapshot("props", "nba", live_data_router.Deadline(50)))
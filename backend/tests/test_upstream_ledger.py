@@ -0,0 +1,71 @@
+"""Upstream ledger - entries, initiators, persistence and the per-market summary"""
+
+from types import SimpleNamespace
+
+import upstream_ledger
+from upstream_ledger import UpstreamLedger, bind_initiator, summarize_calls, unbind_initiator
+
+QUOTA_HEADERS = {"x-requests-last": "4", "x-requests-used": "104", "x-requests-remaining": "396"}
+
+
+def test_record_reads_quota_headers_and_initiator():
+    ledger = UpstreamLedger(size=2)
+    assert ledger.record("events", "basketball_nba", "", 200, 12.0)["initiator"] == "background"
+
+    token = bind_initiator("poller")
+    try:
+        entry = ledger.record("event_odds", "basketball_nba", "player_points", 200, 30.5, 900, QUOTA_HEADERS)
+    finally:
+        unbind_initiator(token)
+    assert entry["initiator"] == "poller"
+    assert (entry["quota_cost"], entry["quota_used"], entry["quota_remaining"]) == (4.0, 104.0, 396.0)
+
+    ledger.record("odds", "icehockey_nhl", "spreads,totals", "timeout", 5000.0)
+    assert [e["path"] for e in ledger.entries()] == ["event_odds", "odds"]
+
+
+def test_request_initiator_resolves_route_template():
+    scope = {"method": "GET", "path": "/live/props/nba"}
+    token = bind_initiator(scope)
+    try:
+        assert upstream_ledger.current_initiator() == "GET /live/props/nba"
+        scope["route"] = SimpleNamespace(path="/live/props/{sport}")
+        assert upstream_ledger.current_initiator() == "GET /live/props/{sport}"
+    finally:
+        unbind_initiator(token)
+
+
+def test_summary_splits_multi_market_calls():
+    ledger = UpstreamLedger()
+    ledger.record("event_odds", "basketball_nba", "player_points,player_assists", 200, 40.0, 1000, QUOTA_HEADERS)
+    ledger.record("events", "basketball_nba", "", 200, 10.0, 200, {"x-requests-last": "0"})
+    ledger.record("odds", "icehockey_nhl", "spreads,totals", 429, 20.0)
+    summary = summarize_calls(ledger.entries())
+
+    assert summary["calls"] == 3
+    assert summary["errors"] == 1
+    assert summary["quota_cost"] == 4.0
+    assert summary["quota_remaining"] == 396.0
+    assert summary["sports"][0]["sport"] == "basketball_nba"
+    markets = {(m["sport"], m["market"]): m for m in summary["markets"]}
+    assert markets[("basketball_nba", "player_points")]["quota_cost"] == 2.0
+    assert markets[("basketball_nba", "player_points")]["total_ms"] == 20.0
+    assert markets[("basketball_nba", "events")]["calls"] == 1
+    assert markets[("icehockey_nhl", "totals")]["errors"] == 1
+    assert summarize_calls([])["calls"] == 0
+
+
+def test_persisted_in_batches(tmp_path):
+    ledger = UpstreamLedger(path=str(tmp_path / "ledger.sqlite3"), batch=2)
+    ledger.record("events", "basketball_nba", "", 200, 10.0)
+    assert not ledger.flush_due
+    ledger.record("odds", "basketball_nba", "spreads,totals", 200, 15.0, 50, QUOTA_HEADERS)
+    assert ledger.flush_due
+    assert ledger.flush() == 2
+    assert ledger.flush() == 0
+
+    other_worker = UpstreamLedger(path=ledger.path)
+    loaded = other_worker.load(since=0)
+    assert [entry["path"] for entry in loaded] == ["events", "odds"]
+    assert loaded[1]["quota_cost"] == 4.0
+    assert loaded[0]["status"] == "200"
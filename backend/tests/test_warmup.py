@@ -0,0 +1,32 @@
+"""Startup warm-up gates /ready"""
+
+import asyncio
+
+import pytest
+
+import live_data_router
+from live_data_router import WARMUP_STATE, run_startup_warmup
+
+
+@pytest.fixture
+def cold_start(monkeypatch):
+    saved = {**WARMUP_STATE, "steps": list(WARMUP_STATE["steps"])}
+    WARMUP_STATE.update({"ready": False, "started_at": None, "completed_at": None, "total_ms": None, "steps": []})
+    monkeypatch.setattr(live_data_router, "SNAPSHOT_SPORTS", ["nba"])
+    yield
+    WARMUP_STATE.update(saved)
+
+
+def test_ready_after_warmup(live_client, cold_start):
+    warming = live_client.get("/ready")
+    assert warming.status_code == 503 and warming.json()["status"] == "warming_up"
+
+    asyncio.run(run_startup_warmup())
+
+    ready = live_client.get("/ready")
+    body = ready.json()
+    assert ready.status_code == 200 and body["status"] == "ready" and body["total_ms"] > 0
+    steps = {step["name"]: step for step in body["steps"]}
+    assert {"scoring_pool", "season_calendar", "snapshot:games:nba", "snapshot:props:nba"} <= set(steps)
+    assert all(step["status"] == "ok" for step in steps.values()), steps
+    assert steps["snapshot:games:nba"]["result"]["rows"] > 0
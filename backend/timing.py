@@ -0,0 +1,157 @@
+"""
+Stage Timing - lightweight spans around each pipeline stage
+
+A Trace collects {stage: [total_ms, count]} for the request (or snapshot
+refresh) it is bound to. span(name) adds to the current trace and is a
+no-op nullcontext when none is bound, so engine code can be instrumented
+unconditionally. Scoring workers time their batch under a local trace and
+ship the spans back with the rows (see scoring_executor).
+
+Traces become the Server-Timing response header (server_timing) and are
+aggregated per route in route_timings (GET /live/timings).
+
+Stdlib only - engines import this inside scoring worker processes.
+
+Config (env):
+- ROUTE_TIMING_WINDOW  samples kept per route/stage for percentiles (default 256)
+"""
+
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Optional
+
+ROUTE_TIMING_WINDOW = int(os.getenv("ROUTE_TIMING_WINDOW", "256"))
+
+_current_trace: ContextVar = ContextVar("stage_trace", default=None)
+_NO_SPAN = nullcontext()
+
+
+class Trace:
+    """Per-stage totals for one request / refresh / scoring batch"""
+
+    __slots__ = ("spans",)
+
+    def __init__(self):
+        self.spans = {}
+
+    def add(self, stage: str, ms: float, count: int = 1):
+        entry = self.spans.get(stage)
+        if entry is None:
+            self.spans[stage] = [ms, count]
+        else:
+            entry[0] += ms
+            entry[1] += count
+
+    def merge(self, spans: dict):
+        """Fold in another trace's spans (e.g. returned by a scoring worker)"""
+        for stage, (ms, count) in spans.items():
+            self.add(stage, ms, count)
+
+    def server_timing(self) -> str:
+        """Server-Timing header value; stages hit more than once carry the count in desc"""
+        parts = []
+        for stage, (ms, count) in self.spans.items():
+            metric = f"{stage};dur={ms:.2f}"
+            if count > 1:
+                metric += f';desc="x{count}"'
+            parts.append(metric)
+        return ", ".join(parts)
+
+
+class _Span:
+    __slots__ = ("trace", "stage", "started")
+
+    def __init__(self, trace: Trace, stage: str):
+        self.trace = trace
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.trace.add(self.stage, (time.perf_counter() - self.started) * 1000)
+        return False
+
+
+def span(stage: str):
+    """Time the enclosed block as `stage` on the current trace (if any)"""
+    trace = _current_trace.get()
+    if trace is None:
+        return _NO_SPAN
+    return _Span(trace, stage)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def bind_trace(trace: Optional[Trace]):
+    """Make trace current for this context -> token for unbind_trace"""
+    return _current_trace.set(trace)
+
+
+def unbind_trace(token):
+    _current_trace.reset(token)
+
+
+async def run_traced(trace: Trace, coro):
+    """Await coro with trace current (run it as a task so the binding stays local)"""
+    token = bind_trace(trace)
+    try:
+        return await coro
+    finally:
+        unbind_trace(token)
+
+
+def _percentile(ordered: list, pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+class RouteTimings:
+    """Per-route, per-stage timing aggregates over a rolling window of requests"""
+
+    def __init__(self, window: int = None):
+        self.window = window or ROUTE_TIMING_WINDOW
+        self._routes = {}
+
+    def record(self, route: str, trace: Trace):
+        entry = self._routes.get(route)
+        if entry is None:
+            entry = self._routes[route] = {"requests": 0, "stages": {}}
+        entry["requests"] += 1
+        for stage, (ms, _) in trace.spans.items():
+            stats = entry["stages"].get(stage)
+            if stats is None:
+                stats = entry["stages"][stage] = {
+                    "count": 0, "total_ms": 0.0, "max_ms": 0.0, "recent": deque(maxlen=self.window)
+                }
+            stats["count"] += 1
+            stats["total_ms"] += ms
+            stats["max_ms"] = max(stats["max_ms"], ms)
+            stats["recent"].append(ms)
+
+    def reset(self):
+        self._routes = {}
+
+    def stats(self) -> dict:
+        out = {}
+        for route, entry in sorted(self._routes.items()):
+            stages = {}
+            for stage, stats in entry["stages"].items():
+                ordered = sorted(stats["recent"])
+                stages[stage] = {
+                    "count": stats["count"],
+                    "avg_ms": round(stats["total_ms"] / stats["count"], 2),
+                    "p50_ms": round(_percentile(ordered, 0.50), 2),
+                    "p95_ms": round(_percentile(ordered, 0.95), 2),
+                    "max_ms": round(stats["max_ms"], 2)
+                }
+            out[route] = {"requests": entry["requests"], "stages": stages}
+        return out
+
+
+route_timings = RouteTimings()
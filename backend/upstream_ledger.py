@@ -0,0 +1,276 @@
+"""
+Upstream Ledger - one entry per call to the Odds API
+
+Every request upstream_get sends to ODDS_API_BASE is recorded: path, sport,
+markets, status (HTTP code, or timeout / error / deadline), latency, body
+bytes, the quota headers (x-requests-last = what the call cost,
+x-requests-used / x-requests-remaining after it) and the initiator - the
+route template of the request that caused it, or "poller" / "warmup" for
+background refreshes - and the request id (request_log). A refresh shared
+by several requests is credited to the one that started it.
+
+Entries live in a ring buffer per process. With UPSTREAM_LEDGER_PATH set
+they are also appended, in batches, to a SQLite file all workers share, so
+GET /live/upstream/ledger?persisted=true can summarize the whole host over
+a longer window.
+
+Quota cost of a multi-market call is split evenly across its markets when
+summarizing by market (the Odds API charges markets x regions).
+
+Config (env):
+- UPSTREAM_LEDGER_SIZE   entries kept in memory per worker (default 2000)
+- UPSTREAM_LEDGER_PATH   SQLite file to persist entries to (default: off)
+- UPSTREAM_LEDGER_BATCH  entries buffered before a write (default 25)
+- UPSTREAM_LEDGER_RETENTION_HOURS  persisted entries older than this are
+                         deleted on write (default 168)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_LEDGER_SIZE = int(os.getenv("UPSTREAM_LEDGER_SIZE", "2000"))
+UPSTREAM_LEDGER_PATH = os.getenv("UPSTREAM_LEDGER_PATH", "")
+UPSTREAM_LEDGER_BATCH = int(os.getenv("UPSTREAM_LEDGER_BATCH", "25"))
+UPSTREAM_LEDGER_RETENTION_HOURS = float(os.getenv("UPSTREAM_LEDGER_RETENTION_HOURS", "168"))
+
+# ASGI scope of the current request, or a label for background work
+_initiator: ContextVar = ContextVar("upstream_initiator", default=None)
+
+FIELDS = (
+    "ts", "path", "sport", "markets", "status", "latency_ms", "bytes",
+    "quota_cost", "quota_used", "quota_remaining", "initiator", "request_id"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS upstream_calls (
+    ts REAL NOT NULL,
+    path TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    markets TEXT NOT NULL,
+    status TEXT NOT NULL,
+    latency_ms REAL NOT NULL,
+    bytes INTEGER NOT NULL,
+    quota_cost REAL,
+    quota_used REAL,
+    quota_remaining REAL,
+    initiator TEXT NOT NULL,
+    request_id TEXT
+);
+CREATE INDEX IF NOT EXISTS upstream_calls_ts ON upstream_calls (ts);
+"""
+
+
+def bind_initiator(initiator):
+    """Credit upstream calls made from this context to initiator -> token for unbind_initiator"""
+    return _initiator.set(initiator)
+
+
+def unbind_initiator(token):
+    _initiator.reset(token)
+
+
+def current_initiator() -> str:
+    initiator = _initiator.get()
+    if initiator is None:
+        return "background"
+    if isinstance(initiator, str):
+        return initiator
+    # The route is only known once the router has matched - resolve it late
+    route = initiator.get("route")
+    return f"{initiator['method']} {route.path if route is not None else initiator['path']}"
+
+
+def _quota(headers, name: str) -> Optional[float]:
+    value = headers.get(name) if headers is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class UpstreamLedger:
+    """Ring buffer of upstream calls, optionally persisted to SQLite in batches"""
+
+    def __init__(self, size: int = None, path: str = None, batch: int = None):
+        self.size = size or UPSTREAM_LEDGER_SIZE
+        self.path = UPSTREAM_LEDGER_PATH if path is None else path
+        self.batch = batch or UPSTREAM_LEDGER_BATCH
+        self._entries = deque(maxlen=self.size)
+        self._pending = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.recorded = 0
+        self.persisted = 0
+
+    def record(
+        self,
+        path: str,
+        sport: str,
+        markets: str,
+        status,
+        latency_ms: float,
+        size: int = 0,
+        headers=None,
+        request_id: str = None
+    ) -> dict:
+        entry = {
+            "ts": time.time(),
+            "path": path,
+            "sport": sport,
+            "markets": markets,
+            "status": str(status),
+            "latency_ms": round(latency_ms, 2),
+            "bytes": size,
+            "quota_cost": _quota(headers, "x-requests-last"),
+            "quota_used": _quota(headers, "x-requests-used"),
+            "quota_remaining": _quota(headers, "x-requests-remaining"),
+            "initiator": current_initiator(),
+            "request_id": request_id
+        }
+        self._entries.append(entry)
+        self.recorded += 1
+        if self.path:
+            with self._lock:
+                self._pending.append(entry)
+        return entry
+
+    @property
+    def flush_due(self) -> bool:
+        return len(self._pending) >= self.batch
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def flush(self) -> int:
+        """Write buffered entries to UPSTREAM_LEDGER_PATH -> how many (blocking; run in a thread)"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+        try:
+            conn = self._conn()
+        except sqlite3.Error:
+            logger.exception("Upstream ledger: cannot open %s", self.path)
+            return 0
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                f"INSERT INTO upstream_calls ({', '.join(FIELDS)}) VALUES ({', '.join('?' * len(FIELDS))})",
+                [tuple(entry[field] for field in FIELDS) for entry in pending]
+            )
+            conn.execute(
+                "DELETE FROM upstream_calls WHERE ts < ?",
+                (time.time() - UPSTREAM_LEDGER_RETENTION_HOURS * 3600,)
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            # The ledger is diagnostics - losing a batch beats failing a refresh
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.exception("Upstream ledger: failed to persist %d entries", len(pending))
+            return 0
+        self.persisted += len(pending)
+        return len(pending)
+
+    def entries(self, since: float = None) -> list:
+        entries = list(self._entries)
+        if since is not None:
+            entries = [entry for entry in entries if entry["ts"] >= since]
+        return entries
+
+    def load(self, since: float) -> list:
+        """Persisted entries (every worker's) since a unix time (blocking; run in a thread)"""
+        if not self.path:
+            return []
+        rows = self._conn().execute(
+            f"SELECT {', '.join(FIELDS)} FROM upstream_calls WHERE ts >= ? ORDER BY ts", (since,)
+        ).fetchall()
+        return [dict(zip(FIELDS, row)) for row in rows]
+
+    def reset(self):
+        self._entries.clear()
+        with self._lock:
+            self._pending = []
+
+
+upstream_ledger = UpstreamLedger()
+
+
+def _percentile(ordered: list, pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _group_stats(calls: list) -> dict:
+    latencies = sorted(call["latency_ms"] for call in calls)
+    costs = [call["quota_cost"] for call in calls if call["quota_cost"] is not None]
+    return {
+        "calls": len(calls),
+        "errors": sum(1 for call in calls if call["status"] != "200"),
+        "quota_cost": round(sum(costs), 2),
+        "total_ms": round(sum(latencies), 1),
+        "avg_ms": round(sum(latencies) / len(latencies), 1),
+        "p95_ms": round(_percentile(latencies, 0.95), 1),
+        "bytes": sum(call["bytes"] for call in calls)
+    }
+
+
+def summarize_calls(entries: list) -> dict:
+    """
+    Ledger entries -> totals, and per sport / per sport+market / per initiator
+    breakdowns sorted by quota cost then time. Calls with several markets are
+    counted under each market with an equal share of their quota cost, latency
+    and bytes.
+    """
+    if not entries:
+        return {"calls": 0, "sports": [], "markets": [], "initiators": [], "quota_remaining": None}
+
+    by_sport = {}
+    by_initiator = {}
+    by_market = {}
+    for entry in entries:
+        by_sport.setdefault(entry["sport"], []).append(entry)
+        by_initiator.setdefault(entry["initiator"], []).append(entry)
+        markets = [m for m in entry["markets"].split(",") if m] or [entry["path"]]
+        share = 1 / len(markets)
+        for market in markets:
+            by_market.setdefault((entry["sport"], market), []).append({
+                **entry,
+                "quota_cost": entry["quota_cost"] * share if entry["quota_cost"] is not None else None,
+                "latency_ms": entry["latency_ms"] * share,
+                "bytes": int(entry["bytes"] * share)
+            })
+
+    def ranked(groups: dict, key_fields: tuple) -> list:
+        rows = []
+        for key, calls in groups.items():
+            key = key if isinstance(key, tuple) else (key,)
+            rows.append({**dict(zip(key_fields, key)), **_group_stats(calls)})
+        return sorted(rows, key=lambda row: (row["quota_cost"], row["total_ms"]), reverse=True)
+
+    latest_quota = next((e for e in reversed(entries) if e["quota_remaining"] is not None), None)
+    return {
+        **_group_stats(entries),
+        "since": min(entry["ts"] for entry in entries),
+        "until": max(entry["ts"] for entry in entries),
+        "quota_used": latest_quota["quota_used"] if latest_quota else None,
+        "quota_remaining": latest_quota["quota_remaining"] if latest_quota else None,
+        "sports": ranked(by_sport, ("sport",)),
+        "markets": ranked(by_market, ("sport", "market")),
+        "initiators": ranked(by_initiator, ("initiator",))
+    }
+
@@ -140,6 +140,37 @@ describe('api', () => {
         { headers: { 'X-API-Key': 'test-api-key' }, cache: 'no-store' }
       )
     })
+
+    it('getStageTimings fetches with auth', async () => {
+      fetch.mockResolvedValueOnce(mockResponse({ routes: {}, window: 256 }))
+
+      const result = await api.getStageTimings()
+
+      expect(fetch).toHaveBeenCalledWith(
+        `${API_BASE_URL}/live/timings`,
+        { headers: { 'X-API-Key': 'test-api-key' }, cache: 'no-store' }
+      )
+      expect(result).toEqual({ routes: {}, window: 256 })
+    })
+
+    it('getCLVSummary fetches with auth and filters', async () => {
+      const summary = { overall: { picks: 3, avg_clv: 0.5 }, by_tier: {} }
+      fetch.mockResolvedValueOnce(mockResponse(summary))
+
+      const result = await api.getCLVSummary({ sport: 'NBA', userId: 'u1', days: 30 })
+
+      expect(fetch).toHaveBeenCalledWith(
+        `${API_BASE_URL}/live/bets/clv?sport=nba&user_id=u1&days=30`,
+        { headers: { 'X-API-Key': 'test-api-key' }, cache: 'no-store' }
+      )
+      expect(result).toEqual(summary)
+    })
+
+    it('getCLVSummary returns null on error', async () => {
+      fetch.mockRejectedValueOnce(new Error('Network error'))
+
+      expect(await api.getCLVSummary()).toBeNull()
+    })
   })
 
   describe('Defensive handling', () => {